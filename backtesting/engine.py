@@ -5,6 +5,7 @@ A framework for testing trading strategies on historical data.
 
 Features:
 - Event-driven backtesting
+- Vectorized backtesting from precomputed signals
 - Multiple strategy support
 - Transaction costs
 - Portfolio tracking
@@ -268,6 +269,10 @@ class BacktestEngine:
         self.tickers = list(self.prices.columns)
         self.dates = list(self.prices.index)
 
+        # Positions of the dates and tickers so that lookups are O(1)
+        self._date_positions = {date: i for i, date in enumerate(self.dates)}
+        self._ticker_positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+
     def run(
         self,
         strategy: Callable,
@@ -295,10 +300,12 @@ class BacktestEngine:
         daily_cash = []
         daily_positions_value = []
 
+        price_rows = self.prices.to_numpy()
+
         # Run through each day
         for i, date in enumerate(self.dates):
             # Get current prices
-            current_prices = self.prices.loc[date].to_dict()
+            current_prices = dict(zip(self.tickers, price_rows[i].tolist()))
 
             # Get strategy signals
             orders = strategy(
@@ -337,9 +344,146 @@ class BacktestEngine:
             prices=self.prices
         )
 
+    def run_vectorized(
+        self,
+        strategy,
+        verbose: bool = False
+    ) -> 'BacktestResults':
+        """
+        Run backtest with signals that are generated for all dates at once.
+
+        Instead of being called on every bar, the strategy precomputes its
+        indicators over the full price history and returns two matrices
+        (dates x tickers) from strategy.generate_vectorized_signals(engine):
+            - entries: fraction of the cash at the start of the date to buy
+              with when there is no open position (0 for no entry)
+            - exits: whether to sell the full position when there is one
+
+        The column order of the matrices is the order in which the orders
+        of a date are executed, strategies that set vectorized_sells_first
+        have their sells executed before their buys. Orders are filled
+        with Portfolio.execute_order on the dates that have signals only,
+        the daily values are computed over NumPy arrays. The trades, cash
+        and positions equal those of run() with the same strategy.
+
+        Args:
+            strategy: Strategy instance, see Strategy.generate_vectorized_signals
+            verbose: Print trades
+
+        Returns:
+            BacktestResults object with performance data
+
+        Raises:
+            TypeError: If the strategy does not generate vectorized signals,
+                such as a strategy function
+        """
+        if not hasattr(strategy, 'generate_vectorized_signals'):
+            raise TypeError(
+                f"{getattr(strategy, '__name__', type(strategy).__name__)} does not "
+                "generate vectorized signals, subclass Strategy or use run()"
+            )
+
+        entries, exits = strategy.generate_vectorized_signals(self)
+        sells_first = getattr(strategy, 'vectorized_sells_first', False)
+
+        signal_tickers = [
+            ticker for ticker in dict.fromkeys([*entries.columns, *exits.columns])
+            if ticker in self._ticker_positions
+        ]
+        entries = entries.reindex(
+            index=self.prices.index, columns=signal_tickers
+        ).fillna(0).to_numpy(dtype=float)
+        exits = exits.reindex(
+            index=self.prices.index, columns=signal_tickers, fill_value=False
+        ).to_numpy(dtype=bool)
+
+        columns = [self._ticker_positions[ticker] for ticker in signal_tickers]
+        price_matrix = self.prices.to_numpy(dtype=float)
+
+        # Initialize portfolio
+        portfolio = Portfolio(
+            initial_cash=self.initial_cash,
+            commission_rate=self.commission
+        )
+
+        fills = np.zeros(price_matrix.shape)
+        cash = np.full(len(self.dates), np.nan)
+
+        # Only the dates with signals can change the portfolio
+        signal_rows = np.flatnonzero((entries > 0).any(axis=1) | exits.any(axis=1))
+
+        for row in signal_rows:
+            date = self.dates[row]
+            available_cash = portfolio.cash
+
+            # Orders are based on the portfolio at the start of the date
+            buy_orders, sell_orders, orders = [], [], []
+            for signal in np.flatnonzero((entries[row] > 0) | exits[row]):
+                ticker = signal_tickers[signal]
+                position = portfolio.get_position(ticker)
+
+                if exits[row, signal] and position.quantity > 0:
+                    order = Order(ticker, Side.SELL, position.quantity)
+                    sell_orders.append(order)
+                elif entries[row, signal] > 0 and position.quantity == 0:
+                    amount = available_cash * entries[row, signal]
+                    quantity = int(amount / price_matrix[row, columns[signal]])
+                    if quantity <= 0:
+                        continue
+                    order = Order(ticker, Side.BUY, quantity)
+                    buy_orders.append(order)
+                else:
+                    continue
+
+                orders.append(order)
+
+            if sells_first:
+                orders = sell_orders + buy_orders
+
+            # Execute orders
+            for order in orders:
+                column = self._ticker_positions[order.ticker]
+                trade = portfolio.execute_order(order, float(price_matrix[row, column]))
+
+                if trade:
+                    fills[row, column] += (
+                        trade.quantity if trade.side == Side.BUY else -trade.quantity
+                    )
+
+                    if verbose:
+                        print(f"{date}: {trade.side.value.upper()} {trade.quantity} "
+                              f"{trade.ticker} @ ${trade.price:.2f}")
+
+            cash[row] = portfolio.cash
+
+        # Record daily values
+        holdings = np.cumsum(fills, axis=0)
+        cash = pd.Series(cash).ffill().fillna(portfolio.initial_cash).to_numpy()
+        positions_value = np.where(
+            holdings > 0, holdings * price_matrix, 0.0
+        ).sum(axis=1)
+
+        daily_values = pd.DataFrame(
+            {
+                'total_value': cash + positions_value,
+                'cash': cash,
+                'positions_value': positions_value
+            },
+            index=pd.Index(self.dates, name='date')
+        )
+
+        # Create results
+        return BacktestResults(
+            portfolio=portfolio,
+            daily_values=daily_values,
+            initial_cash=self.initial_cash,
+            tickers=self.tickers,
+            prices=self.prices
+        )
+
     def get_lookback(self, date: datetime, periods: int) -> pd.DataFrame:
         """Get historical data up to given date."""
-        idx = self.dates.index(date) if date in self.dates else 0
+        idx = self._date_positions.get(date, 0)
         start_idx = max(0, idx - periods)
         return self.prices.iloc[start_idx:idx + 1]
 
@@ -16,7 +16,7 @@ from typing import List, Optional, Dict, Any
 import pandas as pd
 import numpy as np
 
-from .engine import Order, Side, Portfolio, BacktestEngine
+from .engine import Order, OrderType, Side, Portfolio, BacktestEngine
 
 
 class Strategy(ABC):
@@ -30,8 +30,14 @@ class Strategy(ABC):
             def generate_signals(self, date, prices, portfolio, engine):
                 # Your logic
                 return [Order(...)]
+
+    BacktestEngine.run_vectorized replays generate_signals to derive the
+    signals, implement generate_vectorized_signals to compute them at once.
     """
 
+    # Whether run_vectorized executes the sells of a date before the buys
+    vectorized_sells_first = False
+
     def __init__(self, **params):
         """Initialize with parameters."""
         self.params = params
@@ -58,11 +64,99 @@ class Strategy(ABC):
         """
         pass
 
+    def generate_vectorized_signals(
+        self,
+        engine: BacktestEngine
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Generate trading signals for all dates at once.
+
+        By default generate_signals is replayed on every date against a
+        separate portfolio and its orders are converted into signals, which
+        does not make the backtest faster but lets every strategy run with
+        run_vectorized. The orders of a date are executed in ticker order.
+
+        Args:
+            engine: Backtest engine (for historical data access)
+
+        Returns:
+            Tuple of entries and exits DataFrames (dates x tickers), where
+            entries holds the fraction of cash to buy with when there is no
+            position and exits whether to sell the full position
+
+        Raises:
+            ValueError: If an order can not be expressed as an entry or exit,
+                such as a limit order, a partial sell or adding to a position
+        """
+        entries, exits = _empty_signals(engine, engine.tickers)
+        entry_matrix = entries.to_numpy(copy=True)
+        exit_matrix = exits.to_numpy(copy=True)
+
+        portfolio = Portfolio(
+            initial_cash=engine.initial_cash,
+            commission_rate=engine.commission
+        )
+        price_rows = engine.prices.to_numpy()
+
+        for row, date in enumerate(engine.dates):
+            current_prices = dict(zip(engine.tickers, price_rows[row].tolist()))
+            available_cash = portfolio.cash
+
+            for order in self.generate_signals(date, current_prices, portfolio, engine) or []:
+                if order.ticker not in current_prices:
+                    continue
+
+                column = entries.columns.get_loc(order.ticker)
+                position = portfolio.get_position(order.ticker)
+                price = current_prices[order.ticker]
+
+                if order.order_type != OrderType.MARKET:
+                    signal = None
+                elif order.side == Side.SELL and order.quantity == position.quantity:
+                    signal = 'exit'
+                elif order.side == Side.BUY and position.quantity == 0:
+                    signal = 'entry'
+                else:
+                    signal = None
+
+                if signal is None or entry_matrix[row, column] > 0 or exit_matrix[row, column]:
+                    raise ValueError(
+                        f"{type(self).__name__} placed an order on {date} for {order.ticker} "
+                        "that is not an entry or exit, implement generate_vectorized_signals "
+                        "or use BacktestEngine.run"
+                    )
+
+                if signal == 'exit':
+                    exit_matrix[row, column] = True
+                elif available_cash > 0:
+                    # The middle of the quantity so that run_vectorized rounds down to it
+                    entry_matrix[row, column] = (
+                        (order.quantity + 0.5) * price / available_cash
+                    )
+
+                portfolio.execute_order(order, price)
+
+        return (
+            pd.DataFrame(entry_matrix, index=entries.index, columns=entries.columns),
+            pd.DataFrame(exit_matrix, index=exits.index, columns=exits.columns),
+        )
+
     def __call__(self, date, prices, portfolio, engine) -> List[Order]:
         """Make strategy callable."""
         return self.generate_signals(date, prices, portfolio, engine)
 
 
+def _empty_signals(
+    engine: BacktestEngine,
+    tickers: List[str]
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Create entries and exits without signals for the tickers with prices."""
+    tickers = [t for t in tickers if t in engine.prices.columns]
+    entries = pd.DataFrame(0.0, index=engine.prices.index, columns=tickers)
+    exits = pd.DataFrame(False, index=engine.prices.index, columns=tickers)
+    return entries, exits
+
+
 class BuyAndHold(Strategy):
     """
     Simple buy and hold strategy.
@@ -98,6 +192,16 @@ class BuyAndHold(Strategy):
         self.bought = True
         return orders
 
+    def generate_vectorized_signals(self, engine) -> tuple[pd.DataFrame, pd.DataFrame]:
+        entries, exits = _empty_signals(engine, self.tickers)
+
+        if len(entries):
+            entries.iloc[0] = [
+                self.weights.get(t, 1/len(self.tickers)) for t in entries.columns
+            ]
+
+        return entries, exits
+
 
 class MovingAverageCrossover(Strategy):
     """
@@ -178,6 +282,23 @@ class MovingAverageCrossover(Strategy):
 
         return orders
 
+    def generate_vectorized_signals(self, engine) -> tuple[pd.DataFrame, pd.DataFrame]:
+        entries, exits = _empty_signals(engine, self.tickers)
+        prices = engine.prices[entries.columns]
+
+        # Calculate MAs once over the full history
+        short_ma = prices.rolling(self.short_window).mean()
+        long_ma = prices.rolling(self.long_window).mean()
+
+        valid = short_ma.notna() & long_ma.notna()
+        current_signal = short_ma > long_ma
+        prev_signal = short_ma.shift(1) > long_ma.shift(1)
+
+        entries[valid & current_signal & ~prev_signal] = self.position_size
+        exits[valid & ~current_signal & prev_signal] = True
+
+        return entries, exits
+
 
 class MeanReversion(Strategy):
     """
@@ -253,6 +374,24 @@ class MeanReversion(Strategy):
 
         return orders
 
+    def generate_vectorized_signals(self, engine) -> tuple[pd.DataFrame, pd.DataFrame]:
+        entries, exits = _empty_signals(engine, self.tickers)
+        prices = engine.prices[entries.columns]
+
+        # Same window as get_lookback(date, lookback + 1) including the current date
+        rolling = prices.rolling(self.lookback + 2, min_periods=1)
+        mean = rolling.mean()
+        std = rolling.std()
+        zscore = (prices - mean) / std
+
+        enough_data = np.arange(1, len(prices) + 1) >= self.lookback
+        valid = (std != 0) & enough_data[:, None]
+
+        entries[valid & (zscore <= self.entry_zscore)] = self.position_size
+        exits[valid & (zscore >= self.exit_zscore)] = True
+
+        return entries, exits
+
 
 class MomentumStrategy(Strategy):
     """
@@ -268,6 +407,9 @@ class MomentumStrategy(Strategy):
         rebalance_days: Days between rebalancing (default: 20)
     """
 
+    # Tickers leaving the top N are sold before the new top tickers are bought
+    vectorized_sells_first = True
+
     def __init__(
         self,
         tickers: List[str],
@@ -334,6 +476,44 @@ class MomentumStrategy(Strategy):
         self.current_holdings = top_tickers
         return orders
 
+    def generate_vectorized_signals(self, engine) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        New top tickers are bought in the order of the tickers, which makes
+        the fills deterministic when cash runs out during a rebalance.
+        """
+        entries, exits = _empty_signals(engine, self.tickers)
+        price_matrix = engine.prices[entries.columns].to_numpy(dtype=float)
+        tickers = np.array(entries.columns)
+
+        # Rebalance dates that have enough data
+        rebalance_days = max(self.rebalance_days, 1)
+        rebalance_rows = np.arange(rebalance_days - 1, len(price_matrix), rebalance_days)
+        rebalance_rows = rebalance_rows[rebalance_rows + 1 >= self.lookback]
+
+        # Calculate momentum (return over period) for all rebalance dates
+        start_prices = price_matrix[np.maximum(rebalance_rows - self.lookback - 1, 0)]
+        end_prices = price_matrix[rebalance_rows]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            momentum = (end_prices - start_prices) / start_prices
+        momentum[~(start_prices > 0)] = np.nan
+
+        current_holdings = np.zeros(len(tickers), dtype=bool)
+
+        for row, row_momentum in zip(rebalance_rows, momentum):
+            # Rank and select top N
+            ranked = np.flatnonzero(~np.isnan(row_momentum))
+            ranked = ranked[np.argsort(-row_momentum[ranked], kind='stable')]
+            top_tickers = np.zeros(len(tickers), dtype=bool)
+            top_tickers[ranked[:self.top_n]] = True
+
+            exits.iloc[row] = current_holdings & ~top_tickers
+            entries.iloc[row] = np.where(
+                top_tickers & ~current_holdings, 1 / self.top_n, 0.0
+            )
+            current_holdings = top_tickers
+
+        return entries, exits
+
 
 class ValueStrategy(Strategy):
     """
@@ -394,6 +574,19 @@ class ValueStrategy(Strategy):
         self.bought = True
         return orders
 
+    def generate_vectorized_signals(self, engine) -> tuple[pd.DataFrame, pd.DataFrame]:
+        buy_candidates = [
+            ticker for ticker, data in self.fundamental_data.items()
+            if data.get('pe_ratio', float('inf')) <= self.max_pe
+            and data.get('piotroski_f_score', 0) >= self.min_piotroski
+        ]
+        entries, exits = _empty_signals(engine, buy_candidates)
+
+        if len(entries):
+            entries.iloc[0] = self.position_size
+
+        return entries, exits
+
 
 class RSIStrategy(Strategy):
     """
@@ -474,6 +667,24 @@ class RSIStrategy(Strategy):
 
         return orders
 
+    def generate_vectorized_signals(self, engine) -> tuple[pd.DataFrame, pd.DataFrame]:
+        entries, exits = _empty_signals(engine, self.tickers)
+        prices = engine.prices[entries.columns]
+
+        # Calculate RSI once over the full history
+        delta = prices.diff()
+        gain = (delta.where(delta > 0, 0)).rolling(window=self.period).mean()
+        loss = (-delta.where(delta < 0, 0)).rolling(window=self.period).mean()
+        rsi = 100 - (100 / (1 + gain / loss))
+
+        enough_data = np.arange(1, len(prices) + 1) >= self.period + 1
+        valid = rsi.notna() & enough_data[:, None]
+
+        entries[valid & (rsi <= self.oversold)] = self.position_size
+        exits[valid & (rsi >= self.overbought)] = True
+
+        return entries, exits
+
 
 # ============ STRATEGY COMBINERS ============
 
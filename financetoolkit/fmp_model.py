@@ -3,8 +3,8 @@
 __docformat__ = "google"
 
 
+import asyncio
 import importlib.util
-import threading
 import time
 from datetime import datetime, timedelta
 from http.client import RemoteDisconnected
@@ -14,11 +14,10 @@ from urllib.error import HTTPError, URLError
 import numpy as np
 import pandas as pd
 import requests
-from tqdm import tqdm
 from urllib3.exceptions import MaxRetryError
 
 from financetoolkit import helpers
-from financetoolkit.utilities import error_model, logger_model
+from financetoolkit.utilities import error_model, fetch_model, logger_model
 
 logger = logger_model.get_logger()
 
@@ -33,6 +32,45 @@ logger = logger_model.get_logger()
 
 RETRY_LIMIT = 12
 
+# The error messages returned by FinancialModelingPrep and the column names of the
+# empty DataFrame that is returned to report them. The order matters given that
+# "Bandwidth Limit Reach" also contains "Limit Reach".
+ERROR_MESSAGES = {
+    "Premium Query Parameter": "PREMIUM QUERY PARAMETER",
+    "Exclusive Endpoint": "EXCLUSIVE ENDPOINT",
+    "Special Endpoint": "SPECIAL ENDPOINT",
+    "Premium Endpoint": "SPECIAL ENDPOINT",
+    "Bandwidth Limit Reach": "BANDWIDTH LIMIT REACH",
+    "Limit Reach": "LIMIT REACH",
+    "US stocks only": "US STOCKS ONLY",
+    "Invalid API KEY.": "INVALID API KEY",
+}
+
+
+def _convert_error_message(
+    error_message: str, retry_on_limit: bool = False
+) -> pd.DataFrame | None:
+    """
+    Converts an error message from FinancialModelingPrep into an empty DataFrame with a
+    column name that describes the error so that it can be reported by the error model.
+
+    Args:
+        error_message (str): The text of the response.
+        retry_on_limit (bool): Whether the request will be retried when the rate limit is reached.
+            Defaults to False.
+
+    Returns:
+        pd.DataFrame | None: A DataFrame describing the error or None when the request should be retried.
+    """
+    for message, column in ERROR_MESSAGES.items():
+        if message in error_message:
+            if column == "LIMIT REACH" and retry_on_limit:
+                return None
+
+            return pd.DataFrame(columns=[column])
+
+    return None
+
 
 def get_financial_data(
     url: str,
@@ -62,7 +100,7 @@ def get_financial_data(
 
     while True:
         try:
-            response = requests.get(url, timeout=60)
+            response = fetch_model.get(url, timeout=60)
             response.raise_for_status()
 
             if raw:
@@ -76,32 +114,29 @@ def get_financial_data(
 
         except (requests.exceptions.HTTPError, ValueError):
             error_message = response.text
+            retry_on_limit = (
+                sleep_timer
+                and limit_retry_counter < RETRY_LIMIT
+                and user_subscription != "Free"
+            )
+
+            error_dataframe = _convert_error_message(
+                error_message=error_message, retry_on_limit=retry_on_limit
+            )
 
-            if "Premium Query Parameter" in error_message:
-                return pd.DataFrame(columns=["PREMIUM QUERY PARAMETER"])
-            if "Exclusive Endpoint" in error_message:
-                return pd.DataFrame(columns=["EXCLUSIVE ENDPOINT"])
-            if "Special Endpoint" in error_message:
-                return pd.DataFrame(columns=["SPECIAL ENDPOINT"])
-            if "Premium Endpoint" in error_message:
-                return pd.DataFrame(columns=["SPECIAL ENDPOINT"])
-            if "Bandwidth Limit Reach" in error_message:
-                return pd.DataFrame(columns=["BANDWIDTH LIMIT REACH"])
+            if error_dataframe is not None:
+                return error_dataframe
             if "Limit Reach" in error_message:
-                if (
-                    sleep_timer
-                    and limit_retry_counter < RETRY_LIMIT
-                    and user_subscription != "Free"
-                ):
-                    time.sleep(5.01)
-                    limit_retry_counter += 1
-                else:
-                    return pd.DataFrame(columns=["LIMIT REACH"])
-            if "US stocks only" in error_message:
-                return pd.DataFrame(columns=["US STOCKS ONLY"])
+                time.sleep(5.01)
+                limit_retry_counter += 1
+                continue
 
-            if "Invalid API KEY." in error_message:
-                return pd.DataFrame(columns=["INVALID API KEY"])
+            # Any other unsuccessful response is retried as if the connection failed
+            if error_retry_counter == RETRY_LIMIT:
+                return pd.DataFrame(columns=["NO ERRORS"])
+
+            error_retry_counter += 1
+            time.sleep(5)
 
         except (
             MaxRetryError,
@@ -117,6 +152,81 @@ def get_financial_data(
             time.sleep(5)
 
 
+async def aget_financial_data(
+    url: str,
+    sleep_timer: bool = True,
+    raw: bool = False,
+    user_subscription: str = "Free",
+) -> pd.DataFrame:
+    """
+    Collects the financial data from the FinancialModelingPrep API asynchronously. This is the
+    asynchronous equivalent of get_financial_data and returns the same results, including the
+    empty DataFrames that describe errors, but does not block the event loop while waiting.
+
+    Args:
+        url (str): The url to retrieve the data from.
+        sleep_timer (bool): Whether to set a sleep timer when the rate limit is reached. Note that this only works
+            if you have a Premium subscription (Starter or higher) from FinancialModelingPrep. Defaults to True.
+        raw (bool): Whether to return the raw JSON data. Defaults to False.
+        user_subscription (str): The subscription type of the user. Defaults to "Free". Used to determine retry logic
+            on rate limits.
+
+    Returns:
+        pd.DataFrame or dict: A DataFrame containing the financial data, or a dictionary if raw=True.
+            Returns an empty DataFrame with specific column names indicating errors like 'LIMIT REACH',
+            'INVALID API KEY', etc., in case of API issues.
+    """
+    error_retry_counter = 0
+    limit_retry_counter = 0
+
+    while True:
+        try:
+            response = await fetch_model.aget(url, timeout=60)
+        except fetch_model.ASYNC_CONNECTION_ERRORS:
+            # When the connection is refused, retry the request 12 times
+            # and if it doesn't work, then return an empty dataframe
+            if error_retry_counter == RETRY_LIMIT:
+                return pd.DataFrame(columns=["NO ERRORS"])
+
+            error_retry_counter += 1
+            await asyncio.sleep(5)
+            continue
+
+        if response.is_success:
+            try:
+                if raw:
+                    return response.json()
+
+                return pd.read_json(StringIO(response.text))
+            except ValueError:
+                pass
+
+        error_message = response.text
+        retry_on_limit = (
+            sleep_timer
+            and limit_retry_counter < RETRY_LIMIT
+            and user_subscription != "Free"
+        )
+
+        error_dataframe = _convert_error_message(
+            error_message=error_message, retry_on_limit=retry_on_limit
+        )
+
+        if error_dataframe is not None:
+            return error_dataframe
+        if "Limit Reach" in error_message:
+            await asyncio.sleep(5.01)
+            limit_retry_counter += 1
+            continue
+
+        # Any other unsuccessful response is retried as if the connection failed
+        if error_retry_counter == RETRY_LIMIT:
+            return pd.DataFrame(columns=["NO ERRORS"])
+
+        error_retry_counter += 1
+        await asyncio.sleep(5)
+
+
 def get_financial_statement(
     ticker: str,
     statement: str = "",
@@ -146,6 +256,96 @@ def get_financial_statement(
                       The index represents the financial statement items, and the columns represent the dates/periods.
                       Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
     """
+    url = _get_financial_statement_url(
+        ticker=ticker,
+        statement=statement,
+        api_key=api_key,
+        quarter=quarter,
+        start_date=start_date,
+        end_date=end_date,
+        user_subscription=user_subscription,
+    )
+    financial_statement = get_financial_data(
+        url=url, sleep_timer=sleep_timer, user_subscription=user_subscription
+    )
+
+    return _convert_financial_statement(
+        financial_statement=financial_statement, quarter=quarter
+    )
+
+
+async def aget_financial_statement(
+    ticker: str,
+    statement: str = "",
+    api_key: str = "",
+    quarter: bool = False,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    sleep_timer: bool = True,
+    user_subscription: str = "Free",
+) -> pd.DataFrame:
+    """
+    Retrieves financial statements (balance, income, or cash flow statements) for a single company ticker
+    asynchronously. This is the asynchronous equivalent of get_financial_statement.
+
+    Args:
+        ticker (str): The company ticker.
+        statement (str): The type of financial statement to retrieve. Can be "balance", "income", or "cash-flow".
+        api_key (str): API key for the financial data provider.
+        quarter (bool): Whether to retrieve quarterly data. Defaults to False (annual data).
+        start_date (str | None): The start date to filter data with. Defaults to None.
+        end_date (str | None): The end date to filter data with. Defaults to None.
+        sleep_timer (bool): Whether to set a sleep timer when the rate limit is reached. Note that this only works
+            if you have a Premium subscription (Starter or higher) from FinancialModelingPrep. Defaults to True.
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+
+    Returns:
+        pd.DataFrame: A DataFrame containing the financial statement data for the specified ticker.
+                      The index represents the financial statement items, and the columns represent the dates/periods.
+                      Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
+    """
+    url = _get_financial_statement_url(
+        ticker=ticker,
+        statement=statement,
+        api_key=api_key,
+        quarter=quarter,
+        start_date=start_date,
+        end_date=end_date,
+        user_subscription=user_subscription,
+    )
+    financial_statement = await aget_financial_data(
+        url=url, sleep_timer=sleep_timer, user_subscription=user_subscription
+    )
+
+    return _convert_financial_statement(
+        financial_statement=financial_statement, quarter=quarter
+    )
+
+
+def _get_financial_statement_url(
+    ticker: str,
+    statement: str,
+    api_key: str,
+    quarter: bool,
+    start_date: str | None,
+    end_date: str | None,
+    user_subscription: str,
+) -> str:
+    """
+    Constructs the url to retrieve a financial statement for a single company ticker.
+
+    Args:
+        ticker (str): The company ticker.
+        statement (str): The type of financial statement to retrieve. Can be "balance", "income", or "cash-flow".
+        api_key (str): API key for the financial data provider.
+        quarter (bool): Whether to retrieve quarterly data.
+        start_date (str | None): The start date to filter data with.
+        end_date (str | None): The end date to filter data with.
+        user_subscription (str): The subscription type of the user.
+
+    Returns:
+        str: The url to retrieve the financial statement from.
+    """
     if statement == "balance":
         location = "balance-sheet-statement"
     elif statement == "income":
@@ -194,10 +394,24 @@ def get_financial_statement(
         f"?symbol={ticker}&period={period}&apikey={api_key}&"
         f"limit={periods_to_fetch}"
     )
-    financial_statement = get_financial_data(
-        url=url, sleep_timer=sleep_timer, user_subscription=user_subscription
-    )
 
+    return url
+
+
+def _convert_financial_statement(
+    financial_statement: pd.DataFrame, quarter: bool
+) -> pd.DataFrame:
+    """
+    Converts the financial statement as returned by FinancialModelingPrep to a DataFrame with the
+    financial statement items as index and the periods as columns.
+
+    Args:
+        financial_statement (pd.DataFrame): The financial statement as returned by the API.
+        quarter (bool): Whether the data is quarterly data.
+
+    Returns:
+        pd.DataFrame: The converted financial statement.
+    """
     if not financial_statement.empty:
         financial_statement = financial_statement.drop("symbol", axis=1)
 
@@ -243,6 +457,7 @@ def get_historical_data(
     divide_ohlc_by: int | float | None = None,
     sleep_timer: bool = True,
     user_subscription: str = "Free",
+    pad_period: bool = True,
 ):
     """
     Retrieves historical stock data for the given ticker from Financial Modeling Prep for a specified period.
@@ -273,28 +488,231 @@ def get_historical_data(
             Defaults to True.
         user_subscription (str): The subscription type of the user. Defaults to "Free". Used to determine retry logic
             on rate limits.
+        pad_period (bool, optional): Whether to request an additional year before the start date and after
+            the end date to ensure return calculations are correct. This can be disabled when only a few
+            dates are needed, e.g. when updating previously collected data. Defaults to True.
+
+    Raises:
+        ValueError: If the start date is after the end date.
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame object containing the historical stock data for the given ticker.
+                      The index of the DataFrame is the date of the data and the columns include OHLC, Volume,
+                      Dividends (if requested), Log Return, Cumulative Return, Volatility, and Excess Return.
+                      Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
+    """
+    historical_data_url, dividend_url, start_date_string, end_date_string = (
+        _get_historical_data_urls(
+            ticker=ticker,
+            api_key=api_key,
+            start=start,
+            end=end,
+            user_subscription=user_subscription,
+            pad_period=pad_period,
+        )
+    )
+
+    try:
+        historical_data = get_financial_data(
+            url=historical_data_url,
+            sleep_timer=sleep_timer,
+            raw=True,
+            user_subscription=user_subscription,
+        )
+
+        historical_data = pd.DataFrame(historical_data).set_index("date")
+    except (HTTPError, KeyError, ValueError, URLError, RemoteDisconnected):
+        return pd.DataFrame(historical_data)
+
+    historical_data = _convert_historical_data(
+        historical_data=historical_data,
+        ticker=ticker,
+        start_date_string=start_date_string,
+        end_date_string=end_date_string,
+        divide_ohlc_by=divide_ohlc_by,
+    )
+
+    if historical_data.empty:
+        return historical_data
+
+    if include_dividends:
+        try:
+            dividends = get_financial_data(
+                url=dividend_url,
+                sleep_timer=sleep_timer,
+                raw=True,
+                user_subscription=user_subscription,
+            )
+
+            historical_data = _add_dividends(
+                historical_data=historical_data, dividends=dividends
+            )
+        except (HTTPError, URLError, RemoteDisconnected):
+            historical_data["Dividends"] = 0
+
+    historical_data = historical_data.loc[
+        ~historical_data.index.duplicated(keep="first")
+    ]
+
+    historical_data = helpers.enrich_historical_data(
+        historical_data=historical_data,
+        start=start,
+        end=end,
+        return_column=return_column,
+        risk_free_rate=risk_free_rate,
+    )
+
+    return historical_data
+
+
+async def aget_historical_data(
+    ticker: str,
+    api_key: str,
+    start: str | None = None,
+    end: str | None = None,
+    interval: str = "1d",
+    return_column: str = "Adj Close",
+    risk_free_rate: pd.DataFrame = pd.DataFrame(),
+    include_dividends: bool = True,
+    divide_ohlc_by: int | float | None = None,
+    sleep_timer: bool = True,
+    user_subscription: str = "Free",
+    pad_period: bool = True,
+):
+    """
+    Retrieves historical stock data for the given ticker from Financial Modeling Prep for a specified period
+    asynchronously. This is the asynchronous equivalent of get_historical_data and returns the same result.
+
+    Args:
+        ticker (str): The ticker symbol to retrieve data for.
+        api_key (str): API key for the financial data provider.
+        start (str, optional): A string representing the start date of the period to retrieve data for
+            in 'YYYY-MM-DD' format. Defaults to None.
+        end (str, optional): A string representing the end date of the period to retrieve data for
+            in 'YYYY-MM-DD' format. Defaults to None.
+        interval (str, optional): A string representing the interval to retrieve data for. Defaults to '1d'.
+        return_column (str, optional): A string representing the column to use for return calculations.
+            Defaults to 'Adj Close'.
+        risk_free_rate (pd.DataFrame, optional): A pandas DataFrame object containing the risk free rate data.
+            This is used to calculate the excess return and excess volatility. Defaults to an empty DataFrame.
+        include_dividends (bool, optional): A boolean representing whether to include dividends in the
+            historical data. Defaults to True.
+        divide_ohlc_by (int | float | None, optional): A value to divide the OHLC data by.
+            This is useful if the OHLC data is presented in percentages or similar. Defaults to None.
+        sleep_timer (bool, optional): Whether to set a sleep timer when the rate limit is reached. Note that this
+            only works if you have a Premium subscription (Starter or higher) from FinancialModelingPrep.
+            Defaults to True.
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+        pad_period (bool, optional): Whether to request an additional year before the start date and after
+            the end date. Defaults to True.
+
+    Raises:
+        ValueError: If the start date is after the end date.
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame object containing the historical stock data for the given ticker.
+                      Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
+    """
+    historical_data_url, dividend_url, start_date_string, end_date_string = (
+        _get_historical_data_urls(
+            ticker=ticker,
+            api_key=api_key,
+            start=start,
+            end=end,
+            user_subscription=user_subscription,
+            pad_period=pad_period,
+        )
+    )
+
+    historical_data = await aget_financial_data(
+        url=historical_data_url,
+        sleep_timer=sleep_timer,
+        raw=True,
+        user_subscription=user_subscription,
+    )
+
+    try:
+        historical_data = pd.DataFrame(historical_data).set_index("date")
+    except (KeyError, ValueError):
+        return pd.DataFrame(historical_data)
+
+    historical_data = _convert_historical_data(
+        historical_data=historical_data,
+        ticker=ticker,
+        start_date_string=start_date_string,
+        end_date_string=end_date_string,
+        divide_ohlc_by=divide_ohlc_by,
+    )
+
+    if historical_data.empty:
+        return historical_data
+
+    if include_dividends:
+        dividends = await aget_financial_data(
+            url=dividend_url,
+            sleep_timer=sleep_timer,
+            raw=True,
+            user_subscription=user_subscription,
+        )
+
+        historical_data = _add_dividends(
+            historical_data=historical_data, dividends=dividends
+        )
+
+    historical_data = historical_data.loc[
+        ~historical_data.index.duplicated(keep="first")
+    ]
+
+    historical_data = helpers.enrich_historical_data(
+        historical_data=historical_data,
+        start=start,
+        end=end,
+        return_column=return_column,
+        risk_free_rate=risk_free_rate,
+    )
+
+    return historical_data
+
+
+def _get_historical_data_urls(
+    ticker: str,
+    api_key: str,
+    start: str | None,
+    end: str | None,
+    user_subscription: str,
+    pad_period: bool = True,
+) -> tuple[str, str, str, str]:
+    """
+    Constructs the urls to retrieve the historical data and dividends for a single ticker. Additional
+    data is requested around the start and end date to ensure return calculations are correct.
+
+    Args:
+        ticker (str): The ticker symbol to retrieve data for.
+        api_key (str): API key for the financial data provider.
+        start (str | None): The start date in 'YYYY-MM-DD' format.
+        end (str | None): The end date in 'YYYY-MM-DD' format.
+        user_subscription (str): The subscription type of the user.
+        pad_period (bool, optional): Whether to request an additional year before the start date and
+            after the end date. Defaults to True.
 
     Raises:
         ValueError: If the start date is after the end date.
 
     Returns:
-        pd.DataFrame: A pandas DataFrame object containing the historical stock data for the given ticker.
-                      The index of the DataFrame is the date of the data and the columns include OHLC, Volume,
-                      Dividends (if requested), Log Return, Cumulative Return, Volatility, and Excess Return.
-                      Returns an empty DataFrame if data retrieval fails or no data is found for the given parameters.
+        tuple[str, str, str, str]: The historical data url, the dividend url and the start and end date
+            strings that are requested.
     """
     # Additional data is collected to ensure return calculations are correct
+    padding = timedelta(days=1 * 365 if pad_period else 0)
+
     end_date_value = (
-        datetime.strptime(end, "%Y-%m-%d") + timedelta(days=1 * 365)
+        datetime.strptime(end, "%Y-%m-%d") + padding
         if end is not None
         else datetime.today()
     )
 
     if start is not None:
-        # Additional data is collected to ensure return calculations are correct
-        start_date_value = datetime.strptime(start, "%Y-%m-%d") - timedelta(
-            days=1 * 365
-        )
+        start_date_value = datetime.strptime(start, "%Y-%m-%d") - padding
 
         if start_date_value > end_date_value:
             raise ValueError(
@@ -309,9 +727,6 @@ def get_historical_data(
     end_date_string = end_date_value.strftime("%Y-%m-%d")
     start_date_string = start_date_value.strftime("%Y-%m-%d")
 
-    if interval in ["yearly", "quarterly"]:
-        interval = "1d"
-
     historical_data_url = (
         f"https://financialmodelingprep.com/stable/historical-price-eod/full"
         f"?symbol={ticker}&apikey={api_key}&from={start_date_string}&to={end_date_string}"
@@ -322,18 +737,30 @@ def get_historical_data(
         f"?symbol={ticker}&apikey={api_key}&limit={'99999' if user_subscription != 'Free' else '5'}"
     )
 
-    try:
-        historical_data = get_financial_data(
-            url=historical_data_url,
-            sleep_timer=sleep_timer,
-            raw=True,
-            user_subscription=user_subscription,
-        )
+    return historical_data_url, dividend_url, start_date_string, end_date_string
 
-        historical_data = pd.DataFrame(historical_data).set_index("date")
-    except (HTTPError, KeyError, ValueError, URLError, RemoteDisconnected):
-        return pd.DataFrame(historical_data)
 
+def _convert_historical_data(
+    historical_data: pd.DataFrame,
+    ticker: str,
+    start_date_string: str,
+    end_date_string: str,
+    divide_ohlc_by: int | float | None = None,
+) -> pd.DataFrame:
+    """
+    Converts the historical data as returned by FinancialModelingPrep to the OHLC format.
+
+    Args:
+        historical_data (pd.DataFrame): The historical data with the date as index.
+        ticker (str): The ticker symbol the data belongs to.
+        start_date_string (str): The start date that was requested.
+        end_date_string (str): The end date that was requested.
+        divide_ohlc_by (int | float | None, optional): A value to divide the OHLC data by. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The converted historical data or an empty DataFrame if there is no data
+            within the requested period.
+    """
     historical_data = historical_data.sort_index()
 
     if (
@@ -371,41 +798,33 @@ def get_historical_data(
         # In case tickers are presented in percentages or similar
         historical_data = historical_data.div(divide_ohlc_by)
 
-    if include_dividends:
-        try:
-            dividends = get_financial_data(
-                url=dividend_url,
-                sleep_timer=sleep_timer,
-                raw=True,
-                user_subscription=user_subscription,
-            )
+    return historical_data
 
-            try:
-                dividends_df = pd.DataFrame(dividends).set_index("date")
 
-                if not dividends_df.empty:
-                    dividends_df.index = pd.to_datetime(dividends_df.index)
-                    dividends_df.index = dividends_df.index.to_period(freq="D")
+def _add_dividends(historical_data: pd.DataFrame, dividends) -> pd.DataFrame:
+    """
+    Adds the dividends as returned by FinancialModelingPrep to the historical data. If no dividends
+    are available, the dividends are set to zero.
 
-                    historical_data["Dividends"] = dividends_df["dividend"]
-                else:
-                    historical_data["Dividends"] = 0
-            except KeyError:
-                historical_data["Dividends"] = 0
-        except (HTTPError, URLError, RemoteDisconnected):
-            historical_data["Dividends"] = 0
+    Args:
+        historical_data (pd.DataFrame): The historical data.
+        dividends (list | pd.DataFrame): The raw dividend data.
 
-    historical_data = historical_data.loc[
-        ~historical_data.index.duplicated(keep="first")
-    ]
+    Returns:
+        pd.DataFrame: The historical data including a Dividends column.
+    """
+    try:
+        dividends_df = pd.DataFrame(dividends).set_index("date")
 
-    historical_data = helpers.enrich_historical_data(
-        historical_data=historical_data,
-        start=start,
-        end=end,
-        return_column=return_column,
-        risk_free_rate=risk_free_rate,
-    )
+        if not dividends_df.empty:
+            dividends_df.index = pd.to_datetime(dividends_df.index)
+            dividends_df.index = dividends_df.index.to_period(freq="D")
+
+            historical_data["Dividends"] = dividends_df["dividend"]
+        else:
+            historical_data["Dividends"] = 0
+    except KeyError:
+        historical_data["Dividends"] = 0
 
     return historical_data
 
@@ -734,28 +1153,15 @@ def get_revenue_segmentation(
 
     revenue_segmentation_dict: dict = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc=f"Obtaining {method} segmentation data")
-        if progress_bar
-        else ticker_list
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        revenue_segmentation_dict,
+        progress_bar=progress_bar,
+        tqdm_message=f"Obtaining {method} segmentation data",
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
-
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, revenue_segmentation_dict),
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
-
     # Checks if any errors are in the dataset and if this is the case, reports them
     revenue_segmentation_dict = error_model.check_for_error_messages(
         dataset_dictionary=revenue_segmentation_dict,
@@ -943,28 +1349,15 @@ def get_analyst_estimates(
 
     analyst_estimates_dict: dict = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc="Obtaining analyst estimates")
-        if progress_bar
-        else ticker_list
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        analyst_estimates_dict,
+        progress_bar=progress_bar,
+        tqdm_message="Obtaining analyst estimates",
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
-
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, analyst_estimates_dict),
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
-
     # Checks if any errors are in the dataset and if this is the case, reports them
     analyst_estimates_dict = error_model.check_for_error_messages(
         dataset_dictionary=analyst_estimates_dict, user_subscription=user_subscription
@@ -1013,6 +1406,78 @@ def get_analyst_estimates(
     return pd.DataFrame(), no_data
 
 
+PROFILE_NAMING: dict = {
+    "symbol": "Symbol",
+    "price": "Price",
+    "beta": "Beta",
+    "marketCap": "Market Capitalization",
+    "volume": "Volume",
+    "averageVolume": "Average Volume",
+    "lastDividend": "Last Dividend",
+    "range": "Range",
+    "change": "Change",
+    "changePercentage": "Change %",
+    "companyName": "Company Name",
+    "currency": "Currency",
+    "cik": "CIK",
+    "isin": "ISIN",
+    "cusip": "CUSIP",
+    "exchange": "Exchange",
+    "exchangeFullName": "Exchange Full Name",
+    "industry": "Industry",
+    "website": "Website",
+    "description": "Description",
+    "ceo": "CEO",
+    "sector": "Sector",
+    "country": "Country",
+    "fullTimeEmployees": "Full Time Employees",
+    "phone": "Phone",
+    "address": "Address",
+    "city": "City",
+    "state": "State",
+    "zip": "ZIP Code",
+    "dcfDiff": "DCF Difference",
+    "dcf": "DCF",
+    "ipoDate": "IPO Date",
+}
+
+QUOTE_NAMING: dict = {
+    "symbol": "Symbol",
+    "name": "Name",
+    "price": "Price",
+    "change": "Change",
+    "changePercentage": "Change %",
+    "dayLow": "Day Low",
+    "dayHigh": "Day High",
+    "yearHigh": "Year High",
+    "yearLow": "Year Low",
+    "marketCap": "Market Capitalization",
+    "priceAvg50": "Price Average 50 Days",
+    "priceAvg200": "Price Average 200 Days",
+    "exchange": "Exchange",
+    "volume": "Volume",
+    "avgVolume": "Average Volume",
+    "open": "Open",
+    "previousClose": "Previous Close",
+    "eps": "EPS",
+    "pe": "PE",
+    "earningsAnnouncement": "Earnings Announcement",
+    "sharesOutstanding": "Shares Outstanding",
+    "timestamp": "Timestamp",
+}
+
+RATING_NAMING: dict = {
+    "rating": "Rating",
+    "overallScore": "Rating Score",
+    "discountedCashFlowScore": "DCF Score",
+    "returnOnEquityScore": "ROE Score",
+    "returnOnAssetsScore": "ROA Score",
+    "debtToEquityScore": "DE Score",
+    "priceToEarningsScore": "PE Score",
+    "priceToBookScore": "PB Score",
+}
+
+
 def get_profile(
     tickers: list[str] | str,
     api_key: str,
@@ -1037,46 +1502,12 @@ def get_profile(
         url = f"https://financialmodelingprep.com/stable/profile?symbol={ticker}&apikey={api_key}"
         profile_data = get_financial_data(url=url, user_subscription=user_subscription)
 
-        if profile_data.empty:
-            no_data.append(ticker)
-            profile_dict[ticker] = profile_data
-        else:
-            profile_dict[ticker] = profile_data.T
-
-    naming: dict = {
-        "symbol": "Symbol",
-        "price": "Price",
-        "beta": "Beta",
-        "marketCap": "Market Capitalization",
-        "volume": "Volume",
-        "averageVolume": "Average Volume",
-        "lastDividend": "Last Dividend",
-        "range": "Range",
-        "change": "Change",
-        "changePercentage": "Change %",
-        "companyName": "Company Name",
-        "currency": "Currency",
-        "cik": "CIK",
-        "isin": "ISIN",
-        "cusip": "CUSIP",
-        "exchange": "Exchange",
-        "exchangeFullName": "Exchange Full Name",
-        "industry": "Industry",
-        "website": "Website",
-        "description": "Description",
-        "ceo": "CEO",
-        "sector": "Sector",
-        "country": "Country",
-        "fullTimeEmployees": "Full Time Employees",
-        "phone": "Phone",
-        "address": "Address",
-        "city": "City",
-        "state": "State",
-        "zip": "ZIP Code",
-        "dcfDiff": "DCF Difference",
-        "dcf": "DCF",
-        "ipoDate": "IPO Date",
-    }
+        _convert_profile(
+            ticker=ticker,
+            profile_data=profile_data,
+            profile_dict=profile_dict,
+            no_data=no_data,
+        )
 
     if isinstance(tickers, str):
         ticker_list = [tickers]
@@ -1087,28 +1518,107 @@ def get_profile(
 
     profile_dict: dict[str, pd.DataFrame] = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc="Obtaining company profiles")
-        if progress_bar
-        else ticker_list
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        profile_dict,
+        progress_bar=progress_bar,
+        tqdm_message="Obtaining company profiles",
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
+    return _combine_profiles(
+        profile_dict=profile_dict, no_data=no_data, user_subscription=user_subscription
+    )
+
+
+async def aget_profile(
+    tickers: list[str] | str,
+    api_key: str,
+    user_subscription: str = "Free",
+) -> pd.DataFrame:
+    """
+    Gives information about the profile of a company asynchronously. This is the asynchronous
+    equivalent of get_profile and returns the same result.
+
+    Args:
+        ticker (list or string): the company ticker (for example: "AAPL")
+        api_key (string): the API Key obtained from
+        https://www.jeroenbouma.com/fmp
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+
+    Returns:
+        pd.DataFrame: the profile data.
+    """
+
+    async def worker(ticker, profile_dict):
+        url = f"https://financialmodelingprep.com/stable/profile?symbol={ticker}&apikey={api_key}"
+        profile_data = await aget_financial_data(
+            url=url, user_subscription=user_subscription
+        )
 
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, profile_dict),
+        _convert_profile(
+            ticker=ticker,
+            profile_data=profile_data,
+            profile_dict=profile_dict,
+            no_data=no_data,
         )
-        thread.start()
-        threads.append(thread)
 
-    for thread in threads:
-        thread.join()
+    if isinstance(tickers, str):
+        ticker_list = [tickers]
+    elif isinstance(tickers, list):
+        ticker_list = tickers
+    else:
+        raise ValueError(f"Type for the tickers ({type(tickers)}) variable is invalid.")
+
+    profile_dict: dict[str, pd.DataFrame] = {}
+    no_data: list[str] = []
+
+    await fetch_model.arun_workers(worker, ticker_list, profile_dict)
+
+    return _combine_profiles(
+        profile_dict=profile_dict, no_data=no_data, user_subscription=user_subscription
+    )
+
+
+def _convert_profile(
+    ticker: str,
+    profile_data: pd.DataFrame,
+    profile_dict: dict[str, pd.DataFrame],
+    no_data: list[str],
+):
+    """
+    Stores the profile of a single ticker in the profile dictionary.
+
+    Args:
+        ticker (str): the company ticker.
+        profile_data (pd.DataFrame): the profile data as returned by the API.
+        profile_dict (dict[str, pd.DataFrame]): the dictionary to store the profile in.
+        no_data (list[str]): the list of tickers for which no data is available.
+    """
+    if profile_data.empty:
+        no_data.append(ticker)
+        profile_dict[ticker] = profile_data
+    else:
+        profile_dict[ticker] = profile_data.T
+
+
+def _combine_profiles(
+    profile_dict: dict[str, pd.DataFrame],
+    no_data: list[str],
+    user_subscription: str,
+) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Combines the profiles of all tickers into a single DataFrame.
+
+    Args:
+        profile_dict (dict[str, pd.DataFrame]): the profile of each ticker.
+        no_data (list[str]): the list of tickers for which no data is available.
+        user_subscription (str): The subscription type of the user.
 
+    Returns:
+        tuple[pd.DataFrame, list[str]]: the profile data and the tickers without data.
+    """
     # Checks if any errors are in the dataset and if this is the case, reports them
     profile_dict = error_model.check_for_error_messages(
         dataset_dictionary=profile_dict, user_subscription=user_subscription
@@ -1117,7 +1627,7 @@ def get_profile(
     if profile_dict:
         try:
             profile_dataframe = pd.concat(profile_dict)[0].unstack(level=0)
-            profile_dataframe = profile_dataframe.rename(index=naming)
+            profile_dataframe = profile_dataframe.rename(index=PROFILE_NAMING)
             profile_dataframe = profile_dataframe.drop(
                 [
                     "image",
@@ -1162,36 +1672,9 @@ def get_quote(
         url = f"https://financialmodelingprep.com/stable/quote?symbol={ticker}&apikey={api_key}"
         quote_data = get_financial_data(url=url, user_subscription=user_subscription)
 
-        if quote_data.empty:
-            no_data.append(ticker)
-            quote_dict[ticker] = quote_data
-        else:
-            quote_dict[ticker] = quote_data.T
-
-    naming: dict = {
-        "symbol": "Symbol",
-        "name": "Name",
-        "price": "Price",
-        "change": "Change",
-        "changePercentage": "Change %",
-        "dayLow": "Day Low",
-        "dayHigh": "Day High",
-        "yearHigh": "Year High",
-        "yearLow": "Year Low",
-        "marketCap": "Market Capitalization",
-        "priceAvg50": "Price Average 50 Days",
-        "priceAvg200": "Price Average 200 Days",
-        "exchange": "Exchange",
-        "volume": "Volume",
-        "avgVolume": "Average Volume",
-        "open": "Open",
-        "previousClose": "Previous Close",
-        "eps": "EPS",
-        "pe": "PE",
-        "earningsAnnouncement": "Earnings Announcement",
-        "sharesOutstanding": "Shares Outstanding",
-        "timestamp": "Timestamp",
-    }
+        _convert_quote(
+            ticker=ticker, quote_data=quote_data, quote_dict=quote_dict, no_data=no_data
+        )
 
     if isinstance(tickers, str):
         ticker_list = [tickers]
@@ -1202,28 +1685,104 @@ def get_quote(
 
     quote_dict: dict[str, pd.DataFrame] = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc="Obtaining company quotes")
-        if progress_bar
-        else ticker_list
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        quote_dict,
+        progress_bar=progress_bar,
+        tqdm_message="Obtaining company quotes",
+    )
+
+    return _combine_quotes(
+        quote_dict=quote_dict, no_data=no_data, user_subscription=user_subscription
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
 
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, quote_dict),
+async def aget_quote(
+    tickers: list[str] | str,
+    api_key: str,
+    user_subscription: str = "Free",
+) -> pd.DataFrame:
+    """
+    Gives information about the quote of a company asynchronously. This is the asynchronous
+    equivalent of get_quote and returns the same result.
+
+    Args:
+        ticker (list or string): the company ticker (for example: "AMD")
+        api_key (string): the API Key obtained from
+        https://www.jeroenbouma.com/fmp
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+
+    Returns:
+        pd.DataFrame: the quote data.
+    """
+
+    async def worker(ticker, quote_dict):
+        url = f"https://financialmodelingprep.com/stable/quote?symbol={ticker}&apikey={api_key}"
+        quote_data = await aget_financial_data(
+            url=url, user_subscription=user_subscription
+        )
+
+        _convert_quote(
+            ticker=ticker, quote_data=quote_data, quote_dict=quote_dict, no_data=no_data
         )
-        thread.start()
-        threads.append(thread)
 
-    for thread in threads:
-        thread.join()
+    if isinstance(tickers, str):
+        ticker_list = [tickers]
+    elif isinstance(tickers, list):
+        ticker_list = tickers
+    else:
+        raise ValueError(f"Type for the tickers ({type(tickers)}) variable is invalid.")
+
+    quote_dict: dict[str, pd.DataFrame] = {}
+    no_data: list[str] = []
+
+    await fetch_model.arun_workers(worker, ticker_list, quote_dict)
+
+    return _combine_quotes(
+        quote_dict=quote_dict, no_data=no_data, user_subscription=user_subscription
+    )
+
+
+def _convert_quote(
+    ticker: str,
+    quote_data: pd.DataFrame,
+    quote_dict: dict[str, pd.DataFrame],
+    no_data: list[str],
+):
+    """
+    Stores the quote of a single ticker in the quote dictionary.
+
+    Args:
+        ticker (str): the company ticker.
+        quote_data (pd.DataFrame): the quote data as returned by the API.
+        quote_dict (dict[str, pd.DataFrame]): the dictionary to store the quote in.
+        no_data (list[str]): the list of tickers for which no data is available.
+    """
+    if quote_data.empty:
+        no_data.append(ticker)
+        quote_dict[ticker] = quote_data
+    else:
+        quote_dict[ticker] = quote_data.T
+
+
+def _combine_quotes(
+    quote_dict: dict[str, pd.DataFrame],
+    no_data: list[str],
+    user_subscription: str,
+) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Combines the quotes of all tickers into a single DataFrame.
+
+    Args:
+        quote_dict (dict[str, pd.DataFrame]): the quote of each ticker.
+        no_data (list[str]): the list of tickers for which no data is available.
+        user_subscription (str): The subscription type of the user.
 
+    Returns:
+        tuple[pd.DataFrame, list[str]]: the quote data and the tickers without data.
+    """
     # Checks if any errors are in the dataset and if this is the case, reports them
     quote_dict = error_model.check_for_error_messages(
         dataset_dictionary=quote_dict, user_subscription=user_subscription
@@ -1231,9 +1790,11 @@ def get_quote(
 
     if quote_dict:
         quote_dataframe = pd.concat(quote_dict)[0].unstack(level=0)
-        quote_dataframe = quote_dataframe.rename(index=naming)
+        quote_dataframe = quote_dataframe.rename(index=QUOTE_NAMING)
 
-    return quote_dataframe, no_data
+        return quote_dataframe, no_data
+
+    return pd.DataFrame(), no_data
 
 
 def get_rating(
@@ -1264,30 +1825,67 @@ def get_rating(
         )
         ratings = get_financial_data(url=url, user_subscription=user_subscription)
 
-        try:
-            ratings = ratings.drop("symbol", axis=1).sort_values(
-                by="date", ascending=True
-            )
+        _convert_rating(
+            ticker=ticker, ratings=ratings, ratings_dict=ratings_dict, no_data=no_data
+        )
 
-            ratings = ratings.set_index("date")
-
-            ratings = ratings.rename(
-                columns={
-                    "rating": "Rating",
-                    "overallScore": "Rating Score",
-                    "discountedCashFlowScore": "DCF Score",
-                    "returnOnEquityScore": "ROE Score",
-                    "returnOnAssetsScore": "ROA Score",
-                    "debtToEquityScore": "DE Score",
-                    "priceToEarningsScore": "PE Score",
-                    "priceToBookScore": "PB Score",
-                }
-            )
+    if isinstance(tickers, str):
+        ticker_list = [tickers]
+    elif isinstance(tickers, list):
+        ticker_list = tickers
+    else:
+        raise ValueError(f"Type for the tickers ({type(tickers)}) variable is invalid.")
 
-            ratings_dict[ticker] = ratings
-        except (KeyError, ValueError):
-            no_data.append(ticker)
-            ratings_dict[ticker] = ratings
+    ratings_dict: dict[str, pd.DataFrame] = {}
+    no_data: list[str] = []
+
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        ratings_dict,
+        progress_bar=progress_bar,
+        tqdm_message="Obtaining company ratings",
+    )
+
+    return _combine_ratings(
+        ratings_dict=ratings_dict,
+        ticker_list=ticker_list,
+        no_data=no_data,
+        user_subscription=user_subscription,
+    )
+
+
+async def aget_rating(
+    tickers: list[str] | str,
+    api_key: str,
+    user_subscription: str = "Free",
+) -> pd.DataFrame:
+    """
+    Gives information about the rating of a company asynchronously. This is the asynchronous
+    equivalent of get_rating and returns the same result.
+
+    Args:
+        ticker (list or string): the company ticker (for example: "MSFT")
+        api_key (string): the API Key obtained from
+        https://www.jeroenbouma.com/fmp
+        user_subscription (str): The subscription type of the user. Defaults to "Free".
+
+    Returns:
+        pd.DataFrame: the rating data.
+    """
+
+    async def worker(ticker, ratings_dict):
+        url = (
+            f"https://financialmodelingprep.com/stable/ratings-historical?symbol={ticker}&"
+            f"apikey={api_key}&limit={'99999' if user_subscription != 'Free' else '1'}"
+        )
+        ratings = await aget_financial_data(
+            url=url, user_subscription=user_subscription
+        )
+
+        _convert_rating(
+            ticker=ticker, ratings=ratings, ratings_dict=ratings_dict, no_data=no_data
+        )
 
     if isinstance(tickers, str):
         ticker_list = [tickers]
@@ -1298,28 +1896,63 @@ def get_rating(
 
     ratings_dict: dict[str, pd.DataFrame] = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc="Obtaining company ratings")
-        if progress_bar
-        else ticker_list
+    await fetch_model.arun_workers(worker, ticker_list, ratings_dict)
+
+    return _combine_ratings(
+        ratings_dict=ratings_dict,
+        ticker_list=ticker_list,
+        no_data=no_data,
+        user_subscription=user_subscription,
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
 
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, ratings_dict),
-        )
-        thread.start()
-        threads.append(thread)
+def _convert_rating(
+    ticker: str,
+    ratings: pd.DataFrame,
+    ratings_dict: dict[str, pd.DataFrame],
+    no_data: list[str],
+):
+    """
+    Stores the ratings of a single ticker in the ratings dictionary.
+
+    Args:
+        ticker (str): the company ticker.
+        ratings (pd.DataFrame): the ratings as returned by the API.
+        ratings_dict (dict[str, pd.DataFrame]): the dictionary to store the ratings in.
+        no_data (list[str]): the list of tickers for which no data is available.
+    """
+    try:
+        ratings = ratings.drop("symbol", axis=1).sort_values(by="date", ascending=True)
+
+        ratings = ratings.set_index("date")
+
+        ratings = ratings.rename(columns=RATING_NAMING)
+
+        ratings_dict[ticker] = ratings
+    except (KeyError, ValueError):
+        no_data.append(ticker)
+        ratings_dict[ticker] = ratings
+
+
+def _combine_ratings(
+    ratings_dict: dict[str, pd.DataFrame],
+    ticker_list: list[str],
+    no_data: list[str],
+    user_subscription: str,
+) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Combines the ratings of all tickers into a single DataFrame.
 
-    for thread in threads:
-        thread.join()
+    Args:
+        ratings_dict (dict[str, pd.DataFrame]): the ratings of each ticker.
+        ticker_list (list[str]): the tickers that were requested.
+        no_data (list[str]): the list of tickers for which no data is available.
+        user_subscription (str): The subscription type of the user.
 
+    Returns:
+        tuple[pd.DataFrame, list[str]]: the rating data and the tickers without data.
+    """
     # Checks if any errors are in the dataset and if this is the case, reports them
     ratings_dict = error_model.check_for_error_messages(
         dataset_dictionary=ratings_dict, user_subscription=user_subscription
@@ -1426,28 +2059,15 @@ def get_earnings_calendar(
 
     earnings_calendar_dict: dict = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc="Obtaining earnings calendars")
-        if progress_bar
-        else ticker_list
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        earnings_calendar_dict,
+        progress_bar=progress_bar,
+        tqdm_message="Obtaining earnings calendars",
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
-
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, earnings_calendar_dict),
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
-
     # Checks if any errors are in the dataset and if this is the case, reports them
     earnings_calendar_dict = error_model.check_for_error_messages(
         dataset_dictionary=earnings_calendar_dict, user_subscription=user_subscription
@@ -1551,28 +2171,15 @@ def get_dividend_calendar(
 
     dividend_calendar_dict: dict = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc="Obtaining dividend calendars")
-        if progress_bar
-        else ticker_list
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        dividend_calendar_dict,
+        progress_bar=progress_bar,
+        tqdm_message="Obtaining dividend calendars",
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
-
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, dividend_calendar_dict),
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
-
     # Checks if any errors are in the dataset and if this is the case, reports them
     dividend_calendar_dict = error_model.check_for_error_messages(
         dataset_dictionary=dividend_calendar_dict, user_subscription=user_subscription
@@ -1682,26 +2289,15 @@ def get_esg_scores(
 
     esg_scores_dict: dict = {}
     no_data: list[str] = []
-    threads = []
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc="Obtaining ESG scores") if progress_bar else ticker_list
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        esg_scores_dict,
+        progress_bar=progress_bar,
+        tqdm_message="Obtaining ESG scores",
     )
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
-
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, esg_scores_dict),
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
-
     # Checks if any errors are in the dataset and if this is the case, reports them
     esg_scores_dict = error_model.check_for_error_messages(
         dataset_dictionary=esg_scores_dict, user_subscription=user_subscription
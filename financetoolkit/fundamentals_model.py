@@ -1,15 +1,12 @@
 """Fundamentals Model"""
 
 import importlib.util
-import threading
-import time
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
 from financetoolkit import fmp_model, normalization_model, yfinance_model
-from financetoolkit.utilities import error_model, logger_model
+from financetoolkit.utilities import error_model, fetch_model, logger_model
 
 # Check if yfinance is installed
 yf_spec = importlib.util.find_spec("yfinance")
@@ -140,12 +137,6 @@ def collect_financial_statements(
             "For more information, look here: https://www.jeroenbouma.com/fmp"
         )
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc=f"Obtaining {statement} data")
-        if progress_bar
-        else ticker_list
-    )
-
     financial_statement_dict: dict[str, pd.DataFrame] = {
         "FinancialModelingPrep": {},
         "YahooFinance": {},
@@ -153,21 +144,15 @@ def collect_financial_statements(
     fmp_tickers: list[str] = []
     yf_tickers: list[str] = []
     no_data: list[str] = []
-    threads = []
-
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
 
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, financial_statement_dict, enforce_source),
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        financial_statement_dict,
+        enforce_source,
+        progress_bar=progress_bar,
+        tqdm_message=f"Obtaining {statement} data",
+    )
 
     fmp_financial_statements_total = pd.DataFrame()
     yf_financial_statements_total = pd.DataFrame()
@@ -5,7 +5,6 @@ __docformat__ = "google"
 import contextlib
 import inspect
 import re
-import warnings
 from functools import wraps
 
 import numpy as np
@@ -36,69 +35,61 @@ def calculate_growth(
     Returns:
         pd.Series | pd.DataFrame: _description_
     """
-    # With Pandas 2.1, pct_change will no longer automatically forward fill
-    # given that this has been solved within the code already but the warning
-    # still appears, this is a temporary fix to ignore the warning
-    warnings.simplefilter(action="ignore", category=FutureWarning)
-
     if isinstance(lag, list):
-        new_index = []
-        lag_dict = {f"Lag {lag_value}": lag_value for lag_value in lag}
+        # The growth is calculated along the columns for each row (or the other way around)
+        # which means the values are forward filled and shifted along that axis
+        values = dataset.to_numpy(dtype=np.float64)
+        values = values if axis == "columns" else values.T
+
+        filled_values = pd.DataFrame(values).ffill(axis="columns").to_numpy()
+        growth_values = np.full(
+            (len(filled_values), len(lag), filled_values.shape[1]), np.nan
+        )
+
+        for position, lag_value in enumerate(lag):
+            if lag_value == 0:
+                growth_values[:, position] = filled_values / filled_values - 1
+            elif lag_value > 0:
+                growth_values[:, position, lag_value:] = (
+                    filled_values[:, lag_value:] / filled_values[:, :-lag_value] - 1
+                )
+            else:
+                growth_values[:, position, :lag_value] = (
+                    filled_values[:, :lag_value] / filled_values[:, -lag_value:] - 1
+                )
 
-        if axis == "columns":
-            for old_index in dataset.index:
-                for lag_value in lag_dict:
-                    new_index.append(
-                        (*old_index, lag_value)
-                        if isinstance(old_index, tuple)
-                        else (old_index, lag_value)
-                    )
+        old_index = dataset.index if axis == "columns" else dataset.columns
+        old_index_levels = (
+            [old_index.get_level_values(level) for level in range(old_index.nlevels)]
+            if isinstance(old_index, pd.MultiIndex)
+            else [old_index]
+        )
+        new_index = pd.MultiIndex.from_arrays(
+            [level.repeat(len(lag)) for level in old_index_levels]
+            + [np.tile([f"Lag {lag_value}" for lag_value in lag], len(old_index))],
+            names=[None] * (len(old_index_levels) + 1),
+        )
+        growth_values = growth_values.reshape(len(new_index), -1)
 
+        if axis == "columns":
             dataset_lag = pd.DataFrame(
-                index=pd.MultiIndex.from_tuples(new_index),
-                columns=dataset.columns,
-                dtype=np.float64,
+                growth_values, index=new_index, columns=dataset.columns
             )
-
-            for new_index in dataset_lag.index:
-                lag_key = new_index[-1]
-                other_indices = new_index[:-1]
-
-                dataset_lag.loc[new_index] = (
-                    dataset.loc[other_indices]
-                    .ffill()
-                    .pct_change(periods=lag_dict[lag_key])  # type: ignore
-                    .to_numpy()
-                )
         else:
-            for old_index in dataset.columns:
-                for lag_value in lag_dict:
-                    new_index.append(
-                        (*old_index, lag_value)
-                        if isinstance(old_index, tuple)
-                        else (old_index, lag_value)
-                    )
-
             dataset_lag = pd.DataFrame(
-                columns=pd.MultiIndex.from_tuples(new_index),
-                index=dataset.index,
-                dtype=np.float64,
+                growth_values.T, index=dataset.index, columns=new_index
             )
 
-            for new_index in dataset_lag.columns:
-                lag_key = new_index[-1]
-                other_indices = new_index[:-1]
-
-                dataset_lag.loc[:, new_index] = (
-                    dataset.loc[:, other_indices]
-                    .ffill()
-                    .pct_change(periods=lag_dict[lag_key])  # type: ignore
-                    .to_numpy()
-                )
-
         return dataset_lag.round(rounding)
 
-    return dataset.ffill().pct_change(periods=lag, axis=axis).round(rounding)
+    # Forward filling along the axis is what pct_change would do by default, this
+    # is done explicitly given that Pandas 2.1 deprecated the implicit forward fill
+    return (
+        dataset.ffill()
+        .ffill(axis=axis)
+        .pct_change(periods=lag, axis=axis, fill_method=None)
+        .round(rounding)
+    )
 
 
 def combine_dataframes(dataset_dictionary: dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -275,6 +266,107 @@ def enrich_historical_data(
     return historical_data
 
 
+def get_computation_key(controller, name: str, arguments: dict) -> tuple | None:
+    """
+    Returns the key under which a result is stored in the computation cache that the Toolkit
+    shares between the Ratios and Models controllers. The key consists of the name of the
+    controller and the calculation, the tickers, period and rounding of the controller and
+    the arguments.
+
+    Args:
+        controller (Ratios | Models): The controller that calculates the result.
+        name (str): The name of the calculation (e.g. "collect_all_ratios").
+        arguments (dict): The arguments of the calculation.
+
+    Returns:
+        tuple | None: The key or None if the arguments can not be part of a key (e.g. a DataFrame).
+    """
+
+    def freeze(value):
+        if isinstance(value, dict):
+            return tuple((key, freeze(item)) for key, item in value.items())
+        if isinstance(value, list | tuple):
+            return tuple(freeze(item) for item in value)
+
+        return value
+
+    key = (
+        type(controller).__name__.lower(),
+        name,
+        freeze(controller._tickers),
+        controller._quarterly,
+        controller._rounding,
+        freeze(arguments),
+    )
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def handle_computation_cache(func):
+    """
+    A decorator that reuses the result of a function from the computation cache that the Toolkit
+    shares between the Ratios and Models controllers. The result is stored under the key of
+    `get_computation_key` so that it is only reused for the exact same data and arguments.
+
+    Args:
+        func (function): The function to be decorated.
+
+    Returns:
+        function: The wrapped function that reads from and writes to the computation cache.
+
+    Notes:
+        - The decorated function should have a `self` parameter as the first argument with a
+          `_computation_cache` attribute, results are not cached when it is None.
+        - DataFrames and Series are returned as copies so that the cached result can not be changed.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        computation_cache = getattr(self, "_computation_cache", None)
+
+        if computation_cache is None:
+            return func(self, *args, **kwargs)
+
+        bound_args = inspect.signature(func).bind(self, *args, **kwargs)
+        bound_args.apply_defaults()
+        arguments = dict(bound_args.arguments)
+        arguments.pop("self")
+
+        key = get_computation_key(self, func.__name__, arguments)
+
+        if key is None:
+            return func(self, *args, **kwargs)
+
+        if key not in computation_cache:
+            result = func(self, *args, **kwargs)
+
+            # Nothing is stored when nothing could be calculated so that the cause is reported again
+            if result is None:
+                return None
+
+            computation_cache[key] = result
+
+        result = computation_cache[key]
+
+        if isinstance(result, tuple):
+            return tuple(
+                item.copy() if isinstance(item, pd.DataFrame | pd.Series) else item
+                for item in result
+            )
+
+        if isinstance(result, list):
+            return list(result)
+
+        return result.copy() if isinstance(result, pd.DataFrame | pd.Series) else result
+
+    return wrapper
+
+
 def handle_portfolio(func):
     """
     A decorator that processes the result of a function to handle portfolio data.
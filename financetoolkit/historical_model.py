@@ -2,16 +2,14 @@
 
 __docformat__ = "google"
 
+import asyncio
 import importlib.util
-import threading
-import time
 
 import numpy as np
 import pandas as pd
-from tqdm import tqdm
 
-from financetoolkit import fmp_model, yfinance_model
-from financetoolkit.utilities import error_model, logger_model
+from financetoolkit import fmp_model, helpers, yfinance_model
+from financetoolkit.utilities import error_model, fetch_model, logger_model
 
 logger = logger_model.get_logger()
 
@@ -23,6 +21,15 @@ ENABLE_YFINANCE = yf_spec is not None
 
 TREASURY_LIMIT = 90
 
+# The columns that are derived from the prices and therefore recalculated when data is added
+DERIVED_COLUMNS = [
+    "Return",
+    "Volatility",
+    "Excess Return",
+    "Excess Volatility",
+    "Cumulative Return",
+]
+
 INTERVAL_STR = {
     "1min": "min",
     "5min": "min",
@@ -53,6 +60,7 @@ def get_historical_data(
     show_errors: bool = False,
     tqdm_message: str = "Obtaining historical data",
     user_subscription: str = "Free",
+    pad_period: bool = True,
 ):
     """
     Retrieves historical stock data for the given ticker(s) from Financial Modeling Prep or/and Yahoo Finance
@@ -64,8 +72,9 @@ def get_historical_data(
     opposes limits to Free plans (e.g. no tickers from outside the American exchanges) and in some cases
     Yahoo Finance has a broader universe.
 
-    By using threading, multiple API calls can be made at the same time, which speeds up the process
-    significantly. For example, collecting historical data of 100 tickers takes around 10 seconds.
+    By using a pool of workers that share a single session, multiple API calls can be made at the same time
+    while reusing connections, which speeds up the process significantly. For example, collecting historical
+    data of 100 tickers takes around 10 seconds.
 
     Args:
         tickers (list of str): A list of one or more ticker symbols to retrieve data for.
@@ -91,6 +100,9 @@ def get_historical_data(
         acquired data from FinancialModelingPrep and which tickers acquired data from YahooFinance.
         show_errors (bool, optional): A boolean representing whether to show errors. Defaults to True.
         tqdm_message (str, optional): A string representing the message to show in the progress bar.
+        pad_period (bool, optional): A boolean representing whether to request an additional year around
+        the start and end date from FinancialModelingPrep to ensure return calculations are correct.
+        Defaults to True.
 
     Raises:
         ValueError: If the start date is after the end date.
@@ -100,20 +112,8 @@ def get_historical_data(
         The index of the DataFrame is the date of the data and the columns are a multi-index
         with the ticker symbol(s) as the first level and the OHLC data as the second level.
     """
-    empty_historical_data = pd.DataFrame(
-        data=0,
-        index=pd.PeriodIndex(pd.date_range(start, end), freq=INTERVAL_STR[interval]),
-        columns=[
-            "Open",
-            "High",
-            "Low",
-            "Close",
-            "Adj Close",
-            "Volume",
-            "Return",
-            "Volatility",
-            "Cumulative Return",
-        ],
+    empty_historical_data = _get_empty_historical_data(
+        start=start, end=end, interval=interval
     )
 
     def worker(ticker, historical_data_dict, historical_data_error_dict):
@@ -160,6 +160,7 @@ def get_historical_data(
                     include_dividends=include_dividends,
                     divide_ohlc_by=divide_ohlc_by,
                     sleep_timer=sleep_timer,
+                    pad_period=pad_period,
                 )
 
                 if not historical_data.empty:
@@ -200,31 +201,274 @@ def get_historical_data(
     else:
         raise ValueError(f"Type for the tickers ({type(tickers)}) variable is invalid.")
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc=tqdm_message) if progress_bar else ticker_list
+    historical_data_dict: dict[str, pd.DataFrame] = {}
+    historical_data_error_dict: dict[str, pd.DataFrame] = {}
+    fmp_tickers: list[str] = []
+    yf_tickers: list[str] = []
+    no_data: list[str] = []
+
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        historical_data_dict,
+        historical_data_error_dict,
+        progress_bar=progress_bar,
+        tqdm_message=tqdm_message,
+    )
+
+    return _combine_historical_data(
+        tickers=tickers,
+        historical_data_dict=historical_data_dict,
+        historical_data_error_dict=historical_data_error_dict,
+        empty_historical_data=empty_historical_data,
+        fmp_tickers=fmp_tickers,
+        yf_tickers=yf_tickers,
+        no_data=no_data,
+        enforce_source=enforce_source,
+        fill_nan=fill_nan,
+        rounding=rounding,
+        show_ticker_seperation=show_ticker_seperation,
+        show_errors=show_errors,
+        user_subscription=user_subscription,
+    )
+
+
+async def aget_historical_data(
+    tickers: list[str] | str,
+    api_key: str | None = None,
+    enforce_source: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    interval: str = "1d",
+    return_column: str = "Adj Close",
+    risk_free_rate: pd.DataFrame = pd.DataFrame(),
+    include_dividends: bool = True,
+    fill_nan: bool = True,
+    divide_ohlc_by: int | float | None = None,
+    rounding: int | None = None,
+    sleep_timer: bool = True,
+    show_ticker_seperation: bool = True,
+    show_errors: bool = False,
+    user_subscription: str = "Free",
+):
+    """
+    Retrieves historical stock data for the given ticker(s) asynchronously. This is the asynchronous
+    equivalent of get_historical_data and returns the same result. Requests to Financial Modeling Prep
+    are made concurrently on the running event loop, sharing the rate limiter of the synchronous
+    functions. Intraday data and the Yahoo Finance fallback are executed in a worker thread so
+    that they do not block the event loop.
+
+    Args:
+        tickers (list of str): A list of one or more ticker symbols to retrieve data for.
+        start (str, optional): A string representing the start date of the period to retrieve data for
+            in 'YYYY-MM-DD' format. Defaults to None.
+        end (str, optional): A string representing the end date of the period to retrieve data for
+            in 'YYYY-MM-DD' format. Defaults to None.
+        interval (str, optional): A string representing the interval to retrieve data for.
+        return_column (str, optional): A string representing the column to use for return calculations.
+        risk_free_rate (pd.Series, optional): A pandas Series object containing the risk free rate data.
+        This is used to calculate the excess return and excess volatility. Defaults to pd.Series().
+        include_dividends (bool, optional): A boolean representing whether to include dividends in the
+        historical data. Defaults to True.
+        fill_nan (bool, optional): A boolean representing whether to fill NaN values with the previous
+        value. Defaults to True.
+        divide_ohlc_by (int, optional): An integer representing the value to divide the OHLC data by.
+        This is useful if the OHLC data is presented in percentages or similar. Defaults to None.
+        rounding (int, optional): The number of decimal places to round the data to. Defaults to None.
+        sleep_timer (bool, optional): A boolean representing whether to introduce a sleep timer to prevent
+        rate limit errors. Defaults to True.
+        show_ticker_seperation (bool, optional): A boolean representing whether to show which tickers
+        acquired data from FinancialModelingPrep and which tickers acquired data from YahooFinance.
+        show_errors (bool, optional): A boolean representing whether to show errors. Defaults to True.
+
+    Raises:
+        ValueError: If the start date is after the end date.
+
+    Returns:
+        pd.DataFrame: A pandas DataFrame object containing the historical stock data for the given ticker(s).
+        The index of the DataFrame is the date of the data and the columns are a multi-index
+        with the ticker symbol(s) as the first level and the OHLC data as the second level.
+    """
+    empty_historical_data = _get_empty_historical_data(
+        start=start, end=end, interval=interval
     )
 
+    async def worker(ticker, historical_data_dict, historical_data_error_dict):
+        historical_data = pd.DataFrame()
+        attempted_fmp = False
+
+        if interval in ["1min", "5min", "15min", "30min", "1hour", "4hour"]:
+            if not api_key:
+                raise ValueError(
+                    "The requested data requires the api_key parameter to be set, consider "
+                    "obtaining a key with the following link: "
+                    "https://www.jeroenbouma.com/fmp"
+                    "\nThe free plan allows for 250 requests per day, a limit of 5 years and has no "
+                    "quarterly data. Consider upgrading your plan. You can get 15% off by using the "
+                    "above affiliate link which also supports the project."
+                )
+
+            historical_data = await asyncio.to_thread(
+                fmp_model.get_intraday_data,
+                ticker=ticker,
+                api_key=api_key,
+                start=start,
+                end=end,
+                interval=interval,
+                return_column=return_column,
+                sleep_timer=sleep_timer,
+            )
+        else:
+            if api_key and enforce_source in [None, "FinancialModelingPrep"]:
+                historical_data = await fmp_model.aget_historical_data(
+                    ticker=ticker,
+                    api_key=api_key,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    return_column=return_column,
+                    risk_free_rate=risk_free_rate,
+                    include_dividends=include_dividends,
+                    divide_ohlc_by=divide_ohlc_by,
+                    sleep_timer=sleep_timer,
+                    user_subscription=user_subscription,
+                )
+
+                if not historical_data.empty:
+                    fmp_tickers.append(ticker)
+
+                attempted_fmp = True
+
+            if (
+                enforce_source != "FinancialModelingPrep"
+                and historical_data.empty
+                and ENABLE_YFINANCE
+            ):
+                historical_data = await asyncio.to_thread(
+                    yfinance_model.get_historical_data,
+                    ticker=ticker,
+                    start=start,
+                    end=end,
+                    interval=interval,
+                    return_column=return_column,
+                    risk_free_rate=risk_free_rate,
+                    divide_ohlc_by=divide_ohlc_by,
+                    fallback=attempted_fmp,
+                )
+
+                if not historical_data.empty:
+                    yf_tickers.append(ticker)
+
+        if historical_data.empty:
+            no_data.append(ticker)
+            historical_data_error_dict[ticker] = historical_data
+            historical_data_dict[ticker] = empty_historical_data
+        if not historical_data.empty:
+            historical_data_dict[ticker] = historical_data
+
+    if isinstance(tickers, str):
+        ticker_list = [tickers]
+    elif isinstance(tickers, list):
+        ticker_list = tickers
+    else:
+        raise ValueError(f"Type for the tickers ({type(tickers)}) variable is invalid.")
+
     historical_data_dict: dict[str, pd.DataFrame] = {}
     historical_data_error_dict: dict[str, pd.DataFrame] = {}
     fmp_tickers: list[str] = []
     yf_tickers: list[str] = []
     no_data: list[str] = []
-    threads = []
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
+    await fetch_model.arun_workers(
+        worker, ticker_list, historical_data_dict, historical_data_error_dict
+    )
+
+    return _combine_historical_data(
+        tickers=tickers,
+        historical_data_dict=historical_data_dict,
+        historical_data_error_dict=historical_data_error_dict,
+        empty_historical_data=empty_historical_data,
+        fmp_tickers=fmp_tickers,
+        yf_tickers=yf_tickers,
+        no_data=no_data,
+        enforce_source=enforce_source,
+        fill_nan=fill_nan,
+        rounding=rounding,
+        show_ticker_seperation=show_ticker_seperation,
+        show_errors=show_errors,
+        user_subscription=user_subscription,
+    )
+
 
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, historical_data_dict, historical_data_error_dict),
-        )
-        thread.start()
-        threads.append(thread)
+def _get_empty_historical_data(
+    start: str | None, end: str | None, interval: str
+) -> pd.DataFrame:
+    """
+    Creates the placeholder DataFrame that is used for tickers without historical data.
+
+    Args:
+        start (str | None): the start date in 'YYYY-MM-DD' format.
+        end (str | None): the end date in 'YYYY-MM-DD' format.
+        interval (str): the interval of the historical data.
+
+    Returns:
+        pd.DataFrame: a DataFrame filled with zeros for the given period.
+    """
+    return pd.DataFrame(
+        data=0,
+        index=pd.PeriodIndex(pd.date_range(start, end), freq=INTERVAL_STR[interval]),
+        columns=[
+            "Open",
+            "High",
+            "Low",
+            "Close",
+            "Adj Close",
+            "Volume",
+            "Return",
+            "Volatility",
+            "Cumulative Return",
+        ],
+    )
+
+
+def _combine_historical_data(
+    tickers: list[str] | str,
+    historical_data_dict: dict[str, pd.DataFrame],
+    historical_data_error_dict: dict[str, pd.DataFrame],
+    empty_historical_data: pd.DataFrame,
+    fmp_tickers: list[str],
+    yf_tickers: list[str],
+    no_data: list[str],
+    enforce_source: str | None,
+    fill_nan: bool,
+    rounding: int | None,
+    show_ticker_seperation: bool,
+    show_errors: bool,
+    user_subscription: str,
+) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Combines the historical data of each ticker into a single DataFrame and reports on
+    the tickers for which no data could be found. This is shared by the synchronous and
+    asynchronous retrieval of historical data.
 
-    for thread in threads:
-        thread.join()
+    Args:
+        tickers (list[str] | str): the tickers that were requested.
+        historical_data_dict (dict[str, pd.DataFrame]): the historical data of each ticker.
+        historical_data_error_dict (dict[str, pd.DataFrame]): the responses of tickers without data.
+        empty_historical_data (pd.DataFrame): the placeholder for tickers without data.
+        fmp_tickers (list[str]): the tickers that acquired data from FinancialModelingPrep.
+        yf_tickers (list[str]): the tickers that acquired data from YahooFinance.
+        no_data (list[str]): the tickers for which no data is available.
+        enforce_source (str | None): the enforced data source, if any.
+        fill_nan (bool): whether to interpolate NaN values.
+        rounding (int | None): the number of decimal places to round the data to.
+        show_ticker_seperation (bool): whether to show which source each ticker used.
+        show_errors (bool): whether to show errors.
+        user_subscription (str): the subscription type of the user.
 
+    Returns:
+        tuple[pd.DataFrame, list[str]]: the historical data and the tickers without data.
+    """
     if show_errors:
         error_model.check_for_error_messages(
             dataset_dictionary=historical_data_error_dict,
@@ -297,6 +541,282 @@ def get_historical_data(
     return pd.DataFrame(), no_data
 
 
+def update_historical_data(
+    historical_data: pd.DataFrame,
+    api_key: str | None = None,
+    enforce_source: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    return_column: str = "Adj Close",
+    risk_free_rate: pd.DataFrame = pd.DataFrame(),
+    include_dividends: bool = True,
+    progress_bar: bool = True,
+    fill_nan: bool = True,
+    divide_ohlc_by: int | float | None = None,
+    rounding: int | None = None,
+    sleep_timer: bool = True,
+    show_errors: bool = False,
+    user_subscription: str = "Free",
+    tolerance: float = 1e-4,
+) -> tuple[pd.DataFrame, list[str]]:
+    """
+    Updates previously collected daily historical data by only retrieving the dates after the last
+    available date of each ticker. The new dates are added to the existing data after which the
+    derived columns (Return, Excess Return and Cumulative Return) are calculated for the new dates
+    only while the volatility is recalculated over the entire period.
+
+    The last available date is retrieved again and compared with the existing data. If the price
+    differs or a dividend is paid after that date, the (adjusted) history has changed, e.g. due to
+    a stock split, and the entire history of that ticker is retrieved again.
+
+    Args:
+        historical_data (pd.DataFrame): The historical data as returned by get_historical_data with the
+            OHLC data as the first column level and the tickers as the second column level.
+        api_key (str, optional): The API key for FinancialModelingPrep. Defaults to None.
+        enforce_source (str, optional): The source to enforce. Defaults to None.
+        start (str, optional): A string representing the start date of the period in 'YYYY-MM-DD'
+            format. Defaults to None.
+        end (str, optional): A string representing the end date of the period in 'YYYY-MM-DD' format.
+            Defaults to None which means up to today.
+        return_column (str, optional): A string representing the column to use for return calculations.
+        risk_free_rate (pd.DataFrame, optional): The risk free rate used to calculate the excess return.
+        include_dividends (bool, optional): Whether to include dividends. Defaults to True.
+        progress_bar (bool, optional): Whether to show a progress bar. Defaults to True.
+        fill_nan (bool, optional): Whether to interpolate NaN values. Defaults to True.
+        divide_ohlc_by (int, optional): The value to divide the OHLC data by. Defaults to None.
+        rounding (int, optional): The number of decimal places to round the data to. Defaults to None.
+        sleep_timer (bool, optional): Whether to introduce a sleep timer to prevent rate limit errors.
+        show_errors (bool, optional): Whether to show errors. Defaults to False.
+        user_subscription (str, optional): The subscription type of the user. Defaults to "Free".
+        tolerance (float, optional): The relative difference in price on the last available date that
+            is allowed before the history of a ticker is considered changed. Defaults to 1e-4.
+
+    Returns:
+        tuple[pd.DataFrame, list[str]]: The updated historical data and the tickers for which no
+        data could be found.
+    """
+    end = end if end else pd.Timestamp.today().strftime("%Y-%m-%d")
+    tickers = list(historical_data.columns.get_level_values(1).unique())
+
+    ticker_data: dict[str, pd.DataFrame] = {}
+    last_dates: dict[pd.Period, list[str]] = {}
+    refresh_tickers: list[str] = []
+    no_data: list[str] = []
+
+    settings = {
+        "api_key": api_key,
+        "enforce_source": enforce_source,
+        "end": end,
+        "interval": "1d",
+        "return_column": return_column,
+        "risk_free_rate": risk_free_rate,
+        "include_dividends": include_dividends,
+        "progress_bar": progress_bar,
+        "fill_nan": fill_nan,
+        "divide_ohlc_by": divide_ohlc_by,
+        "sleep_timer": sleep_timer,
+        "show_ticker_seperation": False,
+        "show_errors": show_errors,
+        "user_subscription": user_subscription,
+    }
+
+    for ticker in tickers:
+        ticker_data[ticker] = historical_data.xs(ticker, level=1, axis=1)
+        close = ticker_data[ticker]["Close"]
+        available_dates = close.index[close.notna() & (close != 0)]
+
+        if available_dates.empty:
+            refresh_tickers.append(ticker)
+        elif available_dates[-1].strftime("%Y-%m-%d") < end:
+            last_dates.setdefault(available_dates[-1], []).append(ticker)
+
+    # Tickers with the same last available date are retrieved together
+    for last_date, last_date_tickers in last_dates.items():
+        # Only the missing dates are requested, without the additional year around the period
+        new_data, new_no_data = get_historical_data(
+            tickers=last_date_tickers,
+            start=last_date.strftime("%Y-%m-%d"),
+            tqdm_message="Updating historical data",
+            pad_period=False,
+            **settings,
+        )
+
+        for ticker in last_date_tickers:
+            if ticker in new_no_data or new_data.empty:
+                # The existing data is kept when no new data could be found
+                continue
+
+            new_ticker_data = new_data.xs(ticker, level=1, axis=1)
+            new_ticker_data = new_ticker_data[new_ticker_data["Close"].notna()]
+
+            if _is_history_changed(
+                historical_data=ticker_data[ticker],
+                new_data=new_ticker_data,
+                last_date=last_date,
+                return_column=return_column,
+                tolerance=tolerance,
+            ):
+                refresh_tickers.append(ticker)
+                continue
+
+            ticker_data[ticker] = _add_new_dates(
+                historical_data=ticker_data[ticker].loc[:last_date],
+                new_data=new_ticker_data.loc[new_ticker_data.index > last_date],
+                start=start,
+                end=end,
+                return_column=return_column,
+                risk_free_rate=risk_free_rate,
+            )
+
+    if refresh_tickers:
+        refreshed_data, no_data = get_historical_data(
+            tickers=refresh_tickers,
+            start=start,
+            tqdm_message="Refreshing historical data",
+            **settings,
+        )
+
+        for ticker in refresh_tickers:
+            if ticker not in no_data and not refreshed_data.empty:
+                ticker_data[ticker] = refreshed_data.xs(ticker, level=1, axis=1)
+
+    fields = list(
+        dict.fromkeys(field for data in ticker_data.values() for field in data.columns)
+    )
+
+    updated_data = (
+        pd.concat(ticker_data, axis=1)
+        .sort_index()
+        .swaplevel(0, 1, axis=1)
+        .reindex(columns=pd.MultiIndex.from_product([fields, tickers]))
+    )
+
+    if "Dividends" in updated_data.columns:
+        updated_data["Dividends"] = updated_data["Dividends"].fillna(0)
+
+    if fill_nan:
+        updated_data = updated_data.interpolate(limit_area="inside")
+
+    if rounding:
+        updated_data = updated_data.round(rounding)
+
+    return updated_data, no_data
+
+
+def _is_history_changed(
+    historical_data: pd.DataFrame,
+    new_data: pd.DataFrame,
+    last_date: pd.Period,
+    return_column: str,
+    tolerance: float,
+) -> bool:
+    """
+    Checks whether the history of a ticker has changed by comparing the prices on the last
+    available date and by checking for dividends after that date, which change the adjusted prices.
+
+    Args:
+        historical_data (pd.DataFrame): The existing historical data of the ticker.
+        new_data (pd.DataFrame): The newly retrieved historical data of the ticker.
+        last_date (pd.Period): The last available date of the existing data.
+        return_column (str): The column used for return calculations.
+        tolerance (float): The allowed relative difference in price.
+
+    Returns:
+        bool: Whether the history has changed.
+    """
+    if last_date not in new_data.index:
+        # Without an overlapping date, it is not possible to verify the history
+        return True
+
+    for column in dict.fromkeys(["Close", return_column]):
+        if not np.isclose(
+            new_data.loc[last_date, column],
+            historical_data.loc[last_date, column],
+            rtol=tolerance,
+            atol=0,
+        ):
+            return True
+
+    return bool(
+        "Dividends" in new_data.columns
+        and (new_data.loc[new_data.index > last_date, "Dividends"].fillna(0) != 0).any()
+    )
+
+
+def _add_new_dates(
+    historical_data: pd.DataFrame,
+    new_data: pd.DataFrame,
+    start: str | None,
+    end: str | None,
+    return_column: str,
+    risk_free_rate: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Adds new dates to the historical data of a single ticker and calculates the derived columns
+    for these dates. The volatility is recalculated over the entire period given that it
+    depends on all returns.
+
+    Args:
+        historical_data (pd.DataFrame): The existing historical data of the ticker.
+        new_data (pd.DataFrame): The historical data of the ticker for the new dates.
+        start (str | None): The start date of the period in 'YYYY-MM-DD' format.
+        end (str | None): The end date of the period in 'YYYY-MM-DD' format.
+        return_column (str): The column used for return calculations.
+        risk_free_rate (pd.DataFrame): The risk free rate used to calculate the excess return.
+
+    Returns:
+        pd.DataFrame: The historical data including the new dates.
+    """
+    if new_data.empty:
+        return historical_data
+
+    price_columns = [
+        column for column in new_data.columns if column not in DERIVED_COLUMNS
+    ]
+    combined_data = pd.concat([historical_data, new_data[price_columns]])
+    new_dates = new_data.index
+    previous_date = historical_data.index[-1]
+
+    prices = combined_data.loc[previous_date:, return_column].ffill()
+    combined_data.loc[new_dates, "Return"] = prices.pct_change().loc[new_dates]
+
+    if "Excess Return" in combined_data.columns and not risk_free_rate.empty:
+        combined_data.loc[new_dates, "Excess Return"] = (
+            combined_data.loc[new_dates, "Return"]
+            .sub(risk_free_rate["Adj Close"])
+            .reindex(new_dates)
+        )
+
+    period_dates = combined_data.loc[start:end].index
+    previous_cumulative_return = combined_data.loc[previous_date, "Cumulative Return"]
+
+    if previous_date in period_dates and not np.isnan(previous_cumulative_return):
+        new_period_dates = new_dates.intersection(period_dates)
+        combined_data.loc[new_period_dates, "Cumulative Return"] = (
+            previous_cumulative_return
+            * (1.0 + combined_data.loc[new_period_dates, "Return"]).cumprod()
+        )
+    else:
+        # The cumulative return of the new dates can't be continued, e.g. because the
+        # start date falls within the new dates, and is therefore calculated entirely
+        return helpers.enrich_historical_data(
+            historical_data=combined_data,
+            start=start,
+            end=end,
+            return_column=return_column,
+            risk_free_rate=risk_free_rate,
+        )
+
+    combined_data["Volatility"] = combined_data.loc[start:end, "Return"].std()
+
+    if "Excess Volatility" in combined_data.columns:
+        combined_data["Excess Volatility"] = combined_data.loc[
+            start:end, "Excess Return"
+        ].std()
+
+    return combined_data
+
+
 def convert_daily_to_other_period(
     period: str,
     daily_historical_data: pd.DataFrame,
@@ -479,27 +999,16 @@ def get_historical_statistics(
     else:
         raise ValueError(f"Type for the tickers ({type(tickers)}) variable is invalid.")
 
-    ticker_list_iterator = (
-        tqdm(ticker_list, desc=tqdm_message) if progress_bar else ticker_list
-    )
-
     historical_statistics_dict: dict[str, pd.DataFrame] = {}
     no_data: list[str] = []
-    threads = []
 
-    for ticker in ticker_list_iterator:
-        # Introduce a sleep timer to prevent rate limit errors
-        time.sleep(0.1)
-
-        thread = threading.Thread(
-            target=worker,
-            args=(ticker, historical_statistics_dict),
-        )
-        thread.start()
-        threads.append(thread)
-
-    for thread in threads:
-        thread.join()
+    fetch_model.run_workers(
+        worker,
+        ticker_list,
+        historical_statistics_dict,
+        progress_bar=progress_bar,
+        tqdm_message=tqdm_message,
+    )
 
     historical_statistics_dict = (
         error_model.check_for_error_messages(
@@ -4,7 +4,7 @@ __docformat__ = "google"
 
 import pandas as pd
 
-from financetoolkit.helpers import calculate_growth
+from financetoolkit.helpers import calculate_growth, handle_computation_cache
 from financetoolkit.models import (
     altman_model,
     dupont_model,
@@ -113,6 +113,10 @@ class Models:
         self._weighted_average_cost_of_capital_growth: pd.DataFrame = pd.DataFrame()
         self._intrinsic_values: pd.DataFrame = pd.DataFrame()
 
+        # Shared with the Ratios by the Toolkit so that results are calculated only once
+        self._computation_cache: dict | None = None
+
+    @handle_computation_cache
     @handle_errors
     def get_dupont_analysis(
         self,
@@ -214,6 +218,7 @@ class Models:
 
         return self._dupont_analysis_growth if growth else self._dupont_analysis
 
+    @handle_computation_cache
     @handle_errors
     def get_extended_dupont_analysis(
         self,
@@ -336,6 +341,7 @@ class Models:
             else self._extended_dupont_analysis
         )
 
+    @handle_computation_cache
     @handle_errors
     def get_enterprise_value_breakdown(
         self,
@@ -444,6 +450,7 @@ class Models:
             else self._enterprise_value_breakdown
         )
 
+    @handle_computation_cache
     @handle_errors
     def get_weighted_average_cost_of_capital(
         self,
@@ -605,6 +612,7 @@ class Models:
             ]
         )
 
+    @handle_computation_cache
     def get_intrinsic_valuation(
         self,
         growth_rate: float | list | dict[str, float],
@@ -772,6 +780,7 @@ class Models:
 
         return self._intrinsic_values
 
+    @handle_computation_cache
     def get_gorden_growth_model(
         self,
         rate_of_return: float,
@@ -876,6 +885,7 @@ class Models:
 
         return gorden_growth_model_df
 
+    @handle_computation_cache
     @handle_errors
     def get_altman_z_score(
         self,
@@ -1031,6 +1041,7 @@ class Models:
 
         return altman_results
 
+    @handle_computation_cache
     @handle_errors
     def get_piotroski_score(self) -> pd.DataFrame:
         """
@@ -1207,6 +1218,7 @@ class Models:
 
         return piotroski_results
 
+    @handle_computation_cache
     @handle_errors
     def get_present_value_of_growth_opportunities(
         self,
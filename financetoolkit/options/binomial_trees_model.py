@@ -52,6 +52,35 @@ def calculate_risk_neutral_probability(
     return risk_neutral_probability
 
 
+def get_movement_labels(period_length: int, show_unique_combinations: bool = True):
+    """
+    Creates the movement labels for each row of the binomial tree.
+
+    Args:
+        period_length (int): Period length.
+        show_unique_combinations (bool, optional): Whether to only label the unique
+        combinations. Defaults to True.
+
+    Returns:
+        tuple: The movement labels and the matrix of up movements (1) and down movements (0)
+        that belongs to each label, ordered from all up movements to all down movements.
+    """
+    if show_unique_combinations:
+        up_movements = np.arange(period_length, -1, -1)
+        movements = (
+            np.arange(period_length)[np.newaxis, :] < up_movements[:, np.newaxis]
+        ).astype(int)
+    else:
+        combinations = np.arange(2**period_length - 1, -1, -1)
+        movements = (
+            combinations[:, np.newaxis] >> np.arange(period_length - 1, -1, -1)
+        ) & 1
+
+    labels = ["".join("U" if x else "D" for x in movement) for movement in movements]
+
+    return labels, movements
+
+
 def calculate_stock_prices(
     stock_price: float,
     up_movement: float,
@@ -62,6 +91,10 @@ def calculate_stock_prices(
     """
     Calculates stock prices at each node.
 
+    When show_unique_combinations is True, only the path with the most up movements
+    first is kept for every number of up movements which results in period_length + 1
+    rows. Otherwise all 2^period_length paths are returned.
+
     Args:
         stock_price (float): Current stock price.
         up_movement (float): Up movement.
@@ -73,68 +106,61 @@ def calculate_stock_prices(
     Returns:
         pd.DataFrame: Stock prices at each node.
     """
-    combinations_dict: dict = {}
-    unique_combinations = set()
-
-    # Generate combinations of maximum period length
-    combination = [up_movement] * period_length
-
-    while combination.count(up_movement) > 0:
-        combination_key = "".join("U" if x == up_movement else "D" for x in combination)
-
-        # Check if combination_key is unique
-        if combination_key not in unique_combinations:
-            combinations_dict[combination_key] = []
-            value = stock_price
-
-            # Add the current stock price to Period 0
-            combinations_dict[combination_key].append(value)
-
-            for movement in combination:
-                value = value * movement
-                combinations_dict[combination_key].append(value)
-
-            unique_combinations.add(combination_key)
+    labels, movements = get_movement_labels(
+        period_length=period_length,
+        show_unique_combinations=show_unique_combinations,
+    )
 
-        # Generate next combination
-        for i in range(period_length - 1, -1, -1):
-            if combination[i] == up_movement:
-                combination[i] = down_movement
-                break
+    growth = np.where(movements == 1, up_movement, down_movement)
+    growth = np.hstack([np.full((len(labels), 1), stock_price), growth])
 
-            combination[i] = up_movement
+    combinations_df = pd.DataFrame(np.cumprod(growth, axis=1), index=labels)
 
-    combination_key = "".join("U" if x == up_movement else "D" for x in combination)
-    combinations_dict[combination_key] = []
-    value = stock_price
+    return combinations_df
 
-    combinations_dict[combination_key].append(value)
 
-    for movement in combination:
-        value = value * movement
-        combinations_dict[combination_key].append(value)
+def calculate_lattice_stock_prices(
+    stock_price: np.ndarray | float,
+    up_movement: np.ndarray | float,
+    down_movement: np.ndarray | float,
+    period_length: int,
+):
+    """
+    Calculates the stock prices of a recombining binomial lattice. The node at
+    row j and column i is the stock price after i time steps of which j are
+    down movements, the nodes where j > i do not exist and are set to NaN.
 
-    unique_combinations.add(combination_key)
+    All inputs are broadcasted against each other which makes it possible to
+    calculate the lattices of many stocks at once.
 
-    # Create a DataFrame from the Series
-    combinations_df = pd.DataFrame.from_dict(combinations_dict, orient="index")
+    Args:
+        stock_price (np.ndarray | float): Current stock price(s).
+        up_movement (np.ndarray | float): Up movement(s).
+        down_movement (np.ndarray | float): Down movement(s).
+        period_length (int): Period length.
 
-    if show_unique_combinations:
-        # Add a scoring system in a separate dictionary
-        scoring_system = {"U": 1, "D": -1}
-
-        scoring = pd.Series(
-            {
-                combination: sum(scoring_system[movement] for movement in combination)
-                for combination in combinations_df.index
-            }
+    Returns:
+        np.ndarray: Stock prices with the shape (*inputs, period_length + 1, period_length + 1).
+    """
+    stock_price, up_movement, down_movement = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (stock_price, up_movement, down_movement)
         )
+    )
 
-        unique_movements = scoring.drop_duplicates(keep="first")
+    steps = np.arange(period_length + 1)
+    down_count = steps[:, np.newaxis]
+    up_count = steps[np.newaxis, :] - down_count
 
-        combinations_df = combinations_df.loc[unique_movements.index]
+    with np.errstate(invalid="ignore", over="ignore"):
+        stock_prices = (
+            stock_price[..., np.newaxis, np.newaxis]
+            * up_movement[..., np.newaxis, np.newaxis] ** np.maximum(up_count, 0)
+            * down_movement[..., np.newaxis, np.newaxis] ** down_count
+        )
 
-    return combinations_df
+    return np.where(up_count >= 0, stock_prices, np.nan)
 
 
 def get_call_option_payoffs(stock_price: float, strike_price: float):
@@ -169,132 +195,311 @@ def get_put_option_payoffs(stock_price: float, strike_price: float):
     return put_option_payoff
 
 
-def calculate_option_value(
-    up_option_payoff: float,
-    down_option_payoff: float,
-    risk_free_rate: float,
-    time_to_expiration: int,
-    timestep: int | float,
-    risk_neutral_probability: float,
+def get_option_exercise_value(
+    stock_price: np.ndarray | float,
+    strike_price: np.ndarray | float,
+    put_option: bool = False,
 ):
     """
-    Calculates option values at each node.
+    Calculates the exercise value of an option for either a call or a put option.
 
     Args:
-    up_option_payoff (float): Option payoff in the up state
-    down_option_payoff (float): Option payoff in the down state
-    risk_free_rate (float): Risk-free interest rate
-    time_to_expiration (int): Time to expiration
-    timestep (int): Number of time steps
-    risk_neutral_probability (float): Risk-neutral probability
+        stock_price (np.ndarray | float): Stock price(s)
+        strike_price (np.ndarray | float): Option strike price(s)
+        put_option (bool, optional): Whether the option is a put option. Defaults to False.
 
     Returns:
-    float: Option value
+        np.ndarray | float: Option exercise value
     """
-    option_value = np.exp(-risk_free_rate * time_to_expiration / (timestep - 1)) * (
-        risk_neutral_probability * up_option_payoff
-        + (1 - risk_neutral_probability) * down_option_payoff
-    )
+    if put_option:
+        return get_put_option_payoffs(
+            stock_price=stock_price, strike_price=strike_price
+        )
 
-    return option_value
+    return get_call_option_payoffs(stock_price=stock_price, strike_price=strike_price)
 
 
-def get_option_payoffs(
-    stock_price: float,
-    strike_price: float,
-    years: int,
+def calculate_option_lattice(
+    stock_price: np.ndarray | float,
+    strike_price: np.ndarray | float,
+    years: np.ndarray | float,
     timesteps: int,
-    risk_free_rate: float,
-    volatility: float,
-    dividend_yield: float = 0,
+    risk_free_rate: np.ndarray | float,
+    volatility: np.ndarray | float,
+    dividend_yield: np.ndarray | float = 0,
     put_option: bool = False,
     american_option: bool = False,
     show_input_info: bool = False,
 ):
     """
-    Calculates the price of a European call option using the CRR binomial tree model.
+    Calculates the option value at every node of a recombining CRR binomial lattice. The
+    node at row j and column i is the option value after i time steps of which j are down
+    movements, the nodes where j > i do not exist and are set to NaN.
+
+    All inputs except for the timesteps are broadcasted against each other so that the
+    lattices of many tickers, strike prices and expiration times are calculated at once.
+    This takes O(timesteps²) operations per option.
 
     Args:
-        stock_price (float): Current stock price
-        strike_price (float): Option strike price
-        years (int): Time to expiration in years
+        stock_price (np.ndarray | float): Current stock price(s)
+        strike_price (np.ndarray | float): Option strike price(s)
+        years (np.ndarray | float): Time to expiration in years
         timesteps (int): Number of time steps
-        risk_free_rate (float): Risk-free interest rate
-        volatility (float): Volatility of the underlying stock
-        dividend_yield (float, optional): Dividend yield. Defaults to 0.
+        risk_free_rate (np.ndarray | float): Risk-free interest rate(s)
+        volatility (np.ndarray | float): Volatility of the underlying stock(s)
+        dividend_yield (np.ndarray | float, optional): Dividend yield(s). Defaults to 0.
         put_option (bool, optional): Whether the option is a put option. Defaults to False.
         american_option (bool, optional): Whether the option is an American option. Defaults to False.
-        show_input_info (bool, optional): Whether to show input info. Defaults to False.
+        show_input_info (bool, optional): Whether to also return the up movement, down movement
+        and risk neutral probability. Defaults to False.
 
     Returns:
-        pd.DataFrame: Option payoffs
+        np.ndarray: Option values with the shape (*inputs, timesteps + 1, timesteps + 1).
     """
+    (
+        stock_price,
+        strike_price,
+        years,
+        risk_free_rate,
+        volatility,
+        dividend_yield,
+    ) = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (
+                stock_price,
+                strike_price,
+                years,
+                risk_free_rate,
+                volatility,
+                dividend_yield,
+            )
+        )
+    )
+
+    time_delta = years / timesteps
+
     up_movement, down_movement = calculate_up_and_down_movements(
-        volatility=volatility, time_delta=years / timesteps
+        volatility=volatility, time_delta=time_delta
     )
 
     risk_neutral_probability = calculate_risk_neutral_probability(
         risk_free_rate=risk_free_rate,
         dividend_yield=dividend_yield,
-        timestep=years / timesteps,
+        timestep=time_delta,
         up_movement=up_movement,
         down_movement=down_movement,
     )
 
-    stock_prices = calculate_stock_prices(
+    stock_prices = calculate_lattice_stock_prices(
         stock_price=stock_price,
         up_movement=up_movement,
         down_movement=down_movement,
         period_length=timesteps,
     )
 
-    option_payoffs = pd.DataFrame(
-        np.nan, index=stock_prices.index, columns=stock_prices.columns
+    strike = strike_price[..., np.newaxis]
+    probability = risk_neutral_probability[..., np.newaxis]
+    discount = np.exp(-risk_free_rate * time_delta)[..., np.newaxis]
+
+    option_values = np.full(stock_prices.shape, np.nan)
+    option_values[..., :, timesteps] = get_option_exercise_value(
+        stock_price=stock_prices[..., :, timesteps],
+        strike_price=strike,
+        put_option=put_option,
     )
 
-    if put_option:
-        option_payoffs.iloc[:, -1] = [
-            get_put_option_payoffs(stock_price=stock_price, strike_price=strike_price)
-            for stock_price in stock_prices.iloc[:, -1]
-        ]
-    else:
-        option_payoffs.iloc[:, -1] = [
-            get_call_option_payoffs(stock_price=stock_price, strike_price=strike_price)
-            for stock_price in stock_prices.iloc[:, -1]
-        ]
-
-    periods = len(option_payoffs.columns)
-
-    # Calculate put option prices for earlier periods
-    for i in range(periods - 2, -1, -1):
-        option_value = calculate_option_value(
-            up_option_payoff=option_payoffs.iloc[:, i + 1].shift(-1),
-            down_option_payoff=option_payoffs.iloc[:, i + 1],
-            risk_free_rate=risk_free_rate,
-            time_to_expiration=years,
-            timestep=timesteps,
-            risk_neutral_probability=risk_neutral_probability,
+    for step in range(timesteps - 1, -1, -1):
+        next_values = option_values[..., : step + 2, step + 1]
+
+        option_value = discount * (
+            probability * next_values[..., :-1]
+            + (1 - probability) * next_values[..., 1:]
+        )
+
+        if american_option:
+            option_value = np.maximum(
+                option_value,
+                get_option_exercise_value(
+                    stock_price=stock_prices[..., : step + 1, step],
+                    strike_price=strike,
+                    put_option=put_option,
+                ),
+            )
+
+        option_values[..., : step + 1, step] = option_value
+
+    if show_input_info:
+        return option_values, up_movement, down_movement, risk_neutral_probability
+
+    return option_values
+
+
+def calculate_option_price(
+    stock_price: np.ndarray | float,
+    strike_price: np.ndarray | float,
+    years: np.ndarray | float,
+    timesteps: int,
+    risk_free_rate: np.ndarray | float,
+    volatility: np.ndarray | float,
+    dividend_yield: np.ndarray | float = 0,
+    put_option: bool = False,
+    american_option: bool = False,
+):
+    """
+    Calculates the option price with a recombining CRR binomial lattice. Only the current
+    layer of the lattice is kept in memory which makes it possible to price options with
+    a large number of time steps (e.g. 1,000) in O(timesteps²) operations and O(timesteps)
+    memory per option.
+
+    All inputs except for the timesteps are broadcasted against each other so that many
+    tickers, strike prices and expiration times are priced at once.
+
+    Args:
+        stock_price (np.ndarray | float): Current stock price(s)
+        strike_price (np.ndarray | float): Option strike price(s)
+        years (np.ndarray | float): Time to expiration in years
+        timesteps (int): Number of time steps
+        risk_free_rate (np.ndarray | float): Risk-free interest rate(s)
+        volatility (np.ndarray | float): Volatility of the underlying stock(s)
+        dividend_yield (np.ndarray | float, optional): Dividend yield(s). Defaults to 0.
+        put_option (bool, optional): Whether the option is a put option. Defaults to False.
+        american_option (bool, optional): Whether the option is an American option. Defaults to False.
+
+    Returns:
+        np.ndarray: Option prices with the broadcasted shape of the inputs.
+    """
+    (
+        stock_price,
+        strike_price,
+        years,
+        risk_free_rate,
+        volatility,
+        dividend_yield,
+    ) = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (
+                stock_price,
+                strike_price,
+                years,
+                risk_free_rate,
+                volatility,
+                dividend_yield,
+            )
+        )
+    )
+
+    time_delta = years / timesteps
+
+    up_movement, down_movement = calculate_up_and_down_movements(
+        volatility=volatility, time_delta=time_delta
+    )
+
+    risk_neutral_probability = calculate_risk_neutral_probability(
+        risk_free_rate=risk_free_rate,
+        dividend_yield=dividend_yield,
+        timestep=time_delta,
+        up_movement=up_movement,
+        down_movement=down_movement,
+    )
+
+    stock_price = stock_price[..., np.newaxis]
+    strike = strike_price[..., np.newaxis]
+    up_movement = up_movement[..., np.newaxis]
+    down_movement = down_movement[..., np.newaxis]
+    probability = risk_neutral_probability[..., np.newaxis]
+    discount = np.exp(-risk_free_rate * time_delta)[..., np.newaxis]
+
+    down_count = np.arange(timesteps + 1)
+    option_values = get_option_exercise_value(
+        stock_price=stock_price
+        * up_movement ** (timesteps - down_count)
+        * down_movement**down_count,
+        strike_price=strike,
+        put_option=put_option,
+    )
+
+    for step in range(timesteps - 1, -1, -1):
+        option_values = discount * (
+            probability * option_values[..., :-1]
+            + (1 - probability) * option_values[..., 1:]
         )
 
         if american_option:
-            if put_option:
-                exercise_value = [
-                    get_put_option_payoffs(
-                        stock_price=stock_price, strike_price=strike_price
-                    )
-                ]
-            else:
-                exercise_value = [
-                    get_call_option_payoffs(
-                        stock_price=stock_price, strike_price=strike_price
-                    )
-                ]
-
-            option_payoffs.iloc[:, i] = np.maximum(option_value, exercise_value)
-        else:
-            option_payoffs.iloc[:, i] = option_value
+            down_count = np.arange(step + 1)
+            option_values = np.maximum(
+                option_values,
+                get_option_exercise_value(
+                    stock_price=stock_price
+                    * up_movement ** (step - down_count)
+                    * down_movement**down_count,
+                    strike_price=strike,
+                    put_option=put_option,
+                ),
+            )
+
+    return option_values[..., 0]
+
+
+def get_option_payoffs(
+    stock_price: float,
+    strike_price: float,
+    years: int,
+    timesteps: int,
+    risk_free_rate: float,
+    volatility: float,
+    dividend_yield: float = 0,
+    put_option: bool = False,
+    american_option: bool = False,
+    show_input_info: bool = False,
+):
+    """
+    Calculates the price of a European or American option using the CRR binomial tree model.
+
+    Args:
+        stock_price (float): Current stock price
+        strike_price (float): Option strike price
+        years (int): Time to expiration in years
+        timesteps (int): Number of time steps
+        risk_free_rate (float): Risk-free interest rate
+        volatility (float): Volatility of the underlying stock
+        dividend_yield (float, optional): Dividend yield. Defaults to 0.
+        put_option (bool, optional): Whether the option is a put option. Defaults to False.
+        american_option (bool, optional): Whether the option is an American option. Defaults to False.
+        show_input_info (bool, optional): Whether to show input info. Defaults to False.
+
+    Returns:
+        pd.DataFrame: Option payoffs
+    """
+    (
+        option_values,
+        up_movement,
+        down_movement,
+        risk_neutral_probability,
+    ) = calculate_option_lattice(
+        stock_price=stock_price,
+        strike_price=strike_price,
+        years=years,
+        timesteps=timesteps,
+        risk_free_rate=risk_free_rate,
+        volatility=volatility,
+        dividend_yield=dividend_yield,
+        put_option=put_option,
+        american_option=american_option,
+        show_input_info=True,
+    )
+
+    labels, _ = get_movement_labels(period_length=timesteps)
+
+    option_payoffs = pd.DataFrame(option_values, index=labels)
 
     if show_input_info:
-        return option_payoffs, up_movement, down_movement, risk_neutral_probability
+        return (
+            option_payoffs,
+            float(up_movement),
+            float(down_movement),
+            float(risk_neutral_probability),
+        )
 
     return option_payoffs
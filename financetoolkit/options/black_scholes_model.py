@@ -97,3 +97,187 @@ def get_black_scholes(
     return stock_price * np.exp(-dividend_yield * time_to_expiration) * norm.cdf(
         d1
     ) - strike_price * np.exp(-risk_free_rate * time_to_expiration) * norm.cdf(d2)
+
+
+def get_implied_volatility(
+    option_price: float | np.ndarray,
+    stock_price: float | np.ndarray,
+    strike_price: float | np.ndarray,
+    risk_free_rate: float | np.ndarray,
+    time_to_expiration: float | np.ndarray,
+    dividend_yield: float | np.ndarray = 0,
+    put_option: bool = False,
+    initial_volatility: float | np.ndarray | None = None,
+    lower_bound: float = 1e-4,
+    upper_bound: float = 5.0,
+    tolerance: float = 1e-8,
+    max_iterations: int = 100,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the Implied Volatility of many options at once by inverting get_black_scholes with a
+    vectorized, safeguarded Newton iteration. All inputs are broadcasted against each other so that
+    an entire option chain (or surface) is solved in one go.
+
+    The iteration starts from the Corrado-Miller approximation (or the initial volatility if provided)
+    and uses the derivative of the option price with respect to the volatility (vega). Every option
+    keeps a bracket around its solution and whenever a Newton step would leave that bracket, a
+    bisection step is taken instead which guarantees convergence for all options that can be solved.
+    Option prices outside of the range of prices the model can produce between the lower and upper
+    bound (e.g. at or below the intrinsic value) have no (unique) solution and are returned as NaN.
+
+    Args:
+        option_price (float or np.ndarray): The market price of the option.
+        stock_price (float or np.ndarray): The current stock price.
+        strike_price (float or np.ndarray): The option's strike price.
+        risk_free_rate (float or np.ndarray): The risk-free interest rate.
+        time_to_expiration (float or np.ndarray): The time to expiration of the option in years.
+        dividend_yield (float or np.ndarray): The dividend yield of the stock. Defaults to 0.
+        put_option (bool): Whether the option is a put option or not. Defaults to False.
+        initial_volatility (float or np.ndarray, optional): The volatility to start the iteration from.
+            Defaults to None which means the Corrado-Miller approximation is used.
+        lower_bound (float): The lowest volatility that is considered. Defaults to 1e-4.
+        upper_bound (float): The highest volatility that is considered. Defaults to 5 (500%).
+        tolerance (float): The maximum absolute difference between the model and the market price
+            for an option to be considered converged. Defaults to 1e-8.
+        max_iterations (int): The maximum number of iterations. Defaults to 100.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The implied volatility and whether the iteration converged
+        for each option.
+    """
+    (
+        option_price,
+        stock_price,
+        strike_price,
+        risk_free_rate,
+        time_to_expiration,
+        dividend_yield,
+    ) = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (
+                option_price,
+                stock_price,
+                strike_price,
+                risk_free_rate,
+                time_to_expiration,
+                dividend_yield,
+            )
+        )
+    )
+
+    def get_price_and_vega(volatility: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        d1 = get_d1(
+            stock_price, strike_price, risk_free_rate, volatility, time_to_expiration
+        )
+        d2 = get_d2(d1, volatility, time_to_expiration)
+
+        price = get_black_scholes(
+            stock_price=stock_price,
+            strike_price=strike_price,
+            risk_free_rate=risk_free_rate,
+            volatility=volatility,
+            time_to_expiration=time_to_expiration,
+            dividend_yield=dividend_yield,
+            put_option=put_option,
+        )
+
+        # The derivative of get_black_scholes with respect to the volatility, which is the
+        # same for calls and puts given that d1 and d2 depend on the volatility only
+        vega = (
+            strike_price
+            * np.exp(-risk_free_rate * time_to_expiration)
+            * norm.pdf(d2)
+            * d1
+            - stock_price
+            * np.exp(-dividend_yield * time_to_expiration)
+            * norm.pdf(d1)
+            * d2
+        ) / volatility
+
+        return price, vega
+
+    lower_volatility = np.full(option_price.shape, lower_bound)
+    upper_volatility = np.full(option_price.shape, upper_bound)
+
+    lower_price, _ = get_price_and_vega(lower_volatility)
+    upper_price, _ = get_price_and_vega(upper_volatility)
+
+    # Only prices in between the lowest and highest possible model price can be solved. Prices
+    # that (nearly) equal these, e.g. deep in the money options close to expiration that trade
+    # at their intrinsic value, do not depend on the volatility and thus have no unique solution
+    solvable = (lower_price + tolerance < option_price) & (
+        option_price < upper_price - tolerance
+    )
+
+    if initial_volatility is None:
+        discounted_stock_price = stock_price * np.exp(
+            -dividend_yield * time_to_expiration
+        )
+        discounted_strike_price = strike_price * np.exp(
+            -risk_free_rate * time_to_expiration
+        )
+
+        # The Corrado-Miller approximation is defined for calls, puts are converted
+        # through the Put-Call Parity
+        call_price = (
+            option_price + discounted_stock_price - discounted_strike_price
+            if put_option
+            else option_price
+        )
+        moneyness = discounted_stock_price - discounted_strike_price
+        adjusted_price = call_price - moneyness / 2
+
+        volatility = (
+            np.sqrt(2 * np.pi / time_to_expiration)
+            / (discounted_stock_price + discounted_strike_price)
+            * (
+                adjusted_price
+                + np.sqrt(np.maximum(adjusted_price**2 - moneyness**2 / np.pi, 0))
+            )
+        )
+    else:
+        volatility = np.broadcast_to(
+            np.asarray(initial_volatility, dtype=float), option_price.shape
+        ).copy()
+
+    volatility = np.where(
+        np.isfinite(volatility), volatility, (lower_bound + upper_bound) / 2
+    )
+    volatility = np.clip(volatility, lower_bound, upper_bound)
+
+    converged = np.zeros(option_price.shape, dtype=bool)
+
+    for _ in range(max_iterations):
+        price, vega = get_price_and_vega(volatility)
+        difference = price - option_price
+
+        converged = solvable & (np.abs(difference) <= tolerance)
+
+        if (converged | ~solvable).all():
+            break
+
+        # The option price increases with the volatility which narrows down the bracket
+        upper_volatility = np.where(difference > 0, volatility, upper_volatility)
+        lower_volatility = np.where(difference < 0, volatility, lower_volatility)
+
+        newton_volatility = volatility - difference / vega
+
+        # A bisection step is taken when the Newton step leaves the bracket
+        use_bisection = (
+            ~np.isfinite(newton_volatility)
+            | (newton_volatility <= lower_volatility)
+            | (newton_volatility >= upper_volatility)
+        )
+
+        volatility = np.where(
+            converged,
+            volatility,
+            np.where(
+                use_bisection,
+                (lower_volatility + upper_volatility) / 2,
+                newton_volatility,
+            ),
+        )
+
+    return np.where(solvable, volatility, np.nan), converged
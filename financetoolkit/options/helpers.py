@@ -2,6 +2,7 @@
 
 __docformat__ = "google"
 
+import numpy as np
 import pandas as pd
 
 from financetoolkit.utilities import logger_model
@@ -107,6 +108,36 @@ def create_greek_dataframe(
     return greek_dataframe
 
 
+def create_option_surface_dataframe(
+    option_values: np.ndarray,
+    option_keys: list[tuple[str, float]],
+    start_date: str,
+):
+    """
+    Creates the DataFrame that correctly displays the option values (e.g. the greeks) for each ticker
+    and strike price over time (the time of expiration) from a two-dimensional array.
+
+    Args:
+        option_values (np.ndarray): the values with the options as rows and the days to expiration,
+        starting at the start date, as columns.
+        option_keys (list[tuple[str, float]]): the ticker and strike price of each row.
+        start_date (str): the start date that should be excluded out of the DataFrame.
+
+    Returns:
+        pd.DataFrame: the DataFrame that correctly displays the option values for each ticker
+        and strike price.
+    """
+    option_surface_dataframe = pd.DataFrame(
+        option_values,
+        index=pd.MultiIndex.from_tuples(option_keys, names=["Ticker", "Strike Price"]),
+        columns=pd.period_range(
+            start=start_date, periods=option_values.shape[1], freq="D"
+        ),
+    )
+
+    return option_surface_dataframe.drop(start_date, axis=1)
+
+
 def create_binomial_tree_dataframe(
     binomial_tree_dictionary: dict[str, dict[float, pd.DataFrame]],
     start_date: pd.PeriodIndex,
@@ -195,6 +226,53 @@ def create_stock_simulation_dataframe(
     return stock_simulation_dataframe
 
 
+def create_monte_carlo_dataframe(
+    simulation_values: np.ndarray,
+    tickers: list[str],
+    row_labels: list,
+    row_name: str,
+    start_date: pd.PeriodIndex,
+    time_to_expiration: int,
+):
+    """
+    Creates the DataFrame that displays the Monte Carlo simulation (either the paths or the statistics
+    of the paths) for each ticker over time (the time of expiration).
+
+    Args:
+        simulation_values (np.ndarray): the simulated values with the shape (tickers, rows, timesteps + 1).
+        tickers (list[str]): the tickers that belong to the first axis.
+        row_labels (list): the labels that belong to the second axis, e.g. the path numbers.
+        row_name (str): the name of the second index level, e.g. "Path".
+        start_date (str): the start date which is the first column of the DataFrame.
+        time_to_expiration (int): the number of years the simulation spans.
+
+    Returns:
+        pd.DataFrame: the DataFrame with the tickers and row labels as the index and the
+        dates as the columns.
+    """
+    start_date_string = pd.to_datetime(str(start_date))
+    end_date_string = pd.to_datetime(
+        str(start_date_string + pd.Timedelta(days=time_to_expiration * 365))
+    )
+
+    monte_carlo_dataframe = pd.DataFrame(
+        simulation_values.reshape(-1, simulation_values.shape[-1]),
+        index=pd.MultiIndex.from_product(
+            [tickers, row_labels], names=["Ticker", row_name]
+        ),
+        columns=pd.PeriodIndex(
+            pd.date_range(
+                start=start_date_string,
+                end=end_date_string,
+                periods=simulation_values.shape[-1],
+            ),
+            freq="D",
+        ),
+    )
+
+    return monte_carlo_dataframe
+
+
 def show_input_info(
     start_date: str,
     end_date: str,
@@ -0,0 +1,683 @@
+"""Monte Carlo Model"""
+
+__docformat__ = "google"
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# pylint: disable=too-many-arguments,too-many-locals
+
+
+def get_chunks(paths: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split the paths into chunks of at most chunk_size paths. Each chunk is simulated with its own
+    random generator which keeps the memory usage bounded by the chunk size and makes the result
+    independent of the number of workers.
+
+    Args:
+        paths (int): The total number of paths.
+        chunk_size (int): The maximum number of paths per chunk.
+
+    Returns:
+        list[tuple[int, int]]: The start and end (exclusive) of each chunk.
+    """
+    if paths <= 0 or chunk_size <= 0:
+        raise ValueError("The number of paths and the chunk size must be positive.")
+
+    return [
+        (start, min(start + chunk_size, paths)) for start in range(0, paths, chunk_size)
+    ]
+
+
+def get_cholesky_decomposition(correlation: np.ndarray) -> np.ndarray:
+    """
+    Calculate the lower triangular Cholesky decomposition of a correlation matrix which is used to
+    correlate independent standard normal draws. Correlation matrices estimated from data with gaps
+    can be slightly indefinite, in which case the negative eigenvalues are set to zero first.
+
+    Args:
+        correlation (np.ndarray): The correlation matrix of the tickers.
+
+    Returns:
+        np.ndarray: The lower triangular matrix L for which L @ L.T equals the correlation matrix.
+    """
+    correlation = np.asarray(correlation, dtype=float)
+
+    try:
+        return np.linalg.cholesky(correlation)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+        nearest_correlation = (
+            eigenvectors @ np.diag(np.maximum(eigenvalues, 1e-12)) @ eigenvectors.T
+        )
+        scale = np.sqrt(np.diag(nearest_correlation))
+
+        return np.linalg.cholesky(nearest_correlation / np.outer(scale, scale))
+
+
+def simulate_log_returns(
+    generator: np.random.Generator,
+    paths: int,
+    timesteps: int,
+    drift: np.ndarray,
+    diffusion: np.ndarray,
+    cholesky: np.ndarray | None = None,
+    antithetic_variates: bool = False,
+    jump_probability: float = 0,
+    jump_mean: float = 0,
+    jump_volatility: float = 0,
+) -> np.ndarray:
+    """
+    Simulate the log returns of the tickers for a number of paths and time steps.
+
+    With antithetic variates, the second half of the paths uses the negated normal draws of the
+    first half so that path i and path i + paths // 2 form a pair.
+
+    Args:
+        generator (np.random.Generator): The random generator to use.
+        paths (int): The number of paths.
+        timesteps (int): The number of time steps.
+        drift (np.ndarray): The drift per time step of each ticker.
+        diffusion (np.ndarray): The volatility per time step of each ticker.
+        cholesky (np.ndarray | None, optional): The Cholesky decomposition of the correlation matrix.
+            Defaults to None which means the tickers are independent.
+        antithetic_variates (bool, optional): Whether to use antithetic variates. Defaults to False.
+        jump_probability (float, optional): The expected number of jumps per time step. Defaults to 0.
+        jump_mean (float, optional): The mean of the log jump size. Defaults to 0.
+        jump_volatility (float, optional): The volatility of the log jump size. Defaults to 0.
+
+    Returns:
+        np.ndarray: The log returns with the shape (paths, timesteps, tickers).
+    """
+    shape = (paths, timesteps, len(drift))
+
+    if antithetic_variates:
+        normal_draws = generator.standard_normal(((paths + 1) // 2, *shape[1:]))
+        normal_draws = np.concatenate([normal_draws, -normal_draws])[:paths]
+    else:
+        normal_draws = generator.standard_normal(shape)
+
+    if cholesky is not None:
+        normal_draws = normal_draws @ cholesky.T
+
+    log_returns = drift + diffusion * normal_draws
+
+    if jump_probability > 0:
+        jumps = generator.poisson(jump_probability, shape)
+        log_returns += jumps * jump_mean + np.sqrt(
+            jumps
+        ) * jump_volatility * generator.standard_normal(shape)
+
+    return log_returns
+
+
+def get_drift_and_diffusion(
+    volatility: np.ndarray,
+    risk_free_rate: float,
+    time_delta: float,
+    dividend_yield: np.ndarray | float = 0,
+    jump_intensity: float = 0,
+    jump_mean: float = 0,
+    jump_volatility: float = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the risk neutral drift and the diffusion per time step of a (jump) Geometric
+    Brownian Motion. The drift is compensated for the expected jumps so that the discounted stock
+    price remains a martingale.
+
+    The formulas are as follows:
+
+    - k = e^(μJ + σJ^2 / 2) — 1
+    - drift = (r — q — λ * k — σ^2 / 2) * dt
+    - diffusion = σ * sqrt(dt)
+
+    Where r is the risk free rate, q is the dividend yield, σ is the volatility, λ is the jump
+    intensity, μJ and σJ are the mean and volatility of the log jump size and dt is the time delta.
+
+    Args:
+        volatility (np.ndarray): The annual volatility of each ticker.
+        risk_free_rate (float): The annual risk free rate.
+        time_delta (float): The length of a time step in years.
+        dividend_yield (np.ndarray | float, optional): The dividend yield of each ticker. Defaults to 0.
+        jump_intensity (float, optional): The expected number of jumps per year. Defaults to 0.
+        jump_mean (float, optional): The mean of the log jump size. Defaults to 0.
+        jump_volatility (float, optional): The volatility of the log jump size. Defaults to 0.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The drift and the diffusion per time step.
+    """
+    volatility = np.asarray(volatility, dtype=float)
+    jump_compensation = jump_intensity * (
+        np.exp(jump_mean + jump_volatility**2 / 2) - 1
+    )
+
+    drift = (
+        risk_free_rate
+        - np.asarray(dividend_yield, dtype=float)
+        - jump_compensation
+        - volatility**2 / 2
+    ) * time_delta
+    diffusion = volatility * np.sqrt(time_delta)
+
+    return np.broadcast_to(drift, volatility.shape), diffusion
+
+
+def _simulate_paths(
+    generator: np.random.Generator,
+    paths: int,
+    timesteps: int,
+    stock_price: np.ndarray,
+    drift: np.ndarray,
+    diffusion: np.ndarray,
+    cholesky: np.ndarray | None,
+    antithetic_variates: bool,
+    jump_probability: float,
+    jump_mean: float,
+    jump_volatility: float,
+) -> np.ndarray:
+    """
+    Simulate the stock prices of a single chunk of paths, see simulate_stock_prices.
+
+    Returns:
+        np.ndarray: The stock prices with the shape (paths, timesteps + 1, tickers).
+    """
+    log_returns = simulate_log_returns(
+        generator=generator,
+        paths=paths,
+        timesteps=timesteps,
+        drift=drift,
+        diffusion=diffusion,
+        cholesky=cholesky,
+        antithetic_variates=antithetic_variates,
+        jump_probability=jump_probability,
+        jump_mean=jump_mean,
+        jump_volatility=jump_volatility,
+    )
+
+    return stock_price * np.exp(
+        np.concatenate(
+            [np.zeros((paths, 1, len(stock_price))), np.cumsum(log_returns, axis=1)],
+            axis=1,
+        )
+    )
+
+
+def _get_path_arguments(
+    stock_price: np.ndarray | float,
+    volatility: np.ndarray | float,
+    risk_free_rate: float,
+    time_to_expiration: float,
+    timesteps: int,
+    dividend_yield: np.ndarray | float,
+    correlation: np.ndarray | None,
+    jump_intensity: float,
+    jump_mean: float,
+    jump_volatility: float,
+    antithetic_variates: bool,
+) -> dict:
+    """
+    Collect the arguments of _simulate_paths that are shared by all chunks.
+
+    Returns:
+        dict: The keyword arguments for _simulate_paths, except the generator and the paths.
+    """
+    stock_price = np.atleast_1d(np.asarray(stock_price, dtype=float))
+    volatility = np.broadcast_to(np.asarray(volatility, dtype=float), stock_price.shape)
+
+    drift, diffusion = get_drift_and_diffusion(
+        volatility=volatility,
+        risk_free_rate=risk_free_rate,
+        time_delta=time_to_expiration / timesteps,
+        dividend_yield=dividend_yield,
+        jump_intensity=jump_intensity,
+        jump_mean=jump_mean,
+        jump_volatility=jump_volatility,
+    )
+
+    return {
+        "timesteps": timesteps,
+        "stock_price": stock_price,
+        "drift": drift,
+        "diffusion": diffusion,
+        "cholesky": (
+            get_cholesky_decomposition(correlation) if correlation is not None else None
+        ),
+        "antithetic_variates": antithetic_variates,
+        "jump_probability": jump_intensity * time_to_expiration / timesteps,
+        "jump_mean": jump_mean,
+        "jump_volatility": jump_volatility,
+    }
+
+
+def _run_chunks(
+    chunk_function: Callable[[np.random.Generator, int, int], object],
+    paths: int,
+    chunk_size: int,
+    seed: int | None,
+    workers: int | None,
+) -> list:
+    """
+    Run the chunk function for every chunk, each with its own random generator that is derived
+    from the seed. NumPy releases the GIL while drawing random numbers and while evaluating
+    the array operations, so the chunks are simulated in parallel by a pool of threads.
+
+    Args:
+        chunk_function (Callable): The function that is called with the random generator and the
+            start and end of the chunk.
+        paths (int): The total number of paths.
+        chunk_size (int): The maximum number of paths per chunk.
+        seed (int | None): The seed of the random generators.
+        workers (int | None): The number of threads. Defaults to None which means the chunks are
+            simulated one after the other.
+
+    Returns:
+        list: The results of the chunk function in the order of the chunks.
+    """
+    chunks = get_chunks(paths=paths, chunk_size=chunk_size)
+    generators = [
+        np.random.default_rng(child_seed)
+        for child_seed in np.random.SeedSequence(seed).spawn(len(chunks))
+    ]
+
+    if workers is None or workers <= 1 or len(chunks) == 1:
+        return [
+            chunk_function(generator, start, end)
+            for generator, (start, end) in zip(generators, chunks)
+        ]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                lambda arguments: chunk_function(arguments[0], *arguments[1]),
+                zip(generators, chunks),
+            )
+        )
+
+
+def simulate_stock_prices(
+    stock_price: np.ndarray | float,
+    volatility: np.ndarray | float,
+    risk_free_rate: float,
+    time_to_expiration: float,
+    timesteps: int,
+    paths: int,
+    dividend_yield: np.ndarray | float = 0,
+    correlation: np.ndarray | None = None,
+    jump_intensity: float = 0,
+    jump_mean: float = 0,
+    jump_volatility: float = 0,
+    antithetic_variates: bool = False,
+    seed: int | None = None,
+    chunk_size: int = 10_000,
+    workers: int | None = None,
+    memory_map_location: str | None = None,
+) -> np.ndarray:
+    """
+    Simulate stock price paths of one or more tickers with a (jump) Geometric Brownian Motion under
+    the risk neutral measure. The paths are generated in chunks of at most chunk_size paths, each
+    with its own random generator derived from the seed, which means the result only depends on the
+    seed and the chunk size and not on the number of workers.
+
+    The formulas are as follows:
+
+    - S(t + dt) = S(t) * e^(drift + diffusion * Z + J)
+
+    Where Z are (correlated) standard normal draws and J is the sum of the log jump sizes within
+    the time step (see get_drift_and_diffusion).
+
+    Args:
+        stock_price (np.ndarray | float): The current stock price of each ticker.
+        volatility (np.ndarray | float): The annual volatility of each ticker.
+        risk_free_rate (float): The annual risk free rate.
+        time_to_expiration (float): The simulated period in years.
+        timesteps (int): The number of time steps.
+        paths (int): The number of paths.
+        dividend_yield (np.ndarray | float, optional): The dividend yield of each ticker. Defaults to 0.
+        correlation (np.ndarray | None, optional): The correlation matrix of the returns of the tickers.
+            Defaults to None which means the tickers are independent.
+        jump_intensity (float, optional): The expected number of jumps per year. Defaults to 0.
+        jump_mean (float, optional): The mean of the log jump size. Defaults to 0.
+        jump_volatility (float, optional): The volatility of the log jump size. Defaults to 0.
+        antithetic_variates (bool, optional): Whether to use antithetic variates. Defaults to False.
+        seed (int | None, optional): The seed of the random generators. Defaults to None.
+        chunk_size (int, optional): The maximum number of paths simulated at once. Defaults to 10,000.
+        workers (int | None, optional): The number of threads to simulate the chunks with. Defaults to None
+            which means the chunks are simulated one after the other.
+        memory_map_location (str | None, optional): The location of a .npy file to write the paths to.
+            Defaults to None which means the paths are kept in memory.
+
+    Returns:
+        np.ndarray: The stock prices with the shape (paths, timesteps + 1, tickers) where the first
+        time step is the current stock price. This is a np.memmap if memory_map_location is provided.
+    """
+    path_arguments = _get_path_arguments(
+        stock_price=stock_price,
+        volatility=volatility,
+        risk_free_rate=risk_free_rate,
+        time_to_expiration=time_to_expiration,
+        timesteps=timesteps,
+        dividend_yield=dividend_yield,
+        correlation=correlation,
+        jump_intensity=jump_intensity,
+        jump_mean=jump_mean,
+        jump_volatility=jump_volatility,
+        antithetic_variates=antithetic_variates,
+    )
+
+    shape = (paths, timesteps + 1, len(path_arguments["stock_price"]))
+    stock_prices = (
+        np.lib.format.open_memmap(
+            memory_map_location, mode="w+", dtype=float, shape=shape
+        )
+        if memory_map_location
+        else np.empty(shape)
+    )
+
+    def simulate_chunk(generator: np.random.Generator, start: int, end: int):
+        stock_prices[start:end] = _simulate_paths(
+            generator=generator, paths=end - start, **path_arguments
+        )
+
+    _run_chunks(
+        chunk_function=simulate_chunk,
+        paths=paths,
+        chunk_size=chunk_size,
+        seed=seed,
+        workers=workers,
+    )
+
+    if isinstance(stock_prices, np.memmap):
+        stock_prices.flush()
+
+    return stock_prices
+
+
+def _combine_moments(
+    first: tuple[int, np.ndarray, np.ndarray],
+    second: tuple[int, np.ndarray, np.ndarray],
+) -> tuple[int, np.ndarray, np.ndarray]:
+    """
+    Combine the count, mean and sum of squared deviations of two groups of observations
+    (Chan et al.) which is numerically stable, unlike summing the squares.
+
+    Args:
+        first (tuple[int, np.ndarray, np.ndarray]): The count, mean and sum of squared deviations.
+        second (tuple[int, np.ndarray, np.ndarray]): The count, mean and sum of squared deviations.
+
+    Returns:
+        tuple[int, np.ndarray, np.ndarray]: The count, mean and sum of squared deviations of both.
+    """
+    first_count, first_mean, first_deviations = first
+    second_count, second_mean, second_deviations = second
+
+    count = first_count + second_count
+    difference = second_mean - first_mean
+
+    return (
+        count,
+        first_mean + difference * second_count / count,
+        first_deviations
+        + second_deviations
+        + difference**2 * first_count * second_count / count,
+    )
+
+
+def get_simulation_statistics(
+    stock_price: np.ndarray | float,
+    volatility: np.ndarray | float,
+    risk_free_rate: float,
+    time_to_expiration: float,
+    timesteps: int,
+    paths: int,
+    dividend_yield: np.ndarray | float = 0,
+    correlation: np.ndarray | None = None,
+    jump_intensity: float = 0,
+    jump_mean: float = 0,
+    jump_volatility: float = 0,
+    antithetic_variates: bool = False,
+    seed: int | None = None,
+    chunk_size: int = 10_000,
+    workers: int | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate the mean, standard deviation, minimum and maximum of the simulated stock prices at
+    each time step without keeping all paths in memory. The paths are simulated exactly as in
+    simulate_stock_prices (and thus result in the same statistics for the same seed) after which
+    the statistics of each chunk are combined.
+
+    Args:
+        stock_price (np.ndarray | float): The current stock price of each ticker.
+        volatility (np.ndarray | float): The annual volatility of each ticker.
+        risk_free_rate (float): The annual risk free rate.
+        time_to_expiration (float): The simulated period in years.
+        timesteps (int): The number of time steps.
+        paths (int): The number of paths.
+        dividend_yield (np.ndarray | float, optional): The dividend yield of each ticker. Defaults to 0.
+        correlation (np.ndarray | None, optional): The correlation matrix of the returns of the tickers.
+            Defaults to None which means the tickers are independent.
+        jump_intensity (float, optional): The expected number of jumps per year. Defaults to 0.
+        jump_mean (float, optional): The mean of the log jump size. Defaults to 0.
+        jump_volatility (float, optional): The volatility of the log jump size. Defaults to 0.
+        antithetic_variates (bool, optional): Whether to use antithetic variates. Defaults to False.
+        seed (int | None, optional): The seed of the random generators. Defaults to None.
+        chunk_size (int, optional): The maximum number of paths simulated at once. Defaults to 10,000.
+        workers (int | None, optional): The number of threads to simulate the chunks with. Defaults to None.
+
+    Returns:
+        dict[str, np.ndarray]: The Mean, Standard Deviation, Minimum and Maximum, each with the shape
+        (timesteps + 1, tickers).
+    """
+
+    path_arguments = _get_path_arguments(
+        stock_price=stock_price,
+        volatility=volatility,
+        risk_free_rate=risk_free_rate,
+        time_to_expiration=time_to_expiration,
+        timesteps=timesteps,
+        dividend_yield=dividend_yield,
+        correlation=correlation,
+        jump_intensity=jump_intensity,
+        jump_mean=jump_mean,
+        jump_volatility=jump_volatility,
+        antithetic_variates=antithetic_variates,
+    )
+
+    def summarize_chunk(generator: np.random.Generator, start: int, end: int):
+        stock_prices = _simulate_paths(
+            generator=generator, paths=end - start, **path_arguments
+        )
+        mean = stock_prices.mean(axis=0)
+
+        return (
+            (end - start, mean, ((stock_prices - mean) ** 2).sum(axis=0)),
+            stock_prices.min(axis=0),
+            stock_prices.max(axis=0),
+        )
+
+    summaries = _run_chunks(
+        chunk_function=summarize_chunk,
+        paths=paths,
+        chunk_size=chunk_size,
+        seed=seed,
+        workers=workers,
+    )
+
+    moments, minimum, maximum = summaries[0]
+
+    for chunk_moments, chunk_minimum, chunk_maximum in summaries[1:]:
+        moments = _combine_moments(moments, chunk_moments)
+        minimum = np.minimum(minimum, chunk_minimum)
+        maximum = np.maximum(maximum, chunk_maximum)
+
+    count, mean, squared_deviations = moments
+
+    return {
+        "Mean": mean,
+        "Standard Deviation": np.sqrt(squared_deviations / max(count - 1, 1)),
+        "Minimum": minimum,
+        "Maximum": maximum,
+    }
+
+
+def calculate_option_price(
+    stock_price: np.ndarray | float,
+    strike_price: np.ndarray | float,
+    volatility: np.ndarray | float,
+    risk_free_rate: float,
+    time_to_expiration: float,
+    paths: int,
+    timesteps: int = 1,
+    dividend_yield: np.ndarray | float = 0,
+    put_option: bool = False,
+    payoff_function: Callable[[np.ndarray], np.ndarray] | None = None,
+    jump_intensity: float = 0,
+    jump_mean: float = 0,
+    jump_volatility: float = 0,
+    antithetic_variates: bool = False,
+    control_variate: bool = False,
+    seed: int | None = None,
+    chunk_size: int = 10_000,
+    workers: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the price of an option on each ticker by simulating stock price paths and discounting
+    the average payoff. By default the payoff is that of a European call or put on the final stock
+    price, any (path dependent) payoff can be used by providing a payoff function.
+
+    Two variance reduction techniques are available:
+
+    - Antithetic variates: each path is paired with its mirrored path and the average payoff of
+    both paths is used as a single observation.
+    - Control variate: the discounted final stock price, of which the expected value equals
+    S * e^(—q * t), is used to correct the average payoff with the optimal coefficient
+    β = Cov(payoff, control) / Var(control).
+
+    Args:
+        stock_price (np.ndarray | float): The current stock price of each ticker.
+        strike_price (np.ndarray | float): The strike price of each ticker.
+        volatility (np.ndarray | float): The annual volatility of each ticker.
+        risk_free_rate (float): The annual risk free rate.
+        time_to_expiration (float): The time to expiration in years.
+        paths (int): The number of paths.
+        timesteps (int, optional): The number of time steps. Defaults to 1 which suffices for payoffs
+            that only depend on the final stock price.
+        dividend_yield (np.ndarray | float, optional): The dividend yield of each ticker. Defaults to 0.
+        put_option (bool, optional): Whether to calculate the put option price. Defaults to False.
+        payoff_function (Callable | None, optional): A function that receives the stock prices with the
+            shape (paths, timesteps + 1, tickers) and returns the payoffs with the shape (paths, tickers).
+            Defaults to None which means the payoff of a European option is used.
+        jump_intensity (float, optional): The expected number of jumps per year. Defaults to 0.
+        jump_mean (float, optional): The mean of the log jump size. Defaults to 0.
+        jump_volatility (float, optional): The volatility of the log jump size. Defaults to 0.
+        antithetic_variates (bool, optional): Whether to use antithetic variates. Defaults to False.
+        control_variate (bool, optional): Whether to use the final stock price as control variate.
+            Defaults to False.
+        seed (int | None, optional): The seed of the random generators. Defaults to None.
+        chunk_size (int, optional): The maximum number of paths simulated at once. Defaults to 10,000.
+        workers (int | None, optional): The number of threads to simulate the chunks with. Defaults to None.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The option price and its standard error for each ticker.
+    """
+    stock_price = np.atleast_1d(np.asarray(stock_price, dtype=float))
+    strike_price = np.asarray(strike_price, dtype=float)
+    discount_factor = np.exp(-risk_free_rate * time_to_expiration)
+
+    if antithetic_variates:
+        # Each chunk needs to contain complete pairs of paths
+        paths += paths % 2
+        chunk_size += chunk_size % 2
+
+    if payoff_function is None:
+
+        def payoff_function(stock_prices: np.ndarray) -> np.ndarray:
+            if put_option:
+                return np.maximum(strike_price - stock_prices[:, -1], 0)
+
+            return np.maximum(stock_prices[:, -1] - strike_price, 0)
+
+    path_arguments = _get_path_arguments(
+        stock_price=stock_price,
+        volatility=volatility,
+        risk_free_rate=risk_free_rate,
+        time_to_expiration=time_to_expiration,
+        timesteps=timesteps,
+        dividend_yield=dividend_yield,
+        correlation=None,
+        jump_intensity=jump_intensity,
+        jump_mean=jump_mean,
+        jump_volatility=jump_volatility,
+        antithetic_variates=antithetic_variates,
+    )
+
+    def price_chunk(generator: np.random.Generator, start: int, end: int):
+        stock_prices = _simulate_paths(
+            generator=generator, paths=end - start, **path_arguments
+        )
+        payoffs = discount_factor * payoff_function(stock_prices)
+        observations = np.stack(
+            [
+                payoffs,
+                np.broadcast_to(discount_factor * stock_prices[:, -1], payoffs.shape),
+            ]
+        )
+
+        if antithetic_variates:
+            half = (end - start) // 2
+            observations = (observations[:, :half] + observations[:, half:]) / 2
+
+        mean = observations.mean(axis=1, keepdims=True)
+        deviations = observations - mean
+
+        return (
+            observations.shape[1],
+            mean[:, 0],
+            np.einsum("ipt,jpt->ijt", deviations, deviations),
+        )
+
+    moments = _run_chunks(
+        chunk_function=price_chunk,
+        paths=paths,
+        chunk_size=chunk_size,
+        seed=seed,
+        workers=workers,
+    )
+
+    count, mean, co_moments = moments[0]
+
+    for chunk_count, chunk_mean, chunk_co_moments in moments[1:]:
+        total = count + chunk_count
+        difference = chunk_mean - mean
+        co_moments = (
+            co_moments
+            + chunk_co_moments
+            + np.einsum("it,jt->ijt", difference, difference)
+            * count
+            * chunk_count
+            / total
+        )
+        mean = mean + difference * chunk_count / total
+        count = total
+
+    payoff_variance = co_moments[0, 0] / max(count - 1, 1)
+    option_price = mean[0]
+
+    if control_variate:
+        control_variance = co_moments[1, 1] / max(count - 1, 1)
+        covariance = co_moments[0, 1] / max(count - 1, 1)
+        beta = np.divide(
+            covariance,
+            control_variance,
+            out=np.zeros_like(covariance),
+            where=control_variance > 0,
+        )
+
+        expected_control = stock_price * np.exp(
+            -np.asarray(dividend_yield, dtype=float) * time_to_expiration
+        )
+        option_price = option_price - beta * (mean[1] - expected_control)
+        payoff_variance = payoff_variance - beta * covariance
+
+    return option_price, np.sqrt(np.maximum(payoff_variance, 0) / count)
@@ -2,17 +2,18 @@
 
 __docformat__ = "google"
 
+from collections.abc import Callable
 from datetime import datetime
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import minimize
 
 from financetoolkit.options import (
     binomial_trees_model,
     black_scholes_model,
     greeks_model,
     helpers,
+    monte_carlo_model,
     options_model,
 )
 from financetoolkit.ratios import valuation_model
@@ -121,6 +122,121 @@ class Options:
 
             self._dividend_yield[ticker] = dividend_yield_cleaned
 
+    def _calculate_option_surface(
+        self,
+        model_function: Callable,
+        start_date: str | None,
+        strike_price_range: float,
+        strike_step_size: int,
+        expiration_time_range: int,
+        risk_free_rate: float | None,
+        dividend_yield: float | None,
+        show_input_info: bool,
+        rounding: int | None,
+        **model_arguments,
+    ) -> pd.DataFrame:
+        """
+        Calculate a Black Scholes based value (e.g. the option price or one of the Greeks) for all tickers,
+        strike prices and expiration dates at once. The inputs are broadcasted with the options (ticker and
+        strike price) as rows and the days to expiration as columns so that the model function is evaluated
+        in a single vectorized call instead of once per ticker, strike price and expiration date.
+
+        Args:
+            model_function (Callable): The function of the black_scholes_model or greeks_model to evaluate.
+            start_date (str | None): The start date which determines the stock price.
+            strike_price_range (float): The percentage range to use for the strike prices.
+            strike_step_size (int): The step size to use for the strike prices.
+            expiration_time_range (int): The number of days to use for the time to expiration.
+            risk_free_rate (float | None): The risk free rate to use for the calculation.
+            dividend_yield (float | None): The dividend yield to use for the calculation.
+            show_input_info (bool): Whether to show the input information.
+            rounding (int | None): The number of decimals to round the results to.
+            **model_arguments: Any other arguments of the model function such as put_option.
+
+        Returns:
+            pd.DataFrame: The values containing the tickers and strike prices as the index and the
+            time to expiration as the columns.
+        """
+        if start_date is not None and start_date not in self._prices.index:
+            raise ValueError(f"The start date {start_date} is not a valid date.")
+
+        start_date = start_date if start_date else self._daily_historical.index[-1]
+        stock_price = self._prices.loc[start_date]
+        volatility = self._volatility.loc[start_date]
+
+        risk_free_rate = (
+            risk_free_rate
+            if risk_free_rate is not None
+            else self._risk_free_rate.loc[start_date]
+        )
+
+        strike_prices_per_ticker = helpers.define_strike_prices(
+            tickers=self._tickers,
+            stock_price=stock_price,
+            strike_step_size=strike_step_size,
+            strike_price_range=strike_price_range,
+        )
+
+        dividend_yield_value: dict[str, float] = {
+            ticker: (
+                dividend_yield
+                if dividend_yield is not None
+                else self._dividend_yield[ticker].iloc[-1]
+            )
+            for ticker in strike_prices_per_ticker
+        }
+
+        option_keys = [
+            (ticker, strike_price)
+            for ticker, strike_prices in strike_prices_per_ticker.items()
+            for strike_price in strike_prices
+        ]
+        option_tickers = [ticker for ticker, _ in option_keys]
+
+        # This creates the time to expiration values from 0 to time_range, with a step size of 1
+        time_to_expiration = np.arange(expiration_time_range) / 365
+
+        option_values = model_function(
+            stock_price=stock_price.loc[option_tickers].to_numpy(dtype=float)[
+                :, np.newaxis
+            ],
+            strike_price=np.array([strike for _, strike in option_keys], dtype=float)[
+                :, np.newaxis
+            ],
+            time_to_expiration=time_to_expiration[np.newaxis, :],
+            risk_free_rate=risk_free_rate,
+            volatility=volatility.loc[option_tickers].to_numpy(dtype=float)[
+                :, np.newaxis
+            ],
+            dividend_yield=np.array(
+                [dividend_yield_value[ticker] for ticker in option_tickers],
+                dtype=float,
+            )[:, np.newaxis],
+            **model_arguments,
+        )
+
+        option_values_df = helpers.create_option_surface_dataframe(
+            option_values=option_values,
+            option_keys=option_keys,
+            start_date=start_date,
+        )
+
+        option_values_df = option_values_df.round(
+            rounding if rounding else self._rounding
+        )
+
+        if show_input_info:
+            helpers.show_input_info(
+                start_date=self._daily_historical.index[0],
+                end_date=self._daily_historical.index[-1],
+                stock_prices=stock_price,
+                volatility=volatility,
+                risk_free_rate=risk_free_rate,
+                dividend_yield=dividend_yield_value,
+            )
+
+        return option_values_df
+
     def get_option_chains(
         self,
         expiration_date: str | None = None,
@@ -308,79 +424,19 @@ class Options:
         |            165 |       0.0001 |       0.0081 |       0.0378 |       0.0889 |       0.1563 |       0.235  |       0.3213 |       0.413  |       0.5081 |       0.6055 |       0.7043 |       0.804  |       0.9039 |       1.0039 |       1.1036 |       1.2029 |       1.3017 |       1.3999 |       1.4974 |       1.5941 |       1.69   |       1.7852 |       1.8795 |       1.973  |       2.0657 |       2.1576 |       2.2487 |       2.339  |       2.4285 |
         |            170 |       0      |       0.0001 |       0.0017 |       0.0079 |       0.0208 |       0.0412 |       0.0689 |       0.103  |       0.143  |       0.1879 |       0.237  |       0.2897 |       0.3454 |       0.4037 |       0.4641 |       0.5263 |       0.59   |       0.6549 |       0.721  |       0.7878 |       0.8555 |       0.9237 |       0.9923 |       1.0614 |       1.1307 |       1.2003 |       1.27   |       1.3398 |       1.4096 |
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        black_scholes: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            black_scholes[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                black_scholes[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    black_scholes[ticker][strike_price][time_to_expiration] = (
-                        black_scholes_model.get_black_scholes(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            time_to_expiration=time_to_expiration,
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        black_scholes_df = helpers.create_greek_dataframe(
-            greek_dictionary=black_scholes,
+        return self._calculate_option_surface(
+            model_function=black_scholes_model.get_black_scholes,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
         )
 
-        black_scholes_df = black_scholes_df.round(
-            rounding if rounding else self._rounding
-        )
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return black_scholes_df
-
     def get_implied_volatility(
         self,
         expiration_date: str | None = None,
@@ -389,6 +445,7 @@ class Options:
         dividend_yield: float | None = None,
         show_expiration_dates: bool = False,
         show_input_info: bool = False,
+        show_convergence: bool = False,
         rounding: int | None = None,
     ):
         """
@@ -416,11 +473,12 @@ class Options:
 
         In which the Implied Volatility is then calculated as follows:
 
-        - Implied Volatility = MINIMIZE(Black Scholes Theoretical Price — Actual Option Price)
+        - Implied Volatility = SOLVE(Black Scholes Theoretical Price — Actual Option Price = 0)
 
         To determine the Implied Volatility, the Black Scholes Model is used to calculate the theoretical option price in
-        which sigma (σ) is the only unknown variable. The actual option price is then used to determine the implied
-        volatility by minimizing the difference between the theoretical and actual option price.
+        which sigma (σ) is the only unknown variable. The entire option chain is solved at once with a safeguarded
+        Newton iteration that uses vega and falls back to bisection. Option prices that the model can not reproduce,
+        e.g. prices at or below the intrinsic value, have no Implied Volatility and are reported as not converged.
 
         Args:
             expiration_date (str | None, optional): The expiration date to use for the calculation. Defaults to None
@@ -433,11 +491,14 @@ class Options:
             means it will use the dividend yield as obtained through annual historical data.
             show_expiration_dates (bool, optional): Whether to show the expiration dates. Defaults to False.
             show_input_info (bool, optional): Whether to show the input information. Defaults to False.
+            show_convergence (bool, optional): Whether to return the Implied Volatility of every strike price together
+            with whether it converged. Defaults to False which means only the converged values are returned.
             rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
 
         Returns:
-            pd.Series | list[str]: Implied Volatility values containing the tickers as the index and the expiration
-            dates as the columns. If show_expiration_dates is True, it will return a list of expiration dates.
+            pd.Series | pd.DataFrame | list[str]: Implied Volatility values containing the tickers and strike prices as
+            the index. If show_convergence is True, a DataFrame with the Implied Volatility and Converged columns is
+            returned instead. If show_expiration_dates is True, it will return a list of expiration dates.
 
         As an example:
 
@@ -495,59 +556,49 @@ class Options:
             else self._risk_free_rate.loc[current_period]
         )
 
-        tickers = option_chains.index.get_level_values(0).unique()
-        today = datetime.today()
-        dividend_yield_value: dict[str, float] = {}
-        implied_volatility: dict[str, dict[float, float]] = {}
-
-        for ticker in tickers:
-            implied_volatility[ticker] = {}
-            option_chain = option_chains.loc[ticker]
-            dividend_yield_value[ticker] = (
+        tickers = option_chains.index.get_level_values(0)
+        dividend_yield_value: dict[str, float] = {
+            ticker: (
                 dividend_yield
                 if dividend_yield is not None
                 else self._dividend_yield[ticker].iloc[-1]
             )
+            for ticker in tickers.unique()
+        }
 
-            for strike_price, row in option_chain.iterrows():
-                # The expiration date is used to calculate the days to expiration
-                # which serves as input for the time to expiration parameter in the Black Scholes Model.
-                days_to_expiration = (pd.to_datetime(option_chains.name) - today).days
-
-                def objective_function(sigma: float):
-                    return (
-                        black_scholes_model.get_black_scholes(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            risk_free_rate=risk_free_rate,
-                            time_to_expiration=days_to_expiration / 365,
-                            volatility=sigma,
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                        - row["Last Price"]
-                    ) ** 2
-
-                # The minimize function is used to find the implied volatility value that minimizes
-                # the objective function. This means that the difference between the output of the
-                # Black Scholes Model and the market option price is minimized.
-                implied_volatility_value = minimize(
-                    objective_function, volatility.loc[ticker]
-                ).x[0]
-
-                # Values that are equal to the current volatility refer to not being able to resolve
-                # and thus are not added to the implied volatility dictionary.
-                if round(implied_volatility_value, 4) != round(
-                    volatility.loc[ticker], 4
-                ):
-                    implied_volatility[ticker][strike_price] = implied_volatility_value
-
-        implied_volatility_df = pd.DataFrame(implied_volatility).unstack().dropna()
-
-        implied_volatility_df = implied_volatility_df.round(
-            rounding if rounding else self._rounding
+        # The expiration date is used to calculate the days to expiration which serves as
+        # input for the time to expiration parameter in the Black Scholes Model.
+        days_to_expiration = (
+            pd.to_datetime(option_chains.name) - datetime.today()
+        ).days
+
+        implied_volatility, converged = black_scholes_model.get_implied_volatility(
+            option_price=option_chains["Last Price"].to_numpy(dtype=float),
+            stock_price=stock_price.loc[tickers].to_numpy(dtype=float),
+            strike_price=option_chains.index.get_level_values(1).to_numpy(dtype=float),
+            risk_free_rate=risk_free_rate,
+            time_to_expiration=days_to_expiration / 365,
+            dividend_yield=np.array(
+                [dividend_yield_value[ticker] for ticker in tickers], dtype=float
+            ),
+            put_option=put_option,
+            initial_volatility=volatility.loc[tickers].to_numpy(dtype=float),
+        )
+
+        implied_volatility_df = pd.DataFrame(
+            {"Implied Volatility": implied_volatility, "Converged": converged},
+            index=option_chains.index,
         )
 
+        implied_volatility_df["Implied Volatility"] = implied_volatility_df[
+            "Implied Volatility"
+        ].round(rounding if rounding else self._rounding)
+
+        if not show_convergence:
+            implied_volatility_df = implied_volatility_df.loc[
+                implied_volatility_df["Converged"], "Implied Volatility"
+            ]
+
         # The Expiration date is used as the name of the DataFrame
         implied_volatility_df.name = option_chains.name
 
@@ -690,63 +741,66 @@ class Options:
             strike_price_range=strike_price_range,
         )
 
-        binomial_trees: dict[str, dict[float, dict[float, float]]] = {}
-        binomial_trees_statistics: dict[str, dict[float, dict[str, float]]] = {
-            "Up Movement": {},
-            "Down Movement": {},
-            "Risk Neutral Probability": {},
+        dividend_yield_value: dict[str, float] = {
+            ticker: (
+                dividend_yield
+                if dividend_yield is not None
+                else self._dividend_yield[ticker].iloc[-1]
+            )
+            for ticker in strike_prices_per_ticker
         }
 
-        iterator = (
-            tqdm(strike_prices_per_ticker.items(), desc="Calculating Binomial Trees")
-            if ENABLE_TQDM
-            else strike_prices_per_ticker.items()
+        option_keys = [
+            (ticker, strike_price)
+            for ticker, strike_prices in strike_prices_per_ticker.items()
+            for strike_price in strike_prices
+        ]
+        option_tickers = [ticker for ticker, _ in option_keys]
+
+        # All lattices are calculated at once, broadcasted over ticker and strike price
+        (
+            option_lattices,
+            up_movements,
+            down_movements,
+            risk_neutral_probabilities,
+        ) = binomial_trees_model.calculate_option_lattice(
+            stock_price=stock_price.loc[option_tickers].to_numpy(dtype=float),
+            strike_price=np.array([strike for _, strike in option_keys], dtype=float),
+            years=time_to_expiration,
+            timesteps=timesteps,
+            risk_free_rate=risk_free_rate,
+            volatility=volatility.loc[option_tickers].to_numpy(dtype=float),
+            dividend_yield=np.array(
+                [dividend_yield_value[ticker] for ticker in option_tickers],
+                dtype=float,
+            ),
+            put_option=put_option,
+            american_option=american_option,
+            show_input_info=True,
         )
-        dividend_yield_value: dict[str, float] = {}
 
-        for ticker, strike_prices in iterator:
-            binomial_trees[ticker] = {}
+        movement_labels, _ = binomial_trees_model.get_movement_labels(
+            period_length=timesteps
+        )
 
-            for strike_price in strike_prices:
-                binomial_trees[ticker][strike_price] = {}
-                dividend_yield_value[ticker] = (
-                    dividend_yield
-                    if dividend_yield is not None
-                    else self._dividend_yield[ticker].iloc[-1]
-                )
+        binomial_trees: dict[str, dict[float, pd.DataFrame]] = {
+            ticker: {} for ticker in strike_prices_per_ticker
+        }
+        binomial_trees_statistics: dict[str, dict[str, float]] = {
+            "Up Movement": {},
+            "Down Movement": {},
+            "Risk Neutral Probability": {},
+        }
 
-                if show_input_info:
-                    (
-                        binomial_trees[ticker][strike_price],
-                        binomial_trees_statistics["Up Movement"][ticker],
-                        binomial_trees_statistics["Down Movement"][ticker],
-                        binomial_trees_statistics["Risk Neutral Probability"][ticker],
-                    ) = binomial_trees_model.get_option_payoffs(
-                        stock_price=stock_price.loc[ticker],
-                        strike_price=strike_price,
-                        years=time_to_expiration,
-                        timesteps=timesteps,
-                        risk_free_rate=risk_free_rate,
-                        volatility=volatility.loc[ticker],
-                        dividend_yield=dividend_yield_value[ticker],
-                        put_option=put_option,
-                        american_option=american_option,
-                        show_input_info=show_input_info,
-                    )
-
-                binomial_trees[ticker][strike_price] = (
-                    binomial_trees_model.get_option_payoffs(
-                        stock_price=stock_price.loc[ticker],
-                        strike_price=strike_price,
-                        years=time_to_expiration,
-                        timesteps=timesteps,
-                        risk_free_rate=risk_free_rate,
-                        volatility=volatility.loc[ticker],
-                        dividend_yield=dividend_yield_value[ticker],
-                        put_option=put_option,
-                        american_option=american_option,
-                    )
-                )
+        for index, (ticker, strike_price) in enumerate(option_keys):
+            binomial_trees[ticker][strike_price] = pd.DataFrame(
+                option_lattices[index], index=movement_labels
+            )
+            binomial_trees_statistics["Up Movement"][ticker] = up_movements[index]
+            binomial_trees_statistics["Down Movement"][ticker] = down_movements[index]
+            binomial_trees_statistics["Risk Neutral Probability"][ticker] = (
+                risk_neutral_probabilities[index]
+            )
 
         binomial_trees_df = helpers.create_binomial_tree_dataframe(
             binomial_tree_dictionary=binomial_trees,
@@ -775,6 +829,164 @@ class Options:
 
         return binomial_trees_df
 
+    def get_binomial_option_price(
+        self,
+        start_date: str | None = None,
+        put_option: bool = False,
+        american_option: bool = False,
+        strike_price_range: float = 0.25,
+        strike_step_size: int = 5,
+        expiration_time_range: int = 30,
+        timesteps: int = 500,
+        risk_free_rate: float | None = None,
+        dividend_yield: float | None = None,
+        show_input_info: bool = False,
+        rounding: int | None = None,
+    ):
+        """
+        Calculate the option price based on the Binomial Option Pricing Model for each strike price and
+        expiration date. Where get_binomial_model returns the entire binomial tree for a single expiration date,
+        this function only returns the option price at the start date. Only the current layer of the tree is
+        kept in memory which makes it possible to price European and American style options with a large number
+        of time steps (e.g. 500 to 1,000) for all tickers, strike prices and expiration dates at once.
+
+        By default the most recent risk free rate, dividend yield and stock price is used, you can alter this by changing
+        the start date. The volatility is calculated based on the daily returns of the stock price and the selected
+        period (this can be altered by defining this accordingly when defining the Toolkit class, start_date and end_date).
+
+        The formulas are equal to the ones described in get_binomial_model.
+
+        Args:
+            start_date (str | None, optional): The start date which determines the stock price. Defaults to None
+            which means it will use the most recent date.
+            put_option (bool, optional): Whether to calculate the put option price. Defaults to False which means
+            it will calculate the call option price.
+            american_option (bool, optional): Whether to calculate the American option price. Defaults to False
+            which means it will calculate the European option price.
+            strike_price_range (float): The percentage range to use for the strike prices. Defaults to 0.25 which equals
+            25% and thus results in strike prices from 75 to 125 if the current stock price is 100.
+            strike_step_size (int): The step size to use for the strike prices. Defaults to 5 which means that the
+            strike prices will be 75, 80, 85, 90, 95, 100, 105, 110, 115 and 120 if the current stock price is 100.
+            expiration_time_range (int): The number of days to use for the time to expiration. Defaults to 30 which equals
+            30 days.
+            timesteps (int): The number of time steps to use for the binomial tree of each expiration date. Defaults
+            to 500.
+            risk_free_rate (float, optional): The risk free rate to use for the calculation. Defaults to None which
+            means it will use the current risk free rate.
+            dividend_yield (float, optional): The dividend yield to use for the calculation. Defaults to None which
+            means it will use the dividend yield as obtained through annual historical data.
+            show_input_info (bool, optional): Whether to show the input information. Defaults to False.
+            rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
+
+        Returns:
+            pd.DataFrame: Binomial option prices containing the tickers and strike prices as the index and the
+            time to expiration as the columns.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AMZN", "AAPL"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        american_puts = toolkit.options.get_binomial_option_price(
+            put_option=True, american_option=True, timesteps=1000
+        )
+
+        american_puts.loc['AMZN']
+        ```
+        """
+        if start_date is not None and start_date not in self._prices.index:
+            raise ValueError(f"The start date {start_date} is not a valid date.")
+
+        start_date = start_date if start_date else self._daily_historical.index[-1]
+        stock_price = self._prices.loc[start_date]
+        volatility = self._volatility.loc[start_date]
+
+        risk_free_rate = (
+            risk_free_rate
+            if risk_free_rate is not None
+            else self._risk_free_rate.loc[start_date]
+        )
+
+        strike_prices_per_ticker = helpers.define_strike_prices(
+            tickers=self._tickers,
+            stock_price=stock_price,
+            strike_step_size=strike_step_size,
+            strike_price_range=strike_price_range,
+        )
+
+        dividend_yield_value: dict[str, float] = {
+            ticker: (
+                dividend_yield
+                if dividend_yield is not None
+                else self._dividend_yield[ticker].iloc[-1]
+            )
+            for ticker in strike_prices_per_ticker
+        }
+
+        option_keys = [
+            (ticker, strike_price)
+            for ticker, strike_prices in strike_prices_per_ticker.items()
+            for strike_price in strike_prices
+        ]
+        option_tickers = [ticker for ticker, _ in option_keys]
+
+        # The first expiration date is the start date itself which is dropped from the result
+        time_to_expiration = np.arange(1, expiration_time_range) / 365
+
+        option_prices = binomial_trees_model.calculate_option_price(
+            stock_price=stock_price.loc[option_tickers].to_numpy(dtype=float)[
+                :, np.newaxis
+            ],
+            strike_price=np.array([strike for _, strike in option_keys], dtype=float)[
+                :, np.newaxis
+            ],
+            years=time_to_expiration[np.newaxis, :],
+            timesteps=timesteps,
+            risk_free_rate=risk_free_rate,
+            volatility=volatility.loc[option_tickers].to_numpy(dtype=float)[
+                :, np.newaxis
+            ],
+            dividend_yield=np.array(
+                [dividend_yield_value[ticker] for ticker in option_tickers],
+                dtype=float,
+            )[:, np.newaxis],
+            put_option=put_option,
+            american_option=american_option,
+        )
+
+        binomial_option_prices: dict[str, dict[float, dict[float, float]]] = {
+            ticker: {} for ticker in strike_prices_per_ticker
+        }
+
+        for index, (ticker, strike_price) in enumerate(option_keys):
+            binomial_option_prices[ticker][strike_price] = {
+                0: np.nan,
+                **dict(zip(time_to_expiration, option_prices[index])),
+            }
+
+        binomial_option_prices_df = helpers.create_greek_dataframe(
+            greek_dictionary=binomial_option_prices,
+            start_date=start_date,
+        )
+
+        binomial_option_prices_df = binomial_option_prices_df.round(
+            rounding if rounding else self._rounding
+        )
+
+        if show_input_info:
+            helpers.show_input_info(
+                start_date=self._daily_historical.index[0],
+                end_date=self._daily_historical.index[-1],
+                stock_prices=stock_price,
+                volatility=volatility,
+                risk_free_rate=risk_free_rate,
+                dividend_yield=dividend_yield_value,
+            )
+
+        return binomial_option_prices_df
+
     def get_stock_price_simulation(
         self,
         start_date: str | None = None,
@@ -940,29 +1152,232 @@ class Options:
 
         return stock_price_simulation_df
 
-    def collect_all_greeks(
+    def get_monte_carlo_simulation(
         self,
         start_date: str | None = None,
-        strike_price_range: float = 0.25,
-        strike_step_size: int = 5,
-        expiration_time_range: int = 30,
+        time_to_expiration: int = 1,
+        timesteps: int = 252,
+        paths: int = 10_000,
         risk_free_rate: float | None = None,
         dividend_yield: float | None = None,
-        put_option: bool = False,
+        use_correlation: bool = True,
+        jump_intensity: float = 0,
+        jump_mean: float = 0,
+        jump_volatility: float = 0,
+        antithetic_variates: bool = False,
+        seed: int | None = None,
+        chunk_size: int = 10_000,
+        workers: int | None = None,
+        show_paths: bool = False,
+        memory_map_location: str | None = None,
         show_input_info: bool = False,
         rounding: int | None = None,
-    ):
+    ) -> pd.DataFrame | np.memmap:
         """
-        Calculate all Greeks of an option based on the Black Scholes Model. This will return the following Greeks
-        per Strike Price and Expiration Date:
+        Simulate the Stock Price with a Monte Carlo simulation of a (jump) Geometric Brownian Motion under the
+        risk neutral measure. Unlike the Binomial Model of get_stock_price_simulation, which contains every
+        combination of up and down movements and therefore grows exponentially with the number of time steps,
+        this draws a fixed number of random paths which makes it possible to simulate long horizons with many
+        time steps and to use the paths for path dependent payoffs or portfolio scenarios.
 
-        **First Order Greeks:**
+        By default the most recent risk free rate and stock price is used, you can alter this by changing
+        the start date. The volatility is calculated based on the daily returns of the stock price and the selected
+        period (this can be altered by defining this accordingly when defining the Toolkit class, start_date and end_date).
+        The correlation between the tickers is based on the daily returns up to the start date.
 
-        - Delta: measures the rate of change of the theoretical option value with respect to changes in the underlying
-        asset's price.
-        - Dual Delta: the actual probability of an option finishing in the money which is the first derivative
-        of option price with respect to strike.
-        - Vega: measures sensitivity to volatility. Vega is the derivative of the option value with respect to the volatility
+        The formulas are as follows:
+
+        - S(t + dt) = S(t) * e^((r — q — λ * k — σ^2 / 2) * dt + σ * sqrt(dt) * Z + J)
+        - k = e^(μJ + σJ^2 / 2) — 1
+
+        Where S is the stock price, r is the risk free rate, q is the dividend yield, σ is the volatility,
+        dt is the length of a time step, Z are correlated standard normal draws, λ is the jump intensity and
+        J is the sum of the normally distributed log jump sizes (with mean μJ and volatility σJ) within the time step.
+
+        The paths are simulated in chunks of at most chunk_size paths so that the memory usage stays bounded and
+        each chunk is given its own random generator derived from the seed. This makes the simulation reproducible
+        regardless of the number of workers. By default only the statistics of the paths are returned which means
+        the paths themselves are never stored at once.
+
+        Args:
+            start_date (str | None, optional): The start date which determines the stock price. Defaults to None
+            which means it will use the most recent date.
+            time_to_expiration (int): The number of years to simulate. Defaults to 1 which equals one year.
+            timesteps (int): The number of time steps, evenly distributed over the time to expiration. Defaults to 252.
+            paths (int): The number of paths to simulate. Defaults to 10,000.
+            risk_free_rate (float, optional): The risk free rate to use for the calculation. Defaults to None which
+            means it will use the current risk free rate.
+            dividend_yield (float, optional): The dividend yield to use for the calculation. Defaults to None which
+            means it will use the dividend yield as found in the annual historical data.
+            use_correlation (bool, optional): Whether to correlate the tickers based on their daily returns.
+            Defaults to True.
+            jump_intensity (float, optional): The expected number of jumps per year. Defaults to 0 which means
+            no jumps are simulated.
+            jump_mean (float, optional): The mean of the log jump size. Defaults to 0.
+            jump_volatility (float, optional): The volatility of the log jump size. Defaults to 0.
+            antithetic_variates (bool, optional): Whether to pair each path with its mirrored path which reduces
+            the variance of the statistics. Defaults to False.
+            seed (int | None, optional): The seed to use for the random generators. Defaults to None.
+            chunk_size (int, optional): The maximum number of paths simulated at once. Defaults to 10,000.
+            workers (int | None, optional): The number of threads to simulate the chunks with. Defaults to None which
+            means the chunks are simulated one after the other.
+            show_paths (bool, optional): Whether to return all paths instead of the statistics. Defaults to False.
+            memory_map_location (str | None, optional): The location of a .npy file to write the paths to. When
+            provided, a memory-mapped array with the shape (paths, timesteps + 1, tickers) is returned instead of a
+            DataFrame. Defaults to None.
+            show_input_info (bool, optional): Whether to show the input information. Defaults to False.
+            rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
+
+        Returns:
+            pd.DataFrame | np.memmap: The Mean, Standard Deviation, Minimum and Maximum of the simulated stock
+            prices (or the paths when show_paths is True) containing the tickers as the index and the time to
+            expiration as the columns, or the memory-mapped paths when memory_map_location is provided.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AAPL", "MSFT"], api_key=API_KEY)
+
+        monte_carlo_simulation = toolkit.options.get_monte_carlo_simulation(
+            start_date='2022-06-22', timesteps=4, seed=42, rounding=2
+        )
+
+        monte_carlo_simulation.loc['AAPL']
+        ```
+
+        Which returns:
+
+        | Statistic          |   2022-06-22 |   2022-09-21 |   2022-12-21 |   2023-03-22 |   2023-06-22 |
+        |:-------------------|-------------:|-------------:|-------------:|-------------:|-------------:|
+        | Mean               |       133.39 |       134.28 |       135.18 |       135.94 |       136.63 |
+        | Standard Deviation |         0    |        24.81 |        35.56 |        44.35 |        52.74 |
+        | Minimum            |       133.39 |        67.68 |        53.64 |        40.01 |        28.45 |
+        | Maximum            |       133.39 |       253.17 |       337.32 |       447.2  |       544.05 |
+        """
+        if start_date is not None and start_date not in self._prices.index:
+            raise ValueError(f"The start date {start_date} is not a valid date.")
+
+        start_date = start_date if start_date else self._daily_historical.index[-1]
+        stock_price = self._prices.loc[start_date, self._tickers]
+        volatility = self._volatility.loc[start_date, self._tickers]
+
+        risk_free_rate = (
+            risk_free_rate
+            if risk_free_rate is not None
+            else self._risk_free_rate.loc[start_date]
+        )
+
+        dividend_yield_value: dict[str, float] = {
+            ticker: (
+                dividend_yield
+                if dividend_yield is not None
+                else self._dividend_yield[ticker].iloc[-1]
+            )
+            for ticker in self._tickers
+        }
+
+        correlation = None
+
+        if use_correlation and len(self._tickers) > 1:
+            correlation_df = (
+                self._daily_historical["Return"]
+                .loc[:start_date, self._tickers]
+                .corr()
+                .fillna(0)
+            )
+            correlation = correlation_df.to_numpy(dtype=float)
+            np.fill_diagonal(correlation, 1)
+
+        simulation_arguments = {
+            "stock_price": stock_price.to_numpy(dtype=float),
+            "volatility": volatility.to_numpy(dtype=float),
+            "risk_free_rate": risk_free_rate,
+            "time_to_expiration": time_to_expiration,
+            "timesteps": timesteps,
+            "paths": paths,
+            "dividend_yield": np.array(
+                [dividend_yield_value[ticker] for ticker in self._tickers],
+                dtype=float,
+            ),
+            "correlation": correlation,
+            "jump_intensity": jump_intensity,
+            "jump_mean": jump_mean,
+            "jump_volatility": jump_volatility,
+            "antithetic_variates": antithetic_variates,
+            "seed": seed,
+            "chunk_size": chunk_size,
+            "workers": workers,
+        }
+
+        if show_input_info:
+            helpers.show_input_info(
+                start_date=self._daily_historical.index[0],
+                end_date=self._daily_historical.index[-1],
+                stock_prices=stock_price,
+                volatility=volatility,
+                risk_free_rate=risk_free_rate,
+                dividend_yield=dividend_yield_value,
+            )
+
+        if memory_map_location:
+            return monte_carlo_model.simulate_stock_prices(
+                **simulation_arguments, memory_map_location=memory_map_location
+            )
+
+        if show_paths:
+            simulation_values = monte_carlo_model.simulate_stock_prices(
+                **simulation_arguments
+            ).transpose(2, 0, 1)
+            row_labels, row_name = list(range(paths)), "Path"
+        else:
+            simulation_statistics = monte_carlo_model.get_simulation_statistics(
+                **simulation_arguments
+            )
+            simulation_values = np.stack(
+                list(simulation_statistics.values())
+            ).transpose(2, 0, 1)
+            row_labels, row_name = list(simulation_statistics), "Statistic"
+
+        monte_carlo_simulation_df = helpers.create_monte_carlo_dataframe(
+            simulation_values=simulation_values,
+            tickers=self._tickers,
+            row_labels=row_labels,
+            row_name=row_name,
+            start_date=start_date,
+            time_to_expiration=time_to_expiration,
+        )
+
+        monte_carlo_simulation_df = monte_carlo_simulation_df.round(
+            rounding if rounding else self._rounding
+        )
+
+        return monte_carlo_simulation_df
+
+    def collect_all_greeks(
+        self,
+        start_date: str | None = None,
+        strike_price_range: float = 0.25,
+        strike_step_size: int = 5,
+        expiration_time_range: int = 30,
+        risk_free_rate: float | None = None,
+        dividend_yield: float | None = None,
+        put_option: bool = False,
+        show_input_info: bool = False,
+        rounding: int | None = None,
+    ):
+        """
+        Calculate all Greeks of an option based on the Black Scholes Model. This will return the following Greeks
+        per Strike Price and Expiration Date:
+
+        **First Order Greeks:**
+
+        - Delta: measures the rate of change of the theoretical option value with respect to changes in the underlying
+        asset's price.
+        - Dual Delta: the actual probability of an option finishing in the money which is the first derivative
+        of option price with respect to strike.
+        - Vega: measures sensitivity to volatility. Vega is the derivative of the option value with respect to the volatility
         of the underlying asset.
         - Theta: measures the sensitivity of the value of the derivative to the passage of time, the "time decay."
         - Rho: measures sensitivity to the interest rate: it is the derivative of the option value with respect to
@@ -1327,77 +1742,19 @@ class Options:
         toolkit.options.get_delta()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        delta: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            delta[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                delta[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    delta[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_delta(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        delta_df = helpers.create_greek_dataframe(
-            greek_dictionary=delta,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_delta,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
         )
 
-        delta_df = delta_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return delta_df
-
     def get_dual_delta(
         self,
         start_date: str | None = None,
@@ -1465,77 +1822,19 @@ class Options:
         toolkit.options.get_dual_delta()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        dual_delta: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            dual_delta[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                dual_delta[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    dual_delta[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_dual_delta(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        dual_delta_df = helpers.create_greek_dataframe(
-            greek_dictionary=dual_delta,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_dual_delta,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
         )
 
-        dual_delta_df = dual_delta_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return dual_delta_df
-
     def get_vega(
         self,
         start_date: str | None = None,
@@ -1604,76 +1903,18 @@ class Options:
         toolkit.options.get_vega()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        vega: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            vega[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                vega[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    vega[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_vega(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        vega_df = helpers.create_greek_dataframe(
-            greek_dictionary=vega,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_vega,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        vega_df = vega_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return vega_df
-
     def get_theta(
         self,
         start_date: str | None = None,
@@ -1747,76 +1988,18 @@ class Options:
         toolkit.options.get_theta()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        theta: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            theta[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                theta[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    theta[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_theta(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        theta_df = helpers.create_greek_dataframe(
-            greek_dictionary=theta,
-            start_date=start_date,
-        )
-
-        theta_df = theta_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return theta_df
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_theta,
+            start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
+        )
 
     def get_rho(
         self,
@@ -1892,77 +2075,19 @@ class Options:
         toolkit.options.get_rho()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        rho: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            rho[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                rho[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    rho[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_rho(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        rho_df = helpers.create_greek_dataframe(
-            greek_dictionary=rho,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_rho,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
         )
 
-        rho_df = rho_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return rho_df
-
     def get_epsilon(
         self,
         start_date: str | None = None,
@@ -2033,77 +2158,19 @@ class Options:
         toolkit.options.get_epsilon()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        epsilon: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            epsilon[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                epsilon[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    epsilon[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_epsilon(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        epsilon_df = helpers.create_greek_dataframe(
-            greek_dictionary=epsilon,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_epsilon,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
         )
 
-        epsilon_df = epsilon_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return epsilon_df
-
     def get_lambda(
         self,
         start_date: str | None = None,
@@ -2176,77 +2243,19 @@ class Options:
         toolkit.options.get_lambda()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        lambda_greek: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            lambda_greek[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                lambda_greek[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    lambda_greek[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_lambda(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        lambda_df = helpers.create_greek_dataframe(
-            greek_dictionary=lambda_greek,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_lambda,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
         )
 
-        lambda_df = lambda_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return lambda_df
-
     def collect_second_order_greeks(
         self,
         start_date: str | None = None,
@@ -2480,76 +2489,18 @@ class Options:
         toolkit.options.get_gamma()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        gamma: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            gamma[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                gamma[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    gamma[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_gamma(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        gamma_df = helpers.create_greek_dataframe(
-            greek_dictionary=gamma,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_gamma,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        gamma_df = gamma_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return gamma_df
-
     def get_dual_gamma(
         self,
         start_date: str | None = None,
@@ -2612,76 +2563,18 @@ class Options:
         toolkit.options.get_dual_gamma()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_dual_gamma,
+            start_date=start_date,
             strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        dual_gamma: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            dual_gamma[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                dual_gamma[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    dual_gamma[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_dual_gamma(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        dual_gamma_df = helpers.create_greek_dataframe(
-            greek_dictionary=dual_gamma,
-            start_date=start_date,
-        )
-
-        dual_gamma_df = dual_gamma_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return dual_gamma_df
-
     def get_vanna(
         self,
         start_date: str | None = None,
@@ -2751,76 +2644,18 @@ class Options:
         toolkit.options.get_vanna()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        vanna: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            vanna[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                vanna[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    vanna[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_vanna(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        vanna_df = helpers.create_greek_dataframe(
-            greek_dictionary=vanna,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_vanna,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        vanna_df = vanna_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return vanna_df
-
     def get_charm(
         self,
         start_date: str | None = None,
@@ -2892,77 +2727,19 @@ class Options:
         toolkit.options.get_charm()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        charm: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            charm[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                charm[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    charm[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_charm(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                            put_option=put_option,
-                        )
-                    )
-
-        charm_df = helpers.create_greek_dataframe(
-            greek_dictionary=charm,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_charm,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
+            put_option=put_option,
         )
 
-        charm_df = charm_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return charm_df
-
     def get_vomma(
         self,
         start_date: str | None = None,
@@ -3031,76 +2808,18 @@ class Options:
         toolkit.options.get_vomma()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        vomma: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            vomma[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                vomma[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    vomma[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_vomma(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        vomma_df = helpers.create_greek_dataframe(
-            greek_dictionary=vomma,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_vomma,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        vomma_df = vomma_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return vomma_df
-
     def get_vera(
         self,
         start_date: str | None = None,
@@ -3170,76 +2889,18 @@ class Options:
         toolkit.options.get_vera()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        vera: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            vera[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                vera[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    vera[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_vera(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        vera_df = helpers.create_greek_dataframe(
-            greek_dictionary=vera,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_vera,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        vera_df = vera_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return vera_df
-
     def get_veta(
         self,
         start_date: str | None = None,
@@ -3310,76 +2971,18 @@ class Options:
         toolkit.options.get_veta()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        veta: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            veta[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                veta[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    veta[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_veta(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        veta_df = helpers.create_greek_dataframe(
-            greek_dictionary=veta,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_veta,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        veta_df = veta_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return veta_df
-
     def get_partial_derivative(
         self,
         start_date: str | None = None,
@@ -3441,78 +3044,18 @@ class Options:
         toolkit.options.get_partial_derivative()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        partial_derivative: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            partial_derivative[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                partial_derivative[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    partial_derivative[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_second_order_partial_derivative(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        partial_derivative_df = helpers.create_greek_dataframe(
-            greek_dictionary=partial_derivative,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_second_order_partial_derivative,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        partial_derivative_df = partial_derivative_df.round(
-            rounding if rounding else self._rounding
-        )
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return partial_derivative_df
-
     def collect_third_order_greeks(
         self,
         start_date: str | None = None,
@@ -3692,76 +3235,18 @@ class Options:
         toolkit.options.get_speed()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        speed: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            speed[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                speed[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    speed[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_speed(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        speed_df = helpers.create_greek_dataframe(
-            greek_dictionary=speed,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_speed,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        speed_df = speed_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return speed_df
-
     def get_zomma(
         self,
         start_date: str | None = None,
@@ -3831,76 +3316,18 @@ class Options:
         toolkit.options.get_zomma()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        zomma: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            zomma[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                zomma[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    zomma[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_zomma(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        zomma_df = helpers.create_greek_dataframe(
-            greek_dictionary=zomma,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_zomma,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        zomma_df = zomma_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return zomma_df
-
     def get_color(
         self,
         start_date: str | None = None,
@@ -3970,76 +3397,18 @@ class Options:
         toolkit.options.get_color()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        color: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            color[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                color[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    color[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_color(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        color_df = helpers.create_greek_dataframe(
-            greek_dictionary=color,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_color,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
 
-        color_df = color_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return color_df
-
     def get_ultima(
         self,
         start_date: str | None = None,
@@ -4109,72 +3478,14 @@ class Options:
         toolkit.options.get_ultima()
         ```
         """
-        if start_date is not None and start_date not in self._prices.index:
-            raise ValueError(f"The start date {start_date} is not a valid date.")
-
-        start_date = start_date if start_date else self._daily_historical.index[-1]
-        stock_price = self._prices.loc[start_date]
-        volatility = self._volatility.loc[start_date]
-
-        risk_free_rate = (
-            risk_free_rate
-            if risk_free_rate is not None
-            else self._risk_free_rate.loc[start_date]
-        )
-
-        strike_prices_per_ticker = helpers.define_strike_prices(
-            tickers=self._tickers,
-            stock_price=stock_price,
-            strike_step_size=strike_step_size,
-            strike_price_range=strike_price_range,
-        )
-
-        # This creates a list of time to expiration values from 0 to time_range, with a step size of 1
-        time_to_expiration_list = [
-            time / 365 for time in range(0, expiration_time_range)
-        ]
-
-        ultima: dict[str, dict[float, dict[float, float]]] = {}
-        dividend_yield_value: dict[str, float] = {}
-
-        for ticker, strike_prices in strike_prices_per_ticker.items():
-            ultima[ticker] = {}
-            dividend_yield_value[ticker] = (
-                dividend_yield
-                if dividend_yield is not None
-                else self._dividend_yield[ticker].iloc[-1]
-            )
-
-            for strike_price in strike_prices:
-                ultima[ticker][strike_price] = {}
-
-                for time_to_expiration in time_to_expiration_list:
-                    ultima[ticker][strike_price][time_to_expiration] = (
-                        greeks_model.get_ultima(
-                            stock_price=stock_price.loc[ticker],
-                            strike_price=strike_price,
-                            time_to_expiration=time_to_expiration,
-                            risk_free_rate=risk_free_rate,
-                            volatility=volatility.loc[ticker],
-                            dividend_yield=dividend_yield_value[ticker],
-                        )
-                    )
-
-        ultima_df = helpers.create_greek_dataframe(
-            greek_dictionary=ultima,
+        return self._calculate_option_surface(
+            model_function=greeks_model.get_ultima,
             start_date=start_date,
+            strike_price_range=strike_price_range,
+            strike_step_size=strike_step_size,
+            expiration_time_range=expiration_time_range,
+            risk_free_rate=risk_free_rate,
+            dividend_yield=dividend_yield,
+            show_input_info=show_input_info,
+            rounding=rounding,
         )
-
-        ultima_df = ultima_df.round(rounding if rounding else self._rounding)
-
-        if show_input_info:
-            helpers.show_input_info(
-                start_date=self._daily_historical.index[0],
-                end_date=self._daily_historical.index[-1],
-                stock_prices=stock_price,
-                volatility=volatility,
-                risk_free_rate=risk_free_rate,
-                dividend_yield=dividend_yield_value,
-            )
-
-        return ultima_df
@@ -3,13 +3,25 @@
 __docformat__ = "google"
 
 import inspect
+from functools import cached_property
 
+import numpy as np
 import pandas as pd
+from scipy import stats
 
 from financetoolkit.utilities import logger_model
 
 logger = logger_model.get_logger()
 
+# This is meant for calculations in which a Multi Index exists. This is the case
+# when calculating a "within period" in which the first index represents the period
+# (e.g. 2020Q1) and the second index the days within that period (January to March)
+MULTI_PERIOD_INDEX_LEVELS = 2
+
+# The variance, relative to the second moment of the returns, below which returns are
+# considered to not move given that the moments are only precise up to rounding errors
+ZERO_VARIANCE_TOLERANCE = 1e-14
+
 # pylint: disable=protected-access
 
 PERIOD_TRANSLATION: dict[str, str | dict[str, str]] = {
@@ -144,6 +156,654 @@ def determine_within_dataset(
     return within_historical_data
 
 
+class BenchmarkMoments:
+    """
+    The BenchmarkMoments calculate the covariance, correlation, beta, tracking error and
+    information ratio of every ticker against the benchmark from the moments of the (date ×
+    ticker) return matrix. Depending on the returns and the window size, these moments are
+    taken over the full sample, within each period of a (period, date) MultiIndex or
+    over a rolling window through the merged moments of blocks of dates which makes each
+    window O(1) to evaluate regardless of its size. Just like Pandas, the moments are based
+    on the dates on which both the ticker and the benchmark have a return.
+    """
+
+    def __init__(
+        self,
+        returns: pd.DataFrame,
+        benchmark_returns: pd.Series,
+        window_size: int | None = None,
+        within_period: bool = True,
+    ):
+        """
+        Initializes the BenchmarkMoments.
+
+        Args:
+            returns (pd.DataFrame): The returns of the tickers. A (period, date) MultiIndex
+                results in the moments being calculated within each period.
+            benchmark_returns (pd.Series): The returns of the benchmark.
+            window_size (int | None, optional): The size of the rolling window. Defaults to
+                None which calculates the moments over the full sample or within each period.
+            within_period (bool, optional): Whether to calculate the moments within each period
+                when the returns have a (period, date) MultiIndex. Defaults to True.
+        """
+        if not benchmark_returns.index.equals(returns.index):
+            benchmark_returns = benchmark_returns.reindex(returns.index)
+
+        self.columns = returns.columns
+        self.window_size = window_size
+
+        if (
+            window_size is None
+            and within_period
+            and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
+        ):
+            period_codes, self.index = pd.factorize(
+                returns.index.get_level_values(0), sort=True
+            )
+            self.index.name = returns.index.names[0]
+            order = np.argsort(period_codes, kind="stable")
+            counts = np.bincount(period_codes, minlength=len(self.index))
+
+            self._period_codes = period_codes[order]
+            self._period_starts = np.cumsum(counts) - counts
+
+            returns_values = returns.to_numpy(dtype=float)[order]
+            benchmark_values = benchmark_returns.to_numpy(dtype=float)[order]
+        else:
+            self.index = returns.index if window_size else None
+            self._period_codes = None
+            self._period_starts = None
+
+            returns_values = returns.to_numpy(dtype=float)
+            benchmark_values = benchmark_returns.to_numpy(dtype=float)
+
+        self._benchmark = benchmark_values[:, np.newaxis]
+        self._valid = ~np.isnan(returns_values) & ~np.isnan(self._benchmark)
+
+        self._returns = np.where(self._valid, returns_values, 0)
+        self._benchmark_pairs = np.where(self._valid, self._benchmark, 0)
+        self._difference = self._returns - self._benchmark_pairs
+
+    def to_pandas(self, values: np.ndarray) -> pd.Series | pd.DataFrame:
+        """
+        Convert the calculated moments into a Pandas object.
+
+        Args:
+            values (np.ndarray): The moments for each window (or period) and ticker.
+
+        Returns:
+            pd.Series | pd.DataFrame: A Series with the tickers as the index for the full
+                sample and otherwise a DataFrame with the periods or dates as the index.
+        """
+        if self.index is None:
+            return pd.Series(values[0], index=self.columns)
+
+        return pd.DataFrame(values, index=self.index, columns=self.columns)
+
+    def _aggregate(self, values: np.ndarray) -> np.ndarray:
+        """Sum the values over the full sample or within each period."""
+        if self._period_starts is not None:
+            return np.add.reduceat(values, self._period_starts, axis=0)
+
+        return values.sum(axis=0, keepdims=True)
+
+    def _get_comoments(
+        self, first: np.ndarray, second: np.ndarray, valid: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the number of observations, the means and the co-moment, the sum of the products
+        of the deviations from the means, of two return matrices. Within each period and for
+        the full sample this is the two-pass algorithm Pandas uses.
+        """
+        if self.window_size is not None:
+            return self._get_rolling_comoments(first, second, valid)
+
+        rows = (
+            self._period_codes
+            if self._period_codes is not None
+            else np.zeros(len(first), dtype=int)
+        )
+        count = self._aggregate(valid.astype(float))
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            first_mean = self._aggregate(first) / count
+            second_mean = self._aggregate(second) / count
+
+        first_deviation = np.where(valid, first - first_mean[rows], 0)
+        second_deviation = np.where(valid, second - second_mean[rows], 0)
+        first_sum = self._aggregate(first_deviation)
+        second_sum = self._aggregate(second_deviation)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            comoment = (
+                self._aggregate(first_deviation * second_deviation)
+                - first_sum * second_sum / count
+            )
+
+            return (
+                count,
+                first_mean + first_sum / count,
+                second_mean + second_sum / count,
+                comoment,
+            )
+
+    def _get_rolling_comoments(
+        self, first: np.ndarray, second: np.ndarray, valid: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the number of observations, the means and the co-moment of every rolling window.
+
+        The dates are split into blocks of the window size and the moments of every prefix
+        and every suffix of a block are accumulated from the deviations from the running
+        means. A window consists of a suffix of one block and a prefix of the next, of which
+        the moments are merged with the formulas of Chan et al. This makes each window O(1)
+        to evaluate while, unlike sums of products, the moments remain precise when the
+        returns are large compared to their deviations.
+        """
+        window_size = self.window_size
+        observations, columns = first.shape
+        blocks = -(-observations // window_size)
+
+        def to_blocks(values: np.ndarray) -> np.ndarray:
+            """Arrange the values as (position within block × block × ticker)."""
+            padded_values = np.zeros((blocks * window_size, columns))
+            padded_values[:observations] = values
+
+            return np.ascontiguousarray(
+                padded_values.reshape(blocks, window_size, columns).swapaxes(0, 1)
+            )
+
+        first_blocks = to_blocks(first)
+        second_blocks = to_blocks(second)
+        valid_blocks = to_blocks(valid)
+
+        block_prefix = self._accumulate_moments(first_blocks, second_blocks, valid_blocks)
+        block_suffix = [
+            moment[::-1]
+            for moment in self._accumulate_moments(
+                first_blocks[::-1], second_blocks[::-1], valid_blocks[::-1]
+            )
+        ]
+
+        # A window that ends on the last date of a block lies entirely within that block
+        window_ends = np.arange(window_size - 1, observations)
+        window_starts = window_ends - window_size + 1
+        spans_blocks = ((window_ends + 1) % window_size != 0)[:, np.newaxis]
+
+        window_moments = self._merge_moments(
+            [
+                np.where(
+                    spans_blocks,
+                    moment[window_starts % window_size, window_starts // window_size],
+                    0,
+                )
+                for moment in block_suffix
+            ],
+            [
+                moment[window_ends % window_size, window_ends // window_size]
+                for moment in block_prefix
+            ],
+        )
+
+        rolling_moments = []
+
+        for moment in window_moments:
+            rolling_moment = np.full((observations, columns), np.nan)
+            rolling_moment[window_size - 1 :] = moment
+            rolling_moments.append(rolling_moment)
+
+        count = rolling_moments[0]
+        count[count < window_size] = np.nan
+
+        return tuple(rolling_moments)
+
+    @staticmethod
+    def _accumulate_moments(
+        first: np.ndarray, second: np.ndarray, valid: np.ndarray
+    ) -> list[np.ndarray]:
+        """
+        Accumulate the number of observations, the means and the co-moment along the first
+        axis. The co-moment is updated with the deviations from the running means as in
+        Welford's algorithm, C(n) = C(n - 1) + (x(n) - mean x(n - 1)) × (y(n) - mean y(n)),
+        of which the terms only depend on the running means and can therefore be summed at once.
+        """
+        count = np.cumsum(valid, axis=0)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            first_mean = np.where(count > 0, np.cumsum(first, axis=0) / count, 0)
+            second_mean = np.where(count > 0, np.cumsum(second, axis=0) / count, 0)
+
+        previous_first_mean = np.concatenate(
+            [np.zeros_like(first_mean[:1]), first_mean[:-1]]
+        )
+        comoment = np.cumsum(
+            valid * (first - previous_first_mean) * (second - second_mean), axis=0
+        )
+
+        return [count, first_mean, second_mean, comoment]
+
+    @staticmethod
+    def _merge_moments(
+        head: list[np.ndarray], tail: list[np.ndarray]
+    ) -> list[np.ndarray]:
+        """Merge the number of observations, the means and the co-moment of two samples."""
+        head_count, head_first_mean, head_second_mean, head_comoment = head
+        tail_count, tail_first_mean, tail_second_mean, tail_comoment = tail
+
+        count = head_count + tail_count
+        factor = np.divide(
+            tail_count, count, out=np.zeros_like(count), where=count > 0
+        )
+
+        first_delta = tail_first_mean - head_first_mean
+        second_delta = tail_second_mean - head_second_mean
+
+        return [
+            count,
+            head_first_mean + first_delta * factor,
+            head_second_mean + second_delta * factor,
+            head_comoment
+            + tail_comoment
+            + first_delta * second_delta * head_count * factor,
+        ]
+
+    @staticmethod
+    def _get_covariance(count: np.ndarray, comoment: np.ndarray) -> np.ndarray:
+        """The sample covariance (ddof=1) from the co-moment."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            covariance = comoment / (count - 1)
+
+        covariance[~(count > 1)] = np.nan
+
+        return covariance
+
+    @staticmethod
+    def _exclude_zero_variance(variance: np.ndarray, mean: np.ndarray) -> np.ndarray:
+        """
+        Replace the variances that are zero up to rounding errors, relative to the second
+        moment of the returns, with NaN.
+        """
+        with np.errstate(invalid="ignore"):
+            return np.where(
+                variance <= ZERO_VARIANCE_TOLERANCE * (variance + mean**2),
+                np.nan,
+                variance,
+            )
+
+    def _get_variance(
+        self, values: np.ndarray, valid: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """The variance and the mean of the values."""
+        count, mean, _, comoment = self._get_comoments(values, values, valid)
+
+        return np.maximum(self._get_covariance(count, comoment), 0), mean
+
+    @cached_property
+    def _returns_variance(self) -> tuple[np.ndarray, np.ndarray]:
+        """The variance and the mean of the ticker returns on the dates of the benchmark."""
+        return self._get_variance(self._returns, self._valid)
+
+    @cached_property
+    def _benchmark_pairs_variance(self) -> tuple[np.ndarray, np.ndarray]:
+        """The variance and the mean of the benchmark returns on the dates of each ticker."""
+        return self._get_variance(self._benchmark_pairs, self._valid)
+
+    @cached_property
+    def _benchmark_variance(self) -> tuple[np.ndarray, np.ndarray]:
+        """The variance and the mean of the benchmark returns on all dates it has a return."""
+        valid = ~np.isnan(self._benchmark)
+
+        return self._get_variance(np.where(valid, self._benchmark, 0), valid)
+
+    @cached_property
+    def _differences(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """The number of pairs, the mean and the co-moment of the excess returns."""
+        return self._get_comoments(self._difference, self._difference, self._valid)
+
+    @cached_property
+    def covariance(self) -> np.ndarray:
+        """The covariance with the benchmark, equal to pd.Series.cov."""
+        count, _, _, comoment = self._get_comoments(
+            self._returns, self._benchmark_pairs, self._valid
+        )
+
+        return self._get_covariance(count, comoment)
+
+    @cached_property
+    def variance(self) -> np.ndarray:
+        """The variance of the ticker returns on the dates the benchmark has a return."""
+        return self._returns_variance[0]
+
+    @cached_property
+    def benchmark_variance(self) -> np.ndarray:
+        """The variance of the benchmark on all dates it has a return, equal to pd.Series.var."""
+        return self._benchmark_variance[0]
+
+    @cached_property
+    def correlation(self) -> np.ndarray:
+        """
+        The correlation with the benchmark, equal to pd.Series.corr. Returns that do not move,
+        up to rounding errors, have no correlation which is returned as NaN.
+        """
+        variance = self._exclude_zero_variance(*self._returns_variance)
+        benchmark_variance = self._exclude_zero_variance(
+            *self._benchmark_pairs_variance
+        )
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.clip(
+                self.covariance / np.sqrt(variance * benchmark_variance), -1, 1
+            )
+
+    @cached_property
+    def beta(self) -> np.ndarray:
+        """
+        The covariance with the benchmark divided by the variance of the benchmark. A benchmark
+        that does not move, up to rounding errors, has no beta which is returned as NaN.
+        """
+        benchmark_variance = self._exclude_zero_variance(*self._benchmark_variance)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.covariance / benchmark_variance
+
+    @cached_property
+    def tracking_error(self) -> np.ndarray:
+        """The standard deviation of the returns in excess of the benchmark."""
+        count, _, _, comoment = self._differences
+
+        return np.sqrt(np.maximum(self._get_covariance(count, comoment), 0))
+
+    @cached_property
+    def information_ratio(self) -> np.ndarray:
+        """The mean of the returns in excess of the benchmark divided by the tracking error."""
+        _, mean, _, _ = self._differences
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return mean / self.tracking_error
+
+
+class FactorRegressions:
+    """
+    The FactorRegressions fit the regressions of the returns of every ticker on a set of
+    factors within each period at once. The (period, date) returns and factors are placed
+    in dense (period × date × ticker) and (period × date × factor) arrays, padded with
+    zeros for periods with fewer dates, so that the sums of squares and cross products
+    of all periods follow from a single batched matrix multiplication. Given that the
+    factors are the same for every ticker, the normal equations of a period are solved
+    once and shared by all tickers.
+
+    Missing returns are not skipped: a ticker with a missing return in a period receives
+    NaN for that period, just like the regression on a single return series would.
+    """
+
+    def __init__(self, returns: pd.DataFrame, factors: pd.DataFrame):
+        """
+        Initializes the FactorRegressions.
+
+        Args:
+            returns (pd.DataFrame): The returns of the tickers. A (period, date) MultiIndex
+                results in a regression within each period, otherwise a single regression
+                is fitted on all dates.
+            factors (pd.DataFrame): The factors with the same index as the returns.
+        """
+        if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
+            period_codes, self.periods = pd.factorize(
+                returns.index.get_level_values(0), sort=True
+            )
+            self.periods.name = returns.index.names[0]
+        else:
+            period_codes = np.zeros(len(returns), dtype=int)
+            self.periods = None
+
+        self.index = returns.index
+        self.columns = returns.columns
+        self.factors = factors.columns
+        self.counts = np.bincount(
+            period_codes, minlength=1 if self.periods is None else len(self.periods)
+        )
+
+        order = np.argsort(period_codes, kind="stable")
+        positions = np.empty(len(period_codes), dtype=int)
+        positions[order] = np.arange(len(period_codes)) - np.repeat(
+            np.cumsum(self.counts) - self.counts, self.counts
+        )
+
+        self._period_codes = period_codes
+        self._positions = positions
+
+        self._returns = self._to_blocks(returns.to_numpy(dtype=float))
+        self._factors = self._to_blocks(factors.to_numpy(dtype=float))
+
+    def _to_blocks(self, values: np.ndarray) -> np.ndarray:
+        """Place the (date × column) values into a zero padded (period × date × column) array."""
+        blocks = np.zeros(
+            (len(self.counts), self.counts.max(initial=0), values.shape[1])
+        )
+        blocks[self._period_codes, self._positions] = values
+
+        return blocks
+
+    def _from_blocks(self, blocks: np.ndarray) -> np.ndarray:
+        """Convert the (period × date × column) array back into (date × column) values."""
+        return blocks[self._period_codes, self._positions]
+
+    def to_dataframe(self, values: np.ndarray) -> pd.DataFrame:
+        """
+        Convert a (period × ticker) array into a DataFrame.
+
+        Args:
+            values (np.ndarray): The values for each period and ticker.
+
+        Returns:
+            pd.DataFrame: The values with the periods as the index and the tickers as the columns.
+        """
+        return pd.DataFrame(values, index=self.periods, columns=self.columns)
+
+    def to_residuals(self, residuals: np.ndarray) -> pd.DataFrame:
+        """
+        Convert the (period × date × ticker) residuals into a DataFrame.
+
+        Args:
+            residuals (np.ndarray): The residuals for each period, date and ticker.
+
+        Returns:
+            pd.DataFrame: The residuals with the same index and columns as the returns.
+        """
+        return pd.DataFrame(
+            self._from_blocks(residuals), index=self.index, columns=self.columns
+        )
+
+    @cached_property
+    def _count(self) -> np.ndarray:
+        """The number of dates in each period as a (period × 1) array."""
+        return self.counts[:, np.newaxis].astype(float)
+
+    def _center(self, blocks: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get the mean of each period and the values minus that mean with the padding kept at zero."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = blocks.sum(axis=1) / self._count
+
+        observations = (np.arange(blocks.shape[1]) < self.counts[:, np.newaxis])[
+            :, :, np.newaxis
+        ]
+
+        return mean, np.where(observations, blocks - mean[:, np.newaxis, :], 0)
+
+    @cached_property
+    def _centered_returns(self) -> tuple[np.ndarray, np.ndarray]:
+        """The mean and the centered returns."""
+        return self._center(self._returns)
+
+    @cached_property
+    def _centered_factors(self) -> tuple[np.ndarray, np.ndarray]:
+        """The mean and the centered factors."""
+        return self._center(self._factors)
+
+    def get_multi_regression(self) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        """
+        Fit the regression of the returns on all factors for every period and ticker.
+
+        The returns and factors are centered within each period after which the slopes
+        follow from the (pseudo) inverse of the factor cross products. This equals the
+        least squares solution of the regression with an intercept and, for periods with
+        fewer dates than factors, the minimum norm solution.
+
+        Returns:
+            dict[str, np.ndarray]: The intercept, the slope of each factor, the t-statistics,
+                the mean squared error, the R squared and the residual volatility as
+                (period × ticker) arrays.
+            np.ndarray: The residuals for each period, date and ticker.
+        """
+        returns_mean, returns = self._centered_returns
+        factors_mean, factors = self._centered_factors
+        count = self._count
+
+        factors_transposed = factors.transpose(0, 2, 1)
+        inverse = np.linalg.pinv(factors_transposed @ factors, hermitian=True)
+        slopes = inverse @ (factors_transposed @ returns)
+
+        residuals = returns - factors @ slopes
+        sum_of_squared_residuals = (residuals**2).sum(axis=1)
+        total_sum_of_squares = (returns**2).sum(axis=1)
+
+        intercept = returns_mean - (factors_mean[:, np.newaxis, :] @ slopes)[:, 0]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # Follows Scikit-learn in treating perfect predictions as an R squared of one
+            # and a constant return with imperfect predictions as an R squared of zero
+            r_squared = np.where(
+                sum_of_squared_residuals == 0,
+                1.0,
+                np.where(
+                    total_sum_of_squares == 0,
+                    0.0,
+                    1 - sum_of_squared_residuals / total_sum_of_squares,
+                ),
+            )
+            r_squared = np.where(np.isnan(sum_of_squared_residuals), np.nan, r_squared)
+            r_squared[self.counts < 2] = np.nan  # noqa: PLR2004
+
+            degrees_of_freedom = count - len(self.factors) - 1
+            residual_variance = np.where(
+                degrees_of_freedom > 0,
+                sum_of_squared_residuals / degrees_of_freedom,
+                np.nan,
+            )
+
+            slope_errors = np.sqrt(
+                residual_variance[:, np.newaxis, :]
+                * np.diagonal(inverse, axis1=1, axis2=2)[:, :, np.newaxis]
+            )
+            intercept_errors = np.sqrt(
+                residual_variance
+                * (
+                    1 / count
+                    + np.einsum("pk,pkl,pl->p", factors_mean, inverse, factors_mean)[
+                        :, np.newaxis
+                    ]
+                )
+            )
+
+            regression_results = {"Intercept": intercept}
+            regression_results.update(
+                {
+                    f"{factor} Slope": slopes[:, index]
+                    for index, factor in enumerate(self.factors)
+                }
+            )
+            regression_results["Intercept T-Statistic"] = intercept / intercept_errors
+            regression_results.update(
+                {
+                    f"{factor} T-Statistic": slopes[:, index] / slope_errors[:, index]
+                    for index, factor in enumerate(self.factors)
+                }
+            )
+            regression_results["Mean Squared Error (MSE)"] = (
+                sum_of_squared_residuals / count
+            )
+            regression_results["R Squared"] = r_squared
+            regression_results["Residual Volatility"] = np.sqrt(residual_variance)
+
+        return regression_results, residuals
+
+    def get_simple_regression(self) -> dict[str, np.ndarray]:
+        """
+        Fit the simple linear regressions between the returns and each factor for every
+        period and ticker, equal to scipy.stats.linregress with the returns as the
+        independent variable.
+
+        Returns:
+            dict[str, np.ndarray]: The intercept, slope, R squared, p-value and standard error
+                as (period × factor × ticker) arrays.
+        """
+        returns_mean, returns = self._centered_returns
+        factors_mean, factors = self._centered_factors
+        count = self._count[:, :, np.newaxis]
+
+        # The (co)variances without the degrees of freedom correction, equal to np.cov(bias=1)
+        returns_variance = (returns**2).sum(axis=1)[:, np.newaxis, :] / count
+        factors_variance = (factors**2).sum(axis=1)[:, :, np.newaxis] / count
+        covariance = (factors.transpose(0, 2, 1) @ returns) / count
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            correlation = np.clip(
+                covariance / np.sqrt(returns_variance * factors_variance), -1, 1
+            )
+            constant = (returns_variance == 0) | (factors_variance == 0)
+            correlation[constant] = np.where(covariance == 0, np.nan, 0.0)[constant]
+
+            slope = covariance / returns_variance
+            intercept = (
+                factors_mean[:, :, np.newaxis] - slope * returns_mean[:, np.newaxis, :]
+            )
+
+            degrees_of_freedom = count - 2
+            t_statistic = correlation * np.sqrt(
+                degrees_of_freedom
+                / ((1.0 - correlation + 1e-20) * (1.0 + correlation + 1e-20))
+            )
+            p_value = 2 * stats.t.sf(np.abs(t_statistic), degrees_of_freedom)
+            standard_error = np.sqrt(
+                (1 - correlation**2)
+                * factors_variance
+                / returns_variance
+                / degrees_of_freedom
+            )
+
+        # Follows SciPy in treating two dates as a perfect fit without a standard error
+        two_dates = self.counts == 2  # noqa: PLR2004
+        p_value[two_dates] = np.where(factors_variance == 0, 1.0, 0.0)[two_dates]
+        standard_error[two_dates] = 0.0
+
+        return {
+            "Intercept": intercept,
+            "Slope": slope,
+            "R Squared": correlation**2,
+            "P Value": p_value,
+            "Standard Error": standard_error,
+        }
+
+    def get_simple_residuals(
+        self, slope: np.ndarray, intercept: np.ndarray, factor_index: int
+    ) -> np.ndarray:
+        """
+        Get the residuals of the returns for the simple linear regressions on a factor.
+
+        Args:
+            slope (np.ndarray): The (period × factor × ticker) slopes.
+            intercept (np.ndarray): The (period × factor × ticker) intercepts.
+            factor_index (int): The position of the factor.
+
+        Returns:
+            np.ndarray: The residuals for each period, date and ticker.
+        """
+        return self._returns - (
+            slope[:, np.newaxis, factor_index]
+            * self._factors[:, :, factor_index, np.newaxis]
+            + intercept[:, np.newaxis, factor_index]
+        )
+
+
 def handle_errors(func):
     """
     Decorator to handle specific performance errors that may occur in a function and provide informative messages.
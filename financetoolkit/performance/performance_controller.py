@@ -51,6 +51,8 @@ class Performance:
         end_date: str | None = None,
         intraday_period: str | None = None,
         progress_bar: bool = True,
+        cached_data_location: str | None = None,
+        fama_and_french_url: str | None = None,
     ):
         """
         Initializes the Performance Controller Class.
@@ -63,6 +65,11 @@ class Performance:
             rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
             start_date (str | None, optional): The start date to use for the calculations. Defaults to None.
             end_date (str | None, optional): The end date to use for the calculations. Defaults to None.
+            cached_data_location (str | None, optional): The location in which the Fama and French dataset
+                is stored between sessions. Defaults to None which means it is only kept in memory.
+            fama_and_french_url (str | None, optional): The URL of the Fama and French dataset or the path to
+                a ZIP file on disk which allows working offline. Defaults to None which means the 5 Factor
+                dataset is downloaded from the website of Dartmouth College.
 
         As an example:
 
@@ -101,6 +108,8 @@ class Performance:
         self._risk_free_rate_data = risk_free_rate_data
 
         # Fama and French
+        self._cached_data_location: str | None = cached_data_location
+        self._fama_and_french_url: str | None = fama_and_french_url
         self._fama_and_french_dataset: pd.DataFrame = pd.DataFrame()
         self._fama_and_french_model: pd.DataFrame = pd.DataFrame()
         self._fama_and_french_residuals: pd.DataFrame = pd.DataFrame()
@@ -471,7 +480,10 @@ class Performance:
 
         if self._fama_and_french_dataset.empty:
             self._fama_and_french_dataset = (
-                performance_model.obtain_fama_and_french_dataset()
+                performance_model.obtain_fama_and_french_dataset(
+                    fama_and_french_url=self._fama_and_french_url,
+                    cached_data_location=self._cached_data_location,
+                )
             )
 
         fama_and_french_period = determine_within_dataset(
@@ -599,7 +611,10 @@ class Performance:
 
         if self._fama_and_french_dataset.empty:
             self._fama_and_french_dataset = (
-                performance_model.obtain_fama_and_french_dataset()
+                performance_model.obtain_fama_and_french_dataset(
+                    fama_and_french_url=self._fama_and_french_url,
+                    cached_data_location=self._cached_data_location,
+                )
             )
 
         fama_and_french_period = determine_within_dataset(
@@ -732,9 +747,14 @@ class Performance:
             self._tickers_without_portfolio
         ]
 
-        self._fama_and_french_dataset = (
-            performance_model.obtain_fama_and_french_dataset()
-        )
+        if self._fama_and_french_dataset.empty:
+            self._fama_and_french_dataset = (
+                performance_model.obtain_fama_and_french_dataset(
+                    fama_and_french_url=self._fama_and_french_url,
+                    cached_data_location=self._cached_data_location,
+                )
+            )
+
         fama_and_french_period = determine_within_dataset(
             self._fama_and_french_dataset, period, correlation=False
         )
@@ -742,171 +762,83 @@ class Performance:
         merged_df = fama_and_french_period.merge(
             returns, left_index=True, right_index=True
         )
-        factor_scores: dict = {}
-        daily_residuals: dict = {}
 
-        ticker_list_iterator = (
-            tqdm(
-                self._tickers_without_portfolio,
-                desc=f"Calculating {'Multi' if method == 'multi' else 'Individual'} Factor Exposures",
-            )
-            if ENABLE_TQDM & self._progress_bar
-            else self._tickers_without_portfolio
+        excess_returns = (
+            merged_df[self._tickers_without_portfolio]
+            .astype(float)
+            .sub(merged_df["RF"].astype(float), axis=0)
         )
+        factor_data = merged_df[factors_to_calculate].astype(float)
 
-        for ticker in ticker_list_iterator:
-            factor_scores[ticker] = {}
-            daily_residuals[ticker] = {}
-
-            if method == "multi":
-                for dataset_period in merged_df.index.get_level_values(0):
-                    factor_data = merged_df.loc[dataset_period][factors_to_calculate]
-                    excess_returns = (
-                        merged_df.loc[dataset_period][ticker]
-                        - merged_df.loc[dataset_period]["RF"]
-                    )
-
-                    (
-                        factor_scores[ticker][dataset_period],
-                        daily_residuals[ticker][dataset_period],
-                        error_message,
-                    ) = performance_model.get_fama_and_french_model_multi(
-                        excess_returns=excess_returns, factor_dataset=factor_data
-                    )
-
-                    if error_message:
-                        logger.warning(
-                            "%s for %s in %s.", error_message, ticker, dataset_period
-                        )
-
-                    fama_and_french_model = pd.DataFrame.from_dict(
-                        {
-                            (ticker, factor): value
-                            for ticker, factor_scores_ticker in factor_scores.items()
-                            for factor, value in factor_scores_ticker.items()
-                        },
-                        orient="index",
-                    )
-
-                fama_and_french_model = fama_and_french_model.unstack(
-                    level=0, sort=False
-                ).swaplevel(0, 1, axis=1)
-
-                # Sort the DataFrame with respect to the original column order
-                tickers_column_order = fama_and_french_model.columns.get_level_values(
-                    0
-                ).unique()
-                parameters_column_order = (
-                    fama_and_french_model.columns.get_level_values(1).unique()
+        if method == "multi":
+            regression_results, daily_residuals, error_message = (
+                performance_model.get_fama_and_french_model_multi(
+                    excess_returns=excess_returns, factor_dataset=factor_data
                 )
+            )
 
-                fama_and_french_model = (
-                    fama_and_french_model.sort_index(axis=1)
-                    .reindex(tickers_column_order, level=0, axis=1)
-                    .reindex(parameters_column_order, level=1, axis=1)
+            if error_message:
+                logger.warning("%s.", error_message)
+
+            fama_and_french_model = regression_results.reindex(
+                columns=pd.MultiIndex.from_product(
+                    [
+                        self._tickers_without_portfolio,
+                        [
+                            "Intercept",
+                            *[f"{factor} Slope" for factor in factors_to_calculate],
+                            "Mean Squared Error (MSE)",
+                            "R Squared",
+                        ],
+                    ]
                 )
+            )
+        else:
+            fama_and_french_model, daily_residuals = (
+                performance_model.get_fama_and_french_model_single(
+                    excess_returns=excess_returns, factor=factor_data
+                )
+            )
 
-            elif method == "simple":
-                for factor in factors_to_calculate:
-                    factor_scores[ticker][factor] = {}
-                    daily_residuals[ticker][factor] = {}
-                    for dataset_period in merged_df.index.get_level_values(0):
-                        factor_data = merged_df.loc[dataset_period][factor]
-                        excess_returns = (
-                            merged_df.loc[dataset_period][ticker]
-                            - merged_df.loc[dataset_period]["RF"]
-                        )
-
-                        (
-                            factor_scores[ticker][factor][dataset_period],
-                            daily_residuals[ticker][factor][dataset_period],
-                        ) = performance_model.get_fama_and_french_model_single(
-                            excess_returns=excess_returns, factor=factor_data
-                        )
-
-                        factor_scores[ticker][factor][dataset_period][
-                            "Factor Value"
-                        ] = factor_data.iloc[-1]
+            factor_values = factor_data.groupby(level=0).tail(1).droplevel(1)
+            period_returns = returns_total.reindex(fama_and_french_model.index)
 
-                        factor_scores[ticker][factor][dataset_period][
-                            "Residuals"
-                        ] = returns_total.loc[dataset_period][ticker] - (
-                            factor_scores[ticker][factor][dataset_period]["Slope"]
-                            * factor_data.iloc[-1]
-                            + factor_scores[ticker][factor][dataset_period]["Intercept"]
-                        )
+            for ticker in self._tickers_without_portfolio:
+                for factor in factors_to_calculate:
+                    fama_and_french_model[(ticker, factor, "Factor Value")] = (
+                        factor_values[factor]
+                    )
+                    fama_and_french_model[
+                        (ticker, factor, "Residuals")
+                    ] = period_returns[ticker] - (
+                        fama_and_french_model[(ticker, factor, "Slope")]
+                        * factor_values[factor]
+                        + fama_and_french_model[(ticker, factor, "Intercept")]
+                    )
 
-                fama_and_french_model = pd.DataFrame.from_dict(
-                    {
-                        (period, factor, ticker): value
-                        for ticker, factor_scores_ticker in factor_scores.items()
-                        for factor, factor_scores_factor in factor_scores_ticker.items()
-                        for period, value in factor_scores_factor.items()
-                    },
-                    orient="index",
+            fama_and_french_model = fama_and_french_model.reindex(
+                columns=pd.MultiIndex.from_product(
+                    [
+                        self._tickers_without_portfolio,
+                        factors_to_calculate,
+                        fama_and_french_model.columns.get_level_values(2).unique(),
+                    ]
                 )
+            )
 
-                # Sort the DataFrame with respect to the original column order
-                parameters_column_order = fama_and_french_model.columns.unique()
-                factor_column_order = fama_and_french_model.index.get_level_values(
-                    1
-                ).unique()
-                ticker_column_order = fama_and_french_model.index.get_level_values(
-                    2
-                ).unique()
-
-                fama_and_french_model = fama_and_french_model.stack(
-                    future_stack=True
-                ).unstack(level=[2, 1, 3])
-
-                fama_and_french_model = (
-                    fama_and_french_model.sort_index(axis=1)
-                    .reindex(parameters_column_order, level=2, axis=1)
-                    .reindex(factor_column_order, level=1, axis=1)
-                    .reindex(ticker_column_order, level=0, axis=1)
-                )
+            daily_residuals = daily_residuals.sort_index(axis=1, sort_remaining=False)
+
+        fama_and_french_model.index.name = None
 
         self._fama_and_french_model = fama_and_french_model.round(
             rounding if rounding else self._rounding
         ).loc[self._start_date : self._end_date]
 
         if include_daily_residuals:
-            if method == "multi":
-                daily_residuals_df = pd.DataFrame.from_dict(
-                    {
-                        (ticker, factor): value
-                        for ticker, residuals_ticker in daily_residuals.items()
-                        for factor, value in residuals_ticker.items()
-                    },
-                    orient="index",
-                )
-
-                daily_residuals_df = (
-                    daily_residuals_df.stack()
-                    .unstack(level=0)
-                    .sort_index(axis=1, sort_remaining=False)
-                )
-                daily_residuals_df = daily_residuals_df.reset_index(level=0, drop=True)
-            else:
-                daily_residuals_df = pd.DataFrame.from_dict(
-                    {
-                        (period, factor, ticker): value
-                        for ticker, residuals_ticker in daily_residuals.items()
-                        for factor, residuals_factor in residuals_ticker.items()
-                        for period, value in residuals_factor.items()
-                    },
-                    orient="index",
-                )
-
-                daily_residuals_df = (
-                    daily_residuals_df.unstack(level=[1, 2])
-                    .stack(level=0)
-                    .sort_index(axis=1, sort_remaining=False)
-                )
-
-                daily_residuals_df = daily_residuals_df.reset_index(level=0, drop=True)
+            daily_residuals = daily_residuals.droplevel(0).dropna(how="all")
+            daily_residuals.index.name = None
 
-            self._fama_and_french_residuals = daily_residuals_df.round(
+            self._fama_and_french_residuals = daily_residuals.round(
                 rounding if rounding else self._rounding
             ).loc[self._start_date : self._end_date]
 
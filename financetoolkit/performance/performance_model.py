@@ -1,6 +1,8 @@
 """Performance Model"""
 
 import io
+import os
+import time
 import urllib.request
 import warnings
 import zipfile
@@ -9,14 +11,29 @@ import numpy as np
 import pandas as pd
 import requests
 from scipy.stats import linregress
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error
+
+from financetoolkit.performance import helpers
+from financetoolkit.utilities import cache_model, logger_model
+
+logger = logger_model.get_logger()
 
 # This is meant for calculations in which a Multi Index exists. This is the case
 # when calculating a "within period" in which the first index represents the period
 # (e.g. 2020Q1) and the second index the days within that period (January to March)
 MULTI_PERIOD_INDEX_LEVELS = 2
 
+FAMA_AND_FRENCH_URL = (
+    "https://mba.tuck.dartmouth.edu/pages/faculty/ken.french/ftp/"
+    "F-F_Research_Data_5_Factors_2x3_daily_CSV.zip"
+)
+
+# The dataset is updated monthly, it is therefore revalidated at most once a day
+FAMA_AND_FRENCH_TIME_TO_LIVE = 24 * 60 * 60
+HTTP_NOT_MODIFIED = 304
+
+# The downloaded datasets by URL together with the time they were obtained
+_fama_and_french_datasets: dict[str, tuple[float, pd.DataFrame]] = {}
+
 # pylint: disable=isinstance-second-argument-not-valid-type
 
 
@@ -43,20 +60,17 @@ def get_covariance(
     Returns:
         pd.Series | pd.DataFrame: _description_
     """
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        if isinstance(returns, pd.DataFrame):
-            covariance = pd.Series(index=returns.columns)
-
-            for column in returns.columns:
-                covariance.loc[column] = returns[column].cov(benchmark_returns)
+    if isinstance(returns, pd.DataFrame):
+        moments = helpers.BenchmarkMoments(
+            returns, benchmark_returns, within_period=False
+        )
 
-            return covariance
+        return moments.to_pandas(moments.covariance)
 
-        if isinstance(returns, pd.Series | pd.core.window.rolling.Rolling):
-            return returns.cov(benchmark_returns)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
 
-    return returns.cov(benchmark_returns)
+        return returns.cov(benchmark_returns)
 
 
 def get_beta(
@@ -74,18 +88,11 @@ def get_beta(
         pd.Series | pd.DataFrame: _description_
     """
     if isinstance(returns, pd.DataFrame):
-        if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            combination = pd.concat([returns, benchmark_returns], axis=1)
-
-            # Calculate Sharpe ratio for each asset (ticker) in the DataFrame
-            covariance = combination.groupby(level=0).apply(
-                lambda x: get_covariance(x[returns.columns], x[benchmark_returns.name])
-            )
-            variance = benchmark_returns.groupby(level=0).apply(lambda x: x.var())
+        # Calculate beta for each asset (ticker) in the DataFrame at once, within
+        # each period in case of a Multi Index
+        moments = helpers.BenchmarkMoments(returns, benchmark_returns)
 
-            return covariance.div(variance, axis=0)
-
-        return get_covariance(returns, benchmark_returns) / benchmark_returns.var()
+        return moments.to_pandas(moments.beta)
 
     if isinstance(returns, pd.Series):
         # Calculate Sharpe ratio for a single asset (ticker)
@@ -113,20 +120,12 @@ def get_rolling_beta(
         pd.Series | pd.DataFrame: Rolling beta values.
     """
     returns = pd.DataFrame(returns) if isinstance(returns, pd.Series) else returns
-    rolling_cov = pd.DataFrame(
-        index=returns.index, columns=returns.columns, dtype=np.float64
-    )
-
-    for column in returns.columns:
-        rolling_cov.loc[:, column] = get_covariance(
-            returns[column].rolling(window=window_size), benchmark_returns
-        )
 
-    rolling_var = benchmark_returns.rolling(window=window_size).var()
-
-    rolling_beta = rolling_cov.div(rolling_var, axis=0)
+    moments = helpers.BenchmarkMoments(
+        returns, benchmark_returns, window_size=window_size
+    )
 
-    return rolling_beta
+    return moments.to_pandas(moments.beta)
 
 
 def get_capital_asset_pricing_model(
@@ -177,7 +176,11 @@ def get_capital_asset_pricing_model(
     return capital_asset_pricing_model
 
 
-def obtain_fama_and_french_dataset(fama_and_french_url: str | None = None):
+def obtain_fama_and_french_dataset(
+    fama_and_french_url: str | None = None,
+    cached_data_location: str | None = None,
+    time_to_live: float = FAMA_AND_FRENCH_TIME_TO_LIVE,
+) -> pd.DataFrame:
     """
     This functionality returns the Fama and French 5 Factor Model dataset. It is a dataset that contains the
     excess returns of the 5 factors that are used in the Fama and French 5 Factor Model. The factors are:
@@ -193,38 +196,163 @@ def obtain_fama_and_french_dataset(fama_and_french_url: str | None = None):
     and is updated on a monthly basis. The dataset is packaged in a ZIP file, so it needs to be extracted first.
     The ZIP file contains a CSV file with the dataset.
 
-    It is also possible to read other datasets from Fama and French with this functionality.
+    Given that the dataset only changes monthly, it is not downloaded on every call. Within the same process
+    the parsed dataset is reused until the time to live has passed. When a cache location is provided, the
+    parsed dataset is also stored on disk together with the ETag and Last-Modified headers of the response.
+    Once that entry is stale, it is revalidated with a conditional request so that it is only downloaded again
+    when it actually changed. If the website can not be reached, the stored dataset is used regardless of its
+    age which also makes it possible to work offline from a previously stored (or pre-seeded) dataset.
+
+    It is also possible to read other datasets from Fama and French with this functionality, either from
+    their URL or from a ZIP file on disk.
 
     Args:
         fama_and_french_url (str): the URL of the ZIP file that contains the dataset. If no URL is provided, the
         default URL (Fama and French 5 Factor) is used.
+        cached_data_location (str | None): the location of the cached data. Defaults to None which means the
+        dataset is only kept in memory.
+        time_to_live (float): the number of seconds the dataset is used before it is revalidated. Defaults to
+        one day.
 
     Returns:
         pd.DataFrame: the Fama and French 5 Factor Model dataset.
     """
     # Define the URL of the ZIP file
     fama_and_french_url = (
-        fama_and_french_url
-        if fama_and_french_url
-        else "https://mba.tuck.dartmouth.edu/pages/faculty/ken.french/ftp/F-F_Research_Data_5_Factors_2x3_daily_CSV.zip"
+        fama_and_french_url if fama_and_french_url else FAMA_AND_FRENCH_URL
+    )
+
+    if os.path.isfile(fama_and_french_url):
+        with open(fama_and_french_url, "rb") as zip_file:
+            return read_fama_and_french_dataset(zip_file.read())
+
+    if fama_and_french_url in _fama_and_french_datasets:
+        created, fama_and_french_dataset = _fama_and_french_datasets[
+            fama_and_french_url
+        ]
+
+        if time.time() <= created + time_to_live:
+            return fama_and_french_dataset.copy()
+
+    entry = {
+        "source": "FamaFrench",
+        "endpoint": "factors",
+        "params": {"url": fama_and_french_url},
+    }
+    manifest = (
+        cache_model.load_manifest(cached_data_location, **entry)
+        if cached_data_location
+        else {}
+    )
+    stored_dataset = (
+        cache_model.load_entry(cached_data_location, include_expired=True, **entry)
+        if manifest
+        else pd.DataFrame()
+    )
+
+    if not stored_dataset.empty and not cache_model.is_expired(manifest):
+        fama_and_french_dataset = stored_dataset
+    else:
+        try:
+            fama_and_french_dataset, validators = download_fama_and_french_dataset(
+                fama_and_french_url,
+                validators=(
+                    manifest.get("metadata") if not stored_dataset.empty else None
+                ),
+            )
+        except OSError:
+            if stored_dataset.empty:
+                raise
+
+            logger.warning(
+                "The Fama and French dataset could not be downloaded from %s, "
+                "using the stored dataset from %s instead.",
+                fama_and_french_url,
+                time.strftime("%Y-%m-%d", time.localtime(manifest["created"])),
+            )
+
+            fama_and_french_dataset = stored_dataset
+        else:
+            if fama_and_french_dataset is None:
+                # The dataset did not change since it was stored
+                cache_model.refresh_entry(cached_data_location, **entry)
+                fama_and_french_dataset = stored_dataset
+            elif cached_data_location:
+                cache_model.save_entry(
+                    fama_and_french_dataset,
+                    cached_data_location,
+                    time_to_live=time_to_live,
+                    metadata=validators,
+                    **entry,
+                )
+
+    _fama_and_french_datasets[fama_and_french_url] = (
+        time.time(),
+        fama_and_french_dataset,
     )
 
+    return fama_and_french_dataset.copy()
+
+
+def download_fama_and_french_dataset(
+    fama_and_french_url: str, validators: dict | None = None
+) -> tuple[pd.DataFrame | None, dict]:
+    """
+    Downloads a Fama and French dataset. When the validators of a previously downloaded version
+    are provided, the request is conditional and the dataset is only returned if it changed.
+
+    Args:
+        fama_and_french_url (str): the URL of the ZIP file that contains the dataset.
+        validators (dict | None): the ETag and Last-Modified headers of the previously downloaded
+        version, if any.
+
+    Returns:
+        tuple[pd.DataFrame | None, dict]: the dataset, or None if it did not change, and the
+        validators of the downloaded version.
+    """
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/58.0.3029.110 Safari/537.3"
     }
 
+    if validators and validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators and validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
         # Use requests library for better error handling and timeout capabilities
         response = requests.get(fama_and_french_url, timeout=10, headers=headers)
         response.raise_for_status()  # Raise exception for HTTP errors
+
+        if response.status_code == HTTP_NOT_MODIFIED:
+            return None, validators or {}
+
         zip_data = response.content
+        response_headers = response.headers
     except requests.exceptions.RequestException:
         # Fallback to urllib if requests encounters an error
         with urllib.request.urlopen(fama_and_french_url) as response:
             zip_data = response.read()
+            response_headers = response.headers
+
+    return read_fama_and_french_dataset(zip_data), {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+
+
+def read_fama_and_french_dataset(zip_data: bytes) -> pd.DataFrame:
+    """
+    Reads a Fama and French dataset from the contents of the ZIP file it is distributed in.
 
+    Args:
+        zip_data (bytes): the contents of the ZIP file that contains the dataset.
+
+    Returns:
+        pd.DataFrame: the Fama and French dataset with the dates as index.
+    """
     with zipfile.ZipFile(io.BytesIO(zip_data)) as zip_file:
         # The dataset is packaged in a ZIP file, so it needs to be extracted first
         zip_file_contents = zip_file.namelist()
@@ -276,10 +404,30 @@ def get_factor_asset_correlations(
     return correlations
 
 
+def fill_missing_values(dataset: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fill the missing values with the next and otherwise the previous value, within each
+    period in case of a Multi Index.
+
+    Args:
+        dataset (pd.DataFrame): the dataset with missing values.
+
+    Returns:
+        pd.DataFrame: the dataset with the missing values filled.
+    """
+    if not dataset.isna().any().any():
+        return dataset
+
+    if dataset.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
+        return dataset.groupby(level=0).bfill().groupby(level=0).ffill()
+
+    return dataset.bfill().ffill()
+
+
 def get_fama_and_french_model_multi(
-    excess_returns: pd.Series,
+    excess_returns: pd.Series | pd.DataFrame,
     factor_dataset: pd.DataFrame,
-) -> pd.Series | pd.DataFrame:
+) -> tuple[dict | pd.DataFrame, pd.Series | pd.DataFrame, str | None]:
     """
     The Fama and French 5 Factor Model is an extension of the CAPM model. It adds four additional factors to the
     regression analysis to better describe asset returns:
@@ -297,61 +445,81 @@ def get_fama_and_french_model_multi(
         - Excess Return = Intercept + Beta1 * Mkt-RF + Beta2 * SMB + Beta3 * HML +
             Beta4 * RMW + Beta5 * CMA + Residuals
 
+    When a DataFrame of excess returns is provided, the regressions of all tickers are fitted at once and, in
+    case of a (period, date) Multi Index, within each period. Next to the regression parameters, this also
+    includes the t-statistics and the residual volatility.
+
     Args:
-        excess_returns (pd.Series): the excess returns.
+        excess_returns (pd.Series | pd.DataFrame): the excess returns.
         factor_dataset (pd.DataFrame): the factor dataset with each factor in a column.
 
     Returns:
-        dict: the regression results.
-        pd.Series: the residuals.
+        dict | pd.DataFrame: the regression results, a DataFrame with the periods as index and the
+        tickers and parameters as columns when a DataFrame is provided.
+        pd.Series | pd.DataFrame: the residuals.
+        str | None: the error message in case of periods with less than two samples.
     """
     error_message = None
 
-    if excess_returns.isna().any():
-        excess_returns = excess_returns.bfill(limit=None)
-        excess_returns = excess_returns.ffill(limit=None)
+    regressions = helpers.FactorRegressions(
+        fill_missing_values(
+            excess_returns.to_frame()
+            if isinstance(excess_returns, pd.Series)
+            else excess_returns
+        ),
+        fill_missing_values(factor_dataset),
+    )
 
-    if factor_dataset.isna().any().any():
-        excess_returns = excess_returns.bfill(limit=None, axis=1)
-        factor_dataset = factor_dataset.ffill(limit=None, axis=1)
+    regression_results, residuals = regressions.get_multi_regression()
 
-    model = LinearRegression()
-    model.fit(factor_dataset, excess_returns)
+    # Check for sufficient samples to calculate R^2
+    insufficient_samples = regressions.counts < 2  # noqa: PLR2004
 
-    # Check for sufficient samples before calculating R^2
-    if factor_dataset.shape[0] < 2:  # noqa
+    if insufficient_samples.any():
         error_message = (
             "R2 score is not well-defined with less than two samples. "
             "Setting value to NaN"
         )
-        r_squared = np.nan
-    else:
-        # Calculate R^2 using the model's score method
-        r_squared = model.score(factor_dataset, excess_returns)
-
-    y_pred = model.predict(factor_dataset)
-
-    residuals = excess_returns - y_pred
 
-    mse = mean_squared_error(excess_returns, y_pred)
-
-    regression_results = {"Intercept": model.intercept_}
+        if regressions.periods is not None:
+            error_message += " in " + ", ".join(
+                str(period) for period in regressions.periods[insufficient_samples]
+            )
 
-    for factor in factor_dataset.columns:
-        regression_results[f"{factor} Slope"] = model.coef_[
-            factor_dataset.columns.get_loc(factor)
+    if isinstance(excess_returns, pd.Series):
+        parameters = [
+            "Intercept",
+            *[f"{factor} Slope" for factor in factor_dataset.columns],
+            "Mean Squared Error (MSE)",
+            "R Squared",
         ]
 
-    regression_results["Mean Squared Error (MSE)"] = mse
-    regression_results["R Squared"] = r_squared
+        return (
+            {
+                parameter: regression_results[parameter][0, 0]
+                for parameter in parameters
+            },
+            regressions.to_residuals(residuals).iloc[:, 0],
+            error_message,
+        )
 
-    return regression_results, residuals, error_message
+    regression_results = pd.DataFrame(
+        np.stack(list(regression_results.values()), axis=-1).reshape(
+            len(regressions.counts), -1
+        ),
+        index=regressions.periods,
+        columns=pd.MultiIndex.from_product(
+            [excess_returns.columns, list(regression_results)]
+        ),
+    )
+
+    return regression_results, regressions.to_residuals(residuals), error_message
 
 
 def get_fama_and_french_model_single(
-    excess_returns: pd.Series,
-    factor: pd.Series,
-) -> pd.Series | pd.DataFrame:
+    excess_returns: pd.Series | pd.DataFrame,
+    factor: pd.Series | pd.DataFrame,
+) -> tuple[dict | pd.DataFrame, pd.Series | pd.DataFrame]:
     """
     The Fama and French 5 Factor Model is an extension of the CAPM model. It adds four additional factors to the
     regression analysis to better describe asset returns:
@@ -368,25 +536,60 @@ def get_fama_and_french_model_single(
 
         - Excess Return = Intercept + Slope * Factor Value + Residuals
 
+    When a DataFrame of excess returns and a DataFrame of factors are provided, the regressions of all tickers
+    on each factor are fitted at once and, in case of a (period, date) Multi Index, within each period.
+
     Args:
-        excess_returns (pd.Series): the excess returns.
-        factor (pd.Series): the factor series.
+        excess_returns (pd.Series | pd.DataFrame): the excess returns.
+        factor (pd.Series | pd.DataFrame): the factor series or the factor dataset with each factor in a column.
 
     Returns:
-        dict: the regression results.
-        pd.Series: the residuals.
+        dict | pd.DataFrame: the regression results, a DataFrame with the periods as index and the
+        tickers, factors and parameters as columns when DataFrames are provided.
+        pd.Series | pd.DataFrame: the residuals, with the factors and tickers as columns when
+        DataFrames are provided.
     """
-    result = linregress(excess_returns, factor)
-
-    regression_results = {
-        "Intercept": result.intercept,
-        "Slope": result.slope,
-        "R Squared": result.rvalue**2,
-        "P Value": result.pvalue,
-        "Standard Error": result.stderr,
-    }
+    if isinstance(excess_returns, pd.Series):
+        result = linregress(excess_returns, factor)
+
+        regression_results = {
+            "Intercept": result.intercept,
+            "Slope": result.slope,
+            "R Squared": result.rvalue**2,
+            "P Value": result.pvalue,
+            "Standard Error": result.stderr,
+        }
+
+        residuals = excess_returns - (result.slope * factor + result.intercept)
+
+        return regression_results, residuals
+
+    regressions = helpers.FactorRegressions(excess_returns, factor)
+    regression_values = regressions.get_simple_regression()
+
+    regression_results = pd.DataFrame(
+        np.stack(list(regression_values.values()), axis=-1)
+        .transpose(0, 2, 1, 3)
+        .reshape(len(regressions.counts), -1),
+        index=regressions.periods,
+        columns=pd.MultiIndex.from_product(
+            [excess_returns.columns, factor.columns, list(regression_values)]
+        ),
+    )
 
-    residuals = excess_returns - (result.slope * factor + result.intercept)
+    residuals = pd.concat(
+        {
+            factor_name: regressions.to_residuals(
+                regressions.get_simple_residuals(
+                    regression_values["Slope"],
+                    regression_values["Intercept"],
+                    factor_index,
+                )
+            )
+            for factor_index, factor_name in enumerate(factor.columns)
+        },
+        axis=1,
+    )
 
     return regression_results, residuals
 
@@ -640,18 +843,9 @@ def get_tracking_error(
         pd.Series: A Series of Sortino ratios with time as index and assets as columns.
     """
     if isinstance(asset_returns, pd.DataFrame):
-        if asset_returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            tracking_error = asset_returns.groupby(level=0).apply(
-                lambda x: (x.sub(benchmark_returns, axis=0)).std()
-            )
+        moments = helpers.BenchmarkMoments(asset_returns, benchmark_returns)
 
-            return tracking_error
-
-        tracking_error = pd.DataFrame(
-            index=asset_returns.index, columns=asset_returns.columns, dtype=np.float64
-        )
-        for column in tracking_error.columns:
-            tracking_error.loc[:, column] = (asset_returns - benchmark_returns).std()
+        return moments.to_pandas(moments.tracking_error)
 
     if isinstance(asset_returns, (pd.Series | float)):
         tracking_error = (asset_returns - benchmark_returns).std()
@@ -673,22 +867,9 @@ def get_information_ratio(
         pd.Series: A Series of Sortino ratios with time as index and assets as columns.
     """
     if isinstance(asset_returns, pd.DataFrame):
-        if asset_returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            information_ratio = asset_returns.groupby(level=0).apply(
-                lambda x: (
-                    x.sub(benchmark_returns, axis=0).mean()
-                    / (x.sub(benchmark_returns, axis=0)).std()
-                )
-            )
+        moments = helpers.BenchmarkMoments(asset_returns, benchmark_returns)
 
-            return information_ratio
-
-        information_ratio = pd.DataFrame(
-            index=asset_returns.index, columns=asset_returns.columns, dtype=np.float64
-        )
-        for column in information_ratio.columns:
-            difference = asset_returns[column] - benchmark_returns
-            information_ratio.loc[:, column] = difference.mean() / difference.std()
+        return moments.to_pandas(moments.information_ratio)
 
     if isinstance(asset_returns, (pd.Series | float)):
         difference = asset_returns - benchmark_returns
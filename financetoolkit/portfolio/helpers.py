@@ -1,11 +1,36 @@
 """Helpers Module"""
 
+import heapq
 import re
+from collections import deque
+from collections.abc import Iterator
 
+import numpy as np
 import pandas as pd
 import yaml
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods,too-many-locals,too-many-branches,too-many-statements
+
+LOT_MATCHING_METHODS = ["FIFO", "LIFO", "HIFO", "AVERAGE", "SPECIFIC"]
+
+# The ISO 4217 codes of the currencies that are removed from amounts in broker exports
+CURRENCY_CODES = [
+    "USD", "EUR", "GBP", "JPY", "CHF", "CAD", "AUD", "NZD", "CNY", "HKD",
+    "SGD", "SEK", "NOK", "DKK", "PLN", "CZK", "HUF", "RON", "BGN", "INR",
+    "KRW", "RUB", "TRY", "ILS", "VND", "PHP", "THB", "IDR", "MYR", "TWD",
+    "ZAR", "BRL", "MXN", "ARS", "CLP", "COP", "AED", "SAR",
+]  # fmt: skip
+
+# Parentheses, whitespace (which includes the non-breaking spaces used as thousands separator),
+# currency symbols and currency codes are removed before converting amounts to floats
+CURRENCY_PATTERN = (
+    r"[()\s$€£¥₹₩₽₺₪₫₱฿¢]"
+    rf"|(?<![A-Za-z])(?i:{'|'.join(CURRENCY_CODES)})(?![A-Za-z])"
+)
+
+# The number of unique dates that are used to infer the date format
+DATE_SAMPLE_SIZE = 100
 
 
 class Style:
@@ -52,6 +77,28 @@ def read_excel(location: str):
     raise ValueError("File type not supported. Please use .xlsx or .csv")
 
 
+def read_csv_in_chunks(location: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV (.csv) file in chunks of rows so that large files do not have to be held in
+    memory at once. The delimiter is determined from the header, a comma is used unless the
+    header only results in a single column in which case a semicolon is used.
+
+    Args:
+        location (str): The file path of the CSV file to read.
+        chunk_size (int): The number of rows in each chunk.
+
+    Returns:
+        Iterator[pd.DataFrame]: The chunks of the CSV file.
+    """
+    delimiter = ","
+
+    if len(pd.read_csv(location, delimiter=delimiter, nrows=0).columns) == 1:
+        delimiter = ";"
+
+    with pd.read_csv(location, delimiter=delimiter, chunksize=chunk_size) as reader:
+        yield from reader
+
+
 def read_yaml_file(location: str):
     """
     Read and parse a YAML file.
@@ -122,3 +169,330 @@ def convert_to_float(value: str):
         return float(value)
     except Exception as e:
         raise ValueError(f"Cannot convert {value} to float: {e}") from e
+
+
+def convert_series_to_float(values: pd.Series) -> pd.Series:
+    """
+    Convert a Series of numeric strings with locale-specific formatting to floats at once. This
+    follows `convert_to_float` for the separators and additionally handles the notation that is
+    common in broker exports:
+
+    - Currency symbols and the codes in `CURRENCY_CODES` are removed (e.g. "$1,234.50" or
+      "1.234,50 EUR"), any other text is not numeric.
+    - Whitespace, including non-breaking spaces used as thousands separator, is removed.
+    - Amounts between parentheses are negative (e.g. "(1,234.50)" becomes -1234.5).
+
+    Args:
+        values (pd.Series): The values to convert to floats.
+
+    Raises:
+        ValueError: If any of the values can not be converted to a float, this includes empty
+            strings and text such as "NA" or "pending".
+
+    Returns:
+        pd.Series: The converted floating-point numbers, missing values remain NaN.
+    """
+    if is_numeric_dtype(values) and not is_bool_dtype(values):
+        return values.astype(float)
+
+    text = values.astype("string").str.strip()
+    negative = text.str.fullmatch(r"\(.*\)").fillna(False).to_numpy(dtype=bool)
+
+    text = text.str.replace(CURRENCY_PATTERN, "", regex=True)
+
+    # Numbers like "-4.587,24" or "4587,24" and numbers like "-4,587.24"
+    european = text.str.fullmatch(r"-?(\d{1,3}(\.\d{3})*|\d+),\d+").fillna(False)
+    american = text.str.fullmatch(r"-?\d{1,3}(,\d{3})*\.\d+").fillna(False)
+
+    text = text.mask(
+        european,
+        text.str.replace(".", "", regex=False).str.replace(",", ".", regex=False),
+    )
+    text = text.mask(american, text.str.replace(",", "", regex=False))
+
+    numbers = pd.to_numeric(text, errors="coerce").astype(float).to_numpy()
+    invalid = (
+        np.isnan(numbers)
+        & values.notna().to_numpy(dtype=bool)
+        & ~text.str.fullmatch(r"[+-]?nan", case=False).fillna(False).to_numpy(dtype=bool)
+    )
+
+    if invalid.any():
+        raise ValueError(
+            f"Cannot convert {values[invalid].iloc[0]!r} to float: the value is not numeric."
+        )
+
+    return pd.Series(
+        np.where(negative, -np.abs(numbers), numbers),
+        index=values.index,
+        name=values.name,
+    )
+
+
+def infer_date_format(
+    dates: pd.Index | pd.Series,
+    date_format_options: list[str],
+    sample_size: int | None = DATE_SAMPLE_SIZE,
+) -> str | None:
+    """
+    Infer the date format from a sample of the dates so that the full column only has to be
+    parsed once. The first format that parses every date of the sample is returned.
+
+    Args:
+        dates (pd.Index | pd.Series): The dates to infer the format of.
+        date_format_options (list[str]): The formats to try in order.
+        sample_size (int | None): The number of unique dates to try the formats on, None tries the
+            formats on all dates. Defaults to 100.
+
+    Returns:
+        str | None: The format of the dates or None if none of the formats parse the sample.
+    """
+    sample = pd.Series(pd.unique(pd.Series(dates).dropna()))[:sample_size]
+
+    for date_format in date_format_options:
+        try:
+            pd.to_datetime(sample, format=date_format)
+
+            return date_format
+        except (ValueError, TypeError):
+            continue
+
+    return None
+
+
+def gather_values(
+    dataset: pd.Series | pd.DataFrame,
+    rows: pd.Index | np.ndarray,
+    columns: pd.Index | np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Gather the values of a Series or DataFrame for many labels at once. The labels are converted
+    to positions with a single `get_indexer` call per axis so that the lookup scales linearly in
+    the number of labels instead of doing a scalar `.loc` lookup for each of them.
+
+    Args:
+        dataset (pd.Series | pd.DataFrame): the dataset to gather the values from.
+        rows (pd.Index | np.ndarray): the index label of each value.
+        columns (pd.Index | np.ndarray | None): the column label of each value, required when
+            the dataset is a DataFrame. Defaults to None.
+
+    Returns:
+        np.ndarray: the value for each (row, column) label pair.
+
+    Raises:
+        KeyError: if any of the labels can not be found in the dataset.
+    """
+    row_positions = dataset.index.get_indexer(rows)
+
+    if (row_positions < 0).any():
+        raise KeyError(
+            f"Labels not found in the index: {list(pd.Index(rows)[row_positions < 0].unique())}"
+        )
+
+    if columns is None:
+        return dataset.to_numpy()[row_positions]
+
+    column_positions = dataset.columns.get_indexer(columns)
+
+    if (column_positions < 0).any():
+        raise KeyError(
+            f"Labels not found in the columns: "
+            f"{list(pd.Index(columns)[column_positions < 0].unique())}"
+        )
+
+    return dataset.to_numpy()[row_positions, column_positions]
+
+
+def match_lots(
+    ticker_codes: np.ndarray,
+    volumes: np.ndarray,
+    prices: np.ndarray,
+    dates: np.ndarray | None = None,
+    lot_identifiers: np.ndarray | None = None,
+    method: str = "FIFO",
+) -> dict[str, np.ndarray]:
+    """
+    Match the sells of each ticker with the lots that were bought before in a single pass over
+    the transactions. The open lots are kept in a structure that fits the method so that every
+    lot is only visited once when it is sold:
+
+    - FIFO (First-In, First-Out): sells the earliest purchased lots first (a moving pointer).
+    - LIFO (Last-In, First-Out): sells the most recently purchased lots first (a stack).
+    - HIFO (Highest-In, First-Out): sells the lots with the highest price first (a heap).
+    - AVERAGE: uses the average cost of all lots, lots are closed in FIFO order to determine
+      the open volume and holding period.
+    - SPECIFIC: sells the lot with the same identifier as the sell, any remaining volume is
+      matched in FIFO order.
+
+    Sells that exceed the open volume only realize the profit and loss of the open volume.
+
+    Args:
+        ticker_codes (np.ndarray): the integer code of the ticker of each transaction, negative
+            codes (missing tickers) are skipped.
+        volumes (np.ndarray): the volume of each transaction, positive for buys and negative for sells.
+        prices (np.ndarray): the price of each transaction.
+        dates (np.ndarray | None): the date of each transaction in days, used to determine the
+            holding period. Defaults to None which results in a holding period of zero days.
+        lot_identifiers (np.ndarray | None): the identifier of the lot of each transaction, required
+            for the SPECIFIC method. Defaults to None.
+        method (str): the lot matching method, either FIFO, LIFO, HIFO, AVERAGE or SPECIFIC.
+            Defaults to FIFO.
+
+    Returns:
+        dict[str, np.ndarray]: the realized profit and loss of each transaction ("PnL"), the
+        volume of each bought lot that remains open ("Open Volume") and the volume weighted
+        number of days the sold lots were held ("Holding Period").
+    """
+    method = method.upper()
+
+    if method not in LOT_MATCHING_METHODS:
+        raise ValueError(
+            f"Please provide a valid method. This can be {', '.join(LOT_MATCHING_METHODS)}."
+        )
+    if method == "SPECIFIC" and lot_identifiers is None:
+        raise ValueError("The SPECIFIC method requires the lot identifiers.")
+
+    ticker_codes = np.asarray(ticker_codes)
+    number_of_transactions = len(ticker_codes)
+
+    realized_pnl = np.full(number_of_transactions, np.nan)
+    open_volume = np.zeros(number_of_transactions)
+    holding_period = np.full(number_of_transactions, np.nan)
+
+    if number_of_transactions == 0:
+        return {
+            "PnL": realized_pnl,
+            "Open Volume": open_volume,
+            "Holding Period": holding_period,
+        }
+
+    volumes = np.asarray(volumes)
+    prices = np.asarray(prices)
+    dates = np.zeros(number_of_transactions) if dates is None else np.asarray(dates)
+    lot_identifiers = (
+        np.full(number_of_transactions, None)
+        if lot_identifiers is None
+        else np.asarray(lot_identifiers, dtype=object)
+    )
+
+    # Group the transactions by ticker while keeping their order within each ticker
+    order = np.argsort(ticker_codes, kind="stable")
+    boundaries = np.flatnonzero(np.diff(ticker_codes[order])) + 1
+
+    for positions in np.split(order, boundaries):
+        if ticker_codes[positions[0]] < 0:
+            continue
+
+        lot_positions: list[int] = []
+        lot_volumes: list = []
+        lot_prices: list = []
+        lot_dates: list = []
+
+        next_lot = 0  # The earliest lot that might still be open
+        lot_stack: list[int] = []
+        lot_heap: list[tuple] = []
+        lots_by_identifier: dict = {}
+
+        average_cost = 0
+        total_volume = 0
+
+        for position, volume, price, date, identifier in zip(
+            positions.tolist(),
+            volumes[positions].tolist(),
+            prices[positions].tolist(),
+            dates[positions].tolist(),
+            lot_identifiers[positions].tolist(),
+        ):
+            if volume > 0:
+                lot = len(lot_volumes)
+
+                lot_positions.append(position)
+                lot_volumes.append(volume)
+                lot_prices.append(price)
+                lot_dates.append(date)
+
+                if method == "AVERAGE":
+                    total_cost = average_cost * total_volume
+                    total_cost += volume * price
+                    total_volume += volume
+                    average_cost = total_cost / total_volume
+                elif method == "LIFO":
+                    lot_stack.append(lot)
+                elif method == "HIFO":
+                    heapq.heappush(lot_heap, (-price, lot))
+                elif method == "SPECIFIC":
+                    lots_by_identifier.setdefault(identifier, deque()).append(lot)
+
+                realized_pnl[position] = 0
+
+            elif volume < 0:
+                sell_volume = -volume
+                pnl = 0
+                matched_volume = 0
+                matched_days = 0
+
+                if method == "AVERAGE":
+                    if total_volume >= sell_volume:
+                        pnl = sell_volume * (price - average_cost)
+                        total_volume -= sell_volume
+                    else:
+                        pnl = total_volume * (price - average_cost)
+                        total_volume = 0
+
+                specific_lots = lots_by_identifier.get(identifier, deque())
+
+                while sell_volume > 0:
+                    # Select the lot to sell from, lots that are already closed are skipped
+                    if method == "LIFO":
+                        while lot_stack and lot_volumes[lot_stack[-1]] == 0:
+                            lot_stack.pop()
+                        lot = lot_stack[-1] if lot_stack else None
+                    elif method == "HIFO":
+                        while lot_heap and lot_volumes[lot_heap[0][1]] == 0:
+                            heapq.heappop(lot_heap)
+                        lot = lot_heap[0][1] if lot_heap else None
+                    else:
+                        while specific_lots and lot_volumes[specific_lots[0]] == 0:
+                            specific_lots.popleft()
+
+                        if specific_lots:
+                            lot = specific_lots[0]
+                        else:
+                            while (
+                                next_lot < len(lot_volumes)
+                                and lot_volumes[next_lot] == 0
+                            ):
+                                next_lot += 1
+                            lot = next_lot if next_lot < len(lot_volumes) else None
+
+                    if lot is None:
+                        break
+
+                    lot_volume = lot_volumes[lot]
+                    closed_volume = (
+                        lot_volume if lot_volume <= sell_volume else sell_volume
+                    )
+
+                    if method != "AVERAGE":
+                        pnl += closed_volume * (price - lot_prices[lot])
+
+                    lot_volumes[lot] = lot_volume - closed_volume
+                    sell_volume -= closed_volume
+                    matched_volume += closed_volume
+                    matched_days += closed_volume * (date - lot_dates[lot])
+
+                realized_pnl[position] = pnl
+
+                if matched_volume > 0:
+                    holding_period[position] = matched_days / matched_volume
+
+            else:
+                realized_pnl[position] = 0
+
+        open_volume[lot_positions] = lot_volumes
+
+    return {
+        "PnL": realized_pnl,
+        "Open Volume": open_volume,
+        "Holding Period": holding_period,
+    }
@@ -0,0 +1,327 @@
+"""Ledger Module"""
+
+__docformat__ = "google"
+
+import numpy as np
+import pandas as pd
+
+# pylint: disable=too-many-locals
+
+POSITION_COLUMNS = ["Volume", "Costs", "Invested Amount"]
+OVERVIEW_COLUMNS = [
+    "Volume",
+    "Costs",
+    "Invested Amount",
+    "Current Value",
+    "Cumulative Return",
+    "Invested Weight",
+    "Current Weight",
+]
+
+
+class PositionsLedger:
+    """
+    The Positions Ledger keeps the cumulative volume, costs and invested amount of every ticker
+    on every price day. New transactions only update the days from the transaction onwards and new
+    price days only extend the ledger by those days, so that the positions overview does not have
+    to be rebuilt from the full transaction history.
+
+    The ledger follows `overview_model.create_positions_overview`: transactions are counted on the
+    price day with the same date, transactions on dates without prices are not counted. Transactions
+    dated after the last price day are held until that price day is added.
+
+    The positions and prices are stored in arrays with spare rows whose capacity doubles when it
+    runs out, so that adding price days one at a time does not copy the full ledger every time.
+
+    The ledger can be serialized with `to_dict` and restored with `from_dict`.
+    """
+
+    def __init__(
+        self,
+        tickers: list[str],
+        dates: pd.Index,
+    ):
+        """
+        Initialize an empty ledger for the given tickers and price days.
+
+        Args:
+            tickers (list[str]): the tickers of the portfolio.
+            dates (pd.Index): the price days of the ledger in ascending order.
+        """
+        self._tickers = pd.Index(tickers)
+        self._dates = pd.Index(dates)
+
+        if not self._dates.is_monotonic_increasing or not self._dates.is_unique:
+            raise ValueError("The dates of the ledger should be unique and ascending.")
+
+        self._positions = np.zeros(
+            (len(POSITION_COLUMNS), len(self._dates), len(self._tickers))
+        )
+        self._prices = np.full((len(self._dates), len(self._tickers)), np.nan)
+        self._pending_transactions = pd.DataFrame(
+            columns=POSITION_COLUMNS,
+            index=pd.MultiIndex.from_arrays(
+                [self._dates[:0], pd.Index([], dtype=object)]
+            ),
+            dtype=float,
+        )
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: pd.DataFrame,
+        historical_prices: pd.DataFrame,
+        tickers: list[str] | None = None,
+    ) -> "PositionsLedger":
+        """
+        Create a ledger from the full transaction history and the historical prices.
+
+        Args:
+            transactions (pd.DataFrame): the transactions indexed by date and ticker with the
+                "Volume", "Costs" and "Invested Amount" columns.
+            historical_prices (pd.DataFrame): the (adjusted close) prices with the dates as index
+                and the tickers as columns.
+            tickers (list[str] | None): the tickers of the portfolio, defaults to the tickers of the
+                transactions in order of appearance.
+
+        Returns:
+            PositionsLedger: the ledger that contains all transactions and prices.
+        """
+        if tickers is None:
+            tickers = list(transactions.index.get_level_values(1).unique())
+
+        ledger = cls(tickers=tickers, dates=historical_prices.index)
+        ledger.update_prices(historical_prices)
+        ledger.add_transactions(transactions)
+
+        return ledger
+
+    @property
+    def tickers(self) -> list[str]:
+        """The tickers of the ledger."""
+        return list(self._tickers)
+
+    @property
+    def dates(self) -> pd.Index:
+        """The price days of the ledger."""
+        return self._dates
+
+    def add_transactions(self, transactions: pd.DataFrame):
+        """
+        Add transactions to the ledger. Only the cumulative positions from the earliest
+        transaction date onwards are updated.
+
+        Args:
+            transactions (pd.DataFrame): the transactions indexed by date and ticker with the
+                "Volume", "Costs" and "Invested Amount" columns.
+        """
+        if transactions.empty:
+            return
+
+        transactions = transactions[POSITION_COLUMNS].astype(float)
+        transaction_dates = transactions.index.get_level_values(0)
+
+        self._add_tickers(transactions.index.get_level_values(1).unique())
+
+        if len(self._dates):
+            pending = np.asarray(transaction_dates > self._dates[-1])
+        else:
+            pending = np.ones(len(transactions), dtype=bool)
+
+        if pending.any():
+            self._pending_transactions = pd.concat(
+                [self._pending_transactions, transactions[pending]]
+            )
+            transactions = transactions[~pending]
+            transaction_dates = transaction_dates[~pending]
+
+        rows = self._dates.get_indexer(transaction_dates)
+        counted = rows >= 0
+
+        if not counted.any():
+            return
+
+        rows = rows[counted]
+        columns = self._tickers.get_indexer(
+            transactions.index.get_level_values(1)[counted]
+        )
+        first_row = rows.min()
+
+        changes = np.zeros(
+            (len(POSITION_COLUMNS), len(self._dates) - first_row, len(self._tickers))
+        )
+        np.add.at(
+            changes,
+            (slice(None), rows - first_row, columns),
+            transactions.to_numpy()[counted].T,
+        )
+
+        self._positions[:, first_row : len(self._dates)] += np.cumsum(changes, axis=1)
+
+    def update_prices(self, historical_prices: pd.DataFrame):
+        """
+        Add or revise price days. Price days after the last price day extend the ledger with the
+        positions of the last price day and any transactions that were held until that day. Price
+        days that already exist are overwritten, which allows refreshing the latest price.
+
+        Args:
+            historical_prices (pd.DataFrame): the (adjusted close) prices with the dates as index
+                and the tickers as columns.
+
+        Raises:
+            ValueError: if a new price day falls before the last price day of the ledger.
+        """
+        if historical_prices.empty:
+            return
+
+        historical_prices = historical_prices.sort_index()
+        rows = self._dates.get_indexer(historical_prices.index)
+        new_dates = historical_prices.index[rows < 0]
+
+        if len(new_dates) and len(self._dates) and new_dates[0] <= self._dates[-1]:
+            raise ValueError(
+                "New price days can only be added after the last price day of the ledger, "
+                f"found {new_dates[0]} while the last price day is {self._dates[-1]}."
+            )
+
+        self._add_tickers(historical_prices.columns)
+
+        if len(new_dates):
+            size = len(self._dates)
+            self._reserve(size + len(new_dates))
+
+            self._positions[:, size : size + len(new_dates)] = (
+                self._positions[:, size - 1 : size] if size else 0.0
+            )
+            self._prices[size : size + len(new_dates)] = np.nan
+            self._dates = self._dates.append(new_dates)
+
+            rows = self._dates.get_indexer(historical_prices.index)
+
+        columns = self._tickers.get_indexer(historical_prices.columns)
+        self._prices[rows[:, None], columns] = historical_prices.to_numpy(dtype=float)
+
+        if len(new_dates) and not self._pending_transactions.empty:
+            pending_transactions = self._pending_transactions
+            self._pending_transactions = pending_transactions.iloc[:0]
+            self.add_transactions(pending_transactions)
+
+    def get_positions_overview(self, start_date=None) -> pd.DataFrame:
+        """
+        Get the positions overview in the layout of `overview_model.create_positions_overview`.
+
+        Args:
+            start_date: the first price day to include, defaults to all price days. Passing a
+                recent date only derives the metrics for those days.
+
+        Returns:
+            pd.DataFrame: the volume, costs, invested amount, current value, cumulative return,
+            invested weight and current weight of each ticker on each price day.
+        """
+        first_row = 0 if start_date is None else self._dates.searchsorted(start_date)
+        last_row = len(self._dates)
+
+        volume, costs, invested_amount = self._positions[:, first_row:last_row]
+        current_value = volume * self._prices[first_row:last_row]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cumulative_return = current_value / invested_amount
+            invested_weight = invested_amount / invested_amount.sum(
+                axis=1, keepdims=True
+            )
+            current_weight = current_value / np.nansum(
+                current_value, axis=1, keepdims=True
+            )
+
+        positions = np.concatenate(
+            [
+                volume,
+                costs,
+                invested_amount,
+                current_value,
+                cumulative_return,
+                invested_weight,
+                current_weight,
+            ],
+            axis=1,
+        )
+
+        return pd.DataFrame(
+            np.where(np.isnan(positions), 0.0, positions),
+            index=self._dates[first_row:],
+            columns=pd.MultiIndex.from_product([OVERVIEW_COLUMNS, self._tickers]),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the ledger to a dictionary that can be stored, for example with pickle.
+
+        Returns:
+            dict: the tickers, price days, cumulative positions, prices and held transactions.
+        """
+        return {
+            "tickers": self.tickers,
+            "dates": self._dates,
+            "positions": self._positions[:, : len(self._dates)].copy(),
+            "prices": self._prices[: len(self._dates)].copy(),
+            "pending_transactions": self._pending_transactions.copy(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "PositionsLedger":
+        """
+        Restore a ledger that was serialized with `to_dict`.
+
+        Args:
+            state (dict): the serialized ledger.
+
+        Returns:
+            PositionsLedger: the restored ledger.
+        """
+        ledger = cls(tickers=state["tickers"], dates=state["dates"])
+        ledger._positions = np.array(state["positions"], dtype=float)
+        ledger._prices = np.array(state["prices"], dtype=float)
+        ledger._pending_transactions = state["pending_transactions"]
+
+        return ledger
+
+    def _add_tickers(self, tickers: pd.Index):
+        """Add the tickers that are not part of the ledger yet without any positions."""
+        new_tickers = pd.Index(tickers).difference(self._tickers, sort=False)
+
+        if new_tickers.empty:
+            return
+
+        self._tickers = self._tickers.append(new_tickers)
+        capacity = self._prices.shape[0]
+        self._positions = np.concatenate(
+            [
+                self._positions,
+                np.zeros((len(POSITION_COLUMNS), capacity, len(new_tickers))),
+            ],
+            axis=2,
+        )
+        self._prices = np.concatenate(
+            [self._prices, np.full((capacity, len(new_tickers)), np.nan)],
+            axis=1,
+        )
+
+    def _reserve(self, size: int):
+        """Double the capacity of the positions and prices until it holds the given number of days."""
+        capacity = self._prices.shape[0]
+
+        if size <= capacity:
+            return
+
+        capacity = max(capacity, 1)
+
+        while capacity < size:
+            capacity *= 2
+
+        positions = np.zeros((len(POSITION_COLUMNS), capacity, len(self._tickers)))
+        positions[:, : len(self._dates)] = self._positions[:, : len(self._dates)]
+        prices = np.full((capacity, len(self._tickers)), np.nan)
+        prices[: len(self._dates)] = self._prices[: len(self._dates)]
+
+        self._positions = positions
+        self._prices = prices
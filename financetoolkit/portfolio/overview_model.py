@@ -3,6 +3,8 @@
 import numpy as np
 import pandas as pd
 
+from financetoolkit.portfolio import helpers
+
 # pylint: disable=too-many-locals
 
 # Matches up with currency codes EUR, USD, JPY etc. This is used for
@@ -41,32 +43,31 @@ def create_transactions_overview(
             The DataFrame is indexed by the asset tickers from the `portfolio_volume` index.
             Missing or invalid values are replaced with 0.0.
     """
-    invested_amount = []
-    current_value = []
-    percentage_return = []
-    value_return = []
-
-    for row, (_, ticker) in enumerate(portfolio_volume.index):
-        bought_value = portfolio_volume.iloc[row] * portfolio_price.iloc[row] - abs(
-            portfolio_costs.iloc[row]
-        )
+    volumes = portfolio_volume.to_numpy(dtype=float)
+    bought_value = volumes * portfolio_price.to_numpy(dtype=float) - np.abs(
+        portfolio_costs.to_numpy(dtype=float)
+    )
 
-        recent_value = (
-            portfolio_volume.iloc[row] * latest_returns.loc[ticker]
-            if portfolio_volume.iloc[row] > 0
-            else np.nan
-        )
+    # Only positions that are still held are valued at the latest price, the prices are
+    # gathered for all of these transactions at once through the ticker positions.
+    held = volumes > 0
+    recent_value = np.full(len(volumes), np.nan)
+    recent_value[held] = volumes[held] * helpers.gather_values(
+        latest_returns, portfolio_volume.index.get_level_values(1)[held]
+    )
 
-        invested_amount.append(bought_value)
-        current_value.append(recent_value)
-        percentage_return.append((recent_value / bought_value) - 1)
-        value_return.append(recent_value - bought_value)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentage_return = recent_value / bought_value - 1
 
     new_columns = pd.DataFrame(
-        [invested_amount, current_value, percentage_return, value_return],
-        columns=portfolio_volume.index,
-        index=["Invested Amount", "Current Value", "% Return", "Return"],
-    ).T
+        {
+            "Invested Amount": bought_value,
+            "Current Value": recent_value,
+            "% Return": percentage_return,
+            "Return": recent_value - bought_value,
+        },
+        index=portfolio_volume.index,
+    )
 
     new_columns = new_columns.fillna(0.0)
 
@@ -154,9 +155,9 @@ def create_portfolio_overview(
     asset_volatilities = asset_volatilities.reindex(portfolio_overview_grouped.index)
     betas = betas.reindex(portfolio_overview_grouped.index)
 
-    latest_price_values = []
-    for ticker in portfolio_overview_grouped.index:
-        latest_price_values.append(latest_returns.loc[ticker])
+    latest_price_values = helpers.gather_values(
+        latest_returns, portfolio_overview_grouped.index
+    )
 
     portfolio_overview_grouped.insert(
         2,
@@ -349,12 +350,12 @@ def create_transactions_performance(
         period_performance_grouped[costs_column]
     )
 
-    last_prices = []
-    last_benchmark_prices = []
+    periods = period_performance_grouped.index.get_level_values(0)
 
-    for period, _ in period_performance_grouped.iterrows():
-        last_prices.append(period_prices.loc[period[0], period[1]])
-        last_benchmark_prices.append(benchmark_period_prices.loc[period[0]])
+    last_prices = helpers.gather_values(
+        period_prices, periods, period_performance_grouped.index.get_level_values(1)
+    )
+    last_benchmark_prices = helpers.gather_values(benchmark_period_prices, periods)
 
     period_performance_grouped["Current Value"] = (
         period_performance_grouped[volume_column] * last_prices
@@ -536,106 +537,91 @@ def create_profit_and_loss_overview(
     volume_column: str,
     price_column: str,
     method="FIFO",
+    date_column: str | None = None,
+    lot_column: str | None = None,
 ):
     """
-    Calculate Profit and Loss (PnL) using FIFO, LIFO, or Average Price methods for multiple tickers.
+    Calculate Profit and Loss (PnL) using FIFO, LIFO, HIFO, Average Price or Specific Lot
+    methods for multiple tickers.
 
     This function calculates the realized PnL for each transaction based on the chosen inventory
-    valuation method (FIFO, LIFO, or Average Price). It computes both the individual PnL per transaction
-    and the cumulative PnL for each ticker.
+    valuation method. It computes both the individual PnL per transaction and the cumulative PnL
+    over all transactions. Next to that, it returns the volume of each purchase that is still held
+    and, when dates are provided, the average number of days the sold assets were held.
+
+    The transactions are matched in a single pass per ticker in which the open lots are kept in a
+    structure that fits the method, this keeps the calculation linear in the number of transactions
+    (or log-linear for HIFO) instead of quadratic for long-lived positions.
 
     Args:
-        transactions_overview (pd.DataFrame): DataFrame containing transaction data, with columns for tickers,
-            transaction volumes, and transaction prices.
+        transactions_overview (pd.DataFrame): DataFrame containing transaction data, with columns (or index
+            levels) for tickers, transaction volumes, and transaction prices in chronological order.
         ticker_column (str): The column name representing the tickers (e.g., asset names).
         volume_column (str): The column name representing the transaction volumes
             (positive for buys, negative for sells).
         price_column (str): The column name representing the transaction prices.
         method (str, optional): Method for inventory valuation.
-            Can be 'FIFO', 'LIFO', or 'AVERAGE'. Default is 'FIFO'.
+            Can be 'FIFO', 'LIFO', 'HIFO', 'AVERAGE' or 'SPECIFIC'. Default is 'FIFO'.
+        date_column (str | None, optional): The column name representing the transaction dates, used
+            to determine the holding period. Default is None.
+        lot_column (str | None, optional): The column name representing the lot identifier, which is
+            required for the 'SPECIFIC' method. Default is None.
 
     Returns:
-        pd.DataFrame: DataFrame with additional columns for 'PnL' (realized profit and loss per transaction)
-        and 'Cumulative PnL' (cumulative profit and loss).
+        pd.DataFrame: DataFrame with columns for 'PnL' (realized profit and loss per transaction),
+        'Cumulative PnL' (cumulative profit and loss), 'Open Volume' (the volume of a purchase that
+        is still held) and, if a date column is provided, 'Holding Period' (the volume weighted number
+        of days the sold assets were held).
 
     Notes:
         - FIFO (First-In, First-Out): Sells the earliest purchased assets first.
         - LIFO (Last-In, First-Out): Sells the most recently purchased assets first.
-        - AVERAGE: Uses the average cost of all assets in inventory for PnL calculation.
+        - HIFO (Highest-In, First-Out): Sells the assets with the highest purchase price first.
+        - AVERAGE: Uses the average cost of all assets in inventory for PnL calculation. The holding
+          period and open volume are determined as if the assets are sold in FIFO order.
+        - SPECIFIC: Sells the purchase with the same lot identifier as the sell, any remaining volume
+          is sold in FIFO order.
     """
 
-    def process_group(group):
-        inventory = []  # For FIFO or LIFO methods
-        avg_cost = 0  # For Average method
-        total_volume = 0  # For Average method
-        pnl = []  # Store PnL for each row in the group
-
-        for _, row in group.iterrows():
-            volume = row[volume_column]
-            price = row[price_column]
-
-            if volume > 0:  # Buy order
-                if method == "AVERAGE":
-                    # Update average cost
-                    total_cost = avg_cost * total_volume
-                    total_cost += volume * price
-                    total_volume += volume
-                    avg_cost = total_cost / total_volume
-                else:
-                    # Add to inventory for FIFO or LIFO
-                    inventory.append((volume, price))
-                pnl.append(0)  # No PnL for buy orders
-
-            elif volume < 0:  # Sell order
-                sell_volume = -volume
-                realized_pnl = 0
-
-                if method == "FIFO":
-                    # Process FIFO: Sell the earliest assets first
-                    while sell_volume > 0 and inventory:
-                        fifo_volume, fifo_price = inventory[0]
-                        if fifo_volume <= sell_volume:
-                            realized_pnl += fifo_volume * (price - fifo_price)
-                            sell_volume -= fifo_volume
-                            inventory.pop(0)
-                        else:
-                            realized_pnl += sell_volume * (price - fifo_price)
-                            inventory[0] = (fifo_volume - sell_volume, fifo_price)
-                            sell_volume = 0
-
-                elif method == "LIFO":
-                    # Process LIFO: Sell the most recently purchased assets first
-                    while sell_volume > 0 and inventory:
-                        lifo_volume, lifo_price = inventory.pop()
-                        if lifo_volume <= sell_volume:
-                            realized_pnl += lifo_volume * (price - lifo_price)
-                            sell_volume -= lifo_volume
-                        else:
-                            realized_pnl += sell_volume * (price - lifo_price)
-                            inventory.append((lifo_volume - sell_volume, lifo_price))
-                            sell_volume = 0
-
-                elif method == "AVERAGE":
-                    # Calculate PnL based on average cost
-                    if total_volume >= sell_volume:
-                        realized_pnl = sell_volume * (price - avg_cost)
-                        total_volume -= sell_volume
-                    else:
-                        realized_pnl = total_volume * (price - avg_cost)
-                        total_volume = 0
-
-                pnl.append(realized_pnl)
-
-            else:
-                pnl.append(0)  # No action for zero volume
-
-        group["PnL"] = pnl
-        return group
-
-    # Process each ticker group independently
-    transactions_overview = transactions_overview.groupby(
-        ticker_column, group_keys=False, observed=True
-    ).apply(process_group)
-    transactions_overview["Cumulative PnL"] = transactions_overview["PnL"].cumsum()
-
-    return transactions_overview[["PnL", "Cumulative PnL"]]
+    def get_values(column: str) -> pd.Index | pd.Series:
+        if column in transactions_overview.columns:
+            return transactions_overview[column]
+
+        return transactions_overview.index.get_level_values(column)
+
+    ticker_codes, _ = pd.factorize(get_values(ticker_column))
+
+    dates = None
+
+    if date_column is not None:
+        date_values = get_values(date_column)
+
+        if isinstance(date_values.dtype, pd.PeriodDtype):
+            date_values = pd.PeriodIndex(date_values).to_timestamp()
+
+        dates = pd.DatetimeIndex(date_values).to_numpy("datetime64[D]").astype(np.int64)
+
+    lots = helpers.match_lots(
+        ticker_codes=ticker_codes,
+        volumes=get_values(volume_column).to_numpy(),
+        prices=get_values(price_column).to_numpy(),
+        dates=dates,
+        lot_identifiers=(
+            get_values(lot_column).to_numpy() if lot_column is not None else None
+        ),
+        method=method,
+    )
+
+    profit_and_loss_overview = pd.DataFrame(
+        {
+            "PnL": lots["PnL"],
+            "Cumulative PnL": pd.Series(lots["PnL"]).cumsum().to_numpy(),
+            "Open Volume": lots["Open Volume"],
+        },
+        index=transactions_overview.index,
+    )
+
+    if dates is not None:
+        profit_and_loss_overview["Holding Period"] = lots["Holding Period"]
+
+    return profit_and_loss_overview
@@ -4,9 +4,15 @@ import os
 import shutil
 from importlib import resources
 
+import numpy as np
 import pandas as pd
 
-from financetoolkit.portfolio import helpers, overview_model, portfolio_model
+from financetoolkit.portfolio import (
+    helpers,
+    ledger_model,
+    overview_model,
+    portfolio_model,
+)
 from financetoolkit.toolkit_controller import Toolkit
 from financetoolkit.utilities import logger_model
 
@@ -43,6 +49,7 @@ class Portfolio:
         example: bool = False,
         configuration_file: str | None = None,
         rounding: int = 4,
+        use_cached_data: bool | str = False,
     ):
         """
         Initialize the Portfolio class with the provided configuration file and portfolio dataset.
@@ -68,6 +75,9 @@ class Portfolio:
             configuration_file (str | None): Path to a YAML configuration file defining portfolio settings.
                 If None, the default configuration file is used.
             rounding (int): The number of decimal places to round the outputs. Defaults to 4 decimal places.
+            use_cached_data (bool | str): A boolean indicating whether to store the formatted portfolio dataset
+                as a typed snapshot that is reused as long as the files do not change. If True, uses a 'cached'
+                folder. If a string is provided, uses that string as the path to the cache folder. Defaults to False.
 
         Raises:
             ValueError: If the provided configuration file is not in YAML format.
@@ -139,6 +149,12 @@ class Portfolio:
 
         self._rounding: int = rounding
         self._quarterly: bool = quarterly
+        self._use_cached_data: bool = (
+            use_cached_data if isinstance(use_cached_data, bool) else True
+        )
+        self._cached_data_location: str = (
+            "cached" if isinstance(use_cached_data, bool) else use_cached_data
+        )
         self._benchmark_ticker = (
             benchmark_ticker
             if benchmark_ticker
@@ -184,6 +200,7 @@ class Portfolio:
         self._portfolio_dataset: pd.DataFrame = pd.DataFrame()
         self._positions_overview: pd.DataFrame = pd.DataFrame()
         self._transactions_overview: pd.DataFrame = pd.DataFrame()
+        self._positions_ledger: ledger_model.PositionsLedger | None = None
 
         # Finance Toolkit Initialization
         self._api_key: str = api_key
@@ -511,6 +528,9 @@ class Portfolio:
                 currency_columns=currency_columns,
                 costs_columns=costs_columns,
                 column_mapping=column_mapping,
+                cached_data_location=(
+                    self._cached_data_location if self._use_cached_data else None
+                ),
             )
 
         self._original_tickers = list(
@@ -655,53 +675,49 @@ class Portfolio:
             period="yearly", progress_bar=False
         )
 
+        self._align_benchmark_prices()
+
+        return self._daily_benchmark_data
+
+    def _align_benchmark_prices(self):
+        """
+        Align the daily benchmark prices with the transactions of the portfolio dataset. This sets
+        the benchmark price of each transaction, the latest benchmark price and the benchmark prices
+        of each ticker.
+        """
         # It could be that a specific date does not exist for the given benchmark. In that case,
-        # the previous value is used instead.
-        self._benchmark_prices = self._daily_benchmark_data["Adj Close"].iloc[
-            self._daily_benchmark_data["Adj Close"].index.get_indexer(
-                self._portfolio_dataset.index.get_level_values(0), method="backfill"
-            )
-        ]
+        # the previous value is used instead. The positions are looked up once for all transactions
+        # so that the benchmark price of each transaction is a single gather.
+        benchmark_adjusted_close = self._daily_benchmark_data["Adj Close"]
+        benchmark_positions = benchmark_adjusted_close.index.get_indexer(
+            self._portfolio_dataset.index.get_level_values(0), method="backfill"
+        )
 
         # The index of the benchmark prices is set to the dates of the portfolio dataset
         # so that they are matched up again.
-        self._benchmark_prices.index = self._portfolio_dataset.index
-
-        self._benchmark_prices = self._benchmark_prices.sort_index()
-
-        benchmark_specific_prices = []
-        benchmark_latest_price = {}
-        benchmark_prices_per_ticker = pd.DataFrame(
-            columns=self._tickers, index=self._daily_benchmark_data.index
+        self._benchmark_specific_prices = pd.Series(
+            benchmark_adjusted_close.to_numpy()[benchmark_positions],
+            index=self._portfolio_dataset.index,
         )
+        self._benchmark_prices = self._benchmark_specific_prices.sort_index()
 
-        for (date, ticker), _ in self._portfolio_dataset.iterrows():
-            original_ticker = self._original_ticker_combinations[ticker]
-            benchmark_ticker = self._benchmark_tickers[original_ticker]
-
-            # Add the specific benchmark price and, if multiple orders of the same ticker are made on the same day
-            # (e.g. buying and selling), only report the benchmark price once.
-            benchmark_specific_price = self._benchmark_prices.loc[(date, ticker)]
+        # Every ticker in the portfolio is compared against the same benchmark.
+        portfolio_tickers = self._portfolio_dataset.index.get_level_values(1).unique()
 
-            if isinstance(benchmark_specific_price, float):
-                benchmark_specific_prices.append(pd.Series(benchmark_specific_price))
-            else:
-                benchmark_specific_prices.append(
-                    benchmark_specific_price.drop_duplicates()
+        self._latest_benchmark_price = pd.Series(
+            benchmark_adjusted_close.iloc[-1], index=portfolio_tickers
+        )
+        self._benchmark_prices_per_ticker = pd.DataFrame(
+            {
+                ticker: (
+                    benchmark_adjusted_close
+                    if ticker in portfolio_tickers
+                    else np.nan
                 )
-
-            benchmark_latest_price[ticker] = self._daily_benchmark_data[
-                "Adj Close"
-            ].iloc[-1]
-            benchmark_prices_per_ticker[ticker] = self._daily_benchmark_data[
-                "Adj Close"
-            ]
-
-        self._benchmark_specific_prices = pd.concat(benchmark_specific_prices)
-        self._latest_benchmark_price = pd.Series(benchmark_latest_price)
-        self._benchmark_prices_per_ticker = benchmark_prices_per_ticker
-
-        return self._daily_benchmark_data
+                for ticker in self._tickers
+            },
+            index=self._daily_benchmark_data.index,
+        )
 
     def collect_historical_data(
         self,
@@ -989,11 +1005,8 @@ class Portfolio:
 
         if self._positions_overview.empty:
             try:
-                self._positions_overview = overview_model.create_positions_overview(
-                    portfolio_tickers=self._tickers,
-                    period_dates=self._daily_historical_data.index.get_level_values(0),
-                    portfolio_dataset=self._transactions_overview,
-                    historical_prices=self._daily_historical_data,
+                self._positions_overview = (
+                    self.get_positions_ledger().get_positions_overview()
                 )
             except ValueError as error:
                 raise ValueError(
@@ -1006,6 +1019,178 @@ class Portfolio:
 
         return self._positions_overview
 
+    def get_positions_ledger(self) -> ledger_model.PositionsLedger | None:
+        """
+        Get the positions ledger of the portfolio which keeps the cumulative volume, costs and
+        invested amount of each asset on each day.
+
+        The ledger is built once from the transactions and the daily historical data and is then
+        kept up to date by `update_positions`. This means that adding transactions or price days
+        does not require reprocessing the full transaction history. The ledger can be serialized
+        with `to_dict` and restored with `PositionsLedger.from_dict`.
+
+        Returns:
+            PositionsLedger | None: The positions ledger of the portfolio or None if no historical
+                data could be collected.
+
+        Raises:
+            ValueError: If the transactions overview cannot be created.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Portfolio
+
+        portfolio = Portfolio(example=True, api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        ledger = portfolio.get_positions_ledger()
+
+        ledger.get_positions_overview(start_date="2025-02-24")
+        ```
+        """
+        if self._positions_ledger is not None:
+            return self._positions_ledger
+
+        if self._weekly_historical_data.empty:
+            self.collect_historical_data()
+
+            if self._daily_historical_data.empty:
+                return None
+
+        if self._weekly_benchmark_data.empty:
+            self.collect_benchmark_historical_data()
+
+            if self._daily_historical_data.empty:
+                return None
+
+        if self._transactions_overview.empty:
+            try:
+                self.get_transactions_overview()
+            except ValueError as error:
+                raise ValueError(
+                    f"Failed to get transactions overview due to {error}"
+                ) from error
+
+        self._positions_ledger = ledger_model.PositionsLedger.from_transactions(
+            transactions=self._transactions_overview.rename(
+                columns={self._volume_column: "Volume", self._costs_column: "Costs"}
+            ),
+            historical_prices=self._daily_historical_data["Adj Close"],
+            tickers=self._tickers,
+        )
+
+        return self._positions_ledger
+
+    def update_positions(
+        self,
+        transactions: pd.DataFrame | None = None,
+        historical_data: pd.DataFrame | None = None,
+        rounding: int | None = None,
+    ):
+        """
+        Add transactions and price days to the portfolio and update the positions overview without
+        reprocessing the full transaction history. Only the days from the earliest new transaction
+        onwards are updated in the positions ledger, and new price days only extend the ledger.
+
+        The transactions are added to the portfolio dataset so that the transactions and portfolio
+        overviews include them the next time they are requested. The daily historical data is
+        updated, the weekly, monthly, quarterly and yearly historical data are not.
+
+        Args:
+            transactions (pd.DataFrame | None): The new transactions in the layout of the portfolio
+                dataset, indexed by date and ticker with the price, volume and costs columns. The
+                tickers should already be part of the portfolio.
+            historical_data (pd.DataFrame | None): New or revised daily historical data in the layout
+                of `collect_historical_data`. Price days that already exist are overwritten.
+            rounding (int | None): An optional integer specifying the number of decimal places to round the data.
+                If None, the default rounding precision is used.
+
+        Returns:
+            pd.DataFrame: The updated positions overview in the layout of `get_positions_overview`.
+
+        Raises:
+            ValueError: If the transactions contain tickers that are not part of the portfolio.
+
+        As an example:
+
+        ```python
+        from financetoolkit import Portfolio
+
+        portfolio = Portfolio(example=True, api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        new_transactions = portfolio.read_portfolio_dataset().iloc[-1:]
+
+        portfolio.update_positions(transactions=new_transactions)
+        ```
+        """
+        positions_ledger = self.get_positions_ledger()
+
+        if positions_ledger is None:
+            return pd.DataFrame()
+
+        if transactions is not None and not transactions.empty:
+            unknown_tickers = set(transactions.index.get_level_values(1)) - set(
+                self._tickers
+            )
+
+            if unknown_tickers:
+                raise ValueError(
+                    f"The tickers {', '.join(sorted(unknown_tickers))} are not part of the portfolio. "
+                    "Please add them to the portfolio dataset and read it again."
+                )
+
+        if historical_data is not None and not historical_data.empty:
+            positions_ledger.update_prices(historical_data["Adj Close"])
+
+            self._daily_historical_data = pd.concat(
+                [
+                    self._daily_historical_data[
+                        ~self._daily_historical_data.index.isin(historical_data.index)
+                    ],
+                    historical_data,
+                ]
+            ).sort_index()
+            self._latest_price = self._daily_historical_data["Adj Close"].iloc[-1]
+
+        if transactions is not None and not transactions.empty:
+            invested_amount = overview_model.create_transactions_overview(
+                portfolio_volume=transactions[self._volume_column],
+                portfolio_price=transactions[self._price_column],
+                portfolio_costs=transactions[self._costs_column],
+                latest_returns=self._latest_price.loc[self._tickers],
+            )["Invested Amount"]
+
+            new_positions = pd.DataFrame(
+                {
+                    "Volume": transactions[self._volume_column],
+                    "Costs": transactions[self._costs_column],
+                    "Invested Amount": invested_amount,
+                }
+            ).round(self._rounding)
+
+            # The positions are based on the transactions overview which excludes sold positions
+            positions_ledger.add_transactions(
+                new_positions[new_positions["Volume"] > 0]
+            )
+
+            self._portfolio_dataset = pd.concat(
+                [self._portfolio_dataset, transactions]
+            ).sort_index(level=0, sort_remaining=False)
+            self._align_benchmark_prices()
+
+        # The overviews that are derived from the transactions or the latest prices are
+        # created again the next time they are requested.
+        self._transactions_overview = pd.DataFrame()
+        self._portfolio_overview = pd.DataFrame()
+        self._transactions_performance = pd.DataFrame()
+        self._portfolio_performance = pd.DataFrame()
+
+        self._positions_overview = positions_ledger.get_positions_overview().round(
+            rounding if rounding else self._rounding
+        )
+
+        return self._positions_overview
+
     def get_portfolio_overview(
         self,
         include_portfolio: bool = True,
@@ -1320,8 +1505,8 @@ class Portfolio:
                 If None, it defaults to the rounding specified in the configuration.
             exclude_sold_positions (bool): A flag indicating whether to exclude sold positions
             pnl_method (str): The method for calculating profit & loss. Options are:
-                'FIFO' (First In, First Out), 'LIFO' (Last In, First Out), or 'AVERAGE'.
-                Defaults to 'FIFO'.
+                'FIFO' (First In, First Out), 'LIFO' (Last In, First Out), 'HIFO' (Highest In,
+                First Out) or 'AVERAGE'. Defaults to 'FIFO'.
 
         Returns:
             pd.DataFrame: The portfolio dataset with added transaction overview ratios and PnL columns.
@@ -1365,9 +1550,9 @@ class Portfolio:
         """
         pnl_method = pnl_method.upper()
 
-        if pnl_method not in ["FIFO", "LIFO", "AVERAGE"]:
+        if pnl_method not in ["FIFO", "LIFO", "HIFO", "AVERAGE"]:
             raise ValueError(
-                "Please provide a valid method. This can be 'FIFO', 'LIFO', or 'AVERAGE'"
+                "Please provide a valid method. This can be 'FIFO', 'LIFO', 'HIFO' or 'AVERAGE'"
             )
 
         if self._weekly_historical_data.empty:
@@ -1412,7 +1597,7 @@ class Portfolio:
                 volume_column=self._volume_column,
                 price_column=self._price_column,
                 method=pnl_method,
-            )
+            )[["PnL", "Cumulative PnL"]]
 
             # Ensure the indices are unique before concatenation
             self._transactions_overview = self._transactions_overview.reset_index(
@@ -7,7 +7,7 @@ import pandas as pd
 from tqdm import tqdm
 
 from financetoolkit.portfolio import helpers
-from financetoolkit.utilities import logger_model
+from financetoolkit.utilities import cache_model, logger_model
 
 logger = logger_model.get_logger()
 
@@ -17,6 +17,9 @@ logger = logger_model.get_logger()
 # Yahoo Finance's notation of currencies. E.g. EURUSD=X
 CURRENCY_CODE_LENGTH = 3
 
+# The number of rows of a CSV file that are read and formatted at once
+CSV_CHUNK_SIZE = 100_000
+
 
 def read_portfolio_dataset(
     excel_location: list,
@@ -30,6 +33,8 @@ def read_portfolio_dataset(
     column_mapping: dict[str, str],
     currency_columns: list[str] | str | None = None,
     costs_columns: list[str] | None = None,
+    chunk_size: int = CSV_CHUNK_SIZE,
+    cached_data_location: str | None = None,
 ) -> tuple[pd.DataFrame, str, str, str, str, str, str]:
     """
     Read and preprocess a portfolio dataset from Excel files.
@@ -38,6 +43,11 @@ def read_portfolio_dataset(
     the data by renaming columns, handling duplicates, and parsing dates. It returns a combined
     portfolio dataset along with column names and processing details.
 
+    CSV files are read and formatted in chunks so that only the relevant, typed columns of large
+    broker exports are held in memory. When a cache location is provided, the formatted dataset of
+    each file is stored as a typed snapshot (Parquet when pyarrow is installed) which is reused as
+    long as the file and the formatting options do not change.
+
     Args:
         excel_location (list): A list of file paths to Excel or CSV files containing portfolio data.
         adjust_duplicates (bool): If True, duplicate entries are adjusted by aggregating values.
@@ -51,6 +61,10 @@ def read_portfolio_dataset(
         currency_columns (list[str] | str | None, optional): Column name(s) representing currency codes
             or a single column. Defaults to None.
         costs_columns (list[str] | None, optional): Column name(s) representing transaction costs. Defaults to None.
+        chunk_size (int, optional): The number of rows of a CSV file that are read and formatted at once.
+            Defaults to 100,000.
+        cached_data_location (str | None, optional): The location in which the formatted snapshots of the
+            files are stored. Defaults to None which means the files are parsed every time.
 
     Returns:
         tuple[pd.DataFrame, str, str, str, str, str, str | None]:
@@ -89,20 +103,8 @@ def read_portfolio_dataset(
         if len(excel_location) > 1
         else excel_location
     ):
-        portfolio_dataset = helpers.read_excel(file)
-        portfolio_dataset.columns = portfolio_dataset.columns.str.lower()
-
-        (
-            portfolio_dataset,
-            selected_date_column,
-            selected_name_column,
-            selected_ticker_column,
-            selected_price_column,
-            selected_volume_column,
-            selected_currency_column,
-            selected_costs_column,
-        ) = format_portfolio_dataset(
-            dataset=portfolio_dataset,
+        portfolio_dataset = read_portfolio_file(
+            location=file,
             date_columns=date_column,
             date_format_options=date_format_options,
             name_columns=name_columns,
@@ -112,8 +114,18 @@ def read_portfolio_dataset(
             column_mapping=column_mapping,
             currency_columns=currency_columns,
             costs_columns=costs_columns,
+            chunk_size=chunk_size,
+            cached_data_location=cached_data_location,
         )
 
+        selected_date_column = column_mapping["date"]
+        selected_name_column = column_mapping["name"]
+        selected_ticker_column = column_mapping["identifier"]
+        selected_price_column = column_mapping["price"]
+        selected_volume_column = column_mapping["volume"]
+        selected_currency_column = column_mapping["currency"]
+        selected_costs_column = column_mapping["costs"]
+
         if portfolio_dataset.duplicated().any() and adjust_duplicates:
             logger.info(
                 "The same transaction was bought and/or sold on the same day in %s. "
@@ -168,6 +180,157 @@ def read_portfolio_dataset(
     )
 
 
+def read_portfolio_file(
+    location: str,
+    date_columns: list[str],
+    date_format_options: list[str],
+    name_columns: list[str],
+    tickers_columns: list[str],
+    price_columns: list[str],
+    volume_columns: list[str],
+    column_mapping: dict[str, str],
+    currency_columns: list[str] | str | None = None,
+    costs_columns: list[str] | None = None,
+    chunk_size: int = CSV_CHUNK_SIZE,
+    cached_data_location: str | None = None,
+) -> pd.DataFrame:
+    """
+    Read and format a single Excel or CSV file of a portfolio dataset.
+
+    CSV files are read in chunks of rows and every chunk is formatted with `format_portfolio_dataset`
+    so that the raw text of the whole file is never held in memory at once. Every chunk uses the same
+    date format, which is inferred again from all dates so far when a later chunk does not match it.
+    Excel files are read at once.
+
+    When a cache location is provided, the formatted dataset is stored as a typed snapshot. The snapshot
+    is identified by the location, size and modification time of the file and the formatting options so
+    that it is only reused for the exact same file and options.
+
+    Args:
+        location (str): The file path of the Excel or CSV file.
+        date_columns (list[str]): A list of column names representing date information.
+        date_format_options (list[str]): A list of format strings for parsing dates.
+        name_columns (list[str]): A list of column names representing transaction descriptions.
+        tickers_columns (list[str]): A list of column names representing asset tickers.
+        price_columns (list[str]): A list of column names representing asset prices.
+        volume_columns (list[str]): A list of column names representing transaction volumes.
+        column_mapping (dict[str, str]): A dictionary mapping original column names to standardized names.
+        currency_columns (list[str] | str | None, optional): Column name(s) representing currency codes,
+            or a single currency column. Defaults to None.
+        costs_columns (list[str] | None, optional): Column name(s) representing transaction costs,
+            or None if not applicable.
+        chunk_size (int, optional): The number of rows of a CSV file that are read and formatted at once.
+            Defaults to 100,000.
+        cached_data_location (str | None, optional): The location in which the formatted snapshot is stored.
+            Defaults to None which means the file is parsed every time.
+
+    Returns:
+        pd.DataFrame: The formatted portfolio dataset of the file.
+    """
+    format_options = {
+        "date_columns": date_columns,
+        "date_format_options": date_format_options,
+        "name_columns": name_columns,
+        "tickers_columns": tickers_columns,
+        "price_columns": price_columns,
+        "volume_columns": volume_columns,
+        "column_mapping": column_mapping,
+        "currency_columns": currency_columns,
+        "costs_columns": costs_columns,
+    }
+
+    if cached_data_location:
+        file_status = os.stat(location)
+        snapshot = {
+            "source": "Portfolio",
+            "endpoint": "portfolio_dataset",
+            "params": {
+                "location": os.path.abspath(location),
+                "size": file_status.st_size,
+                "modified": file_status.st_mtime_ns,
+                "format_options": format_options,
+            },
+        }
+
+        portfolio_dataset = cache_model.load_entry(cached_data_location, **snapshot)
+
+        if not portfolio_dataset.empty:
+            return portfolio_dataset
+
+    if location.endswith(".csv"):
+        formatted_chunks = []
+        date_column = None
+        date_format = None
+
+        for chunk in helpers.read_csv_in_chunks(location, chunk_size=chunk_size):
+            chunk.columns = chunk.columns.str.strip().str.lower()
+
+            if date_column is None:
+                date_column = next(
+                    (
+                        column.lower()
+                        for column in date_columns
+                        if column.lower() in chunk.columns
+                    ),
+                    None,
+                )
+
+            # A chunk can hold too few dates to tell formats apart (e.g. "01-05-2025"). When a chunk
+            # does not match the format of the earlier chunks, the format is inferred again from all
+            # dates so far and the earlier chunks are parsed again with it.
+            if date_column and (
+                date_format is None
+                or helpers.infer_date_format(
+                    chunk[date_column], [date_format], sample_size=None
+                )
+                is None
+            ):
+                previous_dates = [
+                    formatted_chunk[column_mapping["date"]].dt.strftime(date_format)
+                    for formatted_chunk in formatted_chunks
+                ]
+                date_format = helpers.infer_date_format(
+                    pd.concat([*previous_dates, chunk[date_column]]),
+                    date_format_options,
+                    sample_size=None,
+                )
+
+                if date_format is None:
+                    raise ValueError(
+                        f"The dates in {location} could not be formatted with a single format. Please check "
+                        "the format of the date column and whether it is correct. The options are: "
+                        f"{date_format_options}"
+                    )
+
+                for formatted_chunk, dates in zip(formatted_chunks, previous_dates):
+                    formatted_chunk[column_mapping["date"]] = pd.to_datetime(
+                        dates, format=date_format
+                    ).dt.to_period(freq="D")
+
+            formatted_chunks.append(
+                format_portfolio_dataset(
+                    dataset=chunk, date_format=date_format, **format_options
+                )[0]
+            )
+
+        portfolio_dataset = pd.concat(formatted_chunks, ignore_index=True)
+
+        # The categories differ between chunks which makes the combined columns lose their type
+        for column in formatted_chunks[0].select_dtypes("category").columns:
+            portfolio_dataset[column] = portfolio_dataset[column].astype("category")
+    else:
+        portfolio_dataset = helpers.read_excel(location)
+        portfolio_dataset.columns = portfolio_dataset.columns.str.lower()
+        portfolio_dataset = format_portfolio_dataset(
+            dataset=portfolio_dataset, **format_options
+        )[0]
+
+    if cached_data_location:
+        cache_model.save_entry(portfolio_dataset, cached_data_location, **snapshot)
+
+    return portfolio_dataset
+
+
 def format_portfolio_dataset(
     dataset: pd.DataFrame,
     date_columns: list[str],
@@ -179,6 +342,7 @@ def format_portfolio_dataset(
     column_mapping: dict[str, str],
     currency_columns: list[str] | str | None = None,
     costs_columns: list[str] | None = None,
+    date_format: str | None = None,
 ) -> tuple[pd.DataFrame, str, str, str, str, str, str, str]:
     """
     Format and preprocess a raw portfolio dataset for analysis.
@@ -203,6 +367,9 @@ def format_portfolio_dataset(
             or a single currency column. Defaults to None.
         costs_columns (list[str] | None, optional): Column name(s) representing transaction costs,
             or None if not applicable.
+        date_format (str | None, optional): The format of the dates when it is already known, for
+            example from an earlier chunk of the same file. This format is tried first and the date format
+            options are the fallback. Defaults to None which means the format is inferred from the dataset.
 
     Returns:
         tuple[pd.DataFrame, str, str, str, str, str, str | None]:
@@ -241,13 +408,24 @@ def format_portfolio_dataset(
 
     dataset = dataset.set_index(date_column_first)
 
-    for date_format in date_format_options:
+    # The date format is inferred from a sample so that the full column is usually parsed only
+    # once, the other formats are still tried in case the sample is not representative.
+    inferred_date_format = date_format or helpers.infer_date_format(
+        dataset.index, date_format_options
+    )
+
+    if inferred_date_format:
+        date_format_options = [inferred_date_format] + [
+            option for option in date_format_options if option != inferred_date_format
+        ]
+
+    for date_format_option in date_format_options:
         # An attempt is made to format the date column to a datetime object. If this fails, the next format is tried.
         # This is done to ensure that the date column is correctly formatted.
         try:
-            dataset.index = pd.to_datetime(dataset.index, format=date_format).to_period(
-                freq="D"
-            )
+            dataset.index = pd.to_datetime(
+                dataset.index, format=date_format_option
+            ).to_period(freq="D")
             break
         except ValueError:
             continue
@@ -300,8 +478,8 @@ def format_portfolio_dataset(
             f"there is a column named one of the following: {price_columns}"
         )
     price_column_first = price_columns_match[0]
-    dataset[price_column_first] = dataset[price_column_first].apply(
-        helpers.convert_to_float
+    dataset[price_column_first] = helpers.convert_series_to_float(
+        dataset[price_column_first]
     )
 
     volume_columns = [column.lower() for column in volume_columns]
@@ -315,8 +493,8 @@ def format_portfolio_dataset(
             f"there is a column named one of the following: {volume_columns}"
         )
     volume_column_first = volume_columns_match[0]
-    dataset[volume_column_first] = dataset[volume_column_first].apply(
-        helpers.convert_to_float
+    dataset[volume_column_first] = helpers.convert_series_to_float(
+        dataset[volume_column_first]
     )
 
     if costs_columns:
@@ -336,8 +514,8 @@ def format_portfolio_dataset(
             dataset[costs_column_first] = 0.0
         else:
             costs_column_first = costs_columns_match[0]
-            dataset[costs_column_first] = dataset[costs_column_first].apply(
-                helpers.convert_to_float
+            dataset[costs_column_first] = helpers.convert_series_to_float(
+                dataset[costs_column_first]
             )
             dataset[costs_column_first] = dataset[costs_column_first].fillna(0)
     else:
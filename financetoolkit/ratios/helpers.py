@@ -1,7 +1,34 @@
 """Ratios Helper Module"""
 
+import ast
+import re
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
 import pandas as pd
 
+BINARY_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+    ast.FloorDiv: np.floor_divide,
+    ast.Mod: np.mod,
+    ast.Pow: np.power,
+}
+
+COMPARISON_OPERATORS = {
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+
+UNARY_OPERATORS = {ast.USub: np.negative, ast.UAdd: np.positive}
+
 
 def map_period_data_to_daily_data(
     period_data: pd.DataFrame, daily_dates: pd.PeriodIndex, quarterly: bool = False
@@ -36,3 +63,344 @@ def map_period_data_to_daily_data(
     daily_period.index = daily_dates
 
     return daily_period
+
+
+class StatementStore:
+    """
+    The StatementStore extracts every line item of a financial statement once into a dense
+    (line item × ticker × period) array so that the ratios do not need to slice the MultiIndex
+    and transpose for every calculation. Rolling sums and means (used for the average and
+    trailing values) are calculated over all tickers at once and memoized.
+    """
+
+    def __init__(self, statement: pd.DataFrame):
+        """
+        Initializes the StatementStore.
+
+        Args:
+            statement (pd.DataFrame): The financial statement with the tickers and line items as
+                the index and the periods as the columns.
+        """
+        self.statement = statement
+        self.line_items: set[str] = set(
+            statement.index.get_level_values(1) if not statement.empty else []
+        )
+        self._rolling_values: dict[tuple[str, int, str], np.ndarray] = {}
+
+        if statement.empty or not statement.index.is_unique:
+            # Without a unique index the line items can not be stored densely and
+            # therefore the statement is sliced directly instead
+            self._line_items: dict[str, int] = {}
+            self._values = np.empty((0, 0, len(statement.columns)))
+            return
+
+        tickers = statement.index.get_level_values(0).unique()
+        line_items = statement.index.get_level_values(1).unique()
+
+        positions = line_items.get_indexer(statement.index.get_level_values(1)) * len(
+            tickers
+        ) + tickers.get_indexer(statement.index.get_level_values(0))
+
+        values = np.full(
+            (len(line_items) * len(tickers), len(statement.columns)), np.nan
+        )
+        values[positions] = statement.to_numpy(dtype=float)
+
+        available = np.zeros(len(line_items) * len(tickers), dtype=bool)
+        available[positions] = True
+
+        self._tickers = tickers
+        self._line_items = {line_item: i for i, line_item in enumerate(line_items)}
+        self._values = values.reshape(len(line_items), len(tickers), -1)
+        self._available = available.reshape(len(line_items), len(tickers))
+
+    def _get_values(self, line_item: str) -> tuple[np.ndarray, pd.Index]:
+        """
+        Get the values of a line item and the tickers that report the line item.
+
+        Args:
+            line_item (str): The line item to get.
+
+        Returns:
+            tuple[np.ndarray, pd.Index]: The (ticker × period) values and the tickers.
+        """
+        if line_item not in self._line_items:
+            raise KeyError(line_item)
+
+        position = self._line_items[line_item]
+        available = self._available[position]
+
+        if available.all():
+            return self._values[position], self._tickers
+
+        return self._values[position][available], self._tickers[available]
+
+    def get(self, line_item: str) -> pd.DataFrame:
+        """
+        Get a line item for all tickers, equal to statement.loc[:, line_item, :].
+
+        Args:
+            line_item (str): The line item to get.
+
+        Returns:
+            pd.DataFrame: The line item with the tickers as the index and the periods as the columns.
+        """
+        if not self._line_items:
+            return self.statement.loc[:, line_item, :]
+
+        values, tickers = self._get_values(line_item)
+
+        return pd.DataFrame(
+            values.copy(), index=tickers, columns=self.statement.columns
+        )
+
+    def get_rolling(
+        self, line_item: str, window: int, statistic: str = "sum"
+    ) -> pd.DataFrame:
+        """
+        Get the rolling sum or mean of a line item for all tickers, equal to
+        statement.loc[:, line_item, :].T.rolling(window).sum().T (or .mean()).
+
+        Args:
+            line_item (str): The line item to get.
+            window (int): The number of periods in the window.
+            statistic (str, optional): Either "sum" or "mean". Defaults to "sum".
+
+        Returns:
+            pd.DataFrame: The rolling values with the tickers as the index and the periods as the columns.
+        """
+        if not self._line_items:
+            rolling = self.statement.loc[:, line_item, :].T.rolling(window)
+
+            return (rolling.mean() if statistic == "mean" else rolling.sum()).T
+
+        values, tickers = self._get_values(line_item)
+        key = (line_item, window, statistic)
+
+        if key not in self._rolling_values:
+            rolling_values = np.full(values.shape, np.nan)
+
+            if window <= values.shape[1]:
+                windows = np.lib.stride_tricks.sliding_window_view(
+                    values, window, axis=1
+                )
+                rolling_values[:, window - 1 :] = (
+                    windows.mean(axis=2) if statistic == "mean" else windows.sum(axis=2)
+                )
+
+            self._rolling_values[key] = rolling_values
+
+        return pd.DataFrame(
+            self._rolling_values[key].copy(),
+            index=tickers,
+            columns=self.statement.columns,
+        )
+
+
+class CompiledFormula(NamedTuple):
+    """A formula parsed into an expression tree together with the names it references."""
+
+    expression: ast.expr
+    names: tuple[str, ...]
+
+
+class FormulaCompiler:
+    """
+    The FormulaCompiler parses formulas such as 'Revenue / Total Assets' into expression trees.
+    Given that names of line items contain spaces and other characters, every known name is
+    first replaced by a placeholder (longest names first) after which the formula is parsed
+    with the Python parser and only arithmetic, comparisons and numbers are accepted.
+    Compiled formulas are cached by their text.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Initializes the FormulaCompiler.
+
+        Args:
+            names (Iterable[str]): The names that can be used in the formulas.
+        """
+        self.names = frozenset(names)
+        self._pattern = re.compile(
+            "|".join(
+                rf"(?<!\w){re.escape(name)}(?!\w)"
+                for name in sorted(self.names, key=len, reverse=True)
+            )
+        )
+        self._compiled_formulas: dict[str, CompiledFormula] = {}
+
+    def compile(self, formula: str) -> CompiledFormula:
+        """
+        Compile a formula into an expression tree.
+
+        Args:
+            formula (str): The formula to compile.
+
+        Raises:
+            ValueError: If the formula contains unknown names or unsupported syntax.
+
+        Returns:
+            CompiledFormula: The expression tree and the names referenced by the formula.
+        """
+        if formula in self._compiled_formulas:
+            return self._compiled_formulas[formula]
+
+        names: list[str] = []
+
+        def replace_name(match: re.Match) -> str:
+            if match.group(0) not in names:
+                names.append(match.group(0))
+
+            return f"__name_{names.index(match.group(0))}__"
+
+        placeholder_formula = self._pattern.sub(replace_name, formula.strip())
+
+        try:
+            expression = ast.parse(placeholder_formula, mode="eval").body
+        except SyntaxError:
+            expression = None
+
+        if expression is None or not self._is_supported(expression, len(names)):
+            unknown_names = [
+                section.strip()
+                for section in re.split(
+                    r"__name_\d+__|\d+\.?\d*(?:[eE][+-]?\d+)?|[-+*/%<>=!()]",
+                    placeholder_formula,
+                )
+                if section.strip()
+            ]
+
+            raise ValueError(
+                f"The formula {formula} is invalid given that {', '.join(unknown_names)} "
+                "can not be found and is not a number."
+                if unknown_names
+                else f"The formula {formula} is invalid."
+            )
+
+        self._compiled_formulas[formula] = CompiledFormula(expression, tuple(names))
+
+        return self._compiled_formulas[formula]
+
+    def _is_supported(self, node: ast.AST, number_of_names: int) -> bool:
+        """
+        Check whether the expression only consists of numbers, known names, arithmetic and comparisons.
+
+        Args:
+            node (ast.AST): The node of the expression tree to check.
+            number_of_names (int): The number of placeholders in the formula.
+
+        Returns:
+            bool: Whether the expression is supported.
+        """
+        if isinstance(node, ast.Constant):
+            return isinstance(node.value, (int, float)) and not isinstance(
+                node.value, bool
+            )
+        if isinstance(node, ast.Name):
+            match = re.fullmatch(r"__name_(\d+)__", node.id)
+            return match is not None and int(match.group(1)) < number_of_names
+        if isinstance(node, ast.BinOp):
+            return (
+                type(node.op) in BINARY_OPERATORS
+                and self._is_supported(node.left, number_of_names)
+                and self._is_supported(node.right, number_of_names)
+            )
+        if isinstance(node, ast.UnaryOp):
+            return type(node.op) in UNARY_OPERATORS and self._is_supported(
+                node.operand, number_of_names
+            )
+        if isinstance(node, ast.Compare):
+            return all(
+                type(operator) in COMPARISON_OPERATORS for operator in node.ops
+            ) and all(
+                self._is_supported(child, number_of_names)
+                for child in [node.left, *node.comparators]
+            )
+
+        return False
+
+
+def evaluate_formula(
+    compiled_formula: CompiledFormula, values: dict[str, np.ndarray]
+) -> np.ndarray:
+    """
+    Evaluate a compiled formula as vectorized array operations.
+
+    Args:
+        compiled_formula (CompiledFormula): The compiled formula.
+        values (dict[str, np.ndarray]): The values of (at least) the names referenced by the formula.
+
+    Returns:
+        np.ndarray: The outcome of the formula where comparisons result in 1 or 0.
+    """
+
+    def evaluate(node: ast.expr):
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            return values[compiled_formula.names[int(node.id[7:-2])]]
+        if isinstance(node, ast.BinOp):
+            return BINARY_OPERATORS[type(node.op)](
+                evaluate(node.left), evaluate(node.right)
+            )
+        if isinstance(node, ast.UnaryOp):
+            return UNARY_OPERATORS[type(node.op)](evaluate(node.operand))
+
+        # A chained comparison such as a < b < c equals (a < b) & (b < c)
+        left = evaluate(node.left)
+        outcome = True
+
+        for operator, comparator in zip(node.ops, node.comparators):
+            right = evaluate(comparator)
+            outcome = np.logical_and(
+                outcome, COMPARISON_OPERATORS[type(operator)](left, right)
+            )
+            left = right
+
+        return outcome
+
+    return np.asarray(evaluate(compiled_formula.expression), dtype=np.float64)
+
+
+def sort_formulas(dependencies: dict[str, list[str]]) -> tuple[list[str], list[str]]:
+    """
+    Sort the formulas so that each formula comes after the formulas it depends on.
+
+    Args:
+        dependencies (dict[str, list[str]]): The names of the other formulas each formula depends on.
+
+    Returns:
+        tuple[list[str], list[str]]: The sorted formulas and the formulas that are part of a
+        circular dependency (which are excluded from the sorted formulas).
+    """
+    sorted_formulas: list[str] = []
+    circular_formulas: list[str] = []
+    visited: set[str] = set()
+    path: list[str] = []
+
+    def visit(name: str):
+        if name in path:
+            circular_formulas.extend(
+                formula
+                for formula in path[path.index(name) :]
+                if formula not in circular_formulas
+            )
+            return
+        if name in visited:
+            return
+
+        path.append(name)
+
+        for dependency in dependencies[name]:
+            visit(dependency)
+
+        path.pop()
+        visited.add(name)
+
+        if name not in circular_formulas:
+            sorted_formulas.append(name)
+
+    for name in dependencies:
+        visit(name)
+
+    return sorted_formulas, circular_formulas
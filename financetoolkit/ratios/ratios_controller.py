@@ -8,7 +8,11 @@ import warnings
 import numpy as np
 import pandas as pd
 
-from financetoolkit.helpers import calculate_growth, handle_portfolio
+from financetoolkit.helpers import (
+    calculate_growth,
+    handle_computation_cache,
+    handle_portfolio,
+)
 from financetoolkit.ratios import (
     efficiency_model,
     liquidity_model,
@@ -16,7 +20,13 @@ from financetoolkit.ratios import (
     solvency_model,
     valuation_model,
 )
-from financetoolkit.ratios.helpers import map_period_data_to_daily_data
+from financetoolkit.ratios.helpers import (
+    FormulaCompiler,
+    StatementStore,
+    evaluate_formula,
+    map_period_data_to_daily_data,
+    sort_formulas,
+)
 from financetoolkit.utilities import logger_model
 from financetoolkit.utilities.error_model import handle_errors
 
@@ -27,7 +37,7 @@ logger = logger_model.get_logger()
 # for financial analysis purposes not an issue and should not be considered as a bug.
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
-# pylint: disable=too-many-lines,too-many-instance-attributes,too-many-public-methods,too-many-locals,eval-used
+# pylint: disable=too-many-lines,too-many-instance-attributes,too-many-public-methods,too-many-locals
 
 
 class Ratios:
@@ -109,6 +119,13 @@ class Ratios:
         self._quarterly: bool = quarterly
         self._portfolio_weights: dict | None = None
 
+        # Shared with the Models by the Toolkit so that results are calculated only once
+        self._computation_cache: dict | None = None
+
+        # The line items of each statement, extracted once and reused by all ratios
+        self._statement_stores: dict[str, StatementStore] = {}
+        self._formula_compiler: FormulaCompiler | None = None
+
         # Initialization of Historical Data
         self._historical_data: pd.DataFrame = historical["period"]
         self._daily_historical_data: pd.DataFrame = historical["daily"]
@@ -127,6 +144,60 @@ class Ratios:
         self._valuation_ratios: pd.DataFrame = pd.DataFrame()
         self._valuation_ratios_growth: pd.DataFrame = pd.DataFrame()
 
+    def _get_statement_store(
+        self, name: str, statement: pd.DataFrame
+    ) -> StatementStore:
+        """
+        Get the StatementStore of a financial statement. The store is rebuilt whenever the
+        statement is replaced so that the ratios never use line items of outdated data.
+
+        Args:
+            name (str): The name of the financial statement.
+            statement (pd.DataFrame): The financial statement.
+
+        Returns:
+            StatementStore: The store containing the line items of the financial statement.
+        """
+        store = self._statement_stores.get(name)
+
+        if store is None or store.statement is not statement:
+            store = StatementStore(statement)
+            self._statement_stores[name] = store
+
+        return store
+
+    def _get_formula_compiler(self, names: list[str]) -> FormulaCompiler:
+        """
+        Get the FormulaCompiler for the custom ratios. The compiler, and therefore the compiled
+        formulas, are reused as long as the available names remain the same.
+
+        Args:
+            names (list[str]): The names that can be used in the custom ratios.
+
+        Returns:
+            FormulaCompiler: The compiler of the custom ratio formulas.
+        """
+        if self._formula_compiler is None or self._formula_compiler.names != set(names):
+            self._formula_compiler = FormulaCompiler(names)
+
+        return self._formula_compiler
+
+    @property
+    def _balance_sheet_store(self) -> StatementStore:
+        """The line items of the balance sheet statement."""
+        return self._get_statement_store("balance", self._balance_sheet_statement)
+
+    @property
+    def _income_statement_store(self) -> StatementStore:
+        """The line items of the income statement."""
+        return self._get_statement_store("income", self._income_statement)
+
+    @property
+    def _cash_flow_statement_store(self) -> StatementStore:
+        """The line items of the cash flow statement."""
+        return self._get_statement_store("cash", self._cash_flow_statement)
+
+    @handle_computation_cache
     def collect_all_ratios(
         self,
         include_dividends: bool = False,
@@ -170,6 +241,46 @@ class Ratios:
         toolkit.ratios.collect_all_ratios()
         ```
         """
+        self._all_ratios = self._calculate_all_ratios(
+            include_dividends=include_dividends,
+            diluted=diluted,
+            days=days,
+            rounding=rounding,
+            trailing=trailing,
+        )
+
+        if growth:
+            self._all_ratios_growth = calculate_growth(
+                self._all_ratios,
+                lag=lag,
+                rounding=rounding if rounding else self._rounding,
+                axis="columns",
+            )
+
+        if len(self._tickers) == 1:
+            return (
+                self._all_ratios_growth.loc[self._tickers[0]]
+                if growth
+                else self._all_ratios.loc[self._tickers[0]]
+            )
+
+        return self._all_ratios_growth if growth else self._all_ratios
+
+    @handle_computation_cache
+    def _calculate_all_ratios(
+        self,
+        include_dividends: bool = False,
+        diluted: bool = True,
+        days: int | float | None = None,
+        rounding: int | None = None,
+        trailing: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Calculates all ratios for all tickers, see `collect_all_ratios` for the arguments.
+
+        Returns:
+            pd.DataFrame: Ratios with the tickers and ratios as index and the periods as columns.
+        """
         if not days:
             days = 365 / 4 if self._quarterly else 365
 
@@ -209,23 +320,9 @@ class Ratios:
         ]
         self._all_ratios = self._all_ratios.reindex(available_columns, axis=1)
 
-        if growth:
-            self._all_ratios_growth = calculate_growth(
-                self._all_ratios,
-                lag=lag,
-                rounding=rounding if rounding else self._rounding,
-                axis="columns",
-            )
-
-        if len(self._tickers) == 1:
-            return (
-                self._all_ratios_growth.loc[self._tickers[0]]
-                if growth
-                else self._all_ratios.loc[self._tickers[0]]
-            )
-
-        return self._all_ratios_growth if growth else self._all_ratios
+        return self._all_ratios
 
+    @handle_computation_cache
     def collect_custom_ratios(
         self,
         custom_ratios_dict: dict | None = None,
@@ -239,7 +336,9 @@ class Ratios:
 
         Note that any of the following characters are considered as operators:
             +, -, *, /, **, %, //, <, >, ==, !=, >=, <=, (, )
-        using any of the above characters as part of the column naming will result into an error.
+        names that contain any of the above characters, such as 'Return on Assets (ROA)', can still be
+        used given that the known names are recognized before the formula is parsed. Formulas can depend
+        on each other in any order as long as they do not depend on themselves.
 
         Args:
             custom_ratios (dict): A dictionary containing the custom ratios to calculate.
@@ -299,7 +398,7 @@ class Ratios:
         | Defensive Interval     | 2346.1         | 2592.34        | 2554.55        | 3467.48        |
         """
         if self._all_ratios.empty:
-            self.collect_all_ratios()
+            self._all_ratios = self._calculate_all_ratios()
 
         if not custom_ratios_dict and not options:
             logger.error(
@@ -326,113 +425,139 @@ class Ratios:
 
             return self._available_custom_ratios_options
 
-        custom_ratios = pd.DataFrame(
-            0,
-            index=pd.MultiIndex.from_product(
-                [self._tickers, custom_ratios_dict.keys()]  # type: ignore
-            ),
-            columns=self._balance_sheet_statement.columns,
-        )
+        stores = [
+            self._balance_sheet_store,
+            self._income_statement_store,
+            self._cash_flow_statement_store,
+        ]
+        ratio_names = set(self._all_ratios.index.get_level_values(level=1))
+        periods = self._balance_sheet_statement.columns.rename(None)
 
-        total_financials = pd.concat(
-            [
-                self._balance_sheet_statement,
-                self._income_statement,
-                self._cash_flow_statement,
-                self._all_ratios,
-                custom_ratios,
-            ],
-            axis=0,
+        formula_compiler = self._get_formula_compiler(
+            [name for store in stores for name in store.line_items]
+            + list(ratio_names)
+            + list(custom_ratios_dict.keys())  # type: ignore
         )
 
-        total_financials = total_financials[
-            ~total_financials.index.duplicated(keep="first")
-        ]
-
-        formula_dict = {}
+        compiled_formulas = {}
         for name, formula in custom_ratios_dict.items():  # type: ignore
-            # Rearrange the formula dict in case a formula is dependent on another formula
-            # and the order would result into errors
-            for sub_name, sub_formula in custom_ratios_dict.items():  # type: ignore
-                if sub_name in formula:
-                    formula_dict[sub_name] = sub_formula
-
-            if name not in formula_dict:
-                formula_dict[name] = formula
-
-        for name, formula in formula_dict.items():
-            formula_names = formula
-
-            for operator in [
-                "+",
-                "-",
-                "*",
-                "/",
-                "**",
-                "%",
-                "//",
-                "<",
-                ">",
-                "==",
-                "!=",
-                ">=",
-                "<=",
-                "(",
-                ")",
-            ]:
-                formula_names = formula_names.replace(operator, "SPLIT")
-
-            formula_names = formula_names.split("SPLIT")
-
-            formula_names = [
-                clean_name
-                for clean_name in formula_names
-                if clean_name not in ["", " "]
-            ]
+            try:
+                compiled_formulas[name] = formula_compiler.compile(formula)
+            except ValueError as error:
+                logger.error(
+                    "%s Use collect_custom_ratios(options=True) to see the available columns.",
+                    error,
+                )
 
-            formula_adjusted = formula
+        # A formula can depend on other formulas in which case these are calculated first. A
+        # formula that refers to its own name uses the financial statement item with that name.
+        sorted_formulas, circular_formulas = sort_formulas(
+            {
+                name: [
+                    dependency
+                    for dependency in compiled_formula.names
+                    if dependency in compiled_formulas and dependency != name
+                ]
+                for name, compiled_formula in compiled_formulas.items()
+            }
+        )
 
-            for formula_section in formula_names:
-                formula_section_stripped = formula_section.strip()
-                if formula_section_stripped in total_financials.index.get_level_values(
-                    1
-                ):
-                    formula_adjusted = formula_adjusted.replace(
-                        formula_section_stripped,
-                        f"total_financials.loc[:, '{formula_section_stripped}', :]",
-                    )
-                else:
-                    try:
-                        float(formula_section_stripped)
-                    except ValueError:
-                        formula_adjusted = None
-                        logger.error(
-                            "Column %s not found in total_financials and is not a number. "
-                            "Therefore the formula %s is invalid. Use collect_custom_ratios(options=True) "
-                            "to see the available columns.",
-                            formula_section_stripped,
-                            formula,
-                        )
+        for name in circular_formulas:
+            logger.error(
+                "The formula %s (%s) depends on itself through other formulas and can therefore "
+                "not be calculated.",
+                custom_ratios_dict[name],  # type: ignore
+                name,
+            )
+
+        financial_values: dict[str, np.ndarray] = {}
+        custom_values: dict[str, np.ndarray] = {}
+        # The same formula gives the same outcome as long as its names refer to the same
+        # custom ratios, e.g. "Revenue * 2" differs when "Revenue" is also a custom ratio
+        outcome_by_formula: dict[tuple[str, tuple[str, ...]], np.ndarray] = {}
+
+        def get_financial_values(name: str) -> np.ndarray:
+            if name not in financial_values:
+                for store in stores:
+                    if name in store.line_items:
+                        financial_values[name] = store.get(name)
                         break
+                else:
+                    financial_values[name] = self._all_ratios.loc[:, name, :]
 
-            if formula_adjusted:
-                calculation = eval(formula_adjusted)  # noqa
+                financial_values[name] = (
+                    financial_values[name]
+                    .reindex(index=self._tickers, columns=periods)
+                    .to_numpy(dtype=np.float64)
+                )
+
+            return financial_values[name]
 
-                total_financials.loc[:, name, :] = calculation.astype(
-                    np.float64
-                ).to_numpy()
+        for name in sorted_formulas:
+            formula = custom_ratios_dict[name]  # type: ignore
+            compiled_formula = compiled_formulas[name]
+            custom_dependencies = tuple(
+                dependency
+                for dependency in compiled_formula.names
+                if dependency in custom_ratios_dict  # type: ignore
+                and dependency != name
+            )
+            formula_key = (formula, custom_dependencies)
 
-                self._custom_ratios = total_financials.loc[
-                    :, list(custom_ratios_dict.keys()), :  # type: ignore
+            if formula_key not in outcome_by_formula:
+                missing_formulas = [
+                    dependency
+                    for dependency in custom_dependencies
+                    if dependency not in custom_values
                 ]
-                self._custom_ratios = self._custom_ratios.sort_index(
-                    axis=0, level=0, sort_remaining=False
-                )
 
-                self._custom_ratios = self._custom_ratios.round(
-                    rounding if rounding else self._rounding
+                if missing_formulas:
+                    logger.error(
+                        "The formula %s can not be calculated given that %s could not be calculated.",
+                        formula,
+                        ", ".join(missing_formulas),
+                    )
+                    continue
+
+                outcome_by_formula[formula_key] = evaluate_formula(
+                    compiled_formula,
+                    {
+                        dependency: (
+                            custom_values[dependency]
+                            if dependency in custom_dependencies
+                            else get_financial_values(dependency)
+                        )
+                        for dependency in compiled_formula.names
+                    },
                 )
 
+            custom_values[name] = np.broadcast_to(
+                outcome_by_formula[formula_key], (len(self._tickers), len(periods))
+            )
+
+        custom_ratios_values = np.zeros(
+            (len(self._tickers), len(custom_ratios_dict), len(periods))  # type: ignore
+        )
+
+        for position, name in enumerate(custom_ratios_dict):  # type: ignore
+            if name in custom_values:
+                custom_ratios_values[:, position] = custom_values[name]
+
+        self._custom_ratios = pd.DataFrame(
+            custom_ratios_values.reshape(-1, len(periods)),
+            index=pd.MultiIndex.from_product(
+                [self._tickers, list(custom_ratios_dict)]  # type: ignore
+            ),
+            columns=periods,
+        )
+        self._custom_ratios = self._custom_ratios.sort_index(
+            axis=0, level=0, sort_remaining=False
+        )
+
+        self._custom_ratios = self._custom_ratios.round(
+            rounding if rounding else self._rounding
+        )
+
         if growth:
             self._custom_ratios_growth = calculate_growth(
                 self._custom_ratios,
@@ -626,19 +751,17 @@ class Ratios:
         """
         if trailing:
             asset_turnover_ratio = efficiency_model.get_asset_turnover_ratio(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._income_statement_store.get_rolling("Revenue", trailing),
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", trailing, statistic="mean"
+                ),
             )
         else:
             asset_turnover_ratio = efficiency_model.get_asset_turnover_ratio(
-                self._income_statement.loc[:, "Revenue", :],
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._income_statement_store.get("Revenue"),
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", 2, statistic="mean"
+                ),
             )
 
         if growth:
@@ -701,22 +824,17 @@ class Ratios:
         """
         if trailing:
             inventory_turnover_ratio = efficiency_model.get_inventory_turnover_ratio(
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._income_statement_store.get_rolling(
+                    "Cost of Goods Sold", trailing
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Inventory", trailing, statistic="mean"
+                ),
             )
         else:
             inventory_turnover_ratio = efficiency_model.get_inventory_turnover_ratio(
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._income_statement_store.get("Cost of Goods Sold"),
+                self._balance_sheet_store.get_rolling("Inventory", 2, statistic="mean"),
             )
 
         if growth:
@@ -785,24 +903,21 @@ class Ratios:
         if trailing:
             days_of_inventory_outstanding = (
                 efficiency_model.get_days_of_inventory_outstanding(
-                    self._balance_sheet_statement.loc[:, "Inventory", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._balance_sheet_store.get_rolling(
+                        "Inventory", trailing, statistic="mean"
+                    ),
+                    self._income_statement_store.get_rolling(
+                        "Cost of Goods Sold", trailing
+                    ),
                 )
             )
         else:
             days_of_inventory_outstanding = (
                 efficiency_model.get_days_of_inventory_outstanding(
-                    self._balance_sheet_statement.loc[:, "Inventory", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
+                    self._balance_sheet_store.get_rolling(
+                        "Inventory", 2, statistic="mean"
+                    ),
+                    self._income_statement_store.get("Cost of Goods Sold"),
                     days,
                 )
             )
@@ -875,19 +990,17 @@ class Ratios:
 
         if trailing:
             days_of_sales_outstanding = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", trailing, statistic="mean"
+                ),
+                self._income_statement_store.get_rolling("Revenue", trailing),
             )
         else:
             days_of_sales_outstanding = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", 2, statistic="mean"
+                ),
+                self._income_statement_store.get("Revenue"),
                 days,
             )
 
@@ -955,41 +1068,35 @@ class Ratios:
 
         if trailing:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Inventory", trailing, statistic="mean"
+                ),
+                self._income_statement_store.get_rolling(
+                    "Cost of Goods Sold", trailing
+                ),
                 days,
             )
 
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
+                self._balance_sheet_store.get("Accounts Receivable")
                 .shift(axis=1)
                 .T.rolling(trailing)
                 .mean()
                 .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._income_statement_store.get_rolling("Revenue", trailing),
                 days,
             )
         else:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
+                self._balance_sheet_store.get_rolling("Inventory", 2, statistic="mean"),
+                self._income_statement_store.get("Cost of Goods Sold"),
                 days,
             )
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", 2, statistic="mean"
+                ),
+                self._income_statement_store.get("Revenue"),
                 days,
             )
 
@@ -1057,24 +1164,21 @@ class Ratios:
         if trailing:
             accounts_payables_turnover_ratio = (
                 efficiency_model.get_accounts_payables_turnover_ratio(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get_rolling(
+                        "Cost of Goods Sold", trailing
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Accounts Payable", trailing, statistic="mean"
+                    ),
                 )
             )
         else:
             accounts_payables_turnover_ratio = (
                 efficiency_model.get_accounts_payables_turnover_ratio(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get("Cost of Goods Sold"),
+                    self._balance_sheet_store.get_rolling(
+                        "Accounts Payable", 2, statistic="mean"
+                    ),
                 )
             )
 
@@ -1146,24 +1250,21 @@ class Ratios:
         if trailing:
             days_of_accounts_payable_outstanding = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get_rolling(
+                        "Cost of Goods Sold", trailing
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Accounts Payable", trailing, statistic="mean"
+                    ),
                 )
             )
         else:
             days_of_accounts_payable_outstanding = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get("Cost of Goods Sold"),
+                    self._balance_sheet_store.get_rolling(
+                        "Accounts Payable", 2, statistic="mean"
+                    ),
                     days,
                 )
             )
@@ -1234,64 +1335,54 @@ class Ratios:
 
         if trailing:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Inventory", trailing, statistic="mean"
+                ),
+                self._income_statement_store.get_rolling(
+                    "Cost of Goods Sold", trailing
+                ),
                 days,
             )
 
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", trailing, statistic="mean"
+                ),
+                self._income_statement_store.get_rolling("Revenue", trailing),
                 days,
             )
 
             days_of_payables = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get_rolling(
+                        "Cost of Goods Sold", trailing
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Accounts Payable", trailing, statistic="mean"
+                    ),
                     days,
                 )
             )
         else:
             days_of_inventory = efficiency_model.get_days_of_inventory_outstanding(
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
+                self._balance_sheet_store.get_rolling("Inventory", 2, statistic="mean"),
+                self._income_statement_store.get("Cost of Goods Sold"),
                 days,
             )
             days_of_sales = efficiency_model.get_days_of_sales_outstanding(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", 2, statistic="mean"
+                ),
+                self._income_statement_store.get("Revenue"),
                 days,
             )
 
             days_of_payables = (
                 efficiency_model.get_days_of_accounts_payable_outstanding(
-                    self._income_statement.loc[:, "Cost of Goods Sold", :],
-                    self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get("Cost of Goods Sold"),
+                    self._balance_sheet_store.get_rolling(
+                        "Accounts Payable", 2, statistic="mean"
+                    ),
                     days,
                 )
             )
@@ -1361,21 +1452,17 @@ class Ratios:
         if trailing:
             cash_conversion_efficiency = (
                 efficiency_model.get_cash_conversion_efficiency(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Revenue", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._cash_flow_statement_store.get_rolling(
+                        "Cash Flow from Operations", trailing
+                    ),
+                    self._income_statement_store.get_rolling("Revenue", trailing),
                 )
             )
         else:
             cash_conversion_efficiency = (
                 efficiency_model.get_cash_conversion_efficiency(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                    self._income_statement.loc[:, "Revenue", :],
+                    self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                    self._income_statement_store.get("Revenue"),
                 )
             )
 
@@ -1439,19 +1526,17 @@ class Ratios:
         """
         if trailing:
             receivables_turnover = efficiency_model.get_receivables_turnover(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", trailing, statistic="mean"
+                ),
+                self._income_statement_store.get_rolling("Revenue", trailing),
             )
         else:
             receivables_turnover = efficiency_model.get_receivables_turnover(
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._income_statement.loc[:, "Revenue", :],
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", 2, statistic="mean"
+                ),
+                self._income_statement_store.get("Revenue"),
             )
 
         if growth:
@@ -1513,20 +1598,17 @@ class Ratios:
         """
         if trailing:
             sga_to_revenue_ratio = efficiency_model.get_sga_to_revenue_ratio(
-                self._income_statement.loc[
-                    :, "Selling, General and Administrative Expenses", :
-                ]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._income_statement_store.get_rolling(
+                    "Selling, General and Administrative Expenses", trailing
+                ),
+                self._income_statement_store.get_rolling("Revenue", trailing),
             )
         else:
             sga_to_revenue_ratio = efficiency_model.get_sga_to_revenue_ratio(
-                self._income_statement.loc[
-                    :, "Selling, General and Administrative Expenses", :
-                ],
-                self._income_statement.loc[:, "Revenue", :],
+                self._income_statement_store.get(
+                    "Selling, General and Administrative Expenses"
+                ),
+                self._income_statement_store.get("Revenue"),
             )
 
         if growth:
@@ -1588,19 +1670,17 @@ class Ratios:
         """
         if trailing:
             fixed_asset_turnover = efficiency_model.get_fixed_asset_turnover(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
-                self._balance_sheet_statement.loc[:, "Fixed Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._income_statement_store.get_rolling("Revenue", trailing),
+                self._balance_sheet_store.get_rolling(
+                    "Fixed Assets", trailing, statistic="mean"
+                ),
             )
         else:
             fixed_asset_turnover = efficiency_model.get_fixed_asset_turnover(
-                self._income_statement.loc[:, "Revenue", :],
-                self._balance_sheet_statement.loc[:, "Fixed Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._income_statement_store.get("Revenue"),
+                self._balance_sheet_store.get_rolling(
+                    "Fixed Assets", 2, statistic="mean"
+                ),
             )
 
         if growth:
@@ -1661,21 +1741,19 @@ class Ratios:
         """
         if trailing:
             operating_ratio = efficiency_model.get_operating_ratio(
-                self._income_statement.loc[:, "Operating Expenses", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._income_statement_store.get_rolling(
+                    "Operating Expenses", trailing
+                ),
+                self._income_statement_store.get_rolling(
+                    "Cost of Goods Sold", trailing
+                ),
+                self._income_statement_store.get_rolling("Revenue", trailing),
             )
         else:
             operating_ratio = efficiency_model.get_operating_ratio(
-                self._income_statement.loc[:, "Operating Expenses", :],
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
-                self._income_statement.loc[:, "Revenue", :],
+                self._income_statement_store.get("Operating Expenses"),
+                self._income_statement_store.get("Cost of Goods Sold"),
+                self._income_statement_store.get("Revenue"),
             )
 
         if growth:
@@ -1830,19 +1908,17 @@ class Ratios:
         """
         if trailing:
             current_ratio = liquidity_model.get_current_ratio(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Assets", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Liabilities", trailing, statistic="mean"
+                ),
             )
         else:
             current_ratio = liquidity_model.get_current_ratio(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._balance_sheet_store.get("Total Current Assets"),
+                self._balance_sheet_store.get("Total Current Liabilities"),
             )
 
         if growth:
@@ -1905,29 +1981,25 @@ class Ratios:
         """
         if trailing:
             quick_ratio = liquidity_model.get_quick_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Cash and Cash Equivalents", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Short Term Investments", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Liabilities", trailing, statistic="mean"
+                ),
             )
         else:
             quick_ratio = liquidity_model.get_quick_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :],
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :],
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._balance_sheet_store.get("Cash and Cash Equivalents"),
+                self._balance_sheet_store.get("Short Term Investments"),
+                self._balance_sheet_store.get("Accounts Receivable"),
+                self._balance_sheet_store.get("Total Current Liabilities"),
             )
 
         if growth:
@@ -1986,24 +2058,21 @@ class Ratios:
         """
         if trailing:
             cash_ratio = liquidity_model.get_cash_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Cash and Cash Equivalents", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Short Term Investments", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Liabilities", trailing, statistic="mean"
+                ),
             )
         else:
             cash_ratio = liquidity_model.get_cash_ratio(
-                self._balance_sheet_statement.loc[:, "Cash and Cash Equivalents", :],
-                self._balance_sheet_statement.loc[:, "Short Term Investments", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._balance_sheet_store.get("Cash and Cash Equivalents"),
+                self._balance_sheet_store.get("Short Term Investments"),
+                self._balance_sheet_store.get("Total Current Liabilities"),
             )
 
         if growth:
@@ -2062,19 +2131,17 @@ class Ratios:
         """
         if trailing:
             working_capital = liquidity_model.get_working_capital(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Assets", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Liabilities", trailing, statistic="mean"
+                ),
             )
         else:
             working_capital = liquidity_model.get_working_capital(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._balance_sheet_store.get("Total Current Assets"),
+                self._balance_sheet_store.get("Total Current Liabilities"),
             )
 
         if growth:
@@ -2135,19 +2202,17 @@ class Ratios:
         """
         if trailing:
             operating_cash_flow_ratio = liquidity_model.get_operating_cash_flow_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._cash_flow_statement_store.get_rolling(
+                    "Cash Flow from Operations", trailing
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Liabilities", trailing, statistic="mean"
+                ),
             )
         else:
             operating_cash_flow_ratio = liquidity_model.get_operating_cash_flow_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                self._balance_sheet_store.get("Total Current Liabilities"),
             )
 
         if growth:
@@ -2209,21 +2274,17 @@ class Ratios:
         if trailing:
             operating_cash_flow_sales_ratio = (
                 liquidity_model.get_operating_cash_flow_sales_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Revenue", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._cash_flow_statement_store.get_rolling(
+                        "Cash Flow from Operations", trailing
+                    ),
+                    self._income_statement_store.get_rolling("Revenue", trailing),
                 )
             )
         else:
             operating_cash_flow_sales_ratio = (
                 liquidity_model.get_operating_cash_flow_sales_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                    self._income_statement.loc[:, "Revenue", :],
+                    self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                    self._income_statement_store.get("Revenue"),
                 )
             )
 
@@ -2277,29 +2338,25 @@ class Ratios:
         """
         if trailing:
             short_term_coverage_ratio = liquidity_model.get_short_term_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Inventory", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Accounts Payable", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._cash_flow_statement_store.get_rolling(
+                    "Cash Flow from Operations", trailing
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Receivable", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Inventory", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Accounts Payable", trailing, statistic="mean"
+                ),
             )
         else:
             short_term_coverage_ratio = liquidity_model.get_short_term_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._balance_sheet_statement.loc[:, "Accounts Receivable", :],
-                self._balance_sheet_statement.loc[:, "Inventory", :],
-                self._balance_sheet_statement.loc[:, "Accounts Payable", :],
+                self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                self._balance_sheet_store.get("Accounts Receivable"),
+                self._balance_sheet_store.get("Inventory"),
+                self._balance_sheet_store.get("Accounts Payable"),
             )
 
         if growth:
@@ -2487,16 +2544,15 @@ class Ratios:
         """
         if trailing:
             gross_margin = profitability_model.get_gross_margin(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
-                self._income_statement.loc[:, "Cost of Goods Sold", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling("Revenue", trailing),
+                self._income_statement_store.get_rolling(
+                    "Cost of Goods Sold", trailing
+                ),
             )
         else:
             gross_margin = profitability_model.get_gross_margin(
-                self._income_statement.loc[:, "Revenue", :],
-                self._income_statement.loc[:, "Cost of Goods Sold", :],
+                self._income_statement_store.get("Revenue"),
+                self._income_statement_store.get("Cost of Goods Sold"),
             )
 
         if growth:
@@ -2555,16 +2611,13 @@ class Ratios:
         """
         if trailing:
             operating_margin = profitability_model.get_operating_margin(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._income_statement_store.get_rolling("Operating Income", trailing),
+                self._income_statement_store.get_rolling("Revenue", trailing),
             )
         else:
             operating_margin = profitability_model.get_operating_margin(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._income_statement.loc[:, "Revenue", :],
+                self._income_statement_store.get("Operating Income"),
+                self._income_statement_store.get("Revenue"),
             )
 
         if growth:
@@ -2625,16 +2678,13 @@ class Ratios:
         """
         if trailing:
             net_profit_margin = profitability_model.get_net_profit_margin(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._income_statement_store.get_rolling("Net Income", trailing),
+                self._income_statement_store.get_rolling("Revenue", trailing),
             )
         else:
             net_profit_margin = profitability_model.get_net_profit_margin(
-                self._income_statement.loc[:, "Net Income", :],
-                self._income_statement.loc[:, "Revenue", :],
+                self._income_statement_store.get("Net Income"),
+                self._income_statement_store.get("Revenue"),
             )
 
         if growth:
@@ -2699,19 +2749,13 @@ class Ratios:
         """
         if trailing:
             interest_burden_ratio = profitability_model.get_interest_coverage_ratio(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling("Operating Income", trailing),
+                self._income_statement_store.get_rolling("Interest Expense", trailing),
             )
         else:
             interest_burden_ratio = profitability_model.get_interest_burden_ratio(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._income_statement.loc[:, "Interest Expense", :],
+                self._income_statement_store.get("Operating Income"),
+                self._income_statement_store.get("Interest Expense"),
             )
 
         if growth:
@@ -2772,21 +2816,17 @@ class Ratios:
         if trailing:
             income_before_tax_profit_margin = (
                 profitability_model.get_income_before_tax_profit_margin(
-                    self._income_statement.loc[:, "Income Before Tax", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Revenue", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._income_statement_store.get_rolling(
+                        "Income Before Tax", trailing
+                    ),
+                    self._income_statement_store.get_rolling("Revenue", trailing),
                 )
             )
         else:
             income_before_tax_profit_margin = (
                 profitability_model.get_income_before_tax_profit_margin(
-                    self._income_statement.loc[:, "Income Before Tax", :],
-                    self._income_statement.loc[:, "Revenue", :],
+                    self._income_statement_store.get("Income Before Tax"),
+                    self._income_statement_store.get("Revenue"),
                 )
             )
 
@@ -2849,19 +2889,15 @@ class Ratios:
         """
         if trailing:
             effective_tax_rate = profitability_model.get_effective_tax_rate(
-                self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Income Before Tax", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling(
+                    "Income Tax Expense", trailing
+                ),
+                self._income_statement_store.get_rolling("Income Before Tax", trailing),
             )
         else:
             effective_tax_rate = profitability_model.get_effective_tax_rate(
-                self._income_statement.loc[:, "Income Tax Expense", :],
-                self._income_statement.loc[:, "Income Before Tax", :],
+                self._income_statement_store.get("Income Tax Expense"),
+                self._income_statement_store.get("Income Before Tax"),
             )
 
         if growth:
@@ -2922,22 +2958,17 @@ class Ratios:
         """
         if trailing:
             return_on_assets = profitability_model.get_return_on_assets(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._income_statement_store.get_rolling("Net Income", trailing),
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", trailing, statistic="mean"
+                ),
             )
         else:
             return_on_assets = profitability_model.get_return_on_assets(
-                self._income_statement.loc[:, "Net Income", :],
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._income_statement_store.get("Net Income"),
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", 2, statistic="mean"
+                ),
             )
 
         if growth:
@@ -3001,23 +3032,18 @@ class Ratios:
         """
         if trailing:
             return_on_equity = profitability_model.get_return_on_equity(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(window=trailing)
-                .mean()
-                .T,
+                self._income_statement_store.get_rolling("Net Income", trailing),
+                self._balance_sheet_store.get_rolling(
+                    "Total Equity", trailing, statistic="mean"
+                ),
             )
 
         else:
             return_on_equity = profitability_model.get_return_on_equity(
-                self._income_statement.loc[:, "Net Income", :],
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(window=2)
-                .mean()
-                .T,
+                self._income_statement_store.get("Net Income"),
+                self._balance_sheet_store.get_rolling(
+                    "Total Equity", 2, statistic="mean"
+                ),
             )
 
         if growth:
@@ -3080,45 +3106,37 @@ class Ratios:
         if trailing:
             return_on_invested_capital = (
                 profitability_model.get_return_on_invested_capital(
-                    self._income_statement.loc[:, "Net Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._income_statement_store.get_rolling("Net Income", trailing),
                     (
-                        self._cash_flow_statement.loc[:, "Dividends Paid", :]
-                        .T.rolling(trailing)
-                        .sum()
-                        .T
+                        self._cash_flow_statement_store.get_rolling(
+                            "Dividends Paid", trailing
+                        )
                         if dividend_adjusted
                         else 0
                     ),
-                    self._balance_sheet_statement.loc[:, "Total Equity", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Debt", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._balance_sheet_store.get_rolling(
+                        "Total Equity", trailing, statistic="mean"
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Debt", trailing, statistic="mean"
+                    ),
                 )
             )
         else:
             return_on_invested_capital = (
                 profitability_model.get_return_on_invested_capital(
-                    self._income_statement.loc[:, "Net Income", :],
+                    self._income_statement_store.get("Net Income"),
                     (
-                        self._cash_flow_statement.loc[:, "Dividends Paid", :]
+                        self._cash_flow_statement_store.get("Dividends Paid")
                         if dividend_adjusted
                         else 0
                     ),
-                    self._balance_sheet_statement.loc[:, "Total Equity", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Debt", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._balance_sheet_store.get_rolling(
+                        "Total Equity", 2, statistic="mean"
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Debt", 2, statistic="mean"
+                    ),
                 )
             )
 
@@ -3182,19 +3200,15 @@ class Ratios:
         """
         if trailing:
             income_quality_ratio = profitability_model.get_income_quality_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._cash_flow_statement_store.get_rolling(
+                    "Cash Flow from Operations", trailing
+                ),
+                self._income_statement_store.get_rolling("Net Income", trailing),
             )
         else:
             income_quality_ratio = profitability_model.get_income_quality_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._income_statement.loc[:, "Net Income", :],
+                self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                self._income_statement_store.get("Net Income"),
             )
 
         if growth:
@@ -3255,40 +3269,31 @@ class Ratios:
         if trailing:
             return_on_tangible_assets = (
                 profitability_model.get_return_on_tangible_assets(
-                    self._income_statement.loc[:, "Net Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Assets", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Intangible Assets", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Liabilities", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get_rolling("Net Income", trailing),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Assets", trailing, statistic="mean"
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Intangible Assets", trailing, statistic="mean"
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Liabilities", trailing, statistic="mean"
+                    ),
                 )
             )
         else:
             return_on_tangible_assets = (
                 profitability_model.get_return_on_tangible_assets(
-                    self._income_statement.loc[:, "Net Income", :],
-                    self._balance_sheet_statement.loc[:, "Total Assets", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Intangible Assets", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Liabilities", :]
-                    .T.rolling(2)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get("Net Income"),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Assets", 2, statistic="mean"
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Intangible Assets", 2, statistic="mean"
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Liabilities", 2, statistic="mean"
+                    ),
                 )
             )
 
@@ -3349,38 +3354,29 @@ class Ratios:
         if trailing:
             return_on_capital_employed = (
                 profitability_model.get_return_on_capital_employed(
-                    self._income_statement.loc[:, "Net Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Interest Expense", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._income_statement.loc[:, "Income Tax Expense", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Assets", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get_rolling("Net Income", trailing),
+                    self._income_statement_store.get_rolling(
+                        "Interest Expense", trailing
+                    ),
+                    self._income_statement_store.get_rolling(
+                        "Income Tax Expense", trailing
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Assets", trailing, statistic="mean"
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Current Liabilities", trailing, statistic="mean"
+                    ),
                 )
             )
         else:
             return_on_capital_employed = (
                 profitability_model.get_return_on_capital_employed(
-                    self._income_statement.loc[:, "Net Income", :],
-                    self._income_statement.loc[:, "Interest Expense", :],
-                    self._income_statement.loc[:, "Income Tax Expense", :],
-                    self._balance_sheet_statement.loc[:, "Total Assets", :],
-                    self._balance_sheet_statement.loc[
-                        :, "Total Current Liabilities", :
-                    ],
+                    self._income_statement_store.get("Net Income"),
+                    self._income_statement_store.get("Interest Expense"),
+                    self._income_statement_store.get("Income Tax Expense"),
+                    self._balance_sheet_store.get("Total Assets"),
+                    self._balance_sheet_store.get("Total Current Liabilities"),
                 )
             )
 
@@ -3444,19 +3440,15 @@ class Ratios:
         """
         if trailing:
             net_income_per_ebt = profitability_model.get_net_income_per_ebt(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling("Net Income", trailing),
+                self._income_statement_store.get_rolling(
+                    "Income Tax Expense", trailing
+                ),
             )
         else:
             net_income_per_ebt = profitability_model.get_net_income_per_ebt(
-                self._income_statement.loc[:, "Net Income", :],
-                self._income_statement.loc[:, "Income Tax Expense", :],
+                self._income_statement_store.get("Net Income"),
+                self._income_statement_store.get("Income Tax Expense"),
             )
 
         if growth:
@@ -3517,21 +3509,19 @@ class Ratios:
         if trailing:
             free_cash_flow_operating_cash_flow_ratio = (
                 profitability_model.get_free_cash_flow_operating_cash_flow_ratio(
-                    self._cash_flow_statement.loc[:, "Free Cash Flow", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._cash_flow_statement_store.get_rolling(
+                        "Free Cash Flow", trailing
+                    ),
+                    self._cash_flow_statement_store.get_rolling(
+                        "Cash Flow from Operations", trailing
+                    ),
                 )
             )
         else:
             free_cash_flow_operating_cash_flow_ratio = (
                 profitability_model.get_free_cash_flow_operating_cash_flow_ratio(
-                    self._cash_flow_statement.loc[:, "Free Cash Flow", :],
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
+                    self._cash_flow_statement_store.get("Free Cash Flow"),
+                    self._cash_flow_statement_store.get("Cash Flow from Operations"),
                 )
             )
 
@@ -3596,19 +3586,13 @@ class Ratios:
         """
         if trailing:
             tax_burden_ratio = profitability_model.get_tax_burden_ratio(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Income Before Tax", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling("Net Income", trailing),
+                self._income_statement_store.get_rolling("Income Before Tax", trailing),
             )
         else:
             tax_burden_ratio = profitability_model.get_tax_burden_ratio(
-                self._income_statement.loc[:, "Net Income", :],
-                self._income_statement.loc[:, "Income Before Tax", :],
+                self._income_statement_store.get("Net Income"),
+                self._income_statement_store.get("Income Before Tax"),
             )
 
         if growth:
@@ -3670,34 +3654,25 @@ class Ratios:
         """
         if trailing:
             EBT_to_EBIT = profitability_model.get_EBT_to_EBIT(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling("Net Income", trailing)
+                + self._income_statement_store.get_rolling(
+                    "Income Tax Expense", trailing
+                ),
+                self._income_statement_store.get_rolling("Net Income", trailing)
+                + self._income_statement_store.get_rolling(
+                    "Income Tax Expense", trailing
+                )
+                + self._income_statement_store.get_rolling(
+                    "Interest Expense", trailing
+                ),
             )
         else:
             EBT_to_EBIT = profitability_model.get_EBT_to_EBIT(
-                self._income_statement.loc[:, "Net Income", :]
-                + self._income_statement.loc[:, "Income Tax Expense", :],
-                self._income_statement.loc[:, "Net Income", :]
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                + self._income_statement.loc[:, "Interest Expense", :],
+                self._income_statement_store.get("Net Income")
+                + self._income_statement_store.get("Income Tax Expense"),
+                self._income_statement_store.get("Net Income")
+                + self._income_statement_store.get("Income Tax Expense")
+                + self._income_statement_store.get("Interest Expense"),
             )
 
         if growth:
@@ -3759,25 +3734,20 @@ class Ratios:
         """
         if trailing:
             EBIT_to_revenue = profitability_model.get_EBIT_to_revenue(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Income Tax Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
-                + self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._income_statement_store.get_rolling("Net Income", trailing)
+                + self._income_statement_store.get_rolling(
+                    "Income Tax Expense", trailing
+                )
+                + self._income_statement_store.get_rolling(
+                    "Interest Expense", trailing
+                ),
+                self._income_statement_store.get_rolling("Revenue", trailing),
             )
         EBIT_to_revenue = profitability_model.get_EBIT_to_revenue(
-            self._income_statement.loc[:, "Net Income", :]
-            + self._income_statement.loc[:, "Income Tax Expense", :]
-            + self._income_statement.loc[:, "Interest Expense", :],
-            self._income_statement.loc[:, "Revenue", :],
+            self._income_statement_store.get("Net Income")
+            + self._income_statement_store.get("Income Tax Expense")
+            + self._income_statement_store.get("Interest Expense"),
+            self._income_statement_store.get("Revenue"),
         )
 
         if growth:
@@ -3944,19 +3914,17 @@ class Ratios:
         """
         if trailing:
             debt_to_assets_ratio = solvency_model.get_debt_to_assets_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Debt", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", trailing, statistic="mean"
+                ),
             )
         else:
             debt_to_assets_ratio = solvency_model.get_debt_to_assets_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
-                self._balance_sheet_statement.loc[:, "Total Assets", :],
+                self._balance_sheet_store.get("Total Debt"),
+                self._balance_sheet_store.get("Total Assets"),
             )
 
         if growth:
@@ -4018,19 +3986,17 @@ class Ratios:
         """
         if trailing:
             debt_to_equity_ratio = solvency_model.get_debt_to_equity_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Debt", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Equity", trailing, statistic="mean"
+                ),
             )
         else:
             debt_to_equity_ratio = solvency_model.get_debt_to_equity_ratio(
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
-                self._balance_sheet_statement.loc[:, "Total Equity", :],
+                self._balance_sheet_store.get("Total Debt"),
+                self._balance_sheet_store.get("Total Equity"),
             )
 
         if growth:
@@ -4091,24 +4057,17 @@ class Ratios:
         """
         if trailing:
             interest_coverage_ratio = solvency_model.get_interest_coverage_ratio(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling("Operating Income", trailing),
+                self._cash_flow_statement_store.get_rolling(
+                    "Depreciation and Amortization", trailing
+                ),
+                self._income_statement_store.get_rolling("Interest Expense", trailing),
             )
         else:
             interest_coverage_ratio = solvency_model.get_interest_coverage_ratio(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :],
-                self._income_statement.loc[:, "Interest Expense", :],
+                self._income_statement_store.get("Operating Income"),
+                self._cash_flow_statement_store.get("Depreciation and Amortization"),
+                self._income_statement_store.get("Interest Expense"),
             )
 
         if growth:
@@ -4169,25 +4128,21 @@ class Ratios:
         """
         if trailing:
             equity_multiplier = solvency_model.get_equity_multiplier(
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Equity", trailing, statistic="mean"
+                ),
             )
         else:
             equity_multiplier = solvency_model.get_equity_multiplier(
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(2)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Equity", :]
-                .T.rolling(2)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", 2, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Equity", 2, statistic="mean"
+                ),
             )
 
         if growth:
@@ -4248,23 +4203,19 @@ class Ratios:
         if trailing:
             debt_service_coverage_ratio = (
                 solvency_model.get_debt_service_coverage_ratio(
-                    self._income_statement.loc[:, "Operating Income", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                    .T.rolling(trailing)
-                    .mean()
-                    .T,
+                    self._income_statement_store.get_rolling(
+                        "Operating Income", trailing
+                    ),
+                    self._balance_sheet_store.get_rolling(
+                        "Total Current Liabilities", trailing, statistic="mean"
+                    ),
                 )
             )
         else:
             debt_service_coverage_ratio = (
                 solvency_model.get_debt_service_coverage_ratio(
-                    self._income_statement.loc[:, "Operating Income", :],
-                    self._balance_sheet_statement.loc[
-                        :, "Total Current Liabilities", :
-                    ],
+                    self._income_statement_store.get("Operating Income"),
+                    self._balance_sheet_store.get("Total Current Liabilities"),
                 )
             )
 
@@ -4329,12 +4280,12 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
-        free_cash_flow = self._cash_flow_statement.loc[:, "Free Cash Flow", :]
+        free_cash_flow = self._cash_flow_statement_store.get("Free Cash Flow")
 
         years = self._balance_sheet_statement.columns
         begin, end = str(years[0]), str(years[-1])
@@ -4434,24 +4385,19 @@ class Ratios:
         """
         if trailing:
             net_debt_to_ebitda_ratio = solvency_model.get_net_debt_to_ebitda_ratio(
-                self._income_statement.loc[:, "Operating Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Net Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._income_statement_store.get_rolling("Operating Income", trailing),
+                self._cash_flow_statement_store.get_rolling(
+                    "Depreciation and Amortization", trailing
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Net Debt", trailing, statistic="mean"
+                ),
             )
         else:
             net_debt_to_ebitda_ratio = solvency_model.get_net_debt_to_ebitda_ratio(
-                self._income_statement.loc[:, "Operating Income", :],
-                self._cash_flow_statement.loc[:, "Depreciation and Amortization", :],
-                self._balance_sheet_statement.loc[:, "Net Debt", :],
+                self._income_statement_store.get("Operating Income"),
+                self._cash_flow_statement_store.get("Depreciation and Amortization"),
+                self._balance_sheet_store.get("Net Debt"),
             )
 
         if growth:
@@ -4510,19 +4456,17 @@ class Ratios:
         """
         if trailing:
             cash_flow_coverage_ratio = solvency_model.get_cash_flow_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._cash_flow_statement_store.get_rolling(
+                    "Cash Flow from Operations", trailing
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Debt", trailing, statistic="mean"
+                ),
             )
         else:
             cash_flow_coverage_ratio = solvency_model.get_cash_flow_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
+                self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                self._balance_sheet_store.get("Total Debt"),
             )
 
         if growth:
@@ -4583,19 +4527,17 @@ class Ratios:
         """
         if trailing:
             capex_coverage_ratio = solvency_model.get_capex_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._cash_flow_statement_store.get_rolling(
+                    "Cash Flow from Operations", trailing
+                ),
+                self._cash_flow_statement_store.get_rolling(
+                    "Capital Expenditure", trailing
+                ),
             )
         else:
             capex_coverage_ratio = solvency_model.get_capex_coverage_ratio(
-                self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :],
+                self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                self._cash_flow_statement_store.get("Capital Expenditure"),
             )
 
         if growth:
@@ -4659,26 +4601,23 @@ class Ratios:
         if trailing:
             dividend_capex_coverage_ratio = (
                 solvency_model.get_dividend_capex_coverage_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._cash_flow_statement.loc[:, "Capital Expenditure", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
-                    self._cash_flow_statement.loc[:, "Dividends Paid", :]
-                    .T.rolling(trailing)
-                    .sum()
-                    .T,
+                    self._cash_flow_statement_store.get_rolling(
+                        "Cash Flow from Operations", trailing
+                    ),
+                    self._cash_flow_statement_store.get_rolling(
+                        "Capital Expenditure", trailing
+                    ),
+                    self._cash_flow_statement_store.get_rolling(
+                        "Dividends Paid", trailing
+                    ),
                 )
             )
         else:
             dividend_capex_coverage_ratio = (
                 solvency_model.get_dividend_capex_coverage_ratio(
-                    self._cash_flow_statement.loc[:, "Cash Flow from Operations", :],
-                    self._cash_flow_statement.loc[:, "Capital Expenditure", :],
-                    self._cash_flow_statement.loc[:, "Dividends Paid", :],
+                    self._cash_flow_statement_store.get("Cash Flow from Operations"),
+                    self._cash_flow_statement_store.get("Capital Expenditure"),
+                    self._cash_flow_statement_store.get("Dividends Paid"),
                 )
             )
 
@@ -4904,38 +4843,34 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
         if trailing:
             dividends = (
-                self._cash_flow_statement.loc[:, "Preferred Dividends Paid", :]
-                .T.rolling(trailing)
-                .sum()
-                .T
+                self._cash_flow_statement_store.get_rolling(
+                    "Preferred Dividends Paid", trailing
+                )
                 if include_dividends
                 else 0
             )
 
             earnings_per_share = valuation_model.get_earnings_per_share(
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._income_statement_store.get_rolling("Net Income", trailing),
                 dividends,
                 average_shares,
             )
         else:
             dividends = (
-                self._cash_flow_statement.loc[:, "Preferred Dividends Paid", :]
+                self._cash_flow_statement_store.get("Preferred Dividends Paid")
                 if include_dividends
                 else 0
             )
 
             earnings_per_share = valuation_model.get_earnings_per_share(
-                self._income_statement.loc[:, "Net Income", :],
+                self._income_statement_store.get("Net Income"),
                 dividends,
                 average_shares,
             )
@@ -4999,19 +4934,19 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
         if trailing:
             revenue_per_share = valuation_model.get_revenue_per_share(
-                self._income_statement.loc[:, "Revenue", :].T.rolling(trailing).sum().T,
+                self._income_statement_store.get_rolling("Revenue", trailing),
                 average_shares,
             )
         else:
             revenue_per_share = valuation_model.get_revenue_per_share(
-                self._income_statement.loc[:, "Revenue", :], average_shares
+                self._income_statement_store.get("Revenue"), average_shares
             )
 
         if growth:
@@ -5161,11 +5096,8 @@ class Ratios:
         trailing_metric = 5 * 4 if self._quarterly else 5
 
         if use_ebitda_growth_rate:
-            growth_rate = (
-                self._income_statement.loc[:, "EBITDA", :]
-                .T.rolling(trailing_metric)
-                .sum()
-                .T
+            growth_rate = self._income_statement_store.get_rolling(
+                "EBITDA", trailing_metric
             )
 
             growth_rate = calculate_growth(growth_rate)
@@ -5247,27 +5179,25 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
         if trailing:
             book_value_per_share = valuation_model.get_book_value_per_share(
-                self._balance_sheet_statement.loc[:, "Total Shareholder Equity", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Preferred Stock", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Shareholder Equity", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Preferred Stock", trailing, statistic="mean"
+                ),
                 average_shares.T.rolling(trailing).mean().T,
             )
         else:
             book_value_per_share = valuation_model.get_book_value_per_share(
-                self._balance_sheet_statement.loc[:, "Total Shareholder Equity", :],
-                self._balance_sheet_statement.loc[:, "Preferred Stock", :],
+                self._balance_sheet_store.get("Total Shareholder Equity"),
+                self._balance_sheet_store.get("Preferred Stock"),
                 average_shares,
             )
 
@@ -5415,27 +5345,23 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
         if trailing:
             interest_debt_per_share = valuation_model.get_interest_debt_per_share(
-                self._income_statement.loc[:, "Interest Expense", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Debt", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._income_statement_store.get_rolling("Interest Expense", trailing),
+                self._balance_sheet_store.get_rolling(
+                    "Total Debt", trailing, statistic="mean"
+                ),
                 average_shares.T.rolling(trailing).mean().T,
             )
         else:
             interest_debt_per_share = valuation_model.get_interest_debt_per_share(
-                self._income_statement.loc[:, "Interest Expense", :],
-                self._balance_sheet_statement.loc[:, "Total Debt", :],
+                self._income_statement_store.get("Interest Expense"),
+                self._balance_sheet_store.get("Total Debt"),
                 average_shares,
             )
 
@@ -5498,22 +5424,21 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
         if trailing:
             capex_per_share = valuation_model.get_capex_per_share(
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._cash_flow_statement_store.get_rolling(
+                    "Capital Expenditure", trailing
+                ),
                 average_shares,
             )
         else:
             capex_per_share = valuation_model.get_capex_per_share(
-                self._cash_flow_statement.loc[:, "Capital Expenditure", :],
+                self._cash_flow_statement_store.get("Capital Expenditure"),
                 average_shares,
             )
 
@@ -5656,12 +5581,12 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
-        dividends_paid = abs(self._cash_flow_statement.loc[:, "Dividends Paid", :])
+        dividends_paid = abs(self._cash_flow_statement_store.get("Dividends Paid"))
 
         years = self._cash_flow_statement.columns
         begin, end = str(years[0]), str(years[-1])
@@ -5761,14 +5686,14 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
-        cash_flow_from_operations = self._cash_flow_statement.loc[
-            :, "Cash Flow from Operations", :
-        ]
+        cash_flow_from_operations = self._cash_flow_statement_store.get(
+            "Cash Flow from Operations"
+        )
 
         years = self._cash_flow_statement.columns
         begin, end = str(years[0]), str(years[-1])
@@ -5870,7 +5795,7 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        free_cash_flow = self._cash_flow_statement.loc[:, "Free Cash Flow", :]
+        free_cash_flow = self._cash_flow_statement_store.get("Free Cash Flow")
 
         if show_daily:
             free_cash_flow = map_period_data_to_daily_data(
@@ -5949,9 +5874,9 @@ class Ratios:
         ```
         """
         average_shares = (
-            self._income_statement.loc[:, "Weighted Average Shares Diluted", :]
+            self._income_statement_store.get("Weighted Average Shares Diluted")
             if diluted
-            else self._income_statement.loc[:, "Weighted Average Shares", :]
+            else self._income_statement_store.get("Weighted Average Shares")
         )
 
         years = self._cash_flow_statement.columns
@@ -6032,12 +5957,12 @@ class Ratios:
         enterprise_value = toolkit.ratios.get_enterprise_value()
         ```
         """
-        total_debt = self._balance_sheet_statement.loc[:, "Total Debt", :]
-        minority_interest = self._balance_sheet_statement.loc[:, "Minority Interest", :]
-        preferred_stock = self._balance_sheet_statement.loc[:, "Preferred Stock", :]
-        cash_and_cash_equivalents = self._balance_sheet_statement.loc[
-            :, "Cash and Cash Equivalents", :
-        ]
+        total_debt = self._balance_sheet_store.get("Total Debt")
+        minority_interest = self._balance_sheet_store.get("Minority Interest")
+        preferred_stock = self._balance_sheet_store.get("Preferred Stock")
+        cash_and_cash_equivalents = self._balance_sheet_store.get(
+            "Cash and Cash Equivalents"
+        )
 
         market_cap = self.get_market_cap(
             diluted=diluted,
@@ -6147,7 +6072,7 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        revenue = self._income_statement.loc[:, "Revenue", :]
+        revenue = self._income_statement_store.get("Revenue")
 
         if show_daily:
             revenue = map_period_data_to_daily_data(
@@ -6224,10 +6149,10 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        operating_income = self._income_statement.loc[:, "Operating Income", :]
-        depreciation_and_amortization = self._cash_flow_statement.loc[
-            :, "Depreciation and Amortization", :
-        ]
+        operating_income = self._income_statement_store.get("Operating Income")
+        depreciation_and_amortization = self._cash_flow_statement_store.get(
+            "Depreciation and Amortization"
+        )
 
         if show_daily:
             operating_income = map_period_data_to_daily_data(
@@ -6314,9 +6239,9 @@ class Ratios:
             show_daily=show_daily,
         )
 
-        cash_flow_from_operations = self._cash_flow_statement.loc[
-            :, "Cash Flow from Operations", :
-        ]
+        cash_flow_from_operations = self._cash_flow_statement_store.get(
+            "Cash Flow from Operations"
+        )
 
         if show_daily:
             cash_flow_from_operations = map_period_data_to_daily_data(
@@ -6476,19 +6401,13 @@ class Ratios:
         """
         if trailing:
             payout_ratio = valuation_model.get_dividend_payout_ratio(
-                self._cash_flow_statement.loc[:, "Dividends Paid", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
-                self._income_statement.loc[:, "Net Income", :]
-                .T.rolling(trailing)
-                .sum()
-                .T,
+                self._cash_flow_statement_store.get_rolling("Dividends Paid", trailing),
+                self._income_statement_store.get_rolling("Net Income", trailing),
             )
         else:
             payout_ratio = valuation_model.get_dividend_payout_ratio(
-                self._cash_flow_statement.loc[:, "Dividends Paid", :],
-                self._income_statement.loc[:, "Net Income", :],
+                self._cash_flow_statement_store.get("Dividends Paid"),
+                self._income_statement_store.get("Net Income"),
             )
 
         if growth:
@@ -6601,24 +6520,21 @@ class Ratios:
         """
         if trailing:
             tangible_asset_value = valuation_model.get_tangible_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Goodwill", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Assets", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Liabilities", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Goodwill", trailing, statistic="mean"
+                ),
             )
         else:
             tangible_asset_value = valuation_model.get_tangible_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Liabilities", :],
-                self._balance_sheet_statement.loc[:, "Goodwill", :],
+                self._balance_sheet_store.get("Total Assets"),
+                self._balance_sheet_store.get("Total Liabilities"),
+                self._balance_sheet_store.get("Goodwill"),
             )
 
         if growth:
@@ -6670,19 +6586,17 @@ class Ratios:
         """
         if trailing:
             net_current_asset_value = valuation_model.get_net_current_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :]
-                .T.rolling(trailing)
-                .mean()
-                .T,
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Assets", trailing, statistic="mean"
+                ),
+                self._balance_sheet_store.get_rolling(
+                    "Total Current Liabilities", trailing, statistic="mean"
+                ),
             )
         else:
             net_current_asset_value = valuation_model.get_net_current_asset_value(
-                self._balance_sheet_statement.loc[:, "Total Current Assets", :],
-                self._balance_sheet_statement.loc[:, "Total Current Liabilities", :],
+                self._balance_sheet_store.get("Total Current Assets"),
+                self._balance_sheet_store.get("Total Current Liabilities"),
             )
 
         if growth:
@@ -6743,9 +6657,9 @@ class Ratios:
         )
 
         ebit = (
-            self._income_statement.loc[:, "Net Income", :]
-            + self._income_statement.loc[:, "Income Tax Expense", :]
-            + self._income_statement.loc[:, "Interest Expense", :]
+            self._income_statement_store.get("Net Income")
+            + self._income_statement_store.get("Income Tax Expense")
+            + self._income_statement_store.get("Interest Expense")
         )
 
         if show_daily:
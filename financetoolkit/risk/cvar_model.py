@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
-from financetoolkit.risk import var_model
+from financetoolkit.risk import helpers, var_model
 
 ALPHA_CONSTRAINT = 0.5
 
@@ -28,21 +28,11 @@ def get_cvar_historic(returns: pd.Series | pd.DataFrame, alpha: float) -> pd.Ser
     """
     if isinstance(returns, pd.DataFrame):
         if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            periods = returns.index.get_level_values(0).unique()
-            period_data_list = []
+            period_blocks = helpers.PeriodBlocks(returns)
 
-            for sub_period in periods:
-                period_data = returns.loc[sub_period].aggregate(
-                    get_cvar_historic, alpha=alpha
-                )
-                period_data.name = sub_period
-
-                if not period_data.empty:
-                    period_data_list.append(period_data)
-
-            value_at_risk = pd.concat(period_data_list, axis=1)
-
-            return value_at_risk.T
+            return period_blocks.to_dataframe(
+                period_blocks.get_tail_mean(period_blocks.get_percentile(alpha))
+            )
         return returns.aggregate(get_cvar_historic, alpha=alpha)
     if isinstance(returns, pd.Series):
         return returns[
@@ -70,19 +60,12 @@ def get_cvar_gaussian(
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
-
-        for sub_period in periods:
-            period_data = get_cvar_gaussian(returns.loc[sub_period], alpha)
-            period_data.name = sub_period
+        period_blocks = helpers.PeriodBlocks(returns)
+        za = stats.norm.ppf(alpha, 0, 1)
 
-            if not period_data.empty:
-                period_data_list.append(period_data)
-
-        value_at_risk = pd.concat(period_data_list, axis=1)
-
-        return value_at_risk.T
+        return period_blocks.to_dataframe(
+            period_blocks.std * -stats.norm.pdf(za) / alpha + period_blocks.mean
+        )
 
     za = stats.norm.ppf(alpha, 0, 1)
     return returns.std(ddof=0) * -stats.norm.pdf(za) / alpha + returns.mean()
@@ -106,19 +89,14 @@ def get_cvar_studentt(
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
-
-        for sub_period in periods:
-            period_data = get_cvar_studentt(returns.loc[sub_period], alpha)
-            period_data.name = sub_period
+        period_blocks = helpers.PeriodBlocks(returns)
+        v, scale = period_blocks.get_student_t_parameters()
+        za = stats.t.ppf(1 - alpha, v, 1)
 
-            if not period_data.empty:
-                period_data_list.append(period_data)
-
-        value_at_risk = pd.concat(period_data_list, axis=1)
-
-        return value_at_risk.T
+        return period_blocks.to_dataframe(
+            -scale * (v + za**2) / (v - 1) * stats.t.pdf(za, v) / alpha
+            + period_blocks.mean
+        )
 
     returns = pd.DataFrame(returns)
 
@@ -151,19 +129,17 @@ def get_cvar_laplace(
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
-
-        for sub_period in periods:
-            period_data = get_cvar_laplace(returns.loc[sub_period], alpha)
-            period_data.name = sub_period
+        period_blocks = helpers.PeriodBlocks(returns)
+        b = np.sqrt(period_blocks.std**2 / 2)
 
-            if not period_data.empty:
-                period_data_list.append(period_data)
+        if alpha <= ALPHA_CONSTRAINT:
+            return period_blocks.to_dataframe(
+                -b * (1 - np.log(2 * alpha)) + period_blocks.mean
+            )
 
-        value_at_risk = pd.concat(period_data_list, axis=1)
+        print("Laplace Conditional VaR is not available for a level over 50%.")
 
-        return value_at_risk.T
+        return 0
 
     # For formula see: https://en.wikipedia.org/wiki/Expected_shortfall#Laplace_distribution
 
@@ -197,19 +173,13 @@ def get_cvar_logistic(
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
-
-        for sub_period in periods:
-            period_data = get_cvar_logistic(returns.loc[sub_period], alpha)
-            period_data.name = sub_period
-
-            if not period_data.empty:
-                period_data_list.append(period_data)
-
-        value_at_risk = pd.concat(period_data_list, axis=1)
+        period_blocks = helpers.PeriodBlocks(returns)
+        scale = np.sqrt(3 * period_blocks.std**2 / np.pi**2)
 
-        return value_at_risk.T
+        return period_blocks.to_dataframe(
+            -scale * np.log(((1 - alpha) ** (1 - 1 / alpha)) / alpha)
+            + period_blocks.mean
+        )
 
     # For formula see: https://en.wikipedia.org/wiki/Expected_shortfall#Logistic_distribution
 
@@ -35,19 +35,7 @@ def get_evar_gaussian(
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
-
-        for sub_period in periods:
-            period_data = cvar_model.get_cvar_laplace(returns.loc[sub_period], alpha)
-            period_data.name = sub_period
-
-            if not period_data.empty:
-                period_data_list.append(period_data)
-
-        value_at_risk = pd.concat(period_data_list, axis=1)
-
-        return value_at_risk.T
+        return cvar_model.get_cvar_laplace(returns, alpha)
 
     return returns.mean() + returns.std(ddof=0) * np.sqrt(
         -2 * np.log(returns.std(ddof=0))
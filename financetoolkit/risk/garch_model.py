@@ -2,7 +2,7 @@
 
 import numpy as np
 import pandas as pd
-from scipy import optimize
+from scipy import optimize, signal
 
 ALPHA_CONSTRAINT = 0.5
 
@@ -11,6 +11,57 @@ ALPHA_CONSTRAINT = 0.5
 # (e.g. 2020Q1) and the second index the days within that period (January to March)
 MULTI_PERIOD_INDEX_LEVELS = 2
 
+# The (alpha, beta) starting points that are tried next to the initial guess when no
+# warm start is available, covering both low and high persistence
+STARTING_POINTS = [(0.05, 0.9), (0.2, 0.7), (0.3, 0.3)]
+
+
+def validate_orders(p: int, q: int):
+    """
+    Validate the orders of the GARCH(p, q) model.
+
+    Args:
+        p (int): Number of u_t datapoints to use.
+        q: (int): Number of sigma_t datapoints to use.
+
+    Raises:
+        ValueError: If p or q is not a positive integer.
+    """
+    if not isinstance(p, int) or not isinstance(q, int) or p < 1 or q < 1:
+        raise ValueError(
+            "Invalid input for p or/and q, both need to be positive integers."
+        )
+
+
+def get_garch_input(
+    returns_squared: np.ndarray,
+    first_value: float,
+    omega: float,
+    alpha: np.ndarray,
+    time_steps: int,
+) -> np.ndarray:
+    """
+    Calculates the part of the GARCH recursion that does not depend on earlier sigma_2 values,
+    omega + SUM(alpha_j * u_(i - j) ^ 2), with the first value set to u_0 ^ 2.
+
+    Args:
+        returns_squared (np.ndarray): The squared returns.
+        first_value (float): The first sigma_2 value.
+        omega (float): The constant of the GARCH model.
+        alpha (np.ndarray): The weights of the squared returns.
+        time_steps (int): Time steps to calculate GARCH for.
+
+    Returns:
+        np.ndarray: The input of the GARCH recursion.
+    """
+    garch_input = np.full(time_steps, omega, dtype=float)
+    garch_input[0] = first_value
+
+    for lag, alpha_value in enumerate(alpha, start=1):
+        garch_input[lag:] += alpha_value * returns_squared[: time_steps - lag]
+
+    return garch_input
+
 
 def garch_log_maximization(
     weights: list, returns: np.ndarray, t: int, p: int = 1, q: int = 1
@@ -19,74 +70,163 @@ def garch_log_maximization(
     Calculates -SUM(-ln(v_i) - (u_i ^ 2) / v_i)
 
     Args:
-        weights (list): List with the values for omega, alpha and beta
+        weights (list): List with the values for omega, alpha_1, ..., alpha_p and beta_1, ..., beta_q
         returns (np.ndarray): A np.ndarray of returns.
         t (int): Time steps to optimize GARCH for.
-        p (int): Number of u_t datapoints to use. Note that currently only p=1 is supported.
-        q: (int): Number of sigma_t datapoints to use. Note that currently only q=1 is supported.
+        p (int): Number of u_t datapoints to use.
+        q: (int): Number of sigma_t datapoints to use.
 
     Returns:
         int: The result of the calculation -SUM(-ln(v_i) - (u_i ^ 2) / v_i)
     """
-    # Convert weights to a numpy array for vectorized operations
-    weights_array = np.array(weights)
-
-    # Compute GARCH values using a vectorized function
-    garch = get_garch(returns, weights_array, t, p=p, q=q)
+    garch = get_garch(returns, np.asarray(weights), t, p=p, q=q)
 
-    # Compute the log-likelihood in a vectorized manner
     u = returns[1:t]
     v = garch[: t - 1]
 
-    # Use np.sum to calculate the sum of the log-likelihood
-    result = -np.sum(-np.log(v) - u**2 / v)
+    return -np.sum(-np.log(v) - u**2 / v)
 
-    return result
+
+def garch_log_maximization_gradient(
+    weights: list, returns: np.ndarray, t: int, p: int = 1, q: int = 1
+) -> np.ndarray:
+    """
+    Calculates the analytic gradient of -SUM(-ln(v_i) - (u_i ^ 2) / v_i) with respect to the weights.
+
+    The derivatives of the sigma_2 values follow the same recursion as the sigma_2 values themselves,
+    d v_i = d x_i + SUM(beta_k * d v_(i - k)) + v_(i - k) for beta_k, and are therefore obtained
+    with the same linear filter.
+
+    Args:
+        weights (list): List with the values for omega, alpha_1, ..., alpha_p and beta_1, ..., beta_q
+        returns (np.ndarray): A np.ndarray of returns.
+        t (int): Time steps to optimize GARCH for.
+        p (int): Number of u_t datapoints to use.
+        q: (int): Number of sigma_t datapoints to use.
+
+    Returns:
+        np.ndarray: The gradient with respect to omega, the alphas and the betas.
+    """
+    weights = np.asarray(weights, dtype=float)
+    garch = get_garch(returns, weights, t, p=p, q=q)
+    returns_squared = returns[:t] ** 2
+
+    # Each row is the input of the recursion differentiated to one of the weights
+    garch_input_derivatives = np.zeros((1 + p + q, t))
+    garch_input_derivatives[0, 1:] = 1
+
+    for lag in range(1, p + 1):
+        garch_input_derivatives[lag, lag:] = returns_squared[: t - lag]
+
+    for lag in range(1, q + 1):
+        garch_input_derivatives[p + lag, lag:] = garch[: t - lag]
+
+    garch_derivatives = signal.lfilter(
+        [1.0], np.r_[1.0, -weights[1 + p :]], garch_input_derivatives, axis=1
+    )
+
+    u = returns[1:t]
+    v = garch[: t - 1]
+
+    return garch_derivatives[:, : t - 1] @ (1 / v - u**2 / v**2)
 
 
 def get_garch_weights(
-    returns: np.ndarray, t: int | None = None, p: int = 1, q: int = 1
-) -> list:
+    returns: np.ndarray,
+    t: int | None = None,
+    p: int = 1,
+    q: int = 1,
+    initial_weights: np.ndarray | list | None = None,
+) -> np.ndarray:
     """
-    Estimates the weights (parameters) for a GARCH(p, q) model using simulated annealing optimization.
+    Estimates the weights (parameters) for a GARCH(p, q) model using maximum likelihood estimation.
 
-    The weights are estimated by using simulated annealing, which goes over different values of
-    (1 - alpha - beta) sigma_l, alpha and beta, while maximizing: SUM(-ln(v_i) - (u_i ^ 2) / v_i).
-    With the constraints:
+    The weights are estimated by minimizing -SUM(-ln(v_i) - (u_i ^ 2) / v_i) with a gradient
+    based optimizer (SLSQP) and the analytic gradient, starting from several points to avoid local
+    optima. With the constraints:
     - alpha > 0
     - beta > 0
-    - alpha + beta < 1
-    Note that there is no restriction on (1 - alpha - beta) sigma_l.
+    - SUM(alpha) + SUM(beta) < 1
+    Note that there is no restriction on (1 - SUM(alpha) - SUM(beta)) sigma_l.
+
+    The initial guess (the variance, an alpha of 0.1 and a beta of 0.8) is only replaced when
+    another estimate strictly improves the likelihood.
 
     Args:
         returns (np.ndarray): A np.ndarray of returns.
         t (int): Time steps to optimize GARCH for.
-        p (int): Number of u_t datapoints to use. Note that currently only p=1 is supported.
-        q: (int): Number of sigma_t datapoints to use. Note that currently only q=1 is supported.
+        p (int): Number of u_t datapoints to use.
+        q: (int): Number of sigma_t datapoints to use.
+        initial_weights (np.ndarray | list | None, optional): The weights to start from, e.g. the
+            weights of a previous fit or period. When given, these replace the default starting
+            points which makes refitting considerably faster. Defaults to None.
 
     Returns:
-        list: A list with the weights
+        np.ndarray: An array with the weights omega, alpha_1, ..., alpha_p and beta_1, ..., beta_q
     """
+    validate_orders(p, q)
+
     if isinstance(returns, pd.DataFrame):
         returns = returns.iloc[:, 0].to_numpy()
     if t is None:
         t = len(returns)
 
-    bounds = [(1e-9, 1), (1e-9, 1), (1e-9, 1)]
-    initial_guess = [np.var(returns[: t - 1]), 0.1, 0.8]
+    variance = np.var(returns[: t - 1])
+    initial_guess = np.r_[variance, np.full(p, 0.1 / p), np.full(q, 0.8 / q)]
+
+    if not np.isfinite(initial_guess).all() or variance == 0:
+        return initial_guess
+
+    starting_points = (
+        [np.asarray(initial_weights, dtype=float)]
+        if initial_weights is not None
+        else [
+            np.r_[
+                variance * (1 - alpha - beta),
+                np.full(p, alpha / p),
+                np.full(q, beta / q),
+            ]
+            for alpha, beta in STARTING_POINTS
+        ]
+    )
+
+    # Omega is scaled by the variance so that all weights are of a similar magnitude
+    scale = np.r_[variance, np.ones(p + q)]
+    bounds = optimize.Bounds(
+        np.full(1 + p + q, 1e-9) / scale, np.ones(1 + p + q) / scale
+    )
+    constraint = optimize.LinearConstraint(np.r_[0, np.ones(p + q)], -np.inf, 1 - 1e-9)
+
+    def objective(scaled_weights):
+        weights = scaled_weights * scale
+
+        return (
+            garch_log_maximization(weights, returns, t, p, q) / t,
+            garch_log_maximization_gradient(weights, returns, t, p, q) * scale / t,
+        )
 
-    # Define the wrapper function for optimization that applies the constraints
-    def wrapper_func(parameters):
-        alpha = parameters[1]
-        beta = parameters[2]
-        if alpha + beta >= 1:  # Constraint
-            return np.inf  # Return a large number to represent an invalid solution
-        return garch_log_maximization(parameters, returns, t, p, q)
+    best_weights = initial_guess
+    best_value = garch_log_maximization(initial_guess, returns, t, p, q)
+
+    for starting_point in [initial_guess, *starting_points]:
+        with np.errstate(all="ignore"):
+            result = optimize.minimize(
+                objective,
+                np.clip(starting_point / scale, bounds.lb, bounds.ub),
+                jac=True,
+                method="SLSQP",
+                bounds=bounds,
+                constraints=constraint,
+                options={"ftol": 1e-10},
+            )
 
-    # Perform the optimization using simulated annealing
-    result = optimize.dual_annealing(wrapper_func, bounds, x0=initial_guess)
+            weights = np.clip(result.x * scale, 1e-9, 1)
+            value = garch_log_maximization(weights, returns, t, p, q)
 
-    return result.x
+        if weights[1:].sum() < 1 and value < best_value:
+            best_weights, best_value = weights, value
+
+    return best_weights
 
 
 def get_garch(
@@ -102,6 +242,10 @@ def get_garch(
     GARCH (Generalized autoregressive conditional heteroskedasticity) is stochastic model for time series, which is for
     instance used to model volatility clusters, stock return and inflation. It is a generalisation of the ARCH models.
 
+    The sigma_2 values are calculated with sigma_2_i = omega + SUM(alpha_j * u_(i - j) ^ 2) +
+    SUM(beta_k * sigma_2_(i - k)) in which sigma_2_0 = u_0 ^ 2 and values before the first observation
+    are zero. As this is a linear recursion in sigma_2, it is calculated with a linear filter.
+
     More information can be found in:
     - https://en.wikipedia.org/wiki/Autoregressive_conditional_heteroskedasticity#GARCH
     - Generalized Autoregressive Conditional Heteroskedasticity, by Tim Bollerslev
@@ -110,29 +254,52 @@ def get_garch(
 
     Args:
         returns (pd.Series | pd.DataFrame | np.ndarray): A Series or Dataframe or np.ndarray of returns.
-        weights (list): List with the values for omega, alpha and beta. Note that these are used all columns
-        in the returns.
+        weights (list): List with the values for omega, alpha_1, ..., alpha_p and beta_1, ..., beta_q.
+        Note that these are used all columns in the returns.
         t (int): Time steps to calculate GARCH for.
         optimization_t (int): Time steps to optimize GRACH for. It is only used if no weights are given.
-        p (int): Number of u_t datapoints to use. Note that currently only p=1 is supported.
-        q: (int): Number of sigma_t datapoints to use. Note that currently only q=1 is supported.
+        p (int): Number of u_t datapoints to use.
+        q: (int): Number of sigma_t datapoints to use.
 
     Returns:
         np.array | pd.Series | pd.DataFrame: A object with sigma_2 values
     """
-    # TODO: support GARCH(p, q), for any p and q  # pylint: disable=W0511
-    if p != 1 or q != 1:
-        raise ValueError(
-            "Invalid input for p or/and q, currently only GARCH(1, 1) is implemented."
-        )
+    validate_orders(p, q)
 
     if isinstance(returns, pd.DataFrame):
         if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
             periods = returns.index.get_level_values(0).unique()
             period_data_list = []
+            period_weights: dict = {}
 
             for sub_period in periods:
-                period_data = returns.loc[sub_period].aggregate(get_garch)
+                period_returns = returns.loc[sub_period]
+
+                # The weights of the previous period are used as a warm start
+                for column in period_returns.columns:
+                    period_weights[column] = (
+                        weights
+                        if weights is not None
+                        else get_garch_weights(
+                            period_returns[column].to_numpy(),
+                            p=p,
+                            q=q,
+                            initial_weights=period_weights.get(column),
+                        )
+                    )
+
+                period_data = pd.DataFrame(
+                    {
+                        column: get_garch(
+                            period_returns[column].to_numpy(),
+                            period_weights[column],
+                            p=p,
+                            q=q,
+                        )
+                        for column in period_returns.columns
+                    },
+                    index=period_returns.index,
+                )
                 period_data.name = sub_period
 
                 if not period_data.empty:
@@ -141,7 +308,7 @@ def get_garch(
             garch = pd.concat(period_data_list, axis=0)
 
             return garch
-        return returns.aggregate(get_garch)
+        return returns.aggregate(get_garch, weights=weights, p=p, q=q)
     if isinstance(returns, pd.Series):
         return get_garch(
             returns=returns.values,
@@ -159,19 +326,17 @@ def get_garch(
         if time_steps is None:
             time_steps = len(returns)
 
-        # Initialize sigma2 with zeros and set the first value
-        sigma2 = np.zeros(time_steps)
-        sigma2[0] = returns[0] ** 2
+        weights = np.asarray(weights, dtype=float)
 
-        # Calculate sigma2 values using a vectorized approach
-        for i in range(1, time_steps):
-            sigma2[i] = (
-                weights[0]
-                + weights[1] * returns[i - 1] ** 2
-                + weights[2] * sigma2[i - 1]
-            )
+        garch_input = get_garch_input(
+            returns[:time_steps] ** 2,
+            returns[0] ** 2,
+            weights[0],
+            weights[1 : 1 + p],
+            time_steps,
+        )
 
-        return sigma2
+        return signal.lfilter([1.0], np.r_[1.0, -weights[1 + p :]], garch_input)
 
     raise TypeError("Expects pd.DataFrame or pd.Series or np.ndarry, no other value.")
 
@@ -189,28 +354,57 @@ def get_garch_forecast(
     instance used to model volatility clusters, stock return and inflation. It is a generalisation of the ARCH models.
 
     The forecasting with GARCH is done with the following formula:
-    sigma_l ** 2 + (sigma_t ** 2 - sigma_l ** 2) * (alpha + beta) ** (t - 1)
+    sigma_l ** 2 + (sigma_t ** 2 - sigma_l ** 2) * (SUM(alpha) + SUM(beta)) ** (t - 1)
 
     For more:
     - Finance Compact Plus Band 1, by Yvonne Seler Zimmerman and Heinz Zimmerman; ISBN: 978-3-907291-31-1
 
     Args:
         returns (pd.Series | pd.DataFrame | np.ndarray): A Series or Dataframe or np.ndarray of returns.
-        weights (list): List with the values for omega, alpha and beta
+        weights (list): List with the values for omega, alpha_1, ..., alpha_p and beta_1, ..., beta_q
         time_steps (int): Time steps to calculate GARCH for
-        p (int): Number of u_t datapoints to use. Note that currently only p=1 is supported.
-        q: (int): Number of sigma_t datapoints to use. Note that currently only q=1 is supported.
+        p (int): Number of u_t datapoints to use.
+        q: (int): Number of sigma_t datapoints to use.
 
     Returns:
         np.ndarray: sigma_2 sigma_2 forecasts, going from the forecast from 0 time period to t
     """
+    validate_orders(p, q)
+
     if isinstance(returns, pd.DataFrame):
         if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
             periods = returns.index.get_level_values(0).unique()
             period_data_list = []
+            period_weights: dict = {}
 
             for sub_period in periods:
-                period_data = returns.loc[sub_period].aggregate(get_garch_forecast)
+                period_returns = returns.loc[sub_period]
+
+                # The weights of the previous period are used as a warm start
+                for column in period_returns.columns:
+                    period_weights[column] = (
+                        weights
+                        if weights is not None
+                        else get_garch_weights(
+                            period_returns[column].to_numpy(),
+                            p=p,
+                            q=q,
+                            initial_weights=period_weights.get(column),
+                        )
+                    )
+
+                period_data = pd.DataFrame(
+                    {
+                        column: get_garch_forecast(
+                            period_returns[column].to_numpy(),
+                            period_weights[column],
+                            time_steps,
+                            p=p,
+                            q=q,
+                        )
+                        for column in period_returns.columns
+                    }
+                )
                 period_data.name = sub_period
                 period_data.columns = [
                     col + " " + str(sub_period) for col in period_data.columns
@@ -223,7 +417,9 @@ def get_garch_forecast(
 
             return garch_forecast
 
-        return returns.aggregate(get_garch_forecast)
+        return returns.aggregate(
+            get_garch_forecast, weights=weights, time_steps=time_steps, p=p, q=q
+        )
     if isinstance(returns, pd.Series):
         return get_garch_forecast(
             returns=returns.values, weights=weights, time_steps=time_steps, p=p, q=q
@@ -234,13 +430,13 @@ def get_garch_forecast(
 
         garch_values = get_garch(returns, weights, time_steps, p=p, q=q)
 
-        sigma_l = weights[0] / (1 - weights[1] - weights[2])
+        persistence = np.sum(weights[1:])
+        sigma_l = weights[0] / (1 - persistence)
         sigma_2 = np.zeros(time_steps)
         sigma_2[0] = garch_values[0]
-        for i in range(1, time_steps):
-            sigma_2[i] = sigma_l**2 + (garch_values[0] - sigma_l**2) * (
-                weights[1] + weights[2]
-            ) ** (i - 1)
+        sigma_2[1:] = sigma_l**2 + (garch_values[0] - sigma_l**2) * persistence ** (
+            np.arange(1, time_steps) - 1
+        )
 
         return sigma_2
 
@@ -2,7 +2,11 @@
 
 __docformat__ = "google"
 
+from functools import cached_property
+
+import numpy as np
 import pandas as pd
+from scipy import stats
 
 # pylint: disable=protected-access
 
@@ -55,35 +59,297 @@ def determine_within_historical_data(
             "intraday",
             "daily",
         ]:
-            within_historical_data[period] = (
-                intraday_historical_data.groupby(pd.Grouper(freq=period_symbol))
-                .apply(lambda x: x)
-                .dropna(how="all", axis=0)
-            )
+            historical_data = intraday_historical_data.dropna(how="all", axis=0)
         else:
-            within_historical_data[period] = daily_historical_data.groupby(
-                pd.Grouper(
-                    freq=(
-                        f"{period_symbol}E"
-                        if period_symbol in ["M", "Q", "Y"]
-                        else period_symbol
-                    )
-                )
-            ).apply(lambda x: x)
-
-        within_historical_data[period].index = within_historical_data[
-            period
-        ].index.set_levels(
-            [
-                pd.PeriodIndex(
-                    within_historical_data[period].index.levels[0],
-                    freq=period_symbol,
-                ),
-                pd.PeriodIndex(
-                    within_historical_data[period].index.levels[1],
-                    freq="D" if period != "intraday" else "min",
-                ),
-            ],
-        )
+            historical_data = daily_historical_data
+
+        # Each date is labelled with the period it falls in directly, which results in
+        # the same (period, date) index as grouping by the period and concatenating
+        # the groups again but without splitting the data into a DataFrame per period
+        within_historical_data[period] = historical_data.set_axis(
+            pd.MultiIndex.from_arrays(
+                [
+                    historical_data.index.to_period(period_symbol),
+                    historical_data.index.to_period(
+                        "D" if period != "intraday" else "min"
+                    ),
+                ],
+                names=[historical_data.index.name] * 2,
+            ),
+            axis=0,
+        ).sort_index(level=0, sort_remaining=False, kind="stable")
 
     return within_historical_data
+
+
+class PeriodBlocks:
+    """
+    The PeriodBlocks arrange returns with a (period, date) MultiIndex into a dense
+    (period × ticker × observation) array so that the risk metrics can be calculated for
+    every period and ticker in a single vectorized sweep instead of slicing the returns
+    per period. Periods with fewer observations than the longest period are padded with
+    NaN which, just like missing returns, is ignored when calculating the moments.
+    """
+
+    def __init__(self, returns: pd.DataFrame):
+        """
+        Initializes the PeriodBlocks.
+
+        Args:
+            returns (pd.DataFrame): The returns with the period as the first index level
+                and the dates within the period as the second index level.
+        """
+        period_codes, self.periods = pd.factorize(returns.index.get_level_values(0))
+        self.columns = returns.columns
+        self.counts = np.bincount(period_codes, minlength=len(self.periods))
+
+        order = np.argsort(period_codes, kind="stable")
+        positions = np.empty(len(period_codes), dtype=int)
+        positions[order] = np.arange(len(period_codes)) - np.repeat(
+            np.cumsum(self.counts) - self.counts, self.counts
+        )
+
+        self.values = np.full(
+            (len(self.periods), len(self.columns), self.counts.max(initial=0)), np.nan
+        )
+        self.values[period_codes, :, positions] = returns.to_numpy(dtype=float)
+
+        # Distinguishes the observations from the padding, missing returns
+        # within a period are therefore still considered an observation
+        self.observations = (
+            np.arange(self.values.shape[2]) < self.counts[:, np.newaxis]
+        )[:, np.newaxis, :]
+
+    def to_dataframe(self, values: np.ndarray) -> pd.DataFrame:
+        """
+        Convert a (period × ticker) array into a DataFrame.
+
+        Args:
+            values (np.ndarray): The values for each period and ticker.
+
+        Returns:
+            pd.DataFrame: The values with the periods as the index and the tickers as the columns.
+        """
+        return pd.DataFrame(values, index=self.periods, columns=self.columns)
+
+    @cached_property
+    def _missing(self) -> np.ndarray:
+        """The padding and the missing returns, which are skipped for the moments."""
+        return np.isnan(self.values)
+
+    @cached_property
+    def _count(self) -> np.ndarray:
+        """The number of non-missing returns for each period and ticker."""
+        return (~self._missing).sum(axis=2).astype(float)
+
+    @cached_property
+    def _deviations(self) -> np.ndarray:
+        """The deviations from the mean with the missing returns set to zero."""
+        deviations = self.values - self.mean[:, :, np.newaxis]
+        deviations[self._missing] = 0
+
+        return deviations
+
+    @cached_property
+    def _sorted_values(self) -> np.ndarray:
+        """The returns sorted within each period and ticker with the padding placed last."""
+        return np.sort(np.where(self.observations, self.values, np.inf), axis=2)
+
+    @cached_property
+    def _cumulative_returns(self) -> np.ndarray:
+        """The cumulative returns with the missing returns skipped, equal to pd.DataFrame.cumprod."""
+        cumulative_returns = np.cumprod(
+            np.where(self._missing, 1, 1 + self.values), axis=2
+        )
+        cumulative_returns[self._missing] = np.nan
+
+        return cumulative_returns
+
+    @cached_property
+    def mean(self) -> np.ndarray:
+        """The mean for each period and ticker, equal to pd.DataFrame.mean."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self._missing, 0, self.values).sum(axis=2) / self._count
+
+    @cached_property
+    def std(self) -> np.ndarray:
+        """The population standard deviation, equal to pd.DataFrame.std(ddof=0)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.sqrt((self._deviations**2).sum(axis=2) / self._count)
+
+    @cached_property
+    def skewness(self) -> np.ndarray:
+        """The bias corrected skewness, equal to pd.DataFrame.skew."""
+        count = self._count
+        m2 = (self._deviations**2).sum(axis=2)
+        m3 = (self._deviations**3).sum(axis=2)
+
+        # Follows Pandas in treating floating point errors as zero
+        m2[np.abs(m2) < 1e-14] = 0  # noqa: PLR2004
+        m3[np.abs(m3) < 1e-14] = 0  # noqa: PLR2004
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2**1.5)
+
+        skewness[m2 == 0] = 0
+        skewness[count < 3] = np.nan  # noqa: PLR2004
+
+        return skewness
+
+    def get_kurtosis(self, fisher: bool = True) -> np.ndarray:
+        """
+        Get the kurtosis for each period and ticker.
+
+        Args:
+            fisher (bool, optional): Whether to return the bias corrected excess kurtosis,
+                equal to pd.DataFrame.kurtosis, or the population kurtosis. Defaults to True.
+
+        Returns:
+            np.ndarray: The kurtosis for each period and ticker.
+        """
+        count = self._count
+        m2 = (self._deviations**2).sum(axis=2)
+        m4 = (self._deviations**4).sum(axis=2)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if not fisher:
+                return (m4 / count) / (m2 / count) ** 2
+
+            adjustment = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+            numerator = count * (count + 1) * (count - 1) * m4
+            denominator = (count - 2) * (count - 3) * m2**2
+
+            # Follows Pandas in treating floating point errors as zero
+            numerator[np.abs(numerator) < 1e-14] = 0  # noqa: PLR2004
+            denominator[np.abs(denominator) < 1e-14] = 0  # noqa: PLR2004
+
+            kurtosis = numerator / denominator - adjustment
+
+        kurtosis[denominator == 0] = 0
+        kurtosis[count < 4] = np.nan  # noqa: PLR2004
+
+        return kurtosis
+
+    def get_percentile(self, alpha: float) -> np.ndarray:
+        """
+        Get the percentile for each period and ticker with linear interpolation, equal to
+        np.percentile. Periods and tickers with missing returns result in NaN.
+
+        Args:
+            alpha (float): The percentile as a fraction (e.g. 0.05 for the 5th percentile).
+
+        Returns:
+            np.ndarray: The percentile for each period and ticker.
+        """
+        # Follows np.percentile in converting the percentage back to a fraction
+        virtual_index = (self.counts - 1) * np.true_divide(alpha * 100, 100)
+        lower_index = np.clip(np.floor(virtual_index), 0, self.counts - 1)
+        upper_index = np.minimum(lower_index + 1, self.counts - 1)
+        gamma = (virtual_index - lower_index)[:, np.newaxis]
+
+        lower = np.take_along_axis(
+            self._sorted_values,
+            lower_index.astype(int)[:, np.newaxis, np.newaxis],
+            axis=2,
+        )[:, :, 0]
+        upper = np.take_along_axis(
+            self._sorted_values,
+            upper_index.astype(int)[:, np.newaxis, np.newaxis],
+            axis=2,
+        )[:, :, 0]
+
+        difference = upper - lower
+        percentile = np.where(
+            gamma >= 0.5,  # noqa: PLR2004
+            upper - difference * (1 - gamma),
+            lower + difference * gamma,
+        )
+        percentile[(self._missing & self.observations).any(axis=2)] = np.nan
+
+        return percentile
+
+    def get_tail_mean(self, threshold: np.ndarray) -> np.ndarray:
+        """
+        Get the mean of the returns at or below a threshold for each period and ticker.
+
+        Args:
+            threshold (np.ndarray): The threshold for each period and ticker.
+
+        Returns:
+            np.ndarray: The mean of the returns at or below the threshold.
+        """
+        in_tail = self.values <= threshold[:, :, np.newaxis]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(in_tail, self.values, 0).sum(axis=2) / in_tail.sum(axis=2)
+
+    def get_max_drawdown(self) -> np.ndarray:
+        """
+        Get the maximum drawdown for each period and ticker.
+
+        Returns:
+            np.ndarray: The maximum drawdown for each period and ticker.
+        """
+        cumulative_returns = self._cumulative_returns
+
+        # The running maximum skips the missing returns, equal to pd.DataFrame.cummax
+        drawdowns = (
+            cumulative_returns / np.fmax.accumulate(cumulative_returns, axis=2) - 1
+        )
+        drawdown = np.where(np.isnan(drawdowns), np.inf, drawdowns).min(axis=2)
+        drawdown[self._count == 0] = np.nan
+
+        return drawdown
+
+    def get_ulcer_index(self, rolling: int = 14) -> np.ndarray:
+        """
+        Get the Ulcer Index for each period and ticker.
+
+        Args:
+            rolling (int, optional): The rolling period to determine the highest cumulative
+                return. Defaults to 14.
+
+        Returns:
+            np.ndarray: The Ulcer Index for each period and ticker.
+        """
+        if self.values.shape[2] < rolling:
+            return np.full(self.values.shape[:2], np.nan)
+
+        cumulative_returns = self._cumulative_returns
+
+        # Windows that include a missing return have no maximum, equal to the rolling
+        # maximum of Pandas that requires the full window to be available
+        cumulative_max = np.lib.stride_tricks.sliding_window_view(
+            cumulative_returns, rolling, axis=2
+        ).max(axis=3)
+        drawdowns = (
+            cumulative_returns[:, :, rolling - 1 :] - cumulative_max
+        ) / cumulative_max
+
+        available = ~np.isnan(drawdowns)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.sqrt(
+                np.where(available, drawdowns**2, 0).sum(axis=2) / available.sum(axis=2)
+            )
+
+    def get_student_t_parameters(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Fit the Student-t distribution for each period and ticker. The maximum likelihood
+        estimation has no closed form and is therefore still done for each period and ticker
+        separately, however without slicing the returns per period.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The degrees of freedom and the scale for each
+                period and ticker.
+        """
+        degrees_of_freedom = np.full(self.values.shape[:2], np.nan)
+        scale = np.full(self.values.shape[:2], np.nan)
+
+        for period, count in enumerate(self.counts):
+            for column in range(len(self.columns)):
+                degrees_of_freedom[period, column], _, scale[period, column] = (
+                    stats.t.fit(self.values[period, column, :count])
+                )
+
+        return degrees_of_freedom, scale
@@ -701,6 +701,8 @@ class Risk:
         rounding: int | None = 4,
         growth: bool = False,
         lag: int | list[int] = 1,
+        p: int = 1,
+        q: int = 1,
     ):
         """
         Calculates volatility forecasts based on the GARCH model.
@@ -720,6 +722,8 @@ class Risk:
             rounding (int | None, optional): The number of decimals to round the results to. Defaults to 4.
             growth (bool, optional): Whether to calculate the growth of the GARCH values over time. Defaults to False.
             lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            p (int, optional): The number of lagged squared returns, the p in GARCH(p, q). Defaults to 1.
+            q (int, optional): The number of lagged sigma_2 values, the q in GARCH(p, q). Defaults to 1.
 
         Returns:
             pd.DataFrame | pd.Series: GARCH values
@@ -778,6 +782,8 @@ class Risk:
             weights=None,
             time_steps=time_steps,
             optimization_t=optimization_t,
+            p=p,
+            q=q,
         )
 
         if growth:
@@ -800,6 +806,8 @@ class Risk:
         rounding: int | None = None,
         growth: bool = False,
         lag: int | list[int] = 1,
+        p: int = 1,
+        q: int = 1,
     ):
         """
         Calculates sigma_2 forecasts.
@@ -810,7 +818,7 @@ class Risk:
 
         The forecasting with GARCH is done with the following formula:
 
-        - sigma_l ** 2 + (sigma_t ** 2 - sigma_l ** 2) * (alpha + beta) ** (t - 1)
+        - sigma_l ** 2 + (sigma_t ** 2 - sigma_l ** 2) * (SUM(alpha) + SUM(beta)) ** (t - 1)
 
         For more information about the method, see the following book:
 
@@ -827,6 +835,8 @@ class Risk:
             growth (bool, optional): Whether to calculate the growth of the GARCH values over time. Defaults to
             False.
             lag (int | list[int], optional): The lag to use for the growth calculation. Defaults to 1.
+            p (int, optional): The number of lagged squared returns, the p in GARCH(p, q). Defaults to 1.
+            q (int, optional): The number of lagged sigma_2 values, the q in GARCH(p, q). Defaults to 1.
 
         Returns:
             pd.DataFrame | pd.Series: sigma_2 forecast values
@@ -882,7 +892,7 @@ class Risk:
         )
 
         sigma_2_forecast = garch_model.get_garch_forecast(
-            returns, None, time_steps
+            returns, None, time_steps, p=p, q=q
         ).dropna()
 
         period_symbol = (
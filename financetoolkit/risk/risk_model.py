@@ -3,6 +3,8 @@
 import numpy as np
 import pandas as pd
 
+from financetoolkit.risk import helpers
+
 ALPHA_CONSTRAINT = 0.5
 
 # This is meant for calculations in which a Multi Index exists. This is the case
@@ -28,19 +30,9 @@ def get_max_drawdown(
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
-
-        for sub_period in periods:
-            period_data = get_max_drawdown(returns.loc[sub_period])
-            period_data.name = sub_period
-
-            if not period_data.empty:
-                period_data_list.append(period_data)
-
-        max_drawdown = pd.concat(period_data_list, axis=1)
+        period_blocks = helpers.PeriodBlocks(returns)
 
-        return max_drawdown.T
+        return period_blocks.to_dataframe(period_blocks.get_max_drawdown())
 
     cum_returns = (1 + returns).cumprod()  # type: ignore
 
@@ -70,19 +62,9 @@ def get_ui(
     """
     if isinstance(returns, pd.DataFrame):
         if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            periods = returns.index.get_level_values(0).unique()
-            period_data_list = []
-
-            for sub_period in periods:
-                period_data = returns.loc[sub_period].aggregate(get_ui)
-                period_data.name = sub_period
-
-                if not period_data.empty:
-                    period_data_list.append(period_data)
-
-            ulcer_index = pd.concat(period_data_list, axis=1)
+            period_blocks = helpers.PeriodBlocks(returns)
 
-            return ulcer_index.T
+            return period_blocks.to_dataframe(period_blocks.get_ulcer_index())
 
         return returns.aggregate(get_ui)
 
@@ -110,19 +92,9 @@ def get_skewness(returns: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
     """
     if isinstance(returns, pd.DataFrame):
         if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            periods = returns.index.get_level_values(0).unique()
-            period_data_list = []
+            period_blocks = helpers.PeriodBlocks(returns)
 
-            for sub_period in periods:
-                period_data = returns.loc[sub_period].aggregate(get_skewness)
-                period_data.name = sub_period
-
-                if not period_data.empty:
-                    period_data_list.append(period_data)
-
-            skewness = pd.concat(period_data_list, axis=1)
-
-            return skewness.T
+            return period_blocks.to_dataframe(period_blocks.skewness)
         return returns.aggregate(get_skewness)
     if isinstance(returns, pd.Series):
         return returns.skew()
@@ -144,21 +116,9 @@ def get_kurtosis(
     """
     if isinstance(returns, pd.DataFrame):
         if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            periods = returns.index.get_level_values(0).unique()
-            period_data_list = []
-
-            for sub_period in periods:
-                period_data = returns.loc[sub_period].aggregate(
-                    get_kurtosis, fisher=fisher
-                )
-                period_data.name = sub_period
-
-                if not period_data.empty:
-                    period_data_list.append(period_data)
-
-            kurtosis = pd.concat(period_data_list, axis=1)
+            period_blocks = helpers.PeriodBlocks(returns)
 
-            return kurtosis.T
+            return period_blocks.to_dataframe(period_blocks.get_kurtosis(fisher))
         return returns.aggregate(get_kurtosis, fisher=fisher)
     if isinstance(returns, pd.Series):
         if fisher:
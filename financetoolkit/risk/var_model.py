@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 from scipy import stats
 
-from financetoolkit.risk import risk_model
+from financetoolkit.risk import helpers, risk_model
 
 ALPHA_CONSTRAINT = 0.5
 
@@ -30,21 +30,9 @@ def get_var_historic(
     """
     if isinstance(returns, pd.DataFrame):
         if returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS:
-            periods = returns.index.get_level_values(0).unique()
-            period_data_list = []
+            period_blocks = helpers.PeriodBlocks(returns)
 
-            for sub_period in periods:
-                period_data = returns.loc[sub_period].aggregate(
-                    get_var_historic, alpha=alpha
-                )
-                period_data.name = sub_period
-
-                if not period_data.empty:
-                    period_data_list.append(period_data)
-
-            value_at_risk = pd.concat(period_data_list, axis=1)
-
-            return value_at_risk.T
+            return period_blocks.to_dataframe(period_blocks.get_percentile(alpha))
 
         return returns.aggregate(get_var_historic, alpha=alpha)
     if isinstance(returns, pd.Series):
@@ -83,37 +71,47 @@ def get_var_gaussian(
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
+        period_blocks = helpers.PeriodBlocks(returns)
+        za = stats.norm.ppf(alpha, 0, 1)
 
-        for sub_period in periods:
-            period_data = get_var_gaussian(
-                returns.loc[sub_period], alpha, cornish_fisher
+        if cornish_fisher:
+            za = get_cornish_fisher_quantile(
+                za, period_blocks.skewness, period_blocks.get_kurtosis()
             )
-            period_data.name = sub_period
-
-            if not period_data.empty:
-                period_data_list.append(period_data)
-
-        value_at_risk = pd.concat(period_data_list, axis=1)
 
-        return value_at_risk.T
+        return period_blocks.to_dataframe(period_blocks.mean + za * period_blocks.std)
 
     za = stats.norm.ppf(alpha, 0, 1)
 
     if cornish_fisher:
-        S = risk_model.get_skewness(returns)
-        K = risk_model.get_kurtosis(returns)
-        za = (
-            za
-            + (za**2 - 1) * S / 6
-            + (za**3 - 3 * za) * (K - 3) / 24
-            - (2 * za**3 - 5 * za) * (S**2) / 36
+        za = get_cornish_fisher_quantile(
+            za, risk_model.get_skewness(returns), risk_model.get_kurtosis(returns)
         )
 
     return returns.mean() + za * returns.std(ddof=0)
 
 
+def get_cornish_fisher_quantile(za: float, skewness, kurtosis):
+    """
+    Adjust the quantile of the standard normal distribution for the skewness and
+    kurtosis of the returns based on the Cornish-Fisher expansion.
+
+    Args:
+        za (float): The quantile of the standard normal distribution.
+        skewness (pd.Series | np.ndarray): The skewness of the returns.
+        kurtosis (pd.Series | np.ndarray): The kurtosis of the returns.
+
+    Returns:
+        pd.Series | np.ndarray: The adjusted quantile.
+    """
+    return (
+        za
+        + (za**2 - 1) * skewness / 6
+        + (za**3 - 3 * za) * (kurtosis - 3) / 24
+        - (2 * za**3 - 5 * za) * (skewness**2) / 36
+    )
+
+
 def get_var_studentt(returns, alpha: float) -> pd.Series | pd.DataFrame:
     """
     Calculate the Value at Risk (VaR) of returns based on the Student-T distribution.
@@ -130,19 +128,13 @@ def get_var_studentt(returns, alpha: float) -> pd.Series | pd.DataFrame:
         isinstance(returns, pd.DataFrame)
         and returns.index.nlevels == MULTI_PERIOD_INDEX_LEVELS
     ):
-        periods = returns.index.get_level_values(0).unique()
-        period_data_list = []
+        period_blocks = helpers.PeriodBlocks(returns)
+        v, _ = period_blocks.get_student_t_parameters()
+        za = stats.t.ppf(alpha, v, 1)
 
-        for sub_period in periods:
-            period_data = get_var_studentt(returns.loc[sub_period], alpha)
-            period_data.name = sub_period
-
-            if not period_data.empty:
-                period_data_list.append(period_data)
-
-        value_at_risk = pd.concat(period_data_list, axis=1)
-
-        return value_at_risk.T
+        return period_blocks.to_dataframe(
+            np.sqrt((v - 2) / v) * za * period_blocks.std + period_blocks.mean
+        )
 
     # Fitting Student-T parameters to the data
     if isinstance(returns, pd.Series):
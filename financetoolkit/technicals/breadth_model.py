@@ -4,6 +4,9 @@ __docformat__ = "google"
 
 import pandas as pd
 
+from financetoolkit.technicals.helpers import cache_intermediate, get_price_difference
+from financetoolkit.technicals.overlap_model import get_exponential_moving_average
+
 
 def get_mcclellan_oscillator(
     prices_close: pd.Series, short_ema_window: int, long_ema_window: int
@@ -20,16 +23,13 @@ def get_mcclellan_oscillator(
         pd.Series: McClellan Oscillator values.
     """
     advancers_decliners = get_advancers_decliners(prices_close)
-    short_ema = advancers_decliners.ewm(
-        span=short_ema_window, min_periods=1, adjust=False
-    ).mean()
-    long_ema = advancers_decliners.ewm(
-        span=long_ema_window, min_periods=1, adjust=False
-    ).mean()
+    short_ema = get_exponential_moving_average(advancers_decliners, short_ema_window)
+    long_ema = get_exponential_moving_average(advancers_decliners, long_ema_window)
 
     return short_ema - long_ema
 
 
+@cache_intermediate
 def get_advancers_decliners(prices_close: pd.Series) -> pd.Series:
     """
     Calculate the difference between advancers and decliners for a given price series.
@@ -57,12 +57,13 @@ def get_on_balance_volume(prices_close: pd.Series, volumes: pd.Series) -> pd.Ser
     Returns:
         pd.Series: OBV values.
     """
-    price_diff = prices_close.diff(1)
+    price_diff = get_price_difference(prices_close)
     obv = (price_diff / abs(price_diff)) * volumes
 
     return obv.cumsum()
 
 
+@cache_intermediate
 def get_accumulation_distribution_line(
     prices_high: pd.Series,
     prices_low: pd.Series,
@@ -114,7 +115,7 @@ def get_chaikin_oscillator(
     adl = get_accumulation_distribution_line(
         prices_high, prices_low, prices_close, volumes
     )
-    short_ema = adl.ewm(span=short_window, min_periods=1, adjust=False).mean()
-    long_ema = adl.ewm(span=long_window, min_periods=1, adjust=False).mean()
+    short_ema = get_exponential_moving_average(adl, short_window)
+    long_ema = get_exponential_moving_average(adl, long_window)
 
     return short_ema - long_ema
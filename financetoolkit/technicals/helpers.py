@@ -3,13 +3,21 @@
 __docformat__ = "google"
 
 import inspect
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
 
+import numpy as np
 import pandas as pd
 
 from financetoolkit.utilities import logger_model
 
 logger = logger_model.get_logger()
 
+# The intermediate results shared by the indicators while share_intermediates is active
+_INTERMEDIATES: ContextVar[dict | None] = ContextVar("intermediates", default=None)
+
 
 def handle_errors(func):
     """
@@ -69,3 +77,272 @@ def handle_errors(func):
     wrapper.__module__ = func.__module__
 
     return wrapper
+
+
+@contextmanager
+def share_intermediates() -> Iterator[None]:
+    """
+    Context manager that lets indicators share intermediate results such as the true range,
+    exponential moving averages, rolling highs and lows and the typical price. Within the
+    context each function decorated with `cache_intermediate` is calculated only once for
+    the same input. This is used when collecting many indicators at once. Nested contexts
+    share the intermediate results of the outermost context.
+
+    Yields:
+        None: The intermediate results are discarded when the context is left.
+    """
+    if _INTERMEDIATES.get() is not None:
+        yield
+        return
+
+    token = _INTERMEDIATES.set({})
+
+    try:
+        yield
+    finally:
+        _INTERMEDIATES.reset(token)
+
+
+def _get_argument_key(argument):
+    """Return a hashable key for an argument, data is identified by the object itself."""
+    if isinstance(argument, (pd.Series, pd.DataFrame, np.ndarray)):
+        return ("object", id(argument))
+
+    return argument
+
+
+def cache_intermediate(func):
+    """
+    Decorator that reuses the result of a function while `share_intermediates` is active.
+    Data arguments are matched by identity which means that the returned result is shared
+    and should not be modified in place. Outside of the context the function is simply called.
+
+    Args:
+        func (function): The function to be decorated.
+
+    Returns:
+        function: The decorated function.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        intermediates = _INTERMEDIATES.get()
+
+        if intermediates is None:
+            return func(*args, **kwargs)
+
+        key = (
+            func.__module__,
+            func.__qualname__,
+            tuple(_get_argument_key(argument) for argument in args),
+            tuple(
+                (name, _get_argument_key(argument))
+                for name, argument in sorted(kwargs.items())
+            ),
+        )
+
+        if key not in intermediates:
+            # The arguments are kept so that their identities can not be reused
+            intermediates[key] = (func(*args, **kwargs), args, kwargs)
+
+        return intermediates[key][0]
+
+    return wrapper
+
+
+@cache_intermediate
+def select_column(historical_data: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Select a column (e.g. "High" or "Adj Close") from the historical data. While
+    `share_intermediates` is active, the same object is returned every time which
+    allows the intermediate results based on it to be shared.
+
+    Args:
+        historical_data (pd.DataFrame): The historical data with columns (column x ticker).
+        column (str): The column to select.
+
+    Returns:
+        pd.DataFrame: The selected column for each ticker.
+    """
+    return historical_data[column]
+
+
+@cache_intermediate
+def get_price_difference(prices: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the difference between the current and the previous price.
+
+    Args:
+        prices (pd.Series | pd.DataFrame): Series or DataFrame of prices.
+
+    Returns:
+        pd.Series | pd.DataFrame: Price differences.
+    """
+    return prices.diff(1)
+
+
+@cache_intermediate
+def get_typical_price(
+    prices_high: pd.Series | pd.DataFrame,
+    prices_low: pd.Series | pd.DataFrame,
+    prices_close: pd.Series | pd.DataFrame,
+) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the typical price, the average of the high, low and closing price.
+
+    Args:
+        prices_high (pd.Series | pd.DataFrame): Series or DataFrame of high prices.
+        prices_low (pd.Series | pd.DataFrame): Series or DataFrame of low prices.
+        prices_close (pd.Series | pd.DataFrame): Series or DataFrame of closing prices.
+
+    Returns:
+        pd.Series | pd.DataFrame: Typical prices.
+    """
+    return (prices_high + prices_low + prices_close) / 3
+
+
+@cache_intermediate
+def get_rolling_max(
+    prices: pd.Series | pd.DataFrame, window: int
+) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the highest price within a rolling window.
+
+    Args:
+        prices (pd.Series | pd.DataFrame): Series or DataFrame of prices.
+        window (int): Number of periods in the rolling window.
+
+    Returns:
+        pd.Series | pd.DataFrame: The highest price within each window.
+    """
+    return prices.rolling(window=window).max()
+
+
+@cache_intermediate
+def get_rolling_min(
+    prices: pd.Series | pd.DataFrame, window: int
+) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the lowest price within a rolling window.
+
+    Args:
+        prices (pd.Series | pd.DataFrame): Series or DataFrame of prices.
+        window (int): Number of periods in the rolling window.
+
+    Returns:
+        pd.Series | pd.DataFrame: The lowest price within each window.
+    """
+    return prices.rolling(window=window).min()
+
+
+def _get_rolling_extreme_position(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Determine, for every row and column of a 2-D array, the position of the first
+    maximum within the trailing window.
+
+    The array is cut into blocks of the window size after which the running maximum
+    is determined from the left and from the right of each block (van Herk / Gil-Werman).
+    Each window then spans the tail of one block and the head of the next so that it is
+    answered by comparing two precomputed values. This is what a monotonic deque does
+    for a single column but here it is evaluated for all columns at once, in O(1) per
+    element and without a Python loop over the rows.
+
+    Args:
+        values (np.ndarray): The (time x ticker) values, NaN is allowed.
+        window (int): The size of the trailing window.
+
+    Returns:
+        np.ndarray: The position (0 to window - 1) of the maximum within each window, NaN
+            when the window is incomplete or contains a NaN value.
+    """
+    length, columns = values.shape
+    positions = np.full((length, columns), np.nan)
+
+    if window < 1 or length < window:
+        return positions
+
+    missing_values = np.isnan(values)
+    values = np.where(missing_values, -np.inf, values)
+
+    blocks = -(-length // window)
+    padded_values = np.full((blocks * window, columns), -np.inf)
+    padded_values[:length] = values
+    padded_values = padded_values.reshape(blocks, window, columns)
+    index = np.arange(blocks * window).reshape(blocks, window, 1)
+
+    # Running maximum from the left of each block, ties keep the earliest position
+    prefix_maximum = np.maximum.accumulate(padded_values, axis=1)
+    prefix_new = np.ones(padded_values.shape, dtype=bool)
+    prefix_new[:, 1:] = padded_values[:, 1:] > prefix_maximum[:, :-1]
+    prefix_position = np.maximum.accumulate(np.where(prefix_new, index, 0), axis=1)
+
+    # Running maximum from the right of each block, ties keep the earliest position
+    suffix_maximum = np.maximum.accumulate(padded_values[:, ::-1], axis=1)[:, ::-1]
+    suffix_new = np.ones(padded_values.shape, dtype=bool)
+    suffix_new[:, :-1] = padded_values[:, :-1] >= suffix_maximum[:, 1:]
+    suffix_position = np.minimum.accumulate(
+        np.where(suffix_new, index, blocks * window)[:, ::-1], axis=1
+    )[:, ::-1]
+
+    prefix_maximum = prefix_maximum.reshape(-1, columns)[window - 1 : length]
+    prefix_position = prefix_position.reshape(-1, columns)[window - 1 : length]
+    suffix_maximum = suffix_maximum.reshape(-1, columns)[: length - window + 1]
+    suffix_position = suffix_position.reshape(-1, columns)[: length - window + 1]
+
+    window_start = np.arange(length - window + 1).reshape(-1, 1)
+    position = np.where(
+        suffix_maximum >= prefix_maximum, suffix_position, prefix_position
+    )
+
+    missing_count = np.cumsum(missing_values, axis=0)
+    missing_count = missing_count[window - 1 :] - np.concatenate(
+        [np.zeros((1, columns)), missing_count[: length - window]]
+    )
+
+    positions[window - 1 :] = np.where(
+        missing_count > 0, np.nan, position - window_start
+    )
+
+    return positions
+
+
+def get_rolling_argmax(
+    prices: pd.Series | pd.DataFrame, window: int
+) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the position of the (first) highest value within a rolling window. This
+    equals `prices.rolling(window).apply(lambda x: x.argmax(), raw=True)` but is calculated
+    for all columns at once.
+
+    Args:
+        prices (pd.Series | pd.DataFrame): Series or DataFrame (time x ticker) of prices.
+        window (int): Number of periods in the rolling window.
+
+    Returns:
+        pd.Series | pd.DataFrame: The position of the highest value within each window.
+    """
+    values = prices.to_numpy(dtype=float).reshape(len(prices), -1)
+    positions = _get_rolling_extreme_position(values, window)
+
+    if isinstance(prices, pd.Series):
+        return pd.Series(positions[:, 0], index=prices.index, name=prices.name)
+
+    return pd.DataFrame(positions, index=prices.index, columns=prices.columns)
+
+
+def get_rolling_argmin(
+    prices: pd.Series | pd.DataFrame, window: int
+) -> pd.Series | pd.DataFrame:
+    """
+    Calculate the position of the (first) lowest value within a rolling window. This
+    equals `prices.rolling(window).apply(lambda x: x.argmin(), raw=True)` but is calculated
+    for all columns at once.
+
+    Args:
+        prices (pd.Series | pd.DataFrame): Series or DataFrame (time x ticker) of prices.
+        window (int): Number of periods in the rolling window.
+
+    Returns:
+        pd.Series | pd.DataFrame: The position of the lowest value within each window.
+    """
+    return get_rolling_argmax(-prices, window)
@@ -2,12 +2,22 @@
 
 __docformat__ = "google"
 
+import numpy as np
 import pandas as pd
 
+from financetoolkit.technicals.helpers import (
+    get_price_difference,
+    get_rolling_argmax,
+    get_rolling_argmin,
+    get_rolling_max,
+    get_rolling_min,
+    get_typical_price,
+)
 from financetoolkit.technicals.overlap_model import (
     get_exponential_moving_average,
     get_moving_average,
 )
+from financetoolkit.technicals.volatility_model import get_true_range
 
 
 def get_money_flow_index(
@@ -30,7 +40,7 @@ def get_money_flow_index(
     Returns:
         pd.Series: MFI values.
     """
-    typical_prices = (prices_high + prices_low + prices_close) / 3
+    typical_prices = get_typical_price(prices_high, prices_low, prices_close)
     raw_money_flow = typical_prices * volumes
 
     positive_money_flow = (
@@ -65,8 +75,8 @@ def get_williams_percent_r(
     Returns:
         pd.Series: Williams %R values.
     """
-    highest_high = prices_high.rolling(window=window).max()
-    lowest_low = prices_low.rolling(window=window).min()
+    highest_high = get_rolling_max(prices_high, window)
+    lowest_low = get_rolling_min(prices_low, window)
 
     percent_r = -((highest_high - prices_close) / (highest_high - lowest_low)) * 100
     return percent_r
@@ -86,22 +96,8 @@ def get_aroon_indicator(
     Returns:
         pd.DataFrame: Aroon Up and Aroon Down values.
     """
-    aroon_up = (
-        (
-            window
-            - prices_high.rolling(window=window).apply(lambda x: x.argmax(), raw=True)
-        )
-        / window
-        * 100
-    )
-    aroon_down = (
-        (
-            window
-            - prices_low.rolling(window=window).apply(lambda x: x.argmin(), raw=True)
-        )
-        / window
-        * 100
-    )
+    aroon_up = (window - get_rolling_argmax(prices_high, window)) / window * 100
+    aroon_down = (window - get_rolling_argmin(prices_low, window)) / window * 100
 
     return pd.concat([aroon_up, aroon_down], keys=["Aroon Up", "Aroon Down"], axis=1)
 
@@ -126,7 +122,7 @@ def get_commodity_channel_index(
     Returns:
         pd.Series: CCI values.
     """
-    typical_prices = (prices_high + prices_low + prices_close) / 3
+    typical_prices = get_typical_price(prices_high, prices_low, prices_close)
     sma_typical_prices = typical_prices.rolling(window=window).mean()
 
     mean_deviation = (
@@ -182,7 +178,7 @@ def get_force_index(
     Returns:
         pd.Series: Force Index values.
     """
-    return prices_close.diff(1) * volumes.rolling(window=window).sum()
+    return get_price_difference(prices_close) * volumes.rolling(window=window).sum()
 
 
 def get_ultimate_oscillator(
@@ -207,22 +203,13 @@ def get_ultimate_oscillator(
     Returns:
         pd.Series: Ultimate Oscillator values.
     """
-    true_range = pd.concat(
-        [
-            prices_high - prices_low,
-            abs(prices_high - prices_close.shift(1)),
-            abs(prices_low - prices_close.shift(1)),
-        ],
-        axis=1,
-    ).max(axis=1)
+    true_range = get_true_range(prices_high, prices_low, prices_close)
 
     avg_true_range_1 = true_range.rolling(window=window_1).mean()
     avg_true_range_2 = true_range.rolling(window=window_2).mean()
     avg_true_range_3 = true_range.rolling(window=window_3).mean()
 
-    buying_pressure = prices_close - pd.concat(
-        [prices_low.shift(1), prices_close.shift(1)], axis=1
-    ).min(axis=1)
+    buying_pressure = prices_close - np.fmin(prices_low.shift(1), prices_close.shift(1))
 
     avg_buying_pressure_1 = buying_pressure.rolling(window=window_1).sum()
     avg_buying_pressure_2 = buying_pressure.rolling(window=window_2).sum()
@@ -304,25 +291,15 @@ def get_average_directional_index(
     Returns:
         pd.Series: ADX values.
     """
-    high_low = prices_high - prices_low
-    high_close_prev = abs(prices_high - prices_close.shift(1))
-    low_close_prev = abs(prices_low - prices_close.shift(1))
-
-    tr = pd.DataFrame(
-        {
-            "high_low": high_low,
-            "high_close_prev": high_close_prev,
-            "low_close_prev": low_close_prev,
-        },
-        index=prices_high.index,
-    )
+    true_range = get_true_range(prices_high, prices_low, prices_close)
 
-    tr["true_range"] = tr[["high_low", "high_close_prev", "low_close_prev"]].max(axis=1)
+    high_diff = prices_high.diff()
+    low_diff = prices_low.diff()
 
-    plus_dm = prices_high.diff().apply(lambda x: x if x > 0 else 0)
-    minus_dm = -prices_low.diff().apply(lambda x: x if x < 0 else 0)
+    plus_dm = high_diff.where(high_diff > 0, 0)
+    minus_dm = -low_diff.where(low_diff < 0, 0)
 
-    atr = tr["true_range"].rolling(window=window).mean()
+    atr = true_range.rolling(window=window).mean()
     plus_di = 100 * (plus_dm.rolling(window=window).mean() / atr)
     minus_di = 100 * (minus_dm.rolling(window=window).mean() / atr)
 
@@ -344,7 +321,7 @@ def get_chande_momentum_oscillator(prices_close: pd.Series, window: int) -> pd.S
     Returns:
         pd.Series: CMO values.
     """
-    price_diff = prices_close.diff(1)
+    price_diff = get_price_difference(prices_close)
 
     up_sum = price_diff.where(price_diff > 0, 0).rolling(window=window).sum()
     down_sum = abs(price_diff.where(price_diff < 0, 0)).rolling(window=window).sum()
@@ -375,18 +352,18 @@ def get_ichimoku_cloud(
         pd.DataFrame: Ichimoku Cloud components (Conversion Line, Base Line, Lead Span A, Lead Span B).
     """
     conversion_line = (
-        prices_high.rolling(window=conversion_window).max()
-        + prices_low.rolling(window=conversion_window).min()
+        get_rolling_max(prices_high, conversion_window)
+        + get_rolling_min(prices_low, conversion_window)
     ) / 2
     base_line = (
-        prices_high.rolling(window=base_window).max()
-        + prices_low.rolling(window=base_window).min()
+        get_rolling_max(prices_high, base_window)
+        + get_rolling_min(prices_low, base_window)
     ) / 2
     lead_span_a = ((conversion_line + base_line) / 2).shift(conversion_window)
     lead_span_b = (
         (
-            prices_high.rolling(window=lead_span_b_window).max()
-            + prices_low.rolling(window=lead_span_b_window).min()
+            get_rolling_max(prices_high, lead_span_b_window)
+            + get_rolling_min(prices_low, lead_span_b_window)
         )
         / 2
     ).shift(conversion_window)
@@ -418,8 +395,8 @@ def get_stochastic_oscillator(
     Returns:
         pd.DataFrame: Stochastic Oscillator (%K and %D).
     """
-    lowest_low = prices_low.rolling(window=window).min()
-    highest_high = prices_high.rolling(window=window).max()
+    lowest_low = get_rolling_min(prices_low, window)
+    highest_high = get_rolling_max(prices_high, window)
 
     stochastic_k = ((prices_close - lowest_low) / (highest_high - lowest_low)) * 100
     stochastic_d = stochastic_k.rolling(window=smooth_window).mean()
@@ -444,11 +421,11 @@ def get_moving_average_convergence_divergence(
     Returns:
         pd.Series: MACD values.
     """
-    short_ema = prices.ewm(span=short_window, min_periods=1, adjust=False).mean()
-    long_ema = prices.ewm(span=long_window, min_periods=1, adjust=False).mean()
+    short_ema = get_exponential_moving_average(prices, short_window)
+    long_ema = get_exponential_moving_average(prices, long_window)
 
     macd_line = short_ema - long_ema
-    signal_line = macd_line.ewm(span=signal_window, min_periods=1, adjust=False).mean()
+    signal_line = get_exponential_moving_average(macd_line, signal_window)
 
     return pd.concat(
         [macd_line, signal_line], keys=["MACD Line", "Signal Line"], axis=1
@@ -467,7 +444,7 @@ def get_relative_strength_index(prices: pd.Series, window: int) -> pd.Series:
         pd.Series: RSI values.
     """
     # Calculate price changes
-    price_diff = prices.diff(1)
+    price_diff = get_price_difference(prices)
 
     # Calculate upward and downward price changes
     up_changes = price_diff.where(price_diff > 0, 0)
@@ -6,7 +6,10 @@ import numpy as np
 import pandas as pd
 from scipy.signal import argrelextrema
 
+from financetoolkit.technicals.helpers import cache_intermediate
 
+
+@cache_intermediate
 def get_moving_average(prices: pd.Series, window: int) -> pd.Series:
     """
     Calculate the Moving Average (MA) of a given price series.
@@ -21,6 +24,7 @@ def get_moving_average(prices: pd.Series, window: int) -> pd.Series:
     return prices.rolling(window=window).mean()
 
 
+@cache_intermediate
 def get_exponential_moving_average(prices: pd.Series, window: int) -> pd.Series:
     """
     Calculate the Exponential Moving Average (EMA) of a given price series.
@@ -46,8 +50,8 @@ def get_double_exponential_moving_average(prices: pd.Series, window: int) -> pd.
     Returns:
         pd.Series: DEMA values.
     """
-    ema_first = prices.ewm(span=window, min_periods=1, adjust=False).mean()
-    ema_second = ema_first.ewm(span=window, min_periods=1, adjust=False).mean()
+    ema_first = get_exponential_moving_average(prices, window)
+    ema_second = get_exponential_moving_average(ema_first, window)
     dema = 2 * ema_first - ema_second
 
     return dema
@@ -0,0 +1,883 @@
+"""Streaming Module"""
+
+__docformat__ = "google"
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes,too-many-arguments
+
+NAN = float("nan")
+
+
+def _to_float(value) -> float:
+    """Convert a value to a float, infinite values are treated as missing like pandas does."""
+    value = float(value)
+
+    return NAN if math.isinf(value) else value
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """Divide two floats following IEEE 754 (and thus pandas) when dividing by zero."""
+    try:
+        return numerator / denominator
+    except ZeroDivisionError:
+        if math.isnan(numerator) or numerator == 0:
+            return NAN
+
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+
+
+def _fmax(value_1: float, value_2: float) -> float:
+    """Return the maximum of two floats while ignoring missing values like np.fmax."""
+    if math.isnan(value_1):
+        return value_2
+    if math.isnan(value_2):
+        return value_1
+
+    return max(value_1, value_2)
+
+
+class _RollingSum:
+    """
+    Rolling sum that is updated one value at a time. It follows the Kahan summation
+    and the bookkeeping of pandas' rolling sum so that the results are identical.
+    """
+
+    def __init__(self, window: int, min_periods: int | None = None):
+        self._window = window
+        self._min_periods = window if min_periods is None else min_periods
+        self._values: deque[float] = deque()
+        self._sum = 0.0
+        self._observations = 0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._consecutive_values = 0
+        self._previous_value: float | None = None
+
+    def _add(self, value: float):
+        if not math.isnan(value):
+            self._observations += 1
+            y = value - self._compensation_add
+            t = self._sum + y
+            self._compensation_add = t - self._sum - y
+            self._sum = t
+
+            if value == self._previous_value:
+                self._consecutive_values += 1
+            else:
+                self._consecutive_values = 1
+
+            self._previous_value = value
+
+    def _remove(self, value: float):
+        if not math.isnan(value):
+            self._observations -= 1
+            y = -value - self._compensation_remove
+            t = self._sum + y
+            self._compensation_remove = t - self._sum - y
+            self._sum = t
+
+    def _reset(self, value: float):
+        self._sum = 0.0
+        self._observations = 0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._consecutive_values = 0
+        self._previous_value = value
+
+    def _push(self, value: float):
+        value = _to_float(value)
+
+        if self._previous_value is None or self._window == 1:
+            # This is where pandas starts a new window from scratch
+            self._reset(value)
+            self._values.clear()
+        elif len(self._values) == self._window:
+            self._remove(self._values.popleft())
+
+        self._values.append(value)
+        self._add(value)
+
+    def update(self, value: float) -> float:
+        """Add a value and return the sum over the window."""
+        self._push(value)
+
+        if self._observations == 0 == self._min_periods:
+            return 0.0
+        if self._observations >= self._min_periods:
+            if self._consecutive_values >= self._observations:
+                return self._previous_value * self._observations
+
+            return self._sum
+
+        return NAN
+
+
+class _RollingMean(_RollingSum):
+    """
+    Rolling mean that is updated one value at a time and that is identical to
+    pandas' rolling mean.
+    """
+
+    def __init__(self, window: int, min_periods: int | None = None):
+        super().__init__(window, min_periods)
+        self._negative_count = 0
+
+    def _add(self, value: float):
+        super()._add(value)
+
+        if not math.isnan(value) and math.copysign(1.0, value) < 0:
+            self._negative_count += 1
+
+    def _remove(self, value: float):
+        super()._remove(value)
+
+        if not math.isnan(value) and math.copysign(1.0, value) < 0:
+            self._negative_count -= 1
+
+    def _reset(self, value: float):
+        super()._reset(value)
+        self._negative_count = 0
+
+    def update(self, value: float) -> float:
+        """Add a value and return the mean over the window."""
+        self._push(value)
+
+        if self._observations >= self._min_periods and self._observations > 0:
+            result = self._sum / self._observations
+
+            if self._consecutive_values >= self._observations:
+                return self._previous_value
+            if self._negative_count == 0 and result < 0:
+                return 0.0
+            if self._negative_count == self._observations and result > 0:
+                return 0.0
+
+            return result
+
+        return NAN
+
+
+class _RollingStandardDeviation:
+    """
+    Rolling (sample) standard deviation based on Welford's method with Kahan
+    summation which is identical to pandas' rolling standard deviation.
+    """
+
+    def __init__(self, window: int, min_periods: int | None = None, ddof: int = 1):
+        self._window = window
+        self._min_periods = window if min_periods is None else min_periods
+        self._ddof = ddof
+        self._values: deque[float] = deque()
+        self._observations = 0.0
+        self._mean = 0.0
+        self._squared_deviations = 0.0
+        self._compensation_add = 0.0
+        self._compensation_remove = 0.0
+        self._consecutive_values = 0
+        self._previous_value: float | None = None
+
+    def _add(self, value: float):
+        if math.isnan(value):
+            return
+
+        self._observations += 1
+
+        if value == self._previous_value:
+            self._consecutive_values += 1
+        else:
+            self._consecutive_values = 1
+
+        self._previous_value = value
+
+        previous_mean = self._mean - self._compensation_add
+        y = value - self._compensation_add
+        t = y - self._mean
+        self._compensation_add = t + self._mean - y
+        self._mean = self._mean + t / self._observations if self._observations else 0
+        self._squared_deviations = self._squared_deviations + (
+            value - previous_mean
+        ) * (value - self._mean)
+
+    def _remove(self, value: float):
+        if math.isnan(value):
+            return
+
+        self._observations -= 1
+
+        if self._observations:
+            previous_mean = self._mean - self._compensation_remove
+            y = value - self._compensation_remove
+            t = y - self._mean
+            self._compensation_remove = t + self._mean - y
+            self._mean = self._mean - t / self._observations
+            self._squared_deviations = self._squared_deviations - (
+                value - previous_mean
+            ) * (value - self._mean)
+        else:
+            self._mean = 0.0
+            self._squared_deviations = 0.0
+
+    def update(self, value: float) -> float:
+        """Add a value and return the standard deviation over the window."""
+        value = _to_float(value)
+
+        if self._previous_value is None or self._window == 1:
+            self._values.clear()
+            self._observations = 0.0
+            self._mean = 0.0
+            self._squared_deviations = 0.0
+            self._compensation_add = 0.0
+            self._compensation_remove = 0.0
+            self._consecutive_values = 0
+            self._previous_value = value
+        elif len(self._values) == self._window:
+            self._remove(self._values.popleft())
+
+        self._values.append(value)
+        self._add(value)
+
+        if self._observations >= self._min_periods and self._observations > self._ddof:
+            if (
+                self._observations == 1
+                or self._consecutive_values >= self._observations
+            ):
+                return 0.0
+
+            variance = self._squared_deviations / (self._observations - self._ddof)
+
+            return 0.0 if variance < 0 else math.sqrt(variance)
+
+        return NAN
+
+
+class _RollingExtreme:
+    """
+    Rolling maximum (or minimum) based on a monotonic deque which holds the
+    candidates for the extreme value of the current and coming windows.
+    """
+
+    def __init__(self, window: int, maximum: bool = True):
+        self._window = window
+        self._maximum = maximum
+        self._candidates: deque[tuple[int, float]] = deque()
+        self._missing: deque[bool] = deque()
+        self._observations = 0
+        self._position = 0
+
+    def update(self, value: float) -> float:
+        """Add a value and return the extreme value over the window."""
+        value = _to_float(value)
+        missing = math.isnan(value)
+
+        if len(self._missing) == self._window and not self._missing.popleft():
+            self._observations -= 1
+
+        self._missing.append(missing)
+
+        if not missing:
+            self._observations += 1
+
+            while self._candidates and (
+                self._candidates[-1][1] <= value
+                if self._maximum
+                else self._candidates[-1][1] >= value
+            ):
+                self._candidates.pop()
+
+            self._candidates.append((self._position, value))
+
+        while (
+            self._candidates and self._candidates[0][0] <= self._position - self._window
+        ):
+            self._candidates.popleft()
+
+        self._position += 1
+
+        if self._observations < self._window:
+            return NAN
+
+        return self._candidates[0][1]
+
+
+class _ExponentialMean:
+    """
+    Exponential moving average (adjust=False, min_periods=1) that is identical to
+    `ewm(span=window, min_periods=1, adjust=False).mean()`.
+    """
+
+    def __init__(self, window: int):
+        alpha = 1.0 / (1.0 + (window - 1) / 2.0)
+
+        self._old_weight_factor = 1.0 - alpha
+        self._new_weight = alpha
+        self._old_weight = 1.0
+        self._weighted = NAN
+
+    def update(self, value: float) -> float:
+        """Add a value and return the exponential moving average."""
+        value = _to_float(value)
+        observation = not math.isnan(value)
+
+        if not math.isnan(self._weighted):
+            # Missing values still decay the weight of the previous average
+            self._old_weight *= self._old_weight_factor
+
+            if observation:
+                if self._weighted != value:
+                    self._weighted = (
+                        self._old_weight * self._weighted + self._new_weight * value
+                    )
+                    self._weighted /= self._old_weight + self._new_weight
+
+                self._old_weight = 1.0
+        elif observation:
+            self._weighted = value
+
+        return self._weighted
+
+
+class _CumulativeSum:
+    """Cumulative sum that skips missing values like pandas' cumsum."""
+
+    def __init__(self):
+        self._total = 0.0
+
+    def update(self, value: float) -> float:
+        """Add a value and return the cumulative sum."""
+        if math.isnan(value):
+            self._total = self._total + 0.0
+
+            return NAN
+
+        self._total = self._total + value
+
+        return self._total
+
+
+class StreamingIndicator(ABC):
+    """
+    Base class of the streaming technical indicators. A streaming indicator keeps the
+    state that is required to calculate the next value and is updated with one bar
+    at a time through `update`. Feeding the full history bar by bar results in the
+    exact same values as the batch functions found in the overlap, momentum, volatility
+    and breadth modules while each update only costs O(1) (or O(window) memory).
+
+    A bar is a mapping such as a dictionary or a row of the historical data, e.g.
+    `{"Open": 1.0, "High": 1.2, "Low": 0.9, "Close": 1.1, "Adj Close": 1.1, "Volume": 1000}`.
+    Indicators that only require the close price also accept a number.
+    """
+
+    def __init__(self, close_column: str = "Adj Close"):
+        """
+        Initializes the Streaming Indicator.
+
+        Args:
+            close_column (str, optional): The column of the bar that holds the close price.
+                Defaults to "Adj Close".
+        """
+        self._close_column = close_column
+
+    def _get_close(self, bar) -> float:
+        """Return the close price of the bar."""
+        if isinstance(bar, Mapping) or hasattr(bar, "index"):
+            return float(bar[self._close_column])
+
+        return float(bar)
+
+    @staticmethod
+    def _get_value(bar, column: str) -> float:
+        """Return a value of the bar."""
+        return float(bar[column])
+
+    @abstractmethod
+    def update(self, bar) -> float | dict[str, float]:
+        """
+        Update the indicator with a new bar.
+
+        Args:
+            bar (Mapping | float): The new bar.
+
+        Returns:
+            float | dict[str, float]: The new indicator value(s).
+        """
+
+
+class _PreviousClose:
+    """Keeps track of the previous close price, starting as missing like shift(1)."""
+
+    def __init__(self):
+        self.value = NAN
+
+    def update(self, value: float) -> float:
+        """Store the value and return the previous one."""
+        previous_value, self.value = self.value, value
+
+        return previous_value
+
+
+class MovingAverage(StreamingIndicator):
+    """Streaming version of `overlap_model.get_moving_average`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._mean = _RollingMean(window)
+
+    def update(self, bar) -> float:
+        return self._mean.update(self._get_close(bar))
+
+
+class ExponentialMovingAverage(StreamingIndicator):
+    """Streaming version of `overlap_model.get_exponential_moving_average`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._ema = _ExponentialMean(window)
+
+    def update(self, bar) -> float:
+        return self._ema.update(self._get_close(bar))
+
+
+class DoubleExponentialMovingAverage(StreamingIndicator):
+    """Streaming version of `overlap_model.get_double_exponential_moving_average`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._ema_first = _ExponentialMean(window)
+        self._ema_second = _ExponentialMean(window)
+
+    def update(self, bar) -> float:
+        ema_first = self._ema_first.update(self._get_close(bar))
+        ema_second = self._ema_second.update(ema_first)
+
+        return 2 * ema_first - ema_second
+
+
+class Trix(StreamingIndicator):
+    """Streaming version of `overlap_model.get_trix`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._ema_1 = _ExponentialMean(window)
+        self._ema_2 = _ExponentialMean(window)
+        self._ema_3 = _ExponentialMean(window)
+        self._previous_ema_3 = _PreviousClose()
+
+    def update(self, bar) -> float:
+        ema_3 = self._ema_3.update(
+            self._ema_2.update(self._ema_1.update(self._get_close(bar)))
+        )
+        previous_ema_3 = self._previous_ema_3.update(ema_3)
+
+        return _divide(ema_3 - previous_ema_3, previous_ema_3) * 100
+
+
+class TriangularMovingAverage(StreamingIndicator):
+    """Streaming version of `overlap_model.get_triangular_moving_average`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._window = window
+        self._sum = _RollingSum(window, min_periods=1)
+
+    def update(self, bar) -> float:
+        return self._sum.update(self._get_close(bar)) / ((self._window + 1) / 2)
+
+
+class RelativeStrengthIndex(StreamingIndicator):
+    """Streaming version of `momentum_model.get_relative_strength_index`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._previous_close = _PreviousClose()
+        self._average_gain = _RollingMean(window)
+        self._average_loss = _RollingMean(window)
+
+    def update(self, bar) -> float:
+        close = self._get_close(bar)
+        price_diff = close - self._previous_close.update(close)
+
+        average_gain = self._average_gain.update(price_diff if price_diff > 0 else 0.0)
+        average_loss = self._average_loss.update(
+            -(price_diff if price_diff < 0 else 0.0)
+        )
+
+        return 100 - (100 / (1 + _divide(average_gain, average_loss)))
+
+
+class MovingAverageConvergenceDivergence(StreamingIndicator):
+    """Streaming version of `momentum_model.get_moving_average_convergence_divergence`."""
+
+    def __init__(
+        self,
+        short_window: int,
+        long_window: int,
+        signal_window: int,
+        close_column: str = "Adj Close",
+    ):
+        super().__init__(close_column)
+        self._short_ema = _ExponentialMean(short_window)
+        self._long_ema = _ExponentialMean(long_window)
+        self._signal_ema = _ExponentialMean(signal_window)
+
+    def update(self, bar) -> dict[str, float]:
+        close = self._get_close(bar)
+        macd_line = self._short_ema.update(close) - self._long_ema.update(close)
+
+        return {
+            "MACD Line": macd_line,
+            "Signal Line": self._signal_ema.update(macd_line),
+        }
+
+
+class PercentagePriceOscillator(StreamingIndicator):
+    """Streaming version of `momentum_model.get_percentage_price_oscillator`."""
+
+    def __init__(
+        self, short_window: int, long_window: int, close_column: str = "Adj Close"
+    ):
+        super().__init__(close_column)
+        self._short_ema = _ExponentialMean(short_window)
+        self._long_ema = _ExponentialMean(long_window)
+
+    def update(self, bar) -> float:
+        close = self._get_close(bar)
+        short_ema = self._short_ema.update(close)
+        long_ema = self._long_ema.update(close)
+
+        return _divide(short_ema - long_ema, long_ema) * 100
+
+
+class ChandeMomentumOscillator(StreamingIndicator):
+    """Streaming version of `momentum_model.get_chande_momentum_oscillator`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._previous_close = _PreviousClose()
+        self._up_sum = _RollingSum(window)
+        self._down_sum = _RollingSum(window)
+
+    def update(self, bar) -> float:
+        close = self._get_close(bar)
+        price_diff = close - self._previous_close.update(close)
+
+        up_sum = self._up_sum.update(price_diff if price_diff > 0 else 0.0)
+        down_sum = self._down_sum.update(abs(price_diff if price_diff < 0 else 0.0))
+
+        return _divide(up_sum - down_sum, up_sum + down_sum) * 100
+
+
+class StochasticOscillator(StreamingIndicator):
+    """Streaming version of `momentum_model.get_stochastic_oscillator`."""
+
+    def __init__(
+        self, window: int, smooth_window: int, close_column: str = "Adj Close"
+    ):
+        super().__init__(close_column)
+        self._lowest_low = _RollingExtreme(window, maximum=False)
+        self._highest_high = _RollingExtreme(window, maximum=True)
+        self._stochastic_d = _RollingMean(smooth_window)
+
+    def update(self, bar) -> dict[str, float]:
+        lowest_low = self._lowest_low.update(self._get_value(bar, "Low"))
+        highest_high = self._highest_high.update(self._get_value(bar, "High"))
+
+        stochastic_k = (
+            _divide(self._get_close(bar) - lowest_low, highest_high - lowest_low) * 100
+        )
+
+        return {
+            "Stochastic %K": stochastic_k,
+            "Stochastic %D": self._stochastic_d.update(stochastic_k),
+        }
+
+
+class WilliamsPercentR(StreamingIndicator):
+    """Streaming version of `momentum_model.get_williams_percent_r`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._highest_high = _RollingExtreme(window, maximum=True)
+        self._lowest_low = _RollingExtreme(window, maximum=False)
+
+    def update(self, bar) -> float:
+        highest_high = self._highest_high.update(self._get_value(bar, "High"))
+        lowest_low = self._lowest_low.update(self._get_value(bar, "Low"))
+
+        return (
+            -_divide(highest_high - self._get_close(bar), highest_high - lowest_low)
+            * 100
+        )
+
+
+class MoneyFlowIndex(StreamingIndicator):
+    """Streaming version of `momentum_model.get_money_flow_index`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._previous_typical_price = _PreviousClose()
+        self._positive_money_flow = _RollingSum(window)
+        self._negative_money_flow = _RollingSum(window)
+
+    def update(self, bar) -> float:
+        typical_price = (
+            self._get_value(bar, "High")
+            + self._get_value(bar, "Low")
+            + self._get_close(bar)
+        ) / 3
+        previous_typical_price = self._previous_typical_price.update(typical_price)
+        raw_money_flow = typical_price * self._get_value(bar, "Volume")
+
+        positive_money_flow = self._positive_money_flow.update(
+            raw_money_flow if typical_price > previous_typical_price else 0.0
+        )
+        negative_money_flow = self._negative_money_flow.update(
+            raw_money_flow if typical_price < previous_typical_price else 0.0
+        )
+
+        return 100 - (100 / (1 + _divide(positive_money_flow, negative_money_flow)))
+
+
+class CommodityChannelIndex(StreamingIndicator):
+    """Streaming version of `momentum_model.get_commodity_channel_index`."""
+
+    def __init__(
+        self, window: int, constant: float = 0.015, close_column: str = "Adj Close"
+    ):
+        super().__init__(close_column)
+        self._constant = constant
+        self._sma_typical_price = _RollingMean(window)
+        self._mean_deviation = _RollingMean(window)
+
+    def update(self, bar) -> float:
+        typical_price = (
+            self._get_value(bar, "High")
+            + self._get_value(bar, "Low")
+            + self._get_close(bar)
+        ) / 3
+        sma_typical_price = self._sma_typical_price.update(typical_price)
+        mean_deviation = self._mean_deviation.update(
+            abs(typical_price - sma_typical_price)
+        )
+
+        return _divide(
+            typical_price - sma_typical_price, self._constant * mean_deviation
+        )
+
+
+class BalanceOfPower(StreamingIndicator):
+    """Streaming version of `momentum_model.get_balance_of_power`."""
+
+    def update(self, bar) -> float:
+        balance_of_power = _divide(
+            self._get_close(bar) - self._get_value(bar, "Open"),
+            self._get_value(bar, "High") - self._get_value(bar, "Low"),
+        )
+
+        return 0.0 if math.isnan(balance_of_power) else balance_of_power
+
+
+class TrueRange(StreamingIndicator):
+    """Streaming version of `volatility_model.get_true_range`."""
+
+    def __init__(self, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._previous_close = _PreviousClose()
+
+    def update(self, bar) -> float:
+        high = self._get_value(bar, "High")
+        low = self._get_value(bar, "Low")
+        previous_close = self._previous_close.update(self._get_close(bar))
+
+        return _fmax(
+            _fmax(high - low, abs(high - previous_close)), abs(low - previous_close)
+        )
+
+
+class AverageTrueRange(StreamingIndicator):
+    """Streaming version of `volatility_model.get_average_true_range`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._true_range = TrueRange(close_column)
+        self._mean = _RollingMean(window, min_periods=1)
+
+    def update(self, bar) -> float:
+        return self._mean.update(self._true_range.update(bar))
+
+
+class AverageDirectionalIndex(StreamingIndicator):
+    """Streaming version of `momentum_model.get_average_directional_index`."""
+
+    def __init__(self, window: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._true_range = TrueRange(close_column)
+        self._previous_high = _PreviousClose()
+        self._previous_low = _PreviousClose()
+        self._atr = _RollingMean(window)
+        self._plus_dm = _RollingMean(window)
+        self._minus_dm = _RollingMean(window)
+        self._adx = _RollingMean(window)
+
+    def update(self, bar) -> float:
+        high = self._get_value(bar, "High")
+        low = self._get_value(bar, "Low")
+        high_diff = high - self._previous_high.update(high)
+        low_diff = low - self._previous_low.update(low)
+
+        atr = self._atr.update(self._true_range.update(bar))
+        plus_di = 100 * _divide(
+            self._plus_dm.update(high_diff if high_diff > 0 else 0.0), atr
+        )
+        minus_di = 100 * _divide(
+            self._minus_dm.update(-(low_diff if low_diff < 0 else 0.0)), atr
+        )
+
+        dx = 100 * _divide(abs(plus_di - minus_di), plus_di + minus_di)
+
+        return self._adx.update(dx)
+
+
+class BollingerBands(StreamingIndicator):
+    """Streaming version of `volatility_model.get_bollinger_bands`."""
+
+    def __init__(self, window: int, num_std_dev: int, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._num_std_dev = num_std_dev
+        self._mean = _RollingMean(window)
+        self._standard_deviation = _RollingStandardDeviation(window)
+
+    def update(self, bar) -> dict[str, float]:
+        close = self._get_close(bar)
+        rolling_mean = self._mean.update(close)
+        rolling_std = self._standard_deviation.update(close)
+
+        return {
+            "Upper Band": rolling_mean + (self._num_std_dev * rolling_std),
+            "Middle Band": rolling_mean,
+            "Lower Band": rolling_mean - (self._num_std_dev * rolling_std),
+            "Close": close,
+        }
+
+
+class KeltnerChannels(StreamingIndicator):
+    """Streaming version of `volatility_model.get_keltner_channels`."""
+
+    def __init__(
+        self,
+        window: int,
+        atr_window: int,
+        atr_multiplier: float,
+        close_column: str = "Adj Close",
+    ):
+        super().__init__(close_column)
+        self._atr_multiplier = atr_multiplier
+        self._average_true_range = AverageTrueRange(atr_window, close_column)
+        self._middle_line = _ExponentialMean(window)
+
+    def update(self, bar) -> dict[str, float]:
+        average_true_range = self._average_true_range.update(bar)
+        middle_line = self._middle_line.update(self._get_close(bar))
+
+        return {
+            "Upper Line": middle_line + self._atr_multiplier * average_true_range,
+            "Middle Line": middle_line,
+            "Lower Line": middle_line - self._atr_multiplier * average_true_range,
+        }
+
+
+class AdvancersDecliners(StreamingIndicator):
+    """Streaming version of `breadth_model.get_advancers_decliners`."""
+
+    def __init__(self, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._previous_close = _PreviousClose()
+
+    def update(self, bar) -> float:
+        close = self._get_close(bar)
+        previous_close = self._previous_close.update(close)
+
+        advancers = close if close > previous_close else 0.0
+        decliners = -(close if close < previous_close else 0.0)
+
+        return advancers - decliners
+
+
+class McClellanOscillator(StreamingIndicator):
+    """Streaming version of `breadth_model.get_mcclellan_oscillator`."""
+
+    def __init__(
+        self,
+        short_ema_window: int,
+        long_ema_window: int,
+        close_column: str = "Adj Close",
+    ):
+        super().__init__(close_column)
+        self._advancers_decliners = AdvancersDecliners(close_column)
+        self._short_ema = _ExponentialMean(short_ema_window)
+        self._long_ema = _ExponentialMean(long_ema_window)
+
+    def update(self, bar) -> float:
+        advancers_decliners = self._advancers_decliners.update(bar)
+
+        return self._short_ema.update(advancers_decliners) - self._long_ema.update(
+            advancers_decliners
+        )
+
+
+class OnBalanceVolume(StreamingIndicator):
+    """Streaming version of `breadth_model.get_on_balance_volume`."""
+
+    def __init__(self, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._previous_close = _PreviousClose()
+        self._cumulative_sum = _CumulativeSum()
+
+    def update(self, bar) -> float:
+        close = self._get_close(bar)
+        price_diff = close - self._previous_close.update(close)
+
+        return self._cumulative_sum.update(
+            _divide(price_diff, abs(price_diff)) * self._get_value(bar, "Volume")
+        )
+
+
+class AccumulationDistributionLine(StreamingIndicator):
+    """Streaming version of `breadth_model.get_accumulation_distribution_line`."""
+
+    def __init__(self, close_column: str = "Adj Close"):
+        super().__init__(close_column)
+        self._cumulative_sum = _CumulativeSum()
+
+    def update(self, bar) -> float:
+        high = self._get_value(bar, "High")
+        low = self._get_value(bar, "Low")
+        close = self._get_close(bar)
+
+        money_flow_multiplier = _divide((close - low) - (high - close), high - low)
+
+        return self._cumulative_sum.update(
+            money_flow_multiplier * self._get_value(bar, "Volume")
+        )
+
+
+class ChaikinOscillator(StreamingIndicator):
+    """Streaming version of `breadth_model.get_chaikin_oscillator`."""
+
+    def __init__(
+        self, short_window: int, long_window: int, close_column: str = "Adj Close"
+    ):
+        super().__init__(close_column)
+        self._accumulation_distribution_line = AccumulationDistributionLine(
+            close_column
+        )
+        self._short_ema = _ExponentialMean(short_window)
+        self._long_ema = _ExponentialMean(long_window)
+
+    def update(self, bar) -> float:
+        adl = self._accumulation_distribution_line.update(bar)
+
+        return self._short_ema.update(adl) - self._long_ema.update(adl)
@@ -12,7 +12,11 @@ from financetoolkit.technicals import (
     overlap_model,
     volatility_model,
 )
-from financetoolkit.technicals.helpers import handle_errors
+from financetoolkit.technicals.helpers import (
+    handle_errors,
+    select_column,
+    share_intermediates,
+)
 
 # pylint: disable=too-many-lines,too-many-instance-attributes,too-many-public-methods,too-many-locals,eval-used
 # pylint: disable=too-many-boolean-expressions
@@ -151,23 +155,24 @@ class Technicals:
                 "Please define the 'intraday_period' parameter when initializing the Toolkit."
             )
 
-        self._all_indicators = pd.concat(
-            [
-                self.collect_breadth_indicators(
-                    period=period, close_column=close_column
-                ),
-                self.collect_momentum_indicators(
-                    period=period, close_column=close_column, window=window
-                ),
-                self.collect_overlap_indicators(
-                    period=period, close_column=close_column, window=window
-                ),
-                self.collect_volatility_indicators(
-                    period=period, close_column=close_column, window=window
-                ),
-            ],
-            axis=1,
-        )
+        with share_intermediates():
+            self._all_indicators = pd.concat(
+                [
+                    self.collect_breadth_indicators(
+                        period=period, close_column=close_column
+                    ),
+                    self.collect_momentum_indicators(
+                        period=period, close_column=close_column, window=window
+                    ),
+                    self.collect_overlap_indicators(
+                        period=period, close_column=close_column, window=window
+                    ),
+                    self.collect_volatility_indicators(
+                        period=period, close_column=close_column, window=window
+                    ),
+                ],
+                axis=1,
+            )
 
         self._all_indicators = self._all_indicators.round(
             rounding if rounding else self._rounding
@@ -240,30 +245,31 @@ class Technicals:
                 "Please define the 'intraday_period' parameter when initializing the Toolkit."
             )
 
-        breadth_indicators: dict = {}
-
-        breadth_indicators["McClellan Oscillator"] = self.get_mcclellan_oscillator(
-            period=period, close_column=close_column
-        )
+        with share_intermediates():
+            breadth_indicators: dict = {}
 
-        breadth_indicators["Advancers - Decliners"] = self.get_advancers_decliners(
-            period=period, close_column=close_column
-        )
-        breadth_indicators["On-Balance Volume"] = self.get_on_balance_volume(
-            period=period, close_column=close_column
-        )
+            breadth_indicators["McClellan Oscillator"] = self.get_mcclellan_oscillator(
+                period=period, close_column=close_column
+            )
 
-        breadth_indicators["Accumulation/Distribution Line"] = (
-            self.get_accumulation_distribution_line(
+            breadth_indicators["Advancers - Decliners"] = self.get_advancers_decliners(
+                period=period, close_column=close_column
+            )
+            breadth_indicators["On-Balance Volume"] = self.get_on_balance_volume(
                 period=period, close_column=close_column
             )
-        )
 
-        breadth_indicators["Chaikin Oscillator"] = self.get_chaikin_oscillator(
-            period=period, close_column=close_column
-        )
+            breadth_indicators["Accumulation/Distribution Line"] = (
+                self.get_accumulation_distribution_line(
+                    period=period, close_column=close_column
+                )
+            )
+
+            breadth_indicators["Chaikin Oscillator"] = self.get_chaikin_oscillator(
+                period=period, close_column=close_column
+            )
 
-        self._breadth_indicators = pd.concat(breadth_indicators, axis=1)
+            self._breadth_indicators = pd.concat(breadth_indicators, axis=1)
 
         self._breadth_indicators = self._breadth_indicators.round(
             rounding if rounding else self._rounding
@@ -368,13 +374,11 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        mcclellan_oscillator = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            mcclellan_oscillator[ticker] = breadth_model.get_mcclellan_oscillator(
-                historical_data[close_column][ticker], short_ema_window, long_ema_window
-            ).loc[self._start_date : self._end_date]
+        mcclellan_oscillator = breadth_model.get_mcclellan_oscillator(
+            select_column(historical_data, close_column),
+            short_ema_window,
+            long_ema_window,
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -459,7 +463,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         advancers_decliners = breadth_model.get_advancers_decliners(
-            historical_data[close_column],
+            select_column(historical_data, close_column),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -544,8 +548,8 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         on_balance_volume = breadth_model.get_on_balance_volume(
-            historical_data[close_column],
-            historical_data["Volume"],
+            select_column(historical_data, close_column),
+            select_column(historical_data, "Volume"),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -630,18 +634,14 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        accumulation_distribution_line = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
+        accumulation_distribution_line = (
+            breadth_model.get_accumulation_distribution_line(
+                select_column(historical_data, "High"),
+                select_column(historical_data, "Low"),
+                select_column(historical_data, close_column),
+                select_column(historical_data, "Volume"),
+            ).loc[self._start_date : self._end_date]
         )
-        for ticker in historical_data[close_column].columns:
-            accumulation_distribution_line[ticker] = (
-                breadth_model.get_accumulation_distribution_line(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    historical_data["Volume"][ticker],
-                ).loc[self._start_date : self._end_date]
-            )
 
         if growth:
             return calculate_growth(
@@ -734,10 +734,10 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         chaikin_oscillator = breadth_model.get_chaikin_oscillator(
-            historical_data["High"],
-            historical_data["Low"],
-            historical_data[close_column],
-            historical_data["Volume"],
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
+            select_column(historical_data, "Volume"),
             short_window,
             long_window,
         ).loc[self._start_date : self._end_date]
@@ -812,95 +812,100 @@ class Technicals:
                 "Please define the 'intraday_period' parameter when initializing the Toolkit."
             )
 
-        momentum_indicators: dict = {}
+        with share_intermediates():
+            momentum_indicators: dict = {}
 
-        momentum_indicators["Money Flow Index"] = self.get_money_flow_index(
-            period=period, close_column=close_column, window=window
-        )
+            momentum_indicators["Money Flow Index"] = self.get_money_flow_index(
+                period=period, close_column=close_column, window=window
+            )
 
-        momentum_indicators["Williams %R"] = self.get_williams_percent_r(
-            period=period, close_column=close_column, window=window
-        )
+            momentum_indicators["Williams %R"] = self.get_williams_percent_r(
+                period=period, close_column=close_column, window=window
+            )
 
-        aroon_indicator = self.get_aroon_indicator(period=period, window=window)
+            aroon_indicator = self.get_aroon_indicator(period=period, window=window)
 
-        momentum_indicators["Aroon Indicator Up"] = aroon_indicator["Aroon Up"]
-        momentum_indicators["Aroon Indicator Down"] = aroon_indicator["Aroon Down"]
+            momentum_indicators["Aroon Indicator Up"] = aroon_indicator["Aroon Up"]
+            momentum_indicators["Aroon Indicator Down"] = aroon_indicator["Aroon Down"]
 
-        momentum_indicators["Commodity Channel Index"] = (
-            self.get_commodity_channel_index(
-                period=period, close_column=close_column, window=window
+            momentum_indicators["Commodity Channel Index"] = (
+                self.get_commodity_channel_index(
+                    period=period, close_column=close_column, window=window
+                )
             )
-        )
 
-        momentum_indicators["Relative Vigor Index"] = self.get_relative_vigor_index(
-            period=period, close_column=close_column, window=window
-        )
+            momentum_indicators["Relative Vigor Index"] = self.get_relative_vigor_index(
+                period=period, close_column=close_column, window=window
+            )
 
-        momentum_indicators["Force Index"] = self.get_force_index(
-            period=period, close_column=close_column, window=window
-        )
-        momentum_indicators["Ultimate Oscillator"] = self.get_ultimate_oscillator(
-            period=period, close_column=close_column
-        )
-        momentum_indicators["Percentage Price Oscillator"] = (
-            self.get_percentage_price_oscillator(
+            momentum_indicators["Force Index"] = self.get_force_index(
+                period=period, close_column=close_column, window=window
+            )
+            momentum_indicators["Ultimate Oscillator"] = self.get_ultimate_oscillator(
                 period=period, close_column=close_column
             )
-        )
-        momentum_indicators["Detrended Price Oscillator"] = (
-            self.get_detrended_price_oscillator(
-                period=period, close_column=close_column, window=window
+            momentum_indicators["Percentage Price Oscillator"] = (
+                self.get_percentage_price_oscillator(
+                    period=period, close_column=close_column
+                )
             )
-        )
-        momentum_indicators["Average Directional Index"] = (
-            self.get_average_directional_index(
-                period=period, close_column=close_column, window=window
+            momentum_indicators["Detrended Price Oscillator"] = (
+                self.get_detrended_price_oscillator(
+                    period=period, close_column=close_column, window=window
+                )
             )
-        )
-        momentum_indicators["Chande Momentum Oscillator"] = (
-            self.get_chande_momentum_oscillator(
-                period=period, close_column=close_column, window=window
+            momentum_indicators["Average Directional Index"] = (
+                self.get_average_directional_index(
+                    period=period, close_column=close_column, window=window
+                )
+            )
+            momentum_indicators["Chande Momentum Oscillator"] = (
+                self.get_chande_momentum_oscillator(
+                    period=period, close_column=close_column, window=window
+                )
             )
-        )
 
-        ichimoku_cloud = self.get_ichimoku_cloud(period=period)
-
-        momentum_indicators["Ichimoku Conversion Line"] = ichimoku_cloud[
-            "Conversion Line"
-        ]
-        momentum_indicators["Ichimoku Base Line"] = ichimoku_cloud["Base Line"]
-        momentum_indicators["Ichimoku Leading Span A"] = ichimoku_cloud[
-            "Leading Span A"
-        ]
-        momentum_indicators["Ichimoku Leading Span B"] = ichimoku_cloud[
-            "Leading Span B"
-        ]
-
-        stochastic_oscillator = self.get_stochastic_oscillator(
-            period=period, close_column=close_column, window=window
-        )
+            ichimoku_cloud = self.get_ichimoku_cloud(period=period)
 
-        momentum_indicators["Stochastic %K"] = stochastic_oscillator["Stochastic %K"]
-        momentum_indicators["Stochastic %D"] = stochastic_oscillator["Stochastic %D"]
+            momentum_indicators["Ichimoku Conversion Line"] = ichimoku_cloud[
+                "Conversion Line"
+            ]
+            momentum_indicators["Ichimoku Base Line"] = ichimoku_cloud["Base Line"]
+            momentum_indicators["Ichimoku Leading Span A"] = ichimoku_cloud[
+                "Leading Span A"
+            ]
+            momentum_indicators["Ichimoku Leading Span B"] = ichimoku_cloud[
+                "Leading Span B"
+            ]
 
-        macd = self.get_moving_average_convergence_divergence(
-            period=period, close_column=close_column
-        )
+            stochastic_oscillator = self.get_stochastic_oscillator(
+                period=period, close_column=close_column, window=window
+            )
 
-        momentum_indicators["MACD Line"] = macd["MACD Line"]
-        momentum_indicators["MACD Signal Line"] = macd["Signal Line"]
+            momentum_indicators["Stochastic %K"] = stochastic_oscillator[
+                "Stochastic %K"
+            ]
+            momentum_indicators["Stochastic %D"] = stochastic_oscillator[
+                "Stochastic %D"
+            ]
 
-        momentum_indicators["Relative Strength Index"] = (
-            self.get_relative_strength_index(
-                period=period, close_column=close_column, window=window
+            macd = self.get_moving_average_convergence_divergence(
+                period=period, close_column=close_column
             )
-        )
-        momentum_indicators["Balance of Power"] = self.get_balance_of_power(
-            period=period, close_column=close_column
-        )
 
-        self._momentum_indicators = pd.concat(momentum_indicators, axis=1)
+            momentum_indicators["MACD Line"] = macd["MACD Line"]
+            momentum_indicators["MACD Signal Line"] = macd["Signal Line"]
+
+            momentum_indicators["Relative Strength Index"] = (
+                self.get_relative_strength_index(
+                    period=period, close_column=close_column, window=window
+                )
+            )
+            momentum_indicators["Balance of Power"] = self.get_balance_of_power(
+                period=period, close_column=close_column
+            )
+
+            self._momentum_indicators = pd.concat(momentum_indicators, axis=1)
 
         self._momentum_indicators = self._momentum_indicators.round(
             rounding if rounding else self._rounding
@@ -1003,10 +1008,10 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         money_flow_index = momentum_model.get_money_flow_index(
-            historical_data["High"],
-            historical_data["Low"],
-            historical_data[close_column],
-            historical_data["Volume"],
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
+            select_column(historical_data, "Volume"),
             window,
         ).loc[self._start_date : self._end_date]
 
@@ -1095,9 +1100,9 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         williams_percent_r = momentum_model.get_williams_percent_r(
-            historical_data["High"],
-            historical_data["Low"],
-            historical_data[close_column],
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
             window,
         ).loc[self._start_date : self._end_date]
 
@@ -1175,27 +1180,22 @@ class Technicals:
             raise ValueError(
                 "Period must be intraday, daily, weekly, monthly, quarterly, or yearly."
             )
-        if period == "intraday":
-            if self._historical_data[period].empty:
-                raise ValueError(
-                    "Please define the 'intraday_period' parameter when initializing the Toolkit."
-                )
-            close_column = "Close"
+        if period == "intraday" and self._historical_data[period].empty:
+            raise ValueError(
+                "Please define the 'intraday_period' parameter when initializing the Toolkit."
+            )
 
         historical_data = self._historical_data[period]
 
-        aroon_indicator_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            aroon_indicator_dict[ticker] = momentum_model.get_aroon_indicator(
-                historical_data["High"][ticker], historical_data["Low"][ticker], window
-            )
-
         aroon_indicator = (
-            pd.concat(aroon_indicator_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            momentum_model.get_aroon_indicator(
+                select_column(historical_data, "High"),
+                select_column(historical_data, "Low"),
+                window,
+            )
             .sort_index(axis=1)
-        ).loc[self._start_date : self._end_date]
+            .loc[self._start_date : self._end_date]
+        )
 
         if growth:
             aroon_indicator_growth = calculate_growth(
@@ -1286,20 +1286,13 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        commodity_channel_index = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-
-        for ticker in historical_data[close_column].columns:
-            commodity_channel_index[ticker] = (
-                momentum_model.get_commodity_channel_index(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    window,
-                    constant,
-                ).loc[self._start_date : self._end_date]
-            )
+        commodity_channel_index = momentum_model.get_commodity_channel_index(
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
+            window,
+            constant,
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -1386,9 +1379,9 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         relative_vigor_index = momentum_model.get_relative_vigor_index(
-            historical_data["Open"],
-            historical_data[close_column],
-            historical_data["Volume"],
+            select_column(historical_data, "Open"),
+            select_column(historical_data, close_column),
+            select_column(historical_data, "Volume"),
             window,
         ).loc[self._start_date : self._end_date]
 
@@ -1476,8 +1469,8 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         force_index = momentum_model.get_force_index(
-            historical_data[close_column],
-            historical_data["Volume"],
+            select_column(historical_data, close_column),
+            select_column(historical_data, "Volume"),
             window,
         ).loc[self._start_date : self._end_date]
 
@@ -1571,18 +1564,14 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        ultimate_oscillator = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            ultimate_oscillator[ticker] = momentum_model.get_ultimate_oscillator(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
-                window_1,
-                window_2,
-                window_3,
-            ).loc[self._start_date : self._end_date]
+        ultimate_oscillator = momentum_model.get_ultimate_oscillator(
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
+            window_1,
+            window_2,
+            window_3,
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             ultimate_oscillator_growth = calculate_growth(
@@ -1673,7 +1662,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         percentage_price_oscillator = momentum_model.get_percentage_price_oscillator(
-            historical_data[close_column],
+            select_column(historical_data, close_column),
             short_window,
             long_window,
         ).loc[self._start_date : self._end_date]
@@ -1766,7 +1755,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         detrended_price_oscillator = momentum_model.get_detrended_price_oscillator(
-            historical_data[close_column], window
+            select_column(historical_data, close_column), window
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -1856,18 +1845,12 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        average_directional_index = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            average_directional_index[ticker] = (
-                momentum_model.get_average_directional_index(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    window,
-                ).loc[self._start_date : self._end_date]
-            )
+        average_directional_index = momentum_model.get_average_directional_index(
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
+            window,
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             adx_growth = calculate_growth(
@@ -1956,7 +1939,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         chande_momentum_oscillator = momentum_model.get_chande_momentum_oscillator(
-            historical_data[close_column], window
+            select_column(historical_data, close_column), window
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2044,30 +2027,23 @@ class Technicals:
             raise ValueError(
                 "Period must be intraday, daily, weekly, monthly, quarterly, or yearly."
             )
-        if period == "intraday":
-            if self._historical_data[period].empty:
-                raise ValueError(
-                    "Please define the 'intraday_period' parameter when initializing the Toolkit."
-                )
-            close_column = "Close"
+        if period == "intraday" and self._historical_data[period].empty:
+            raise ValueError(
+                "Please define the 'intraday_period' parameter when initializing the Toolkit."
+            )
 
         historical_data = self._historical_data[period]
 
-        ichimoku_cloud_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            ichimoku_cloud_dict[ticker] = momentum_model.get_ichimoku_cloud(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
+        ichimoku_cloud = (
+            momentum_model.get_ichimoku_cloud(
+                select_column(historical_data, "High"),
+                select_column(historical_data, "Low"),
                 conversion_window,
                 base_window,
                 lead_span_b_window,
-            ).loc[self._start_date : self._end_date]
-
-        ichimoku_cloud = (
-            pd.concat(ichimoku_cloud_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            )
             .sort_index(axis=1)
+            .loc[self._start_date : self._end_date]
         )
 
         if growth:
@@ -2162,23 +2138,16 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        stochastic_oscillator_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            stochastic_oscillator_dict[ticker] = (
-                momentum_model.get_stochastic_oscillator(
-                    historical_data["High"][ticker],
-                    historical_data["Low"][ticker],
-                    historical_data[close_column][ticker],
-                    window,
-                    smooth_widow,
-                ).loc[self._start_date : self._end_date]
-            )
-
         stochastic_oscillator = (
-            pd.concat(stochastic_oscillator_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            momentum_model.get_stochastic_oscillator(
+                select_column(historical_data, "High"),
+                select_column(historical_data, "Low"),
+                select_column(historical_data, close_column),
+                window,
+                smooth_widow,
+            )
             .sort_index(axis=1)
+            .loc[self._start_date : self._end_date]
         )
 
         if growth:
@@ -2276,19 +2245,16 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        macd_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            macd_dict[ticker] = (
-                momentum_model.get_moving_average_convergence_divergence(
-                    historical_data[close_column][ticker],
-                    short_window,
-                    long_window,
-                    signal_window,
-                ).loc[self._start_date : self._end_date]
+        macd = (
+            momentum_model.get_moving_average_convergence_divergence(
+                select_column(historical_data, close_column),
+                short_window,
+                long_window,
+                signal_window,
             )
-
-        macd = pd.concat(macd_dict, axis=1).swaplevel(1, 0, axis=1).sort_index(axis=1)
+            .sort_index(axis=1)
+            .loc[self._start_date : self._end_date]
+        )
 
         if growth:
             macd_growth = calculate_growth(
@@ -2378,7 +2344,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         relative_strength_index = momentum_model.get_relative_strength_index(
-            historical_data[close_column], window
+            select_column(historical_data, close_column), window
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2464,10 +2430,10 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         balance_of_power = momentum_model.get_balance_of_power(
-            historical_data["Open"],
-            historical_data["High"],
-            historical_data["Low"],
-            historical_data[close_column],
+            select_column(historical_data, "Open"),
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2540,35 +2506,36 @@ class Technicals:
                 "Please define the 'intraday_period' parameter when initializing the Toolkit."
             )
 
-        overlap_indicators: dict = {}
-
-        overlap_indicators["Simple Moving Average (SMA)"] = self.get_moving_average(
-            period=period, close_column=close_column, window=window
-        )
+        with share_intermediates():
+            overlap_indicators: dict = {}
 
-        overlap_indicators["Exponential Moving Average (EMA)"] = (
-            self.get_exponential_moving_average(
+            overlap_indicators["Simple Moving Average (SMA)"] = self.get_moving_average(
                 period=period, close_column=close_column, window=window
             )
-        )
 
-        overlap_indicators["Double Exponential Moving Average (DEMA)"] = (
-            self.get_double_exponential_moving_average(
-                period=period, close_column=close_column, window=window
+            overlap_indicators["Exponential Moving Average (EMA)"] = (
+                self.get_exponential_moving_average(
+                    period=period, close_column=close_column, window=window
+                )
             )
-        )
 
-        overlap_indicators["TRIX"] = self.get_trix(
-            period=period, close_column=close_column, window=window
-        )
+            overlap_indicators["Double Exponential Moving Average (DEMA)"] = (
+                self.get_double_exponential_moving_average(
+                    period=period, close_column=close_column, window=window
+                )
+            )
 
-        overlap_indicators["Triangular Moving Average"] = (
-            self.get_triangular_moving_average(
+            overlap_indicators["TRIX"] = self.get_trix(
                 period=period, close_column=close_column, window=window
             )
-        )
 
-        self._overlap_indicators = pd.concat(overlap_indicators, axis=1)
+            overlap_indicators["Triangular Moving Average"] = (
+                self.get_triangular_moving_average(
+                    period=period, close_column=close_column, window=window
+                )
+            )
+
+            self._overlap_indicators = pd.concat(overlap_indicators, axis=1)
 
         self._overlap_indicators = self._overlap_indicators.round(
             rounding if rounding else self._rounding
@@ -2669,7 +2636,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         moving_average = overlap_model.get_moving_average(
-            historical_data[close_column], window
+            select_column(historical_data, close_column), window
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2758,7 +2725,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         exponential_moving_average = overlap_model.get_exponential_moving_average(
-            historical_data[close_column], window
+            select_column(historical_data, close_column), window
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -2850,7 +2817,7 @@ class Technicals:
 
         double_exponential_moving_average = (
             overlap_model.get_double_exponential_moving_average(
-                historical_data[close_column], window
+                select_column(historical_data, close_column), window
             ).loc[self._start_date : self._end_date]
         )
 
@@ -2945,9 +2912,9 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        trix = overlap_model.get_trix(historical_data[close_column], window).loc[
-            self._start_date : self._end_date
-        ]
+        trix = overlap_model.get_trix(
+            select_column(historical_data, close_column), window
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -3041,17 +3008,12 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        bollinger_bands_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            bollinger_bands_dict[ticker] = volatility_model.get_bollinger_bands(
-                historical_data[close_column][ticker], window, num_std_dev
-            ).loc[self._start_date : self._end_date]
-
         bollinger_bands = (
-            pd.concat(bollinger_bands_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            volatility_model.get_bollinger_bands(
+                select_column(historical_data, close_column), window, num_std_dev
+            )
             .sort_index(axis=1)
+            .loc[self._start_date : self._end_date]
         )
 
         if growth:
@@ -3141,7 +3103,7 @@ class Technicals:
         historical_data = self._historical_data[period]
 
         triangular_moving_average = overlap_model.get_triangular_moving_average(
-            historical_data[close_column], window
+            select_column(historical_data, close_column), window
         ).loc[self._start_date : self._end_date]
 
         if growth:
@@ -3239,10 +3201,10 @@ class Technicals:
 
         support_resistance_levels = {}
 
-        for ticker in historical_data[close_column].columns:
+        for ticker in select_column(historical_data, close_column).columns:
             support_resistance_levels[ticker] = (
                 overlap_model.get_support_resistance_levels(
-                    prices=historical_data[close_column][ticker],
+                    prices=select_column(historical_data, close_column)[ticker],
                     window=window,
                     sensitivity=sensitivity,
                 )
@@ -3318,35 +3280,46 @@ class Technicals:
                 "Please define the 'intraday_period' parameter when initializing the Toolkit."
             )
 
-        volatility_indicators: dict = {}
+        with share_intermediates():
+            volatility_indicators: dict = {}
 
-        bollinger_bands = self.get_bollinger_bands(
-            period=period, close_column=close_column, window=window
-        )
+            bollinger_bands = self.get_bollinger_bands(
+                period=period, close_column=close_column, window=window
+            )
 
-        volatility_indicators["Bollinger Band Upper"] = bollinger_bands["Upper Band"]
-        volatility_indicators["Bollinger Band Middle"] = bollinger_bands["Middle Band"]
-        volatility_indicators["Bollinger Band Lower"] = bollinger_bands["Lower Band"]
+            volatility_indicators["Bollinger Band Upper"] = bollinger_bands[
+                "Upper Band"
+            ]
+            volatility_indicators["Bollinger Band Middle"] = bollinger_bands[
+                "Middle Band"
+            ]
+            volatility_indicators["Bollinger Band Lower"] = bollinger_bands[
+                "Lower Band"
+            ]
 
-        volatility_indicators["True Range"] = self.get_true_range(
-            period=period, close_column=close_column
-        )
+            volatility_indicators["True Range"] = self.get_true_range(
+                period=period, close_column=close_column
+            )
 
-        volatility_indicators["Average True Range"] = self.get_average_true_range(
-            period=period, close_column=close_column, window=window
-        )
+            volatility_indicators["Average True Range"] = self.get_average_true_range(
+                period=period, close_column=close_column, window=window
+            )
 
-        keltner_channels = self.get_keltner_channels(
-            period=period, close_column=close_column, window=window
-        )
+            keltner_channels = self.get_keltner_channels(
+                period=period, close_column=close_column, window=window
+            )
 
-        volatility_indicators["Keltner Channel Upper"] = keltner_channels["Upper Line"]
-        volatility_indicators["Keltner Channel Middle"] = keltner_channels[
-            "Middle Line"
-        ]
-        volatility_indicators["Keltner Channel Lower"] = keltner_channels["Lower Line"]
+            volatility_indicators["Keltner Channel Upper"] = keltner_channels[
+                "Upper Line"
+            ]
+            volatility_indicators["Keltner Channel Middle"] = keltner_channels[
+                "Middle Line"
+            ]
+            volatility_indicators["Keltner Channel Lower"] = keltner_channels[
+                "Lower Line"
+            ]
 
-        self._volatility_indicators = pd.concat(volatility_indicators, axis=1)
+            self._volatility_indicators = pd.concat(volatility_indicators, axis=1)
 
         self._volatility_indicators = self._volatility_indicators.round(
             rounding if rounding else self._rounding
@@ -3447,15 +3420,11 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        true_range = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            true_range[ticker] = volatility_model.get_true_range(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
-            ).loc[self._start_date : self._end_date]
+        true_range = volatility_model.get_true_range(
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -3548,16 +3517,12 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        average_true_range = pd.DataFrame(
-            index=historical_data.loc[self._start_date : self._end_date].index
-        )
-        for ticker in historical_data[close_column].columns:
-            average_true_range[ticker] = volatility_model.get_average_true_range(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
-                window,
-            ).loc[self._start_date : self._end_date]
+        average_true_range = volatility_model.get_average_true_range(
+            select_column(historical_data, "High"),
+            select_column(historical_data, "Low"),
+            select_column(historical_data, close_column),
+            window,
+        ).loc[self._start_date : self._end_date]
 
         if growth:
             return calculate_growth(
@@ -3654,22 +3619,17 @@ class Technicals:
 
         historical_data = self._historical_data[period]
 
-        keltner_channels_dict = {}
-
-        for ticker in historical_data[close_column].columns:
-            keltner_channels_dict[ticker] = volatility_model.get_keltner_channels(
-                historical_data["High"][ticker],
-                historical_data["Low"][ticker],
-                historical_data[close_column][ticker],
+        kelter_channels = (
+            volatility_model.get_keltner_channels(
+                select_column(historical_data, "High"),
+                select_column(historical_data, "Low"),
+                select_column(historical_data, close_column),
                 window,
                 atr_window,
                 atr_multiplier,
-            ).loc[self._start_date : self._end_date]
-
-        kelter_channels = (
-            pd.concat(keltner_channels_dict, axis=1)
-            .swaplevel(1, 0, axis=1)
+            )
             .sort_index(axis=1)
+            .loc[self._start_date : self._end_date]
         )
 
         if growth:
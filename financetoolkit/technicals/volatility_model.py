@@ -2,11 +2,17 @@
 
 __docformat__ = "google"
 
+import numpy as np
 import pandas as pd
 
-from financetoolkit.technicals.overlap_model import get_exponential_moving_average
+from financetoolkit.technicals.helpers import cache_intermediate
+from financetoolkit.technicals.overlap_model import (
+    get_exponential_moving_average,
+    get_moving_average,
+)
 
 
+@cache_intermediate
 def get_true_range(
     prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series
 ) -> pd.Series:
@@ -22,18 +28,19 @@ def get_true_range(
     Returns:
         pd.Series: ATR values.
     """
-    true_range = pd.concat(
-        [
-            prices_high - prices_low,
-            abs(prices_high - prices_close.shift(1)),
-            abs(prices_low - prices_close.shift(1)),
-        ],
-        axis=1,
-    ).max(axis=1)
+    previous_close = prices_close.shift(1)
+
+    # np.fmax ignores NaN values like DataFrame.max does and works on Series
+    # and DataFrames alike so that all tickers are calculated at once
+    true_range = np.fmax(
+        np.fmax(prices_high - prices_low, abs(prices_high - previous_close)),
+        abs(prices_low - previous_close),
+    )
 
     return true_range
 
 
+@cache_intermediate
 def get_average_true_range(
     prices_high: pd.Series, prices_low: pd.Series, prices_close: pd.Series, window: int
 ) -> pd.Series:
@@ -107,7 +114,7 @@ def get_bollinger_bands(
     Returns:
         pd.DataFrame: Bollinger Bands (upper, middle, lower).
     """
-    rolling_mean = prices.rolling(window=window).mean()
+    rolling_mean = get_moving_average(prices, window)
     rolling_std = prices.rolling(window=window).std()
 
     upper_band = rolling_mean + (num_std_dev * rolling_std)
@@ -3,6 +3,7 @@
 __docformat__ = "google"
 
 
+import asyncio
 import re
 import warnings
 from collections import Counter
@@ -14,6 +15,9 @@ from financetoolkit import currencies_model, helpers
 from financetoolkit.economics.economics_controller import Economics
 from financetoolkit.fixedincome.fixedincome_controller import FixedIncome
 from financetoolkit.fmp_model import (
+    aget_profile as _aget_profile,
+    aget_quote as _aget_quote,
+    aget_rating as _aget_rating,
     get_analyst_estimates as _get_analyst_estimates,
     get_dividend_calendar as _get_dividend_calendar,
     get_earnings_calendar as _get_earnings_calendar,
@@ -26,9 +30,11 @@ from financetoolkit.fmp_model import (
 )
 from financetoolkit.fundamentals_model import collect_financial_statements
 from financetoolkit.historical_model import (
+    aget_historical_data as _aget_historical_data,
     convert_daily_to_other_period as _convert_daily_to_other_period,
     get_historical_data as _get_historical_data,
     get_historical_statistics as _get_historical_statistics,
+    update_historical_data as _update_historical_data,
 )
 from financetoolkit.models.models_controller import Models
 from financetoolkit.normalization_model import (
@@ -40,7 +46,7 @@ from financetoolkit.performance.performance_controller import Performance
 from financetoolkit.ratios.ratios_controller import Ratios
 from financetoolkit.risk.risk_controller import Risk
 from financetoolkit.technicals.technicals_controller import Technicals
-from financetoolkit.utilities import cache_model, logger_model
+from financetoolkit.utilities import cache_model, fetch_model, logger_model
 
 # Set up logger, this is meant to display useful messages, warnings or errors when
 # the Finance Toolkit runs into issues or does something that might not be entirely
@@ -48,6 +54,37 @@ from financetoolkit.utilities import cache_model, logger_model
 logger_model.setup_logger()
 logger = logger_model.get_logger()
 
+_STATEMENTS = [
+    "_balance_sheet_statement",
+    "_income_statement",
+    "_cash_flow_statement",
+]
+_HISTORICAL_DATA = [
+    "_daily_historical_data",
+    "_weekly_historical_data",
+    "_monthly_historical_data",
+    "_quarterly_historical_data",
+    "_yearly_historical_data",
+]
+_RISK_FREE_RATES = [
+    "_daily_risk_free_rate",
+    "_weekly_risk_free_rate",
+    "_monthly_risk_free_rate",
+    "_quarterly_risk_free_rate",
+    "_yearly_risk_free_rate",
+]
+
+# The attributes each of the controllers is created from, the controllers are cached
+# and only created again when one of these attributes is replaced
+CONTROLLER_INPUTS: dict[str, list[str]] = {
+    "ratios": _STATEMENTS + ["_daily_historical_data"],
+    "models": _STATEMENTS + _HISTORICAL_DATA + _RISK_FREE_RATES,
+    "options": ["_daily_historical_data", "_yearly_historical_data"] + _RISK_FREE_RATES,
+    "technicals": _HISTORICAL_DATA + ["_intraday_historical_data"],
+    "performance": _HISTORICAL_DATA + ["_intraday_historical_data"] + _RISK_FREE_RATES,
+    "risk": _HISTORICAL_DATA + ["_intraday_historical_data"],
+}
+
 # Runtime errors are ignored on purpose given the nature of the calculations
 # sometimes leading to division by zero or other mathematical errors. This is however
 # for financial analysis purposes not an issue and should not be considered as a bug.
@@ -109,7 +146,8 @@ class Toolkit:
         a specific range. Another option is to work with cached data. This is useful when you have collected
         data before and want to use this data again. This can be done by setting the use_cached_data variable
         to True. If you want to use a specific location to store the cached data, you can define this as a string,
-        e.g. "datasets".
+        e.g. "datasets". Historical data is cached per ticker (in the Parquet format if pyarrow is installed)
+        which means that only the tickers of the Toolkit are read from the cache.
 
         It is good to note that the Finance Toolkit will always attempt to acquire data from Financial Modeling Prep
         if an API key is set. If this isn't the case, the data comes from Yahoo Finance. In case you have an API key
@@ -404,6 +442,9 @@ class Toolkit:
         else:
             self._fmp_plan = "Premium"
 
+        # The rate limiter of the shared fetch executor is sized to the detected plan
+        fetch_model.configure(plan=self._fmp_plan)
+
         self._sleep_timer = (
             sleep_timer if sleep_timer is not None else self._fmp_plan != "Free"
         )
@@ -425,6 +466,10 @@ class Toolkit:
             self._revenue_geographic_segmentation_growth: pd.DataFrame = pd.DataFrame()
             self._revenue_product_segmentation_growth: pd.DataFrame = pd.DataFrame()
 
+            # The profile and quote are stored per ticker and expire after their time to
+            # live, see cache_model.TIME_TO_LIVE. The other datasets are stored as a whole.
+            ticker_cached_attributes = {"_profile": "profile", "_quote": "quote"}
+
             # Define attributes and their corresponding cache file names
             cached_attributes = {
                 "_profile": "profile.pickle",
@@ -441,14 +486,24 @@ class Toolkit:
 
             # Initialize FinancialModelingPrep Variables
             for attr_name, file_name in cached_attributes.items():
-                data = (
-                    cache_model.load_cached_data(
+                data = pd.DataFrame()
+
+                if self._use_cached_data and attr_name in ticker_cached_attributes:
+                    data = cache_model.load_ticker_data(
+                        cached_data_location=self._cached_data_location,
+                        source="Toolkit",
+                        endpoint=ticker_cached_attributes[attr_name],
+                        tickers=self._tickers,
+                        level=None,
+                    )
+
+                if self._use_cached_data and data.empty:
+                    # Caches created before the introduction of the columnar store
+                    data = cache_model.load_cached_data(
                         cached_data_location=self._cached_data_location,
                         file_name=file_name,
                     )
-                    if self._use_cached_data
-                    else pd.DataFrame()
-                )
+
                 setattr(self, attr_name, data)
 
         if intraday_period and intraday_period not in [
@@ -465,30 +520,76 @@ class Toolkit:
         self._intraday_period = intraday_period
 
         # Load intraday data from cache if specified, otherwise initialize empty DataFrame
-        self._intraday_historical_data: pd.DataFrame = (
-            cache_model.load_cached_data(
-                cached_data_location=self._cached_data_location,
-                file_name="intraday_historical_data.pickle",
-            )
-            if self._use_cached_data
-            else pd.DataFrame()
-        )
+        self._intraday_historical_data: pd.DataFrame = pd.DataFrame()
+
+        if self._use_cached_data:
+            # Only the tickers of this Toolkit are read from the cache
+            if self._intraday_period:
+                self._intraday_historical_data = cache_model.load_ticker_data(
+                    cached_data_location=self._cached_data_location,
+                    source="Toolkit",
+                    endpoint="historical_data",
+                    tickers=(
+                        self._tickers + [self._benchmark_ticker]
+                        if self._benchmark_ticker
+                        else self._tickers
+                    ),
+                    period=self._intraday_period,
+                    params={"start_date": self._start_date},
+                )
+
+            if self._intraday_historical_data.empty:
+                # Caches created before the introduction of the columnar store
+                self._intraday_historical_data = cache_model.load_cached_data(
+                    cached_data_location=self._cached_data_location,
+                    file_name="intraday_historical_data.pickle",
+                )
+
+            # The end date is not part of the key, intraday data that does not cover the
+            # end date can not be extended and is therefore collected again
+            if (
+                not self._intraday_historical_data.empty
+                and self._intraday_historical_data.index[-1].strftime("%Y-%m-%d")
+                < self._end_date
+            ):
+                self._intraday_historical_data = pd.DataFrame()
 
         # Use provided historical data if available, otherwise load daily data from cache or initialize empty DataFrame
         self._historical = historical
 
-        self._daily_historical_data: pd.DataFrame = (
-            historical
-            if not historical.empty
-            else (
-                cache_model.load_cached_data(
+        self._daily_historical_data: pd.DataFrame = historical
+        self._extend_historical_data = False
+
+        if historical.empty and self._use_cached_data:
+            # Only the tickers of this Toolkit are read from the cache. The end date is not part
+            # of the key so that the data can be updated incrementally (see get_historical_data)
+            self._daily_historical_data = cache_model.load_ticker_data(
+                cached_data_location=self._cached_data_location,
+                source="Toolkit",
+                endpoint="historical_data",
+                tickers=(
+                    self._tickers + ["Benchmark"]
+                    if self._benchmark_ticker
+                    else self._tickers
+                ),
+                period="daily",
+                params={"start_date": self._start_date},
+            )
+
+            if self._daily_historical_data.empty:
+                # Caches created before the introduction of the columnar store
+                self._daily_historical_data = cache_model.load_cached_data(
                     cached_data_location=self._cached_data_location,
                     file_name="daily_historical_data.pickle",
                 )
-                if self._use_cached_data
-                else pd.DataFrame()
+
+            # Cached data that does not cover the end date is extended with the missing
+            # dates once the historical data is requested
+            self._extend_historical_data = (
+                not self._daily_historical_data.empty
+                and self._daily_historical_data.index[-1].strftime("%Y-%m-%d")
+                < self._end_date
             )
-        )
 
         # Initialize other periods as empty DataFrames. They will be populated on demand.
         self._weekly_historical_data: pd.DataFrame = pd.DataFrame()
@@ -560,8 +661,181 @@ class Toolkit:
         # Initialization of the Portfolio Variables
         self._portfolio_weights: dict | None = None
 
+        # The daily historical data and rounding each period was converted with and the cached
+        # controllers together with the inputs they were created with
+        self._converted_historical_data: dict[str, tuple[pd.DataFrame, int | None]] = {}
+        self._controllers: dict[str, tuple[list, object]] = {}
+
+        # The results of the Ratios and Models controllers (e.g. collect_all_ratios), shared so
+        # that a result is calculated only once, and the inputs each controller calculated them from
+        self._computation_cache: dict[tuple, object] = {}
+        self._computation_cache_inputs: dict[str, list] = {}
+
         pd.set_option("display.float_format", str)
 
+    def _is_converted(self, period: str, rounding: int | None) -> bool:
+        """
+        Returns whether the historical data of a period was converted from the current
+        daily historical data with the given rounding.
+
+        Args:
+            period (str): The period of the historical data (e.g. "yearly").
+            rounding (int | None): The rounding that is applied to the converted data.
+
+        Returns:
+            bool: Whether the converted historical data can be reused.
+        """
+        daily_historical_data, converted_rounding = self._converted_historical_data.get(
+            period, (None, None)
+        )
+
+        return (
+            daily_historical_data is self._daily_historical_data
+            and converted_rounding == rounding
+        )
+
+    def _get_controller_inputs(self, name: str) -> list:
+        """
+        Returns the inputs of a controller. A cached controller is only reused when
+        all of these inputs are still the same objects or values.
+
+        Args:
+            name (str): The name of the controller (e.g. "ratios").
+
+        Returns:
+            list: The inputs of the controller.
+        """
+        inputs = [getattr(self, attribute) for attribute in CONTROLLER_INPUTS[name]]
+
+        if name == "ratios":
+            # The Ratios are created from either the quarterly or the yearly historical data
+            inputs.append(
+                self._quarterly_historical_data
+                if self._quarterly
+                else self._yearly_historical_data
+            )
+
+        return inputs + [
+            self._tickers,
+            self._start_date,
+            self._end_date,
+            self._quarterly,
+            self._rounding,
+            self._intraday_period,
+            self._portfolio_weights,
+            self._progress_bar,
+        ]
+
+    def _get_cached_controller(self, name: str):
+        """
+        Returns the cached controller if none of its inputs changed since it was created.
+
+        Args:
+            name (str): The name of the controller (e.g. "ratios").
+
+        Returns:
+            Ratios | Models | Options | Technicals | Performance | Risk | None: The cached
+            controller or None if it needs to be created (again).
+        """
+        if name not in self._controllers:
+            return None
+
+        cached_inputs, controller = self._controllers[name]
+
+        if not self._inputs_unchanged(cached_inputs, self._get_controller_inputs(name)):
+            return None
+
+        if hasattr(controller, "_computation_cache"):
+            controller._computation_cache = self._get_computation_cache(name)
+
+        return controller
+
+    def _set_cached_controller(self, name: str, controller):
+        """
+        Caches a controller together with its current inputs. The Ratios and Models controllers
+        are given the shared computation cache.
+
+        Args:
+            name (str): The name of the controller (e.g. "ratios").
+            controller (Ratios | Models | Options | Technicals | Performance | Risk): The controller.
+        """
+        if hasattr(controller, "_computation_cache"):
+            controller._computation_cache = self._get_computation_cache(name)
+
+        self._controllers[name] = (self._get_controller_inputs(name), controller)
+
+    def _get_computation_cache(self, name: str) -> dict:
+        """
+        Returns the computation cache that the Ratios and Models controllers share. The results
+        are stored under the controller, tickers, period, rounding and arguments of the calculation
+        (see `helpers.get_computation_key`) and are kept, even when a controller is created again,
+        until one of the inputs of the controller that calculated them changes.
+
+        Args:
+            name (str): The name of the controller (e.g. "ratios").
+
+        Returns:
+            dict: The computation cache.
+        """
+        current_inputs = self._get_controller_inputs(name)
+
+        if name not in self._computation_cache_inputs or not self._inputs_unchanged(
+            self._computation_cache_inputs[name], current_inputs
+        ):
+            for key in list(self._computation_cache):
+                if key[0] == name:
+                    del self._computation_cache[key]
+
+            self._computation_cache_inputs[name] = current_inputs
+
+        return self._computation_cache
+
+    @staticmethod
+    def _inputs_unchanged(cached_inputs: list, current_inputs: list) -> bool:
+        """
+        Returns whether the inputs are the same, datasets are compared by identity given that
+        they are replaced rather than changed in place.
+
+        Args:
+            cached_inputs (list): The inputs at the time of caching.
+            current_inputs (list): The current inputs.
+
+        Returns:
+            bool: Whether none of the inputs changed.
+        """
+        for cached_input, current_input in zip(cached_inputs, current_inputs):
+            if isinstance(current_input, pd.DataFrame | pd.Series | dict):
+                if cached_input is not current_input:
+                    return False
+            elif cached_input != current_input:
+                return False
+
+        return True
+
+    def _save_ticker_cache(self, endpoint: str, cached_data: pd.DataFrame):
+        """
+        Saves a dataset with the tickers as columns (e.g. the profile) as one cache entry
+        per ticker with the time to live of the dataset. The pickle of the entire dataset,
+        as created by earlier versions, is removed so that it is not used once the entries
+        have expired.
+
+        Args:
+            endpoint (str): The name of the dataset (e.g. "profile").
+            cached_data (pd.DataFrame): The dataset with the tickers as columns.
+        """
+        if cache_model.save_ticker_data(
+            cached_data=cached_data,
+            cached_data_location=self._cached_data_location,
+            source="Toolkit",
+            endpoint=endpoint,
+            time_to_live=cache_model.TIME_TO_LIVE.get(endpoint),
+            level=None,
+        ):
+            cache_model.remove_cached_data(
+                cached_data_location=self._cached_data_location,
+                file_name=f"{endpoint}.pickle",
+            )
+
     @property
     def ratios(self) -> Ratios:
         """
@@ -613,6 +887,11 @@ class Toolkit:
         | EBIT to Revenue                             | 0.286688 | 0.26641  | 0.254864 | 0.305759 | 0.309473 |
 
         """
+        cached_ratios = self._get_cached_controller("ratios")
+
+        if cached_ratios is not None:
+            return cached_ratios
+
         empty_data: list = []
 
         if (
@@ -704,6 +983,8 @@ class Toolkit:
         if self._portfolio_weights:
             ratios._portfolio_weights = self._portfolio_weights
 
+        self._set_cached_controller("ratios", ratios)
+
         return ratios
 
     @property
@@ -738,6 +1019,11 @@ class Toolkit:
         | Equity Multiplier       | nan         | 3.15403   |  3.14263    | 3.08433   | 2.91521   |
         | Return on Equity        | nan         | 0.0213618 |  0.00196098 | 0.0211066 | 0.0417791 |
         """
+        cached_models = self._get_cached_controller("models")
+
+        if cached_models is not None:
+            return cached_models
+
         empty_data: list = []
 
         if not self._api_key and (
@@ -815,7 +1101,7 @@ class Toolkit:
             self._balance_sheet_statement.index.get_level_values(0).unique().tolist()
         )
 
-        return Models(
+        models = Models(
             tickers=tickers,
             historical_data=historical_data,
             risk_free_rate_data=risk_free_rate_data,
@@ -826,6 +1112,10 @@ class Toolkit:
             rounding=self._rounding,
         )
 
+        self._set_cached_controller("models", models)
+
+        return models
+
     @property
     def options(self) -> Options:
         """
@@ -880,6 +1170,11 @@ class Toolkit:
         |            290 |  0      |      -0      | 0      | -0      | 0      |   -0      |   2.401  |  0      |       0      |  0      |  -0      |  0      |  0      |    0      | 0      |  0      |  0      |  0      |   0      |
         |            295 |  0      |      -0      | 0      | -0      | 0      |   -0      |   2.595  |  0      |       0      |  0      |  -0      |  0      |  0      |    0      | 0      |  0      |  0      |  0      |   0      |
         """
+        cached_options = self._get_cached_controller("options")
+
+        if cached_options is not None:
+            return cached_options
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -890,7 +1185,7 @@ class Toolkit:
         self.get_historical_data(period="daily")
         self.get_historical_data(period="yearly")
 
-        return Options(
+        options = Options(
             tickers=self._tickers,
             daily_historical=self._daily_historical_data,
             annual_historical=self._yearly_historical_data,
@@ -899,6 +1194,10 @@ class Toolkit:
             rounding=self._rounding,
         )
 
+        self._set_cached_controller("options", options)
+
+        return options
+
     @property
     def technicals(self) -> Technicals:
         """
@@ -936,6 +1235,11 @@ class Toolkit:
         | 2023-08-25 | 63.4837 | 32.3323 |
 
         """
+        cached_technicals = self._get_cached_controller("technicals")
+
+        if cached_technicals is not None:
+            return cached_technicals
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -980,6 +1284,8 @@ class Toolkit:
         if self._portfolio_weights:
             technicals._portfolio_weights = self._portfolio_weights
 
+        self._set_cached_controller("technicals", technicals)
+
         return technicals
 
     @property
@@ -1015,6 +1321,11 @@ class Toolkit:
         | 2023Q2 |  0.0922 |  0.1342 |
         | 2023Q3 |  0.0052 | -0.0482 |
         """
+        cached_performance = self._get_cached_controller("performance")
+
+        if cached_performance is not None:
+            return cached_performance
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -1069,11 +1380,16 @@ class Toolkit:
             end_date=self._end_date,
             intraday_period=self._intraday_period,
             progress_bar=self._progress_bar,
+            cached_data_location=(
+                self._cached_data_location if self._use_cached_data else None
+            ),
         )
 
         if self._portfolio_weights:
             performance._portfolio_weights = self._portfolio_weights
 
+        self._set_cached_controller("performance", performance)
+
         return performance
 
     @property
@@ -1115,6 +1431,11 @@ class Toolkit:
         | 2022   | -0.8026 | -1.0046 |
         | 2023   |  1.8549 |  1.8238 |
         """
+        cached_risk = self._get_cached_controller("risk")
+
+        if cached_risk is not None:
+            return cached_risk
+
         if not self._start_date:
             self._start_date = (datetime.today() - timedelta(days=365 * 10)).strftime(
                 "%Y-%m-%d"
@@ -1159,6 +1480,8 @@ class Toolkit:
         if self._portfolio_weights:
             risk._portfolio_weights = self._portfolio_weights
 
+        self._set_cached_controller("risk", risk)
+
         return risk
 
     @property
@@ -1335,11 +1658,7 @@ class Toolkit:
             )
 
             if self._use_cached_data:
-                cache_model.save_cached_data(
-                    cached_data=self._profile,
-                    cached_data_location=self._cached_data_location,
-                    file_name="profile.pickle",
-                )
+                self._save_ticker_cache(endpoint="profile", cached_data=self._profile)
 
         if self._remove_invalid_tickers:
             self._tickers = [
@@ -1416,11 +1735,7 @@ class Toolkit:
             )
 
             if self._use_cached_data:
-                cache_model.save_cached_data(
-                    cached_data=self._quote,
-                    cached_data_location=self._cached_data_location,
-                    file_name="quote.pickle",
-                )
+                self._save_ticker_cache(endpoint="quote", cached_data=self._quote)
 
         if self._remove_invalid_tickers:
             self._tickers = [
@@ -1512,6 +1827,103 @@ class Toolkit:
 
         return self._rating
 
+    async def aget_profile(self):
+        """
+        Obtain the profile of the specified tickers asynchronously. This is the asynchronous
+        equivalent of get_profile and returns the same result, which makes it possible to
+        collect data from within a running event loop (e.g. a web server) without blocking it.
+
+        As an example:
+
+        ```python
+        import asyncio
+
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["MSFT", "AAPL"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        asyncio.run(toolkit.aget_profile())
+        ```
+        """
+        # Without an api_key nothing is collected and get_profile reports the missing key
+        if self._api_key and self._profile.empty:
+            self._profile, self._invalid_tickers = await _aget_profile(
+                tickers=self._tickers,
+                api_key=self._api_key,
+                user_subscription=self._fmp_plan,
+            )
+
+            if self._use_cached_data:
+                self._save_ticker_cache(endpoint="profile", cached_data=self._profile)
+
+        return self.get_profile()
+
+    async def aget_quote(self):
+        """
+        Obtain the quote of the specified tickers asynchronously. This is the asynchronous
+        equivalent of get_quote and returns the same result, which makes it possible to
+        collect data from within a running event loop (e.g. a web server) without blocking it.
+
+        As an example:
+
+        ```python
+        import asyncio
+
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["TSLA", "AAPL"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        asyncio.run(toolkit.aget_quote())
+        ```
+        """
+        # Without an api_key nothing is collected and get_quote reports the missing key
+        if self._api_key and self._quote.empty:
+            self._quote, self._invalid_tickers = await _aget_quote(
+                tickers=self._tickers,
+                api_key=self._api_key,
+                user_subscription=self._fmp_plan,
+            )
+
+            if self._use_cached_data:
+                self._save_ticker_cache(endpoint="quote", cached_data=self._quote)
+
+        return self.get_quote()
+
+    async def aget_rating(self):
+        """
+        Obtain the rating of the specified tickers asynchronously. This is the asynchronous
+        equivalent of get_rating and returns the same result, which makes it possible to
+        collect data from within a running event loop (e.g. a web server) without blocking it.
+
+        As an example:
+
+        ```python
+        import asyncio
+
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AMZN", "TSLA"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        asyncio.run(toolkit.aget_rating())
+        ```
+        """
+        # Without an api_key nothing is collected and get_rating reports the missing key
+        if self._api_key and self._rating.empty:
+            self._rating, self._invalid_tickers = await _aget_rating(
+                tickers=self._tickers,
+                api_key=self._api_key,
+                user_subscription=self._fmp_plan,
+            )
+
+            if self._use_cached_data:
+                cache_model.save_cached_data(
+                    cached_data=self._rating,
+                    cached_data_location=self._cached_data_location,
+                    file_name="rating.pickle",
+                )
+
+        return self.get_rating()
+
     def get_analyst_estimates(
         self,
         overwrite: bool = False,
@@ -1918,6 +2330,7 @@ class Toolkit:
         rounding: int | None = None,
         show_ticker_seperation: bool = True,
         progress_bar: bool | None = None,
+        incremental: bool = False,
     ):
         """
         Returns historical data for the specified tickers. This contains the following columns:
@@ -1963,6 +2376,9 @@ class Toolkit:
             show_ticker_seperation (bool, optional): A boolean representing whether to show which tickers
             acquired data from FinancialModelingPrep and which tickers acquired data from YahooFinance.
             progress_bar (bool, optional): Whether to show a progress bar. Defaults to None.
+            incremental (bool, optional): Whether to only retrieve the dates after the last available date of
+            the earlier retrieved (or cached) data. The history of a ticker is retrieved again entirely if it has
+            changed, e.g. due to a stock split or dividend. Defaults to False.
 
         Raises:
             ValueError: If an invalid value is specified for period.
@@ -2011,34 +2427,72 @@ class Toolkit:
                 fill_nan=fill_nan,
             )
 
-        if self._daily_historical_data.empty or overwrite:
-            self._daily_historical_data, self._invalid_tickers = _get_historical_data(
-                tickers=(
-                    self._tickers + [self._benchmark_ticker]
-                    if self._benchmark_ticker
-                    else self._tickers
-                ),
-                api_key=self._api_key,
-                enforce_source=(
-                    enforce_source
-                    if enforce_source is not None
-                    else self._enforce_source
-                ),
-                start=self._start_date,
-                end=self._end_date,
-                interval="1d",
-                return_column=return_column,
-                risk_free_rate=self._daily_risk_free_rate,
-                include_dividends=include_dividends,
-                progress_bar=(
-                    progress_bar if progress_bar is not None else self._progress_bar
-                ),
-                fill_nan=fill_nan,
-                rounding=rounding if rounding else self._rounding,
-                sleep_timer=self._sleep_timer,
-                show_ticker_seperation=show_ticker_seperation,
-                show_errors=True,
-            )
+        if self._extend_historical_data:
+            incremental = True
+            self._extend_historical_data = False
+
+        if self._daily_historical_data.empty or overwrite or incremental:
+            if incremental and not self._daily_historical_data.empty and not overwrite:
+                self._daily_historical_data, self._invalid_tickers = (
+                    _update_historical_data(
+                        historical_data=self._daily_historical_data.rename(
+                            columns={"Benchmark": self._benchmark_ticker}, level=1
+                        ),
+                        api_key=self._api_key,
+                        enforce_source=(
+                            enforce_source
+                            if enforce_source is not None
+                            else self._enforce_source
+                        ),
+                        start=self._start_date,
+                        end=self._end_date,
+                        return_column=return_column,
+                        risk_free_rate=self._daily_risk_free_rate,
+                        include_dividends=include_dividends,
+                        progress_bar=(
+                            progress_bar
+                            if progress_bar is not None
+                            else self._progress_bar
+                        ),
+                        fill_nan=fill_nan,
+                        rounding=rounding if rounding else self._rounding,
+                        sleep_timer=self._sleep_timer,
+                        show_errors=True,
+                        user_subscription=self._fmp_plan,
+                    )
+                )
+            else:
+                self._daily_historical_data, self._invalid_tickers = (
+                    _get_historical_data(
+                        tickers=(
+                            self._tickers + [self._benchmark_ticker]
+                            if self._benchmark_ticker
+                            else self._tickers
+                        ),
+                        api_key=self._api_key,
+                        enforce_source=(
+                            enforce_source
+                            if enforce_source is not None
+                            else self._enforce_source
+                        ),
+                        start=self._start_date,
+                        end=self._end_date,
+                        interval="1d",
+                        return_column=return_column,
+                        risk_free_rate=self._daily_risk_free_rate,
+                        include_dividends=include_dividends,
+                        progress_bar=(
+                            progress_bar
+                            if progress_bar is not None
+                            else self._progress_bar
+                        ),
+                        fill_nan=fill_nan,
+                        rounding=rounding if rounding else self._rounding,
+                        sleep_timer=self._sleep_timer,
+                        show_ticker_seperation=show_ticker_seperation,
+                        show_errors=True,
+                    )
+                )
 
             # Change the benchmark ticker name to Benchmark
             if not self._daily_historical_data.empty:
@@ -2047,10 +2501,13 @@ class Toolkit:
                 )
 
             if self._use_cached_data:
-                cache_model.save_cached_data(
+                cache_model.save_ticker_data(
                     cached_data=self._daily_historical_data,
                     cached_data_location=self._cached_data_location,
-                    file_name="daily_historical_data.pickle",
+                    source="Toolkit",
+                    endpoint="historical_data",
+                    period="daily",
+                    params={"start_date": self._start_date},
                 )
 
         if self._remove_invalid_tickers:
@@ -2080,14 +2537,24 @@ class Toolkit:
                     period="weekly", risk_free_rate=self._risk_free_rate
                 )
 
-            self._weekly_historical_data = _convert_daily_to_other_period(
-                period="weekly",
-                daily_historical_data=self._daily_historical_data,
-                start=self._start_date,
-                end=self._end_date,
-                risk_free_rate=self._weekly_risk_free_rate,
-                rounding=rounding if rounding else self._rounding,
-            )
+            # The conversion is only repeated when the daily data or the rounding changed
+            conversion_rounding = rounding if rounding else self._rounding
+
+            if overwrite or not self._is_converted(
+                period="weekly", rounding=conversion_rounding
+            ):
+                self._weekly_historical_data = _convert_daily_to_other_period(
+                    period="weekly",
+                    daily_historical_data=self._daily_historical_data,
+                    start=self._start_date,
+                    end=self._end_date,
+                    risk_free_rate=self._weekly_risk_free_rate,
+                    rounding=conversion_rounding,
+                )
+                self._converted_historical_data["weekly"] = (
+                    self._daily_historical_data,
+                    conversion_rounding,
+                )
 
             historical_data = self._weekly_historical_data.loc[
                 self._start_date : self._end_date, :
@@ -2105,14 +2572,24 @@ class Toolkit:
                     period="monthly", risk_free_rate=self._risk_free_rate
                 )
 
-            self._monthly_historical_data = _convert_daily_to_other_period(
-                period="monthly",
-                daily_historical_data=self._daily_historical_data,
-                start=self._start_date,
-                end=self._end_date,
-                risk_free_rate=self._monthly_risk_free_rate,
-                rounding=rounding if rounding else self._rounding,
-            )
+            # The conversion is only repeated when the daily data or the rounding changed
+            conversion_rounding = rounding if rounding else self._rounding
+
+            if overwrite or not self._is_converted(
+                period="monthly", rounding=conversion_rounding
+            ):
+                self._monthly_historical_data = _convert_daily_to_other_period(
+                    period="monthly",
+                    daily_historical_data=self._daily_historical_data,
+                    start=self._start_date,
+                    end=self._end_date,
+                    risk_free_rate=self._monthly_risk_free_rate,
+                    rounding=conversion_rounding,
+                )
+                self._converted_historical_data["monthly"] = (
+                    self._daily_historical_data,
+                    conversion_rounding,
+                )
 
             historical_data = self._monthly_historical_data.loc[
                 self._start_date : self._end_date, :
@@ -2130,14 +2607,24 @@ class Toolkit:
                     period="quarterly", risk_free_rate=self._risk_free_rate
                 )
 
-            self._quarterly_historical_data = _convert_daily_to_other_period(
-                period="quarterly",
-                daily_historical_data=self._daily_historical_data,
-                start=self._start_date,
-                end=self._end_date,
-                risk_free_rate=self._quarterly_risk_free_rate,
-                rounding=rounding if rounding else self._rounding,
-            )
+            # The conversion is only repeated when the daily data or the rounding changed
+            conversion_rounding = rounding if rounding else self._rounding
+
+            if overwrite or not self._is_converted(
+                period="quarterly", rounding=conversion_rounding
+            ):
+                self._quarterly_historical_data = _convert_daily_to_other_period(
+                    period="quarterly",
+                    daily_historical_data=self._daily_historical_data,
+                    start=self._start_date,
+                    end=self._end_date,
+                    risk_free_rate=self._quarterly_risk_free_rate,
+                    rounding=conversion_rounding,
+                )
+                self._converted_historical_data["quarterly"] = (
+                    self._daily_historical_data,
+                    conversion_rounding,
+                )
 
             historical_data = self._quarterly_historical_data.loc[
                 self._start_date : self._end_date, :
@@ -2155,14 +2642,24 @@ class Toolkit:
                     period="yearly", risk_free_rate=self._risk_free_rate
                 )
 
-            self._yearly_historical_data = _convert_daily_to_other_period(
-                period="yearly",
-                daily_historical_data=self._daily_historical_data,
-                start=self._start_date,
-                end=self._end_date,
-                risk_free_rate=self._yearly_risk_free_rate,
-                rounding=rounding if rounding else self._rounding,
-            )
+            # The conversion is only repeated when the daily data or the rounding changed
+            conversion_rounding = rounding if rounding else self._rounding
+
+            if overwrite or not self._is_converted(
+                period="yearly", rounding=conversion_rounding
+            ):
+                self._yearly_historical_data = _convert_daily_to_other_period(
+                    period="yearly",
+                    daily_historical_data=self._daily_historical_data,
+                    start=self._start_date,
+                    end=self._end_date,
+                    risk_free_rate=self._yearly_risk_free_rate,
+                    rounding=conversion_rounding,
+                )
+                self._converted_historical_data["yearly"] = (
+                    self._daily_historical_data,
+                    conversion_rounding,
+                )
 
             historical_data = self._yearly_historical_data.loc[
                 self._start_date : self._end_date, :
@@ -2178,6 +2675,126 @@ class Toolkit:
             "Please choose from daily, weekly, monthly, quarterly or yearly as period."
         )
 
+    async def aget_historical_data(
+        self,
+        enforce_source: str | None = None,
+        period: str = "daily",
+        return_column: str = "Adj Close",
+        include_dividends: bool = True,
+        fill_nan: bool = True,
+        overwrite: bool = False,
+        rounding: int | None = None,
+        show_ticker_seperation: bool = True,
+    ):
+        """
+        Returns historical data for the specified tickers asynchronously. This is the asynchronous
+        equivalent of get_historical_data and returns the same result. The daily historical data
+        of all tickers is collected concurrently on the running event loop after which the
+        conversion to the requested period is done in the same way as get_historical_data.
+
+        Args:
+            enforce_source (str, optional): A string representing the source to use. Defaults to None.
+            period (str, optional): The interval at which the historical data should be
+            returned - daily, weekly, monthly, quarterly, or yearly. Defaults to "daily".
+            return_column (str, optional): The column to use for return calculations. Defaults to "Adj Close".
+            include_dividends (bool, optional): Whether to include dividends in the historical data.
+            Defaults to True.
+            fill_nan (bool, optional): Whether to fill NaN values. Defaults to True.
+            overwrite (bool, optional): Whether to overwrite the existing data. Defaults to False.
+            rounding (int, optional): The number of decimals to round the results to. Defaults to None.
+            show_ticker_seperation (bool, optional): Whether to show which tickers acquired data
+            from FinancialModelingPrep and which from YahooFinance. Defaults to True.
+
+        Returns:
+            pd.DataFrame: The historical data for the specified tickers.
+
+        As an example:
+
+        ```python
+        import asyncio
+
+        from financetoolkit import Toolkit
+
+        toolkit = Toolkit(["AAPL", "MSFT"], api_key="FINANCIAL_MODELING_PREP_KEY")
+
+        asyncio.run(toolkit.aget_historical_data(period="yearly"))
+        ```
+        """
+        if enforce_source is not None and enforce_source not in [
+            "FinancialModelingPrep",
+            "YahooFinance",
+        ]:
+            raise ValueError(
+                "The enforce_source parameter must be either 'FinancialModelingPrep' or 'YahooFinance'."
+            )
+
+        if self._daily_risk_free_rate.empty or overwrite:
+            await asyncio.to_thread(
+                self.get_treasury_data,
+                risk_free_rate=self._risk_free_rate,
+                show_errors=False,
+                fill_nan=fill_nan,
+            )
+
+        if self._daily_historical_data.empty or overwrite:
+            self._daily_historical_data, self._invalid_tickers = (
+                await _aget_historical_data(
+                    tickers=(
+                        self._tickers + [self._benchmark_ticker]
+                        if self._benchmark_ticker
+                        else self._tickers
+                    ),
+                    api_key=self._api_key,
+                    enforce_source=(
+                        enforce_source
+                        if enforce_source is not None
+                        else self._enforce_source
+                    ),
+                    start=self._start_date,
+                    end=self._end_date,
+                    interval="1d",
+                    return_column=return_column,
+                    risk_free_rate=self._daily_risk_free_rate,
+                    include_dividends=include_dividends,
+                    fill_nan=fill_nan,
+                    rounding=rounding if rounding else self._rounding,
+                    sleep_timer=self._sleep_timer,
+                    show_ticker_seperation=show_ticker_seperation,
+                    show_errors=True,
+                    user_subscription=self._fmp_plan,
+                )
+            )
+
+            # Change the benchmark ticker name to Benchmark
+            if not self._daily_historical_data.empty:
+                self._daily_historical_data = self._daily_historical_data.rename(
+                    columns={self._benchmark_ticker: "Benchmark"}, level=1
+                )
+
+            if self._use_cached_data:
+                cache_model.save_ticker_data(
+                    cached_data=self._daily_historical_data,
+                    cached_data_location=self._cached_data_location,
+                    source="Toolkit",
+                    endpoint="historical_data",
+                    period="daily",
+                    params={"start_date": self._start_date},
+                )
+
+        # The period conversions only use the data collected above and thus
+        # run in a worker thread to keep the event loop responsive.
+        return await asyncio.to_thread(
+            self.get_historical_data,
+            enforce_source=enforce_source,
+            period=period,
+            return_column=return_column,
+            include_dividends=include_dividends,
+            fill_nan=fill_nan,
+            overwrite=False,
+            rounding=rounding,
+            show_ticker_seperation=show_ticker_seperation,
+        )
+
     def get_intraday_data(
         self,
         period: str = "1hour",
@@ -2296,10 +2913,13 @@ class Toolkit:
             )
 
             if self._use_cached_data:
-                cache_model.save_cached_data(
+                cache_model.save_ticker_data(
                     cached_data=self._intraday_historical_data,
                     cached_data_location=self._cached_data_location,
-                    file_name="intraday_historical_data.pickle",
+                    source="Toolkit",
+                    endpoint="historical_data",
+                    period=period,
+                    params={"start_date": self._start_date},
                 )
 
         # Save the period to prevent having to reacquire the data
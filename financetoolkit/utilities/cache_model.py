@@ -2,8 +2,14 @@
 
 __docformat__ = "google"
 
+import hashlib
+import importlib.util
+import json
 import os
 import pickle
+import tempfile
+import time
+from collections.abc import Callable
 
 import pandas as pd
 
@@ -11,7 +17,22 @@ from financetoolkit.utilities import logger_model
 
 logger = logger_model.get_logger()
 
-# pylint: disable=comparison-with-itself,too-many-locals,protected-access
+# Check if pyarrow is installed, this is required for the columnar (Parquet) cache
+pyarrow_spec = importlib.util.find_spec("pyarrow")
+ENABLE_PYARROW = pyarrow_spec is not None
+
+# pylint: disable=comparison-with-itself,too-many-locals,protected-access,too-many-arguments
+
+# The version of the cache layout, entries written with another version are ignored
+CACHE_VERSION = 1
+STORE_DIRECTORY = "store"
+
+# The number of seconds the cache entries of the Toolkit remain valid, datasets that are
+# not listed here do not expire
+TIME_TO_LIVE: dict[str, float] = {
+    "profile": 7 * 24 * 60 * 60,
+    "quote": 24 * 60 * 60,
+}
 
 
 def load_cached_data(
@@ -55,28 +76,604 @@ def save_cached_data(
     include_message: bool = True,
 ):
     """
-    Save the cached data to the specified location and file name.
+    Save the cached data to the specified location and file name. An existing file is
+    replaced atomically so that the cached data can be refreshed.
 
     Args:
+        cached_data (pd.DataFrame | dict): The data to save.
         cached_data_location (str): The location to save the cached data.
         file_name (str): The name of the file to save.
+        method (str): The method to use for saving the data, either "pandas" or "pickle".
+        include_message (bool): Whether to log a message once the data is saved.
     """
-    os.makedirs(cached_data_location, exist_ok=True)
-
-    if file_name in os.listdir(cached_data_location):
-        # When the file already exists do nothing.
-        pass
-    else:
-        try:
-            if method == "pandas":
-                cached_data.to_pickle(f"{cached_data_location}/{file_name}")
-            elif method == "pickle":
-                with open(f"{cached_data_location}/{file_name}", "wb") as file:
+    try:
+        if method == "pandas":
+            _write_atomically(
+                f"{cached_data_location}/{file_name}", cached_data.to_pickle
+            )
+        elif method == "pickle":
+
+            def write_pickle(path):
+                with open(path, "wb") as file:
                     pickle.dump(cached_data, file, protocol=pickle.HIGHEST_PROTOCOL)
 
-            if include_message:
-                logger.info(
-                    "The data has been saved to %s/%s", cached_data_location, file_name
-                )
-        except Exception as error:  # pylint: disable=broad-except
-            logger.error("An error occurred while saving the data: %s", error)
+            _write_atomically(f"{cached_data_location}/{file_name}", write_pickle)
+
+        if include_message:
+            logger.info(
+                "The data has been saved to %s/%s", cached_data_location, file_name
+            )
+    except Exception as error:  # pylint: disable=broad-except
+        logger.error("An error occurred while saving the data: %s", error)
+
+
+def remove_cached_data(cached_data_location: str, file_name: str) -> bool:
+    """
+    Removes the cached data with the specified location and file name, if it exists.
+
+    Args:
+        cached_data_location (str): The location of the cached data.
+        file_name (str): The name of the file to remove.
+
+    Returns:
+        bool: Whether a file was removed.
+    """
+    try:
+        os.remove(f"{cached_data_location}/{file_name}")
+    except FileNotFoundError:
+        return False
+
+    return True
+
+
+def get_cache_key(
+    source: str,
+    endpoint: str,
+    ticker: str | None = None,
+    period: str | None = None,
+    params: dict | None = None,
+) -> str:
+    """
+    Creates the key of a cache entry. The key is the hash of the source, endpoint, ticker,
+    period and parameters so that any change in the request results in a different entry.
+
+    Args:
+        source (str): The source of the data (e.g. "FinancialModelingPrep").
+        endpoint (str): The endpoint or dataset name (e.g. "daily_historical_data").
+        ticker (str | None): The ticker the data belongs to, if any.
+        period (str | None): The period of the data (e.g. "daily"), if any.
+        params (dict | None): Any other parameters that influence the data.
+
+    Returns:
+        str: The hexadecimal key of the cache entry.
+    """
+    key = json.dumps(
+        {
+            "version": CACHE_VERSION,
+            "source": source,
+            "endpoint": endpoint,
+            "ticker": ticker,
+            "period": period,
+            "params": params or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def save_entry(
+    cached_data: pd.DataFrame,
+    cached_data_location: str,
+    source: str,
+    endpoint: str,
+    ticker: str | None = None,
+    period: str | None = None,
+    params: dict | None = None,
+    time_to_live: float | None = None,
+    metadata: dict | None = None,
+) -> bool:
+    """
+    Saves a DataFrame as a single cache entry. The data is stored in the Parquet format
+    when pyarrow is installed and the columns allow for it, otherwise it is pickled. Next
+    to the data a small manifest is stored that contains the creation time and the time
+    to live of the entry. Both files are written atomically so that concurrent readers
+    never observe a partially written entry.
+
+    Args:
+        cached_data (pd.DataFrame): The data to save.
+        cached_data_location (str): The location of the cached data.
+        source (str): The source of the data.
+        endpoint (str): The endpoint or dataset name.
+        ticker (str | None): The ticker the data belongs to, if any.
+        period (str | None): The period of the data, if any.
+        params (dict | None): Any other parameters that influence the data.
+        time_to_live (float | None): The number of seconds the entry is valid for. Defaults
+            to None which means that the entry does not expire.
+        metadata (dict | None): Any information about the origin of the data that should be
+            kept in the manifest, e.g. the validators returned by a web server.
+
+    Returns:
+        bool: Whether the entry was saved.
+    """
+    key = get_cache_key(
+        source=source, endpoint=endpoint, ticker=ticker, period=period, params=params
+    )
+    data_path, manifest_path = _get_entry_paths(
+        cached_data_location=cached_data_location,
+        source=source,
+        endpoint=endpoint,
+        key=key,
+    )
+
+    try:
+        data_format = "pickle"
+
+        if ENABLE_PYARROW and _is_columnar(cached_data):
+            try:
+                _write_atomically(f"{data_path}.parquet", cached_data.to_parquet)
+                data_format = "parquet"
+            except (ValueError, TypeError, NotImplementedError):
+                # Mixed or unsupported data types, these are stored as a pickle instead
+                pass
+
+        if data_format == "pickle":
+            _write_atomically(f"{data_path}.pickle", cached_data.to_pickle)
+
+        # An entry that was previously stored in the other format is removed
+        stale_path = (
+            f"{data_path}.{'pickle' if data_format == 'parquet' else 'parquet'}"
+        )
+
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+        manifest = {
+            "version": CACHE_VERSION,
+            "source": source,
+            "endpoint": endpoint,
+            "ticker": ticker,
+            "period": period,
+            "params": params or {},
+            "created": time.time(),
+            "time_to_live": time_to_live,
+            "format": data_format,
+            "metadata": metadata or {},
+        }
+
+        _write_manifest(manifest_path, manifest)
+    except Exception as error:  # pylint: disable=broad-except
+        logger.error("An error occurred while saving the data: %s", error)
+
+        return False
+
+    return True
+
+
+def load_entry(
+    cached_data_location: str,
+    source: str,
+    endpoint: str,
+    ticker: str | None = None,
+    period: str | None = None,
+    params: dict | None = None,
+    columns: list[str] | None = None,
+    include_expired: bool = False,
+) -> pd.DataFrame:
+    """
+    Loads a single cache entry. Parquet entries are memory-mapped and only the requested
+    columns are read from disk.
+
+    Args:
+        cached_data_location (str): The location of the cached data.
+        source (str): The source of the data.
+        endpoint (str): The endpoint or dataset name.
+        ticker (str | None): The ticker the data belongs to, if any.
+        period (str | None): The period of the data, if any.
+        params (dict | None): Any other parameters that influence the data.
+        columns (list[str] | None): The columns to load. Defaults to None which loads all columns.
+        include_expired (bool): Whether to also return an entry that has expired, e.g. when
+            the data can not be refreshed. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The cached data or an empty DataFrame if the entry does not
+        exist or has expired.
+    """
+    key = get_cache_key(
+        source=source, endpoint=endpoint, ticker=ticker, period=period, params=params
+    )
+    data_path, manifest_path = _get_entry_paths(
+        cached_data_location=cached_data_location,
+        source=source,
+        endpoint=endpoint,
+        key=key,
+    )
+
+    manifest = _read_manifest(manifest_path)
+
+    if not manifest or (not include_expired and is_expired(manifest)):
+        return pd.DataFrame()
+
+    try:
+        if manifest["format"] == "parquet":
+            return pd.read_parquet(
+                f"{data_path}.parquet", columns=columns, memory_map=True
+            )
+
+        cached_data = pd.read_pickle(f"{data_path}.pickle")
+    except (FileNotFoundError, ImportError):
+        return pd.DataFrame()
+
+    if columns is not None:
+        cached_data = cached_data[columns]
+
+    return cached_data
+
+
+def load_manifest(
+    cached_data_location: str,
+    source: str,
+    endpoint: str,
+    ticker: str | None = None,
+    period: str | None = None,
+    params: dict | None = None,
+) -> dict:
+    """
+    Loads the manifest of a single cache entry, which describes when the entry was created,
+    how long it remains valid and any metadata that was saved alongside it.
+
+    Args:
+        cached_data_location (str): The location of the cached data.
+        source (str): The source of the data.
+        endpoint (str): The endpoint or dataset name.
+        ticker (str | None): The ticker the data belongs to, if any.
+        period (str | None): The period of the data, if any.
+        params (dict | None): Any other parameters that influence the data.
+
+    Returns:
+        dict: The manifest or an empty dictionary if the entry does not exist.
+    """
+    key = get_cache_key(
+        source=source, endpoint=endpoint, ticker=ticker, period=period, params=params
+    )
+    _, manifest_path = _get_entry_paths(
+        cached_data_location=cached_data_location,
+        source=source,
+        endpoint=endpoint,
+        key=key,
+    )
+
+    return _read_manifest(manifest_path)
+
+
+def refresh_entry(
+    cached_data_location: str,
+    source: str,
+    endpoint: str,
+    ticker: str | None = None,
+    period: str | None = None,
+    params: dict | None = None,
+) -> bool:
+    """
+    Marks a cache entry as freshly created without rewriting its data. This is used when the
+    source confirms that the data has not changed since the entry was saved.
+
+    Args:
+        cached_data_location (str): The location of the cached data.
+        source (str): The source of the data.
+        endpoint (str): The endpoint or dataset name.
+        ticker (str | None): The ticker the data belongs to, if any.
+        period (str | None): The period of the data, if any.
+        params (dict | None): Any other parameters that influence the data.
+
+    Returns:
+        bool: Whether the entry was refreshed.
+    """
+    key = get_cache_key(
+        source=source, endpoint=endpoint, ticker=ticker, period=period, params=params
+    )
+    _, manifest_path = _get_entry_paths(
+        cached_data_location=cached_data_location,
+        source=source,
+        endpoint=endpoint,
+        key=key,
+    )
+
+    manifest = _read_manifest(manifest_path)
+
+    if not manifest:
+        return False
+
+    manifest["created"] = time.time()
+
+    try:
+        _write_manifest(manifest_path, manifest)
+    except OSError as error:
+        logger.error("An error occurred while refreshing the data: %s", error)
+
+        return False
+
+    return True
+
+
+def save_ticker_data(
+    cached_data: pd.DataFrame,
+    cached_data_location: str,
+    source: str,
+    endpoint: str,
+    period: str | None = None,
+    params: dict | None = None,
+    time_to_live: float | None = None,
+    level: int | None = 1,
+) -> bool:
+    """
+    Saves a DataFrame that has the tickers in one of the column levels (e.g. the historical
+    data) or as the columns themselves (e.g. the profile) as one cache entry per ticker. This
+    makes it possible to only load the tickers that are needed instead of the entire universe.
+
+    Args:
+        cached_data (pd.DataFrame): The data to save with a MultiIndex as columns.
+        cached_data_location (str): The location of the cached data.
+        source (str): The source of the data.
+        endpoint (str): The endpoint or dataset name.
+        period (str | None): The period of the data, if any.
+        params (dict | None): Any other parameters that influence the data.
+        time_to_live (float | None): The number of seconds the entries are valid for.
+        level (int | None): The column level that contains the tickers or None when the
+            columns are the tickers. Defaults to 1.
+
+    Returns:
+        bool: Whether all entries were saved.
+    """
+    if cached_data.empty:
+        return False
+
+    saved = [
+        save_entry(
+            cached_data=(
+                cached_data[[ticker]]
+                if level is None
+                else cached_data.xs(ticker, level=level, axis=1)
+            ),
+            cached_data_location=cached_data_location,
+            source=source,
+            endpoint=endpoint,
+            ticker=ticker,
+            period=period,
+            params=params,
+            time_to_live=time_to_live,
+        )
+        for ticker in (
+            cached_data.columns
+            if level is None
+            else cached_data.columns.get_level_values(level).unique()
+        )
+    ]
+
+    return all(saved)
+
+
+def load_ticker_data(
+    cached_data_location: str,
+    source: str,
+    endpoint: str,
+    tickers: list[str],
+    period: str | None = None,
+    params: dict | None = None,
+    columns: list[str] | None = None,
+    level: int | None = 1,
+) -> pd.DataFrame:
+    """
+    Loads the cache entries of the given tickers that were saved with save_ticker_data and
+    combines them into a single DataFrame with the tickers in the given column level.
+
+    Args:
+        cached_data_location (str): The location of the cached data.
+        source (str): The source of the data.
+        endpoint (str): The endpoint or dataset name.
+        tickers (list[str]): The tickers to load.
+        period (str | None): The period of the data, if any.
+        params (dict | None): Any other parameters that influence the data.
+        columns (list[str] | None): The columns to load. Defaults to None which loads all columns.
+        level (int | None): The column level that should contain the tickers or None when the
+            columns are the tickers. Defaults to 1.
+
+    Returns:
+        pd.DataFrame: The cached data or an empty DataFrame if any of the tickers is
+        missing or has expired so that the data can be collected again.
+    """
+    ticker_data: dict[str, pd.DataFrame] = {}
+
+    for ticker in tickers:
+        data = load_entry(
+            cached_data_location=cached_data_location,
+            source=source,
+            endpoint=endpoint,
+            ticker=ticker,
+            period=period,
+            params=params,
+            columns=columns,
+        )
+
+        if data.empty:
+            return pd.DataFrame()
+
+        ticker_data[ticker] = data
+
+    if not ticker_data:
+        return pd.DataFrame()
+
+    if level is None:
+        return pd.concat(ticker_data.values(), axis=1)
+
+    fields = list(
+        dict.fromkeys(field for data in ticker_data.values() for field in data.columns)
+    )
+
+    cached_data = pd.concat(ticker_data, axis=1).sort_index()
+
+    if level == 1:
+        cached_data = cached_data.swaplevel(0, 1, axis=1).reindex(
+            columns=pd.MultiIndex.from_product([fields, tickers])
+        )
+
+    return cached_data
+
+
+def remove_expired_entries(cached_data_location: str) -> int:
+    """
+    Removes all expired entries from the cache.
+
+    Args:
+        cached_data_location (str): The location of the cached data.
+
+    Returns:
+        int: The number of removed entries.
+    """
+    removed = 0
+
+    for directory, _, file_names in os.walk(
+        os.path.join(cached_data_location, STORE_DIRECTORY)
+    ):
+        for file_name in file_names:
+            if not file_name.endswith(".json"):
+                continue
+
+            manifest_path = os.path.join(directory, file_name)
+            manifest = _read_manifest(manifest_path)
+
+            if manifest and not is_expired(manifest):
+                continue
+
+            data_path = manifest_path.removesuffix(".json")
+
+            for path in [manifest_path, f"{data_path}.parquet", f"{data_path}.pickle"]:
+                if os.path.exists(path):
+                    os.remove(path)
+
+            removed += 1
+
+    return removed
+
+
+def _get_entry_paths(
+    cached_data_location: str, source: str, endpoint: str, key: str
+) -> tuple[str, str]:
+    """
+    Returns the location of the data (without extension) and manifest of a cache entry. Entries
+    are spread over subdirectories based on the start of their key.
+
+    Args:
+        cached_data_location (str): The location of the cached data.
+        source (str): The source of the data.
+        endpoint (str): The endpoint or dataset name.
+        key (str): The key of the entry.
+
+    Returns:
+        tuple[str, str]: The data path without extension and the manifest path.
+    """
+    directory = os.path.join(
+        cached_data_location, STORE_DIRECTORY, source, endpoint, key[:2]
+    )
+    data_path = os.path.join(directory, key)
+
+    return data_path, f"{data_path}.json"
+
+
+def _read_manifest(manifest_path: str) -> dict:
+    """
+    Reads the manifest of a cache entry.
+
+    Args:
+        manifest_path (str): The location of the manifest.
+
+    Returns:
+        dict: The manifest or an empty dictionary if it does not exist or is invalid.
+    """
+    try:
+        with open(manifest_path, encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    if manifest.get("version") != CACHE_VERSION:
+        return {}
+
+    return manifest
+
+
+def _write_manifest(manifest_path: str, manifest: dict):
+    """
+    Writes the manifest of a cache entry atomically.
+
+    Args:
+        manifest_path (str): The location of the manifest.
+        manifest (dict): The manifest of the entry.
+    """
+
+    def write_manifest(path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file, default=str)
+
+    _write_atomically(manifest_path, write_manifest)
+
+
+def is_expired(manifest: dict) -> bool:
+    """
+    Checks whether a cache entry has expired.
+
+    Args:
+        manifest (dict): The manifest of the entry.
+
+    Returns:
+        bool: Whether the entry has expired.
+    """
+    time_to_live = manifest.get("time_to_live")
+
+    if time_to_live is None:
+        return False
+
+    return time.time() > manifest["created"] + time_to_live
+
+
+def _is_columnar(cached_data: pd.DataFrame) -> bool:
+    """
+    Checks whether a DataFrame can be stored in a columnar format, which requires
+    a single level of string column names.
+
+    Args:
+        cached_data (pd.DataFrame): The data to check.
+
+    Returns:
+        bool: Whether the DataFrame can be stored in a columnar format.
+    """
+    return isinstance(cached_data, pd.DataFrame) and all(
+        isinstance(column, str) for column in cached_data.columns
+    )
+
+
+def _write_atomically(path: str, write_function: Callable[[str], None]):
+    """
+    Writes a file by first writing to a temporary file in the same directory and then
+    replacing the target. This ensures that a file is either fully written or not at all.
+
+    Args:
+        path (str): The location of the file.
+        write_function (Callable[[str], None]): The function that writes to the given location.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    file_descriptor, temporary_path = tempfile.mkstemp(
+        dir=directory, prefix=".", suffix=".tmp"
+    )
+    os.close(file_descriptor)
+
+    try:
+        write_function(temporary_path)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
@@ -0,0 +1,471 @@
+"""Fetch Module"""
+
+__docformat__ = "google"
+
+import asyncio
+import importlib.util
+import threading
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+
+from financetoolkit.utilities import logger_model
+
+logger = logger_model.get_logger()
+
+# Check if httpx is installed, this is required for the asynchronous requests
+httpx_spec = importlib.util.find_spec("httpx")
+ENABLE_HTTPX = httpx_spec is not None
+
+if ENABLE_HTTPX:
+    import httpx
+
+    ASYNC_CONNECTION_ERRORS: tuple = (httpx.TransportError,)
+else:
+    ASYNC_CONNECTION_ERRORS = ()
+
+# pylint: disable=too-few-public-methods
+
+# The maximum number of requests per minute for each of the FinancialModelingPrep plans. Note
+# that the Toolkit is only able to differentiate between the Free and Premium plans.
+PLAN_RATE_LIMITS: dict[str, int] = {
+    "Free": 300,
+    "Starter": 300,
+    "Premium": 750,
+    "Ultimate": 3000,
+}
+
+MAX_WORKERS = 16
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket that limits the amount of requests that can be made per minute. Tokens
+    are refilled continuously and a request is only made once a token is available which means that
+    bursts up to the capacity are allowed while the average rate never exceeds the defined limit.
+    """
+
+    def __init__(self, requests_per_minute: int, capacity: int | None = None):
+        """
+        Initializes the token bucket.
+
+        Args:
+            requests_per_minute (int): the maximum number of requests per minute.
+            capacity (int | None): the maximum number of tokens that can be accumulated. Defaults to
+                one second of requests with a minimum of one.
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("The requests per minute should be larger than zero.")
+
+        self.rate = requests_per_minute / 60
+        self.capacity = (
+            capacity if capacity is not None else max(1, int(round(self.rate)))
+        )
+        self._tokens = float(self.capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """
+        Attempts to take a token from the bucket.
+
+        Returns:
+            float: zero if a token was taken, otherwise the amount of seconds until a token is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        Takes a token from the bucket, waiting until one is available.
+
+        Returns:
+            float: the amount of seconds that was waited for the token.
+        """
+        waited = 0.0
+
+        while wait_time := self._take():
+            time.sleep(wait_time)
+            waited += wait_time
+
+        return waited
+
+    async def acquire_async(self) -> float:
+        """
+        Takes a token from the bucket, waiting until one is available without blocking
+        the event loop. The tokens are shared with the synchronous acquire method.
+
+        Returns:
+            float: the amount of seconds that was waited for the token.
+        """
+        waited = 0.0
+
+        while wait_time := self._take():
+            await asyncio.sleep(wait_time)
+            waited += wait_time
+
+        return waited
+
+
+# The shared state of the fetch executor, this is adjusted through the configure function
+_configuration: dict = {
+    "max_workers": MAX_WORKERS,
+    "rate_limiter": TokenBucket(PLAN_RATE_LIMITS["Free"]),
+    "session": None,
+}
+_session_lock = threading.Lock()
+# Asynchronous clients and semaphores are bound to the event loop they are created in
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# Clients that were replaced after the worker pool was resized, closed by close_async_client
+_retired_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_statistics: dict[str, dict[str, float]] = {}
+_statistics_lock = threading.Lock()
+
+
+def configure(
+    max_workers: int | None = None,
+    requests_per_minute: int | None = None,
+    plan: str | None = None,
+):
+    """
+    Configures the fetch executor that is used for every per-ticker request. This defines the size
+    of the worker pool and the rate limit that is applied to the FinancialModelingPrep requests.
+
+    Args:
+        max_workers (int | None): the maximum number of workers in the pool. Defaults to None which
+            keeps the current value.
+        requests_per_minute (int | None): the maximum number of requests per minute. Defaults to None which
+            keeps the current value unless a plan is provided.
+        plan (str | None): the FinancialModelingPrep plan (e.g. "Free" or "Premium") used to determine
+            the rate limit when requests_per_minute is not provided. Defaults to None.
+    """
+    if max_workers is not None:
+        if max_workers < 1:
+            raise ValueError("The maximum number of workers should be at least 1.")
+
+        with _session_lock:
+            _configuration["max_workers"] = max_workers
+            # The connection pools are sized to the worker pool and therefore need to be rebuilt,
+            # the asynchronous clients are replaced the next time they are requested
+            _configuration["session"] = None
+
+    if requests_per_minute is None and plan is not None:
+        if plan not in PLAN_RATE_LIMITS:
+            raise ValueError(
+                f"Please select a valid plan ({', '.join(PLAN_RATE_LIMITS)})."
+            )
+        requests_per_minute = PLAN_RATE_LIMITS[plan]
+
+    if requests_per_minute is not None:
+        _configuration["rate_limiter"] = TokenBucket(requests_per_minute)
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the shared session. The session keeps connections alive and pools them per host so
+    that consecutive requests do not require a new TLS handshake.
+
+    Returns:
+        requests.Session: the shared session.
+    """
+    with _session_lock:
+        if _configuration["session"] is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_configuration["max_workers"],
+                pool_maxsize=_configuration["max_workers"],
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _configuration["session"] = session
+
+        return _configuration["session"]
+
+
+def get(url: str, timeout: int = 60, rate_limit: bool = True) -> requests.Response:
+    """
+    Performs a GET request through the shared session, waits for the rate limiter and records
+    the throughput of the endpoint.
+
+    Args:
+        url (str): the url to request.
+        timeout (int): the timeout of the request in seconds. Defaults to 60.
+        rate_limit (bool): whether to apply the rate limiter. Defaults to True.
+
+    Returns:
+        requests.Response: the response of the request.
+    """
+    if rate_limit:
+        _configuration["rate_limiter"].acquire()
+
+    endpoint = urlparse(url).path
+    start = time.monotonic()
+    error = False
+
+    try:
+        response = get_session().get(url, timeout=timeout)
+        error = not response.ok
+        return response
+    except requests.exceptions.RequestException:
+        error = True
+        raise
+    finally:
+        _record(endpoint=endpoint, start=start, end=time.monotonic(), error=error)
+
+
+def get_async_client() -> tuple["httpx.AsyncClient", asyncio.Semaphore]:
+    """
+    Returns the asynchronous client for the running event loop together with the semaphore
+    that bounds the number of concurrent requests to the size of the worker pool. The client
+    keeps connections alive and is shared by every coroutine on the same event loop.
+
+    Returns:
+        tuple[httpx.AsyncClient, asyncio.Semaphore]: the shared client and semaphore.
+    """
+    if not ENABLE_HTTPX:
+        raise ImportError(
+            "The asynchronous functionality requires the optional dependency httpx. "
+            "Enable this functionality by using: pip install httpx"
+        )
+
+    loop = asyncio.get_running_loop()
+    max_workers = _configuration["max_workers"]
+
+    if loop in _async_clients:
+        client, semaphore, client_max_workers = _async_clients[loop]
+
+        if client_max_workers == max_workers:
+            return client, semaphore
+
+        # Requests can still be running on the outdated client which is
+        # why it is only closed when the event loop closes its clients
+        _retired_async_clients.setdefault(loop, []).append(client)
+
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_workers,
+            max_keepalive_connections=max_workers,
+        ),
+    )
+    semaphore = asyncio.Semaphore(max_workers)
+    _async_clients[loop] = (client, semaphore, max_workers)
+
+    return client, semaphore
+
+
+async def aget(
+    url: str, timeout: int = 60, rate_limit: bool = True
+) -> "httpx.Response":
+    """
+    Performs an asynchronous GET request through the shared client, waits for the rate limiter
+    and records the throughput of the endpoint. The rate limiter is shared with the synchronous
+    requests.
+
+    Args:
+        url (str): the url to request.
+        timeout (int): the timeout of the request in seconds. Defaults to 60.
+        rate_limit (bool): whether to apply the rate limiter. Defaults to True.
+
+    Returns:
+        httpx.Response: the response of the request.
+    """
+    client, semaphore = get_async_client()
+
+    if rate_limit:
+        await _configuration["rate_limiter"].acquire_async()
+
+    endpoint = urlparse(url).path
+
+    async with semaphore:
+        start = time.monotonic()
+        error = False
+
+        try:
+            response = await client.get(url, timeout=timeout)
+            error = not response.is_success
+            return response
+        except httpx.HTTPError:
+            error = True
+            raise
+        finally:
+            _record(endpoint=endpoint, start=start, end=time.monotonic(), error=error)
+
+
+async def close_async_client():
+    """
+    Closes the asynchronous client of the running event loop, if any, together with the
+    clients that were replaced after the worker pool was resized.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _retired_async_clients.pop(loop, [])
+
+    if loop in _async_clients:
+        client, _, _ = _async_clients.pop(loop)
+        clients.append(client)
+
+    for client in clients:
+        await client.aclose()
+
+
+def _record(endpoint: str, start: float, end: float, error: bool):
+    """
+    Records the duration and outcome of a request for the given endpoint.
+
+    Args:
+        endpoint (str): the endpoint that was requested.
+        start (float): the monotonic start time of the request.
+        end (float): the monotonic end time of the request.
+        error (bool): whether the request resulted in an error.
+    """
+    with _statistics_lock:
+        statistics = _statistics.setdefault(
+            endpoint,
+            {"Requests": 0, "Errors": 0, "Busy Time": 0.0, "First": start, "Last": end},
+        )
+        statistics["Requests"] += 1
+        statistics["Errors"] += int(error)
+        statistics["Busy Time"] += end - start
+        statistics["First"] = min(statistics["First"], start)
+        statistics["Last"] = max(statistics["Last"], end)
+
+
+def get_statistics() -> pd.DataFrame:
+    """
+    Returns the throughput per endpoint for all requests made through the fetch executor.
+
+    Returns:
+        pd.DataFrame: the number of requests, errors, the average latency in seconds and
+            the achieved number of requests per second for each endpoint.
+    """
+    with _statistics_lock:
+        statistics = {
+            endpoint: values.copy() for endpoint, values in _statistics.items()
+        }
+
+    if not statistics:
+        return pd.DataFrame(
+            columns=["Requests", "Errors", "Average Latency", "Requests per Second"]
+        )
+
+    statistics_df = pd.DataFrame(statistics).T
+    elapsed = (statistics_df["Last"] - statistics_df["First"]).clip(lower=1e-9)
+
+    statistics_df["Average Latency"] = (
+        statistics_df["Busy Time"] / statistics_df["Requests"]
+    )
+    statistics_df["Requests per Second"] = statistics_df["Requests"] / elapsed
+    statistics_df[["Requests", "Errors"]] = statistics_df[
+        ["Requests", "Errors"]
+    ].astype(int)
+    statistics_df.index.name = "Endpoint"
+
+    return statistics_df[
+        ["Requests", "Errors", "Average Latency", "Requests per Second"]
+    ].sort_index()
+
+
+def reset_statistics():
+    """
+    Resets the recorded throughput statistics.
+    """
+    with _statistics_lock:
+        _statistics.clear()
+
+
+def run_workers(
+    worker: Callable,
+    items: Iterable,
+    *args,
+    progress_bar: bool = False,
+    tqdm_message: str = "",
+):
+    """
+    Runs the worker for each of the items on a pool with a fixed number of threads. The worker
+    is called as worker(item, *args) and is expected to store its results in the (shared) arguments
+    that are passed. A new pool is created for each call so that workers can themselves call
+    this function without waiting on each other while the session and rate limiter stay shared.
+
+    An error within a worker is logged and does not stop the other workers, the item is then
+    simply missing from the results.
+
+    Args:
+        worker (Callable): the function to run for each item.
+        items (Iterable): the items, usually tickers, to run the worker for.
+        *args: additional arguments passed to the worker.
+        progress_bar (bool): whether to show a progress bar. Defaults to False.
+        tqdm_message (str): the message to show in the progress bar. Defaults to "".
+    """
+    item_list = list(items)
+
+    if not item_list:
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(_configuration["max_workers"], len(item_list))
+    ) as executor:
+        futures = {executor.submit(worker, item, *args): item for item in item_list}
+
+        completed = as_completed(futures)
+
+        if progress_bar:
+            completed = tqdm(completed, total=len(futures), desc=tqdm_message)
+
+        for future in completed:
+            if future.exception() is not None:
+                _log_worker_error(futures[future], future.exception())
+
+
+async def arun_workers(worker: Callable[..., Awaitable], items: Iterable, *args):
+    """
+    Runs the asynchronous worker for each of the items on the running event loop. The worker
+    is called as worker(item, *args) and is expected to store its results in the (shared) arguments
+    that are passed. Concurrency is bounded by the shared client and not by the number of items.
+    Similar to run_workers, an error within a worker is logged and does not stop the other workers.
+
+    Args:
+        worker (Callable): the coroutine function to run for each item.
+        items (Iterable): the items, usually tickers, to run the worker for.
+        *args: additional arguments passed to the worker.
+    """
+    item_list = list(items)
+
+    results = await asyncio.gather(
+        *[worker(item, *args) for item in item_list], return_exceptions=True
+    )
+
+    for item, result in zip(item_list, results):
+        if isinstance(result, Exception):
+            _log_worker_error(item, result)
+
+
+def _log_worker_error(item, error: BaseException):
+    """
+    Logs an error that occurred within a worker.
+
+    Args:
+        item: the item, usually a ticker, the worker was run for.
+        error (BaseException): the error raised by the worker.
+    """
+    logger.error(
+        "An error occurred while collecting the data for %s: %s",
+        item,
+        error,
+        exc_info=(type(error), error, error.__traceback__),
+    )
@@ -466,6 +466,29 @@ async def run_toolkit_call(
     raise HTTPException(status_code=status_code, detail=f"{op} unavailable")
 
 
+async def prefetch_historical_data(toolkit, *, ticker: str | None = None) -> None:
+    """
+    Collect the historical data of a Toolkit on the event loop.
+
+    The asynchronous collection does not occupy a worker thread while waiting on the
+    network, the requests of all tickers are fanned out on the event loop. Failures are
+    logged and left to the synchronous path in run_toolkit_call. Every endpoint that
+    depends on prices (valuation ratios, health scores, risk, comparisons) prefetches
+    this way. The financial statements have no asynchronous API in the Toolkit and are
+    therefore still collected through run_toolkit_call.
+    """
+    try:
+        await asyncio.wait_for(
+            toolkit.aget_historical_data(),
+            timeout=API_REQUEST_TIMEOUT,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(
+            "Asynchronous historical data prefetch failed",
+            extra={"ticker": ticker, "error": str(exc)},
+        )
+
+
 # ============ ENDPOINTS ============
 
 @app.get("/")
@@ -773,6 +796,8 @@ async def get_valuation_ratios(
 
     async def compute():
         toolkit = get_toolkit([normalized])
+        await prefetch_historical_data(toolkit, ticker=normalized)
+
         ratios = await run_toolkit_call(
             lambda: toolkit.ratios.collect_valuation_ratios(),
             op="ratios_valuation",
@@ -807,6 +832,8 @@ async def get_all_ratios(
 
     async def compute():
         toolkit = get_toolkit([normalized])
+        await prefetch_historical_data(toolkit, ticker=normalized)
+
         ratios = await run_toolkit_call(
             lambda: toolkit.ratios.collect_all_ratios(),
             op="ratios_all",
@@ -850,6 +877,7 @@ async def get_health_scores(
 
     async def compute():
         toolkit = get_toolkit([normalized])
+        await prefetch_historical_data(toolkit, ticker=normalized)
 
         # Get scores
         altman = await run_toolkit_call(
@@ -981,6 +1009,7 @@ async def get_risk_metrics(
 
     async def compute():
         toolkit = get_toolkit([normalized])
+        await prefetch_historical_data(toolkit, ticker=normalized)
 
         var = await run_toolkit_call(
             lambda: toolkit.risk.get_value_at_risk(confidence_level=confidence_level),
@@ -1039,6 +1068,7 @@ async def compare_tickers(
 
         async def compute():
             toolkit = get_toolkit(tickers, request.start_date, quarterly=request.quarterly)
+            await prefetch_historical_data(toolkit)
 
             profitability = await run_toolkit_call(
                 lambda: toolkit.ratios.collect_profitability_ratios(),
@@ -1086,6 +1116,7 @@ async def quick_analysis(
 
     async def compute():
         toolkit = get_toolkit([normalized])
+        await prefetch_historical_data(toolkit, ticker=normalized)
 
         # Get key metrics
         profitability = await run_toolkit_call(
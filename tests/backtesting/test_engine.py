@@ -0,0 +1,115 @@
+"""Backtesting Engine Tests"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting import BacktestEngine, Order, Side
+from backtesting.strategies import (
+    BuyAndHold,
+    CombinedStrategy,
+    MeanReversion,
+    MomentumStrategy,
+    MovingAverageCrossover,
+    RSIStrategy,
+    Strategy,
+    ValueStrategy,
+)
+
+TICKERS = ["AAPL", "MSFT", "GOOGL", "AMZN", "NVDA"]
+
+STRATEGIES = {
+    "buy_and_hold": lambda: BuyAndHold(TICKERS[:3], weights={"AAPL": 0.5}),
+    "moving_average_crossover": lambda: MovingAverageCrossover(TICKERS, 5, 20),
+    "mean_reversion": lambda: MeanReversion(TICKERS, lookback=10, entry_zscore=-1.5),
+    "momentum": lambda: MomentumStrategy(TICKERS, lookback=20, top_n=2, rebalance_days=10),
+    "rsi": lambda: RSIStrategy(TICKERS, period=10, oversold=40, overbought=60),
+    "value": lambda: ValueStrategy(
+        {
+            "AAPL": {"pe_ratio": 12, "piotroski_f_score": 8},
+            "MSFT": {"pe_ratio": 30, "piotroski_f_score": 8},
+            "NVDA": {"pe_ratio": 10, "piotroski_f_score": 7},
+        }
+    ),
+    "combined": lambda: CombinedStrategy(
+        [MovingAverageCrossover(TICKERS, 5, 20), MeanReversion(TICKERS, lookback=10)],
+        min_agree=1,
+    ),
+}
+
+
+@pytest.fixture
+def engine():
+    """Engine with random walk prices"""
+    rng = np.random.default_rng(2024)
+    returns = rng.normal(0.0005, 0.02, size=(300, len(TICKERS)))
+    prices = pd.DataFrame(
+        100 * np.exp(np.cumsum(returns, axis=0)),
+        index=pd.bdate_range("2022-01-03", periods=300),
+        columns=TICKERS,
+    )
+
+    return BacktestEngine(prices, initial_cash=100_000, commission=0.001)
+
+
+def get_trades(results):
+    """The ticker, side, quantity and price of every trade"""
+    return [
+        (trade.ticker, trade.side, trade.quantity, trade.price)
+        for trade in results.portfolio.trades
+    ]
+
+
+@pytest.mark.parametrize("name", STRATEGIES)
+def test_run_vectorized_equals_run(engine, name):
+    """Test that the vectorized backtest has the same trades and daily values"""
+    # The momentum strategy buys in set order in run() and in ticker order in run_vectorized(),
+    # without commission the order does not change which buy is reduced to fit the cash
+    if name == "momentum":
+        engine.commission = 0.0
+
+    results = engine.run(STRATEGIES[name]())
+    vectorized = engine.run_vectorized(STRATEGIES[name]())
+
+    trades = get_trades(results)
+    vectorized_trades = get_trades(vectorized)
+
+    assert trades
+
+    # The orders of a date are executed in ticker order in run_vectorized()
+    if name in {"momentum", "combined"}:
+        assert sorted(vectorized_trades, key=str) == sorted(trades, key=str)
+    else:
+        assert vectorized_trades == trades
+
+    pd.testing.assert_frame_equal(
+        vectorized.daily_values,
+        results.daily_values,
+        check_exact=False,
+        rtol=1e-10,
+        check_names=False,
+    )
+
+
+def test_run_vectorized_strategy_function(engine):
+    """Test that a strategy function can not be run vectorized"""
+
+    def buy_first_day(date, prices, portfolio, engine):
+        return []
+
+    with pytest.raises(TypeError, match="buy_first_day does not generate vectorized signals"):
+        engine.run_vectorized(buy_first_day)
+
+
+def test_run_vectorized_partial_sell(engine):
+    """Test that a strategy with orders that are not entries or exits needs its own signals"""
+
+    class TrimStrategy(Strategy):
+        def generate_signals(self, date, prices, portfolio, engine):
+            if portfolio.get_position("AAPL").quantity == 0:
+                return [Order("AAPL", Side.BUY, 10)]
+
+            return [Order("AAPL", Side.SELL, 5)]
+
+    with pytest.raises(ValueError, match="implement generate_vectorized_signals"):
+        engine.run_vectorized(TrimStrategy())
@@ -0,0 +1,125 @@
+"""Binomial Trees Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pytest
+
+from financetoolkit.options import binomial_trees_model, black_scholes_model
+
+# pylint: disable=missing-function-docstring
+
+
+def test_calculate_stock_prices():
+    all_paths = binomial_trees_model.calculate_stock_prices(
+        stock_price=100,
+        up_movement=1.1,
+        down_movement=1 / 1.1,
+        period_length=3,
+        show_unique_combinations=False,
+    )
+
+    assert list(all_paths.index) == [
+        "UUU",
+        "UUD",
+        "UDU",
+        "UDD",
+        "DUU",
+        "DUD",
+        "DDU",
+        "DDD",
+    ]
+    np.testing.assert_allclose(all_paths.loc["UDU"], [100, 110, 100, 110])
+
+    unique_paths = binomial_trees_model.calculate_stock_prices(
+        stock_price=100, up_movement=1.1, down_movement=1 / 1.1, period_length=3
+    )
+
+    assert list(unique_paths.index) == ["UUU", "UUD", "UDD", "DDD"]
+    assert unique_paths.equals(all_paths.loc[unique_paths.index])
+
+
+def test_calculate_option_lattice():
+    option_lattice = binomial_trees_model.calculate_option_lattice(
+        stock_price=np.array([[100.0], [50.0]]),
+        strike_price=np.array([90.0, 100.0, 110.0]),
+        years=1,
+        timesteps=50,
+        risk_free_rate=0.05,
+        volatility=0.2,
+        dividend_yield=0.01,
+        put_option=True,
+        american_option=True,
+    )
+
+    assert option_lattice.shape == (2, 3, 51, 51)
+    assert np.isnan(option_lattice[..., 1, 0]).all()
+    assert not np.isnan(option_lattice[..., 50]).any()
+
+    option_price = binomial_trees_model.calculate_option_price(
+        stock_price=np.array([[100.0], [50.0]]),
+        strike_price=np.array([90.0, 100.0, 110.0]),
+        years=1,
+        timesteps=50,
+        risk_free_rate=0.05,
+        volatility=0.2,
+        dividend_yield=0.01,
+        put_option=True,
+        american_option=True,
+    )
+
+    np.testing.assert_allclose(option_price, option_lattice[..., 0, 0])
+
+
+@pytest.mark.parametrize("put_option", [False, True])
+def test_calculate_option_price_converges_to_black_scholes(put_option):
+    strike_prices = np.array([80.0, 100.0, 120.0])
+    years = np.array([[0.5], [2.0]])
+
+    option_price = binomial_trees_model.calculate_option_price(
+        stock_price=100,
+        strike_price=strike_prices,
+        years=years,
+        timesteps=1000,
+        risk_free_rate=0.05,
+        volatility=0.25,
+        put_option=put_option,
+    )
+
+    black_scholes = black_scholes_model.get_black_scholes(
+        stock_price=100,
+        strike_price=strike_prices,
+        risk_free_rate=0.05,
+        volatility=0.25,
+        time_to_expiration=years,
+        put_option=put_option,
+    )
+
+    np.testing.assert_allclose(option_price, black_scholes, atol=0.02)
+
+
+def test_calculate_option_price_american_exercise():
+    arguments = {
+        "stock_price": 100,
+        "strike_price": np.array([90.0, 100.0, 110.0]),
+        "years": 1,
+        "timesteps": 500,
+        "risk_free_rate": 0.05,
+        "volatility": 0.2,
+    }
+
+    european_put = binomial_trees_model.calculate_option_price(
+        **arguments, put_option=True
+    )
+    american_put = binomial_trees_model.calculate_option_price(
+        **arguments, put_option=True, american_option=True
+    )
+
+    assert (american_put > european_put).all()
+    assert american_put[1] == pytest.approx(6.09, abs=0.01)
+
+    # Without dividends an American call is never exercised early
+    np.testing.assert_allclose(
+        binomial_trees_model.calculate_option_price(**arguments, american_option=True),
+        binomial_trees_model.calculate_option_price(**arguments),
+    )
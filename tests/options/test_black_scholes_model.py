@@ -0,0 +1,57 @@
+"""Black Scholes Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pytest
+
+from financetoolkit.options import black_scholes_model
+
+# pylint: disable=missing-function-docstring
+
+
+@pytest.mark.parametrize("put_option", [False, True])
+def test_get_implied_volatility(put_option):
+    strike_prices = np.array([80.0, 90.0, 100.0, 110.0, 125.0])
+    time_to_expiration = np.array([[7 / 365], [0.5], [2.0]])
+    volatility = np.array([[0.6], [0.25], [0.4]])
+
+    option_price = black_scholes_model.get_black_scholes(
+        stock_price=100,
+        strike_price=strike_prices,
+        risk_free_rate=0.05,
+        volatility=volatility,
+        time_to_expiration=time_to_expiration,
+        dividend_yield=0.02,
+        put_option=put_option,
+    )
+
+    implied_volatility, converged = black_scholes_model.get_implied_volatility(
+        option_price=option_price,
+        stock_price=100,
+        strike_price=strike_prices,
+        risk_free_rate=0.05,
+        time_to_expiration=time_to_expiration,
+        dividend_yield=0.02,
+        put_option=put_option,
+    )
+
+    assert implied_volatility.shape == (3, 5)
+    assert converged.all()
+    np.testing.assert_allclose(
+        implied_volatility, np.broadcast_to(volatility, (3, 5)), atol=1e-6
+    )
+
+
+def test_get_implied_volatility_without_solution():
+    implied_volatility, converged = black_scholes_model.get_implied_volatility(
+        # Below the intrinsic value, at the intrinsic value and above the stock price
+        option_price=np.array([10.0, 20.0 - 80 * (1 - np.exp(-0.05)), 150.0]),
+        stock_price=100,
+        strike_price=80,
+        risk_free_rate=0.05,
+        time_to_expiration=1,
+    )
+
+    assert np.isnan(implied_volatility).all()
+    assert not converged.any()
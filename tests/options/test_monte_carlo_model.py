@@ -0,0 +1,145 @@
+"""Monte Carlo Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pytest
+
+from financetoolkit.options import black_scholes_model, monte_carlo_model
+
+# pylint: disable=missing-function-docstring
+
+SIMULATION_ARGUMENTS = {
+    "stock_price": np.array([100.0, 50.0]),
+    "volatility": np.array([0.2, 0.3]),
+    "risk_free_rate": 0.05,
+    "time_to_expiration": 1,
+    "timesteps": 20,
+    "paths": 5001,
+    "correlation": np.array([[1.0, 0.6], [0.6, 1.0]]),
+    "seed": 42,
+    "chunk_size": 1000,
+}
+
+
+def test_get_chunks():
+    assert monte_carlo_model.get_chunks(paths=25, chunk_size=10) == [
+        (0, 10),
+        (10, 20),
+        (20, 25),
+    ]
+
+    with pytest.raises(ValueError):
+        monte_carlo_model.get_chunks(paths=0, chunk_size=10)
+
+
+def test_simulate_stock_prices():
+    stock_prices = monte_carlo_model.simulate_stock_prices(**SIMULATION_ARGUMENTS)
+
+    assert stock_prices.shape == (5001, 21, 2)
+    np.testing.assert_array_equal(stock_prices[:, 0], [[100.0, 50.0]] * 5001)
+
+    # The result only depends on the seed and chunk size, not on the number of workers
+    np.testing.assert_array_equal(
+        stock_prices,
+        monte_carlo_model.simulate_stock_prices(**SIMULATION_ARGUMENTS, workers=4),
+    )
+
+    log_returns = np.diff(np.log(stock_prices), axis=1).reshape(-1, 2)
+
+    assert np.corrcoef(log_returns.T)[0, 1] == pytest.approx(0.6, abs=0.02)
+    np.testing.assert_allclose(
+        stock_prices[:, -1].mean(axis=0),
+        np.array([100.0, 50.0]) * np.exp(0.05),
+        rtol=0.01,
+    )
+
+
+def test_simulate_stock_prices_memory_map(tmp_path):
+    memory_map_location = str(tmp_path / "paths.npy")
+
+    stock_prices = monte_carlo_model.simulate_stock_prices(
+        **SIMULATION_ARGUMENTS, memory_map_location=memory_map_location
+    )
+
+    assert isinstance(stock_prices, np.memmap)
+    np.testing.assert_array_equal(
+        np.load(memory_map_location, mmap_mode="r"),
+        monte_carlo_model.simulate_stock_prices(**SIMULATION_ARGUMENTS),
+    )
+
+
+def test_get_simulation_statistics():
+    stock_prices = monte_carlo_model.simulate_stock_prices(**SIMULATION_ARGUMENTS)
+    statistics = monte_carlo_model.get_simulation_statistics(**SIMULATION_ARGUMENTS)
+
+    np.testing.assert_allclose(statistics["Mean"], stock_prices.mean(axis=0))
+    np.testing.assert_allclose(
+        statistics["Standard Deviation"], stock_prices.std(axis=0, ddof=1)
+    )
+    np.testing.assert_array_equal(statistics["Minimum"], stock_prices.min(axis=0))
+    np.testing.assert_array_equal(statistics["Maximum"], stock_prices.max(axis=0))
+
+
+@pytest.mark.parametrize("put_option", [False, True])
+def test_calculate_option_price_converges_to_black_scholes(put_option):
+    strike_prices = np.array([90.0, 100.0, 110.0])
+
+    black_scholes = black_scholes_model.get_black_scholes(
+        stock_price=100,
+        strike_price=strike_prices,
+        risk_free_rate=0.05,
+        volatility=0.2,
+        time_to_expiration=1,
+        put_option=put_option,
+    )
+
+    standard_errors = []
+
+    for antithetic_variates, control_variate in [
+        (False, False),
+        (True, False),
+        (True, True),
+    ]:
+        option_price, standard_error = monte_carlo_model.calculate_option_price(
+            stock_price=100,
+            strike_price=strike_prices,
+            volatility=0.2,
+            risk_free_rate=0.05,
+            time_to_expiration=1,
+            paths=100_000,
+            put_option=put_option,
+            antithetic_variates=antithetic_variates,
+            control_variate=control_variate,
+            seed=3,
+        )
+
+        assert (np.abs(option_price - black_scholes) < 4 * standard_error).all()
+        standard_errors.append(standard_error)
+
+    assert (standard_errors[1] < standard_errors[0]).all()
+    assert (standard_errors[2] < standard_errors[1]).all()
+
+
+def test_calculate_option_price_path_dependent():
+    arguments = {
+        "stock_price": 100,
+        "strike_price": 100,
+        "volatility": 0.2,
+        "risk_free_rate": 0.05,
+        "time_to_expiration": 1,
+        "paths": 20_000,
+        "timesteps": 50,
+        "seed": 7,
+    }
+
+    european_call, _ = monte_carlo_model.calculate_option_price(**arguments)
+    asian_call, _ = monte_carlo_model.calculate_option_price(
+        **arguments,
+        payoff_function=lambda stock_prices: np.maximum(
+            stock_prices[:, 1:].mean(axis=1) - 100, 0
+        ),
+    )
+
+    # Averaging lowers the volatility of the underlying and thus the option price
+    assert asian_call[0] < european_call[0]
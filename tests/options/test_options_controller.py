@@ -1,7 +1,12 @@
 """Options Controller Tests""" ""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 
 from financetoolkit import Toolkit
+from financetoolkit.options import black_scholes_model
 
 historical = pd.read_pickle("tests/datasets/historical_dataset.pickle")
 risk_free_rate = pd.read_pickle("tests/datasets/risk_free_rate.pickle")
@@ -40,6 +45,25 @@ def test_get_binomial_model(recorder):
     )
 
 
+def test_get_binomial_option_price(recorder):
+    recorder.capture(options_module.get_binomial_option_price(timesteps=100))
+    recorder.capture(
+        options_module.get_binomial_option_price(
+            put_option=True, american_option=True, timesteps=100
+        )
+    )
+    recorder.capture(
+        options_module.get_binomial_option_price(
+            strike_price_range=0.10,
+            strike_step_size=2,
+            expiration_time_range=5,
+            risk_free_rate=0.01,
+            dividend_yield=0.005,
+            rounding=2,
+        )
+    )
+
+
 def test_get_black_scholes_model(recorder):
     recorder.capture(options_module.get_black_scholes_model())
     recorder.capture(options_module.get_black_scholes_model(put_option=True))
@@ -366,3 +390,85 @@ def test_get_ultima(recorder):
             rounding=2,
         )
     )
+
+
+def test_get_implied_volatility():
+    expiration_date = (datetime.today() + timedelta(days=31)).strftime("%Y-%m-%d")
+    stock_price = options_module._prices.iloc[-1]
+    index = pd.MultiIndex.from_tuples(
+        [
+            (ticker, strike_price)
+            for ticker in ["AAPL", "MSFT"]
+            for strike_price in np.round(stock_price[ticker] * np.array([0.9, 1, 1.1]))
+        ],
+        names=["Ticker", "Strike Price"],
+    )
+    volatility = np.array([0.3, 0.25, 0.35, 0.2, 0.22, 0.28])
+
+    days_to_expiration = (pd.to_datetime(expiration_date) - datetime.today()).days
+    option_chains = pd.DataFrame(
+        {
+            "Last Price": black_scholes_model.get_black_scholes(
+                stock_price=stock_price.loc[index.get_level_values(0)].to_numpy(),
+                strike_price=index.get_level_values(1).to_numpy(dtype=float),
+                risk_free_rate=0.05,
+                volatility=volatility,
+                time_to_expiration=days_to_expiration / 365,
+            )
+        },
+        index=index,
+    )
+    # A price below the intrinsic value can not be resolved
+    option_chains.iloc[0, 0] = 0.01
+    option_chains.name = expiration_date
+
+    with patch.object(options_module, "get_option_chains", return_value=option_chains):
+        implied_volatility = options_module.get_implied_volatility(
+            risk_free_rate=0.05, dividend_yield=0, rounding=6
+        )
+        convergence = options_module.get_implied_volatility(
+            risk_free_rate=0.05, dividend_yield=0, show_convergence=True, rounding=6
+        )
+
+    assert implied_volatility.name == expiration_date
+    assert list(implied_volatility.index) == list(index[1:])
+    np.testing.assert_allclose(implied_volatility, volatility[1:], atol=1e-6)
+
+    assert list(convergence.columns) == ["Implied Volatility", "Converged"]
+    assert convergence["Converged"].tolist() == [False] + [True] * 5
+    assert np.isnan(convergence["Implied Volatility"].iloc[0])
+
+
+def test_get_monte_carlo_simulation(tmp_path):
+    monte_carlo_simulation = options_module.get_monte_carlo_simulation(
+        timesteps=12, paths=1000, seed=42
+    )
+
+    assert monte_carlo_simulation.shape == (8, 13)
+    assert list(monte_carlo_simulation.loc["AAPL"].index) == [
+        "Mean",
+        "Standard Deviation",
+        "Minimum",
+        "Maximum",
+    ]
+
+    stock_paths = options_module.get_monte_carlo_simulation(
+        timesteps=12, paths=1000, seed=42, show_paths=True, rounding=8
+    )
+
+    assert stock_paths.shape == (2000, 13)
+    np.testing.assert_allclose(
+        stock_paths.loc["MSFT"].mean(),
+        monte_carlo_simulation.loc[("MSFT", "Mean")],
+        atol=1e-4,
+    )
+
+    memory_map_location = str(tmp_path / "paths.npy")
+    memory_map = options_module.get_monte_carlo_simulation(
+        timesteps=12, paths=1000, seed=42, memory_map_location=memory_map_location
+    )
+
+    assert memory_map.shape == (1000, 13, 2)
+    np.testing.assert_allclose(
+        memory_map[:, :, 0], stock_paths.loc["AAPL"].to_numpy(), atol=1e-6
+    )
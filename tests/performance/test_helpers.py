@@ -0,0 +1,272 @@
+"""Performance Helpers Tests"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from financetoolkit.performance import helpers
+
+historical = pd.read_pickle("tests/datasets/historical_dataset.pickle")
+
+returns = historical["Return"].copy()
+returns.index = pd.DatetimeIndex(returns.index.to_timestamp())
+returns.iloc[[3, 40, 41], 1] = np.nan
+returns.iloc[[7, 41, 300], 2] = np.nan
+
+within_returns = helpers.determine_within_historical_data(
+    daily_historical_data=returns,
+    intraday_historical_data=pd.DataFrame(),
+    intraday_period=None,
+)["quarterly"]
+
+# pylint: disable=missing-function-docstring
+
+
+def get_pandas_moments(
+    period_returns: pd.DataFrame, benchmark_returns: pd.Series
+) -> dict[str, pd.Series]:
+    difference = period_returns.sub(benchmark_returns, axis=0)
+
+    return {
+        "covariance": period_returns.apply(lambda x: x.cov(benchmark_returns)),
+        "correlation": period_returns.apply(lambda x: x.corr(benchmark_returns)),
+        "beta": period_returns.apply(lambda x: x.cov(benchmark_returns))
+        / benchmark_returns.var(),
+        "tracking_error": difference.std(),
+        "information_ratio": difference.mean() / difference.std(),
+    }
+
+
+@pytest.mark.parametrize(
+    "statistic",
+    ["covariance", "correlation", "beta", "tracking_error", "information_ratio"],
+)
+def test_benchmark_moments(statistic):
+    moments = helpers.BenchmarkMoments(returns[["AAPL", "MSFT"]], returns["Benchmark"])
+
+    pd.testing.assert_series_equal(
+        moments.to_pandas(getattr(moments, statistic)),
+        get_pandas_moments(returns[["AAPL", "MSFT"]], returns["Benchmark"])[statistic],
+        rtol=1e-10,
+    )
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize(
+    "statistic",
+    ["covariance", "correlation", "beta", "tracking_error", "information_ratio"],
+)
+def test_benchmark_moments_within_period(statistic):
+    moments = helpers.BenchmarkMoments(
+        within_returns[["AAPL", "MSFT"]], within_returns["Benchmark"]
+    )
+
+    expected = pd.DataFrame(
+        {
+            period: get_pandas_moments(
+                within_returns.loc[period, ["AAPL", "MSFT"]],
+                within_returns.loc[period, "Benchmark"],
+            )[statistic]
+            for period in within_returns.index.get_level_values(0).unique()
+        }
+    ).T
+    expected.index.name = within_returns.index.names[0]
+
+    pd.testing.assert_frame_equal(
+        moments.to_pandas(getattr(moments, statistic)), expected, rtol=1e-10
+    )
+
+    # The period MultiIndex can also be treated as a single sample
+    full_sample_moments = helpers.BenchmarkMoments(
+        within_returns[["AAPL", "MSFT"]],
+        within_returns["Benchmark"],
+        within_period=False,
+    )
+
+    np.testing.assert_allclose(
+        full_sample_moments.covariance[0],
+        helpers.BenchmarkMoments(
+            returns[["AAPL", "MSFT"]], returns["Benchmark"]
+        ).covariance[0],
+        rtol=1e-10,
+    )
+
+
+@pytest.mark.parametrize("window_size", [2, 5, 30, 757, 800])
+def test_benchmark_moments_rolling(window_size):
+    moments = helpers.BenchmarkMoments(
+        returns[["AAPL", "MSFT"]], returns["Benchmark"], window_size=window_size
+    )
+
+    rolling_covariance = pd.DataFrame(
+        {
+            column: returns[column].rolling(window_size).cov(returns["Benchmark"])
+            for column in ["AAPL", "MSFT"]
+        }
+    )
+    rolling_variance = returns["Benchmark"].rolling(window_size).var()
+
+    pd.testing.assert_frame_equal(
+        moments.to_pandas(moments.covariance), rolling_covariance, atol=1e-15
+    )
+    # A window in which the benchmark does not move has no beta, Pandas returns
+    # infinity there as its covariance is not exactly zero due to rounding errors
+    pd.testing.assert_frame_equal(
+        moments.to_pandas(moments.beta),
+        rolling_covariance.div(rolling_variance, axis=0).replace(
+            [np.inf, -np.inf], np.nan
+        ),
+        rtol=1e-8,
+    )
+
+
+def test_benchmark_moments_constant_benchmark():
+    benchmark_returns = returns["Benchmark"].copy()
+    benchmark_returns.iloc[100:140] = 0.05
+
+    moments = helpers.BenchmarkMoments(
+        returns[["AAPL", "MSFT"]], benchmark_returns, window_size=20
+    )
+
+    # Windows in which the benchmark does not move have no beta or correlation
+    assert np.isnan(moments.beta[119:140]).all()
+    assert np.isnan(moments.correlation[119:140]).all()
+    assert (moments.benchmark_variance[119:140] < 1e-30).all()  # noqa: PLR2004
+    assert not np.isnan(moments.beta[160:290]).any()
+
+    within_moments = helpers.BenchmarkMoments(
+        returns[["AAPL", "MSFT"]].iloc[100:140],
+        pd.Series(0.05, index=returns.index[100:140]),
+    )
+
+    assert np.isnan(within_moments.beta).all()
+
+
+def get_factor_dataset() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+
+    factors = pd.DataFrame(
+        rng.normal(0, 0.01, size=(len(within_returns), 3)),
+        index=within_returns.index,
+        columns=["Mkt-RF", "SMB", "HML"],
+    )
+    factors["Mkt-RF"] += within_returns["Benchmark"].fillna(0)
+
+    return factors
+
+
+def test_factor_regressions_multi():
+    factors = get_factor_dataset()
+    period_returns = within_returns[["AAPL", "MSFT"]].fillna(0)
+
+    regressions = helpers.FactorRegressions(period_returns, factors)
+    regression_results, residuals = regressions.get_multi_regression()
+    residuals = regressions.to_residuals(residuals)
+
+    for period_index, period in enumerate(regressions.periods):
+        period_factors = np.column_stack(
+            [np.ones(len(factors.loc[period])), factors.loc[period]]
+        )
+
+        if len(period_factors) < 5:  # noqa: PLR2004
+            assert np.isnan(regression_results["R Squared"][period_index]).all()
+            continue
+
+        for ticker_index, ticker in enumerate(["AAPL", "MSFT"]):
+            ticker_returns = period_returns.loc[period, ticker].to_numpy()
+            coefficients, sum_of_squared_residuals, _, _ = np.linalg.lstsq(
+                period_factors, ticker_returns
+            )
+            residual_variance = sum_of_squared_residuals[0] / (len(ticker_returns) - 4)
+            t_statistics = coefficients / np.sqrt(
+                residual_variance
+                * np.diag(np.linalg.inv(period_factors.T @ period_factors))
+            )
+
+            np.testing.assert_allclose(
+                [
+                    regression_results[parameter][period_index, ticker_index]
+                    for parameter in [
+                        "Intercept",
+                        "Mkt-RF Slope",
+                        "SMB Slope",
+                        "HML Slope",
+                    ]
+                ],
+                coefficients,
+                rtol=1e-8,
+                atol=1e-12,
+            )
+            np.testing.assert_allclose(
+                [
+                    regression_results[parameter][period_index, ticker_index]
+                    for parameter in [
+                        "Intercept T-Statistic",
+                        "Mkt-RF T-Statistic",
+                        "SMB T-Statistic",
+                        "HML T-Statistic",
+                    ]
+                ],
+                t_statistics,
+                rtol=1e-8,
+            )
+            np.testing.assert_allclose(
+                residuals.loc[period, ticker],
+                ticker_returns - period_factors @ coefficients,
+                atol=1e-12,
+            )
+            assert regression_results["Residual Volatility"][
+                period_index, ticker_index
+            ] == pytest.approx(np.sqrt(residual_variance))
+            assert regression_results["R Squared"][
+                period_index, ticker_index
+            ] == pytest.approx(
+                1
+                - sum_of_squared_residuals[0]
+                / ((ticker_returns - ticker_returns.mean()) ** 2).sum()
+            )
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_factor_regressions_simple():
+    factors = get_factor_dataset()
+    period_returns = within_returns[["AAPL", "MSFT"]]
+
+    regressions = helpers.FactorRegressions(period_returns, factors)
+    regression_results = regressions.get_simple_regression()
+
+    for period_index, period in enumerate(regressions.periods):
+        for factor_index, factor in enumerate(factors.columns):
+            for ticker_index, ticker in enumerate(["AAPL", "MSFT"]):
+                expected = stats.linregress(
+                    period_returns.loc[period, ticker], factors.loc[period, factor]
+                )
+
+                np.testing.assert_allclose(
+                    [
+                        regression_results[parameter][
+                            period_index, factor_index, ticker_index
+                        ]
+                        for parameter in [
+                            "Intercept",
+                            "Slope",
+                            "R Squared",
+                            "P Value",
+                            "Standard Error",
+                        ]
+                    ],
+                    [
+                        expected.intercept,
+                        expected.slope,
+                        expected.rvalue**2,
+                        expected.pvalue,
+                        expected.stderr,
+                    ],
+                    rtol=1e-8,
+                    atol=1e-14,
+                )
+
+    # A missing return results in NaN for that period and ticker only
+    assert np.isnan(regression_results["Slope"][1, :, 1]).all()
+    assert not np.isnan(regression_results["Slope"][1, :, 0]).any()
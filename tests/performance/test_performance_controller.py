@@ -10,6 +10,10 @@ historical = pd.read_pickle("tests/datasets/historical_dataset.pickle")
 risk_free_rate = pd.read_pickle("tests/datasets/risk_free_rate.pickle")
 treasury_data = pd.read_pickle("tests/datasets/treasury_data.pickle")
 
+# A synthetic dataset in the layout of the Fama and French 5 Factor ZIP file which
+# covers the historical dataset and makes the factor tests run without network access
+fama_and_french_dataset = "tests/datasets/fama_and_french_dataset.zip"
+
 toolkit = Toolkit(
     tickers=["AAPL", "MSFT"],
     start_date="2019-12-31",
@@ -26,6 +30,7 @@ toolkit._daily_risk_free_rate = risk_free_rate
 toolkit._daily_treasury_data = treasury_data
 
 performance_module = toolkit.performance
+performance_module._fama_and_french_url = fama_and_french_dataset
 
 # pylint: disable=missing-function-docstring
 
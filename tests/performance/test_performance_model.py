@@ -1,10 +1,19 @@
 """Performance Model Tests"""
 
+import io
+import os
+import tempfile
+import time
+import zipfile
+from unittest.mock import MagicMock, patch
+
 import pandas as pd
+import pytest
+import requests
 
 from financetoolkit.performance import performance_model
 
-# pylint: disable=missing-function-docstring
+# pylint: disable=missing-function-docstring,protected-access
 
 
 def test_get_covariance(recorder):
@@ -46,12 +55,155 @@ def test_get_capital_asset_pricing_model(recorder):
 
 
 def test_obtain_fama_and_french_dataset(recorder):
-    dataset = performance_model.obtain_fama_and_french_dataset()
+    # A synthetic dataset in the layout of the Fama and French 5 Factor ZIP file
+    dataset = performance_model.obtain_fama_and_french_dataset(
+        "tests/datasets/fama_and_french_dataset.zip"
+    )
+
+    recorder.capture(dataset.iloc[:100])
+
+
+def get_fama_and_french_zip() -> bytes:
+    csv_data = (
+        "This file was created using the 202401 CRSP database.\n"
+        "The Tbill return is the simple daily rate.\n"
+        "\n"
+        ",Mkt-RF,SMB,RF\n"
+        "20240102,-0.71,0.39,0.021\n"
+        "20240103,-0.99,-0.25,0.021\n"
+    )
+    zip_data = io.BytesIO()
+
+    with zipfile.ZipFile(zip_data, "w") as zip_file:
+        zip_file.writestr("F-F_Research_Data_daily.CSV", csv_data)
+
+    return zip_data.getvalue()
+
+
+def get_response(status_code: int = 200, content: bytes = b"") -> MagicMock:
+    response = MagicMock(status_code=status_code, content=content)
+    response.headers = {"ETag": '"abc"', "Last-Modified": "Tue, 02 Jan 2024 GMT"}
+
+    return response
+
+
+@patch.dict(performance_model._fama_and_french_datasets, clear=True)
+def test_obtain_fama_and_french_dataset_store():
+    zip_data = get_fama_and_french_zip()
+    expected = performance_model.read_fama_and_french_dataset(zip_data)
 
-    # This is done given that the dataset can change over time
-    # it is only important to check if the data remains the same
-    # for a short period of time
-    recorder.capture(dataset.round(0).iloc[:100])
+    with (
+        tempfile.TemporaryDirectory() as temp_dir,
+        patch(
+            "financetoolkit.performance.performance_model.requests.get",
+            return_value=get_response(content=zip_data),
+        ) as mock_get,
+    ):
+        dataset = performance_model.obtain_fama_and_french_dataset(
+            cached_data_location=temp_dir
+        )
+
+        pd.testing.assert_frame_equal(dataset, expected)
+        assert list(expected.columns) == ["Mkt-RF", "SMB", "RF"]
+        assert mock_get.call_count == 1
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+        # Altering the returned dataset does not affect the in-memory dataset
+        dataset.iloc[0, 0] = 0
+
+        pd.testing.assert_frame_equal(
+            performance_model.obtain_fama_and_french_dataset(
+                cached_data_location=temp_dir
+            ),
+            expected,
+        )
+        assert mock_get.call_count == 1
+
+        # A new process reads the dataset from disk instead of downloading it
+        performance_model._fama_and_french_datasets.clear()
+
+        pd.testing.assert_frame_equal(
+            performance_model.obtain_fama_and_french_dataset(
+                cached_data_location=temp_dir
+            ),
+            expected,
+        )
+        assert mock_get.call_count == 1
+
+        # Once stale, the stored dataset is revalidated with a conditional request
+        performance_model._fama_and_french_datasets.clear()
+        mock_get.return_value = get_response(status_code=304)
+
+        with patch("time.time", return_value=time.time() + 2 * 24 * 60 * 60):
+            pd.testing.assert_frame_equal(
+                performance_model.obtain_fama_and_french_dataset(
+                    cached_data_location=temp_dir
+                ),
+                expected,
+            )
+
+            assert mock_get.call_count == 2  # noqa: PLR2004
+            assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+
+            # The entry is valid again after the revalidation
+            performance_model._fama_and_french_datasets.clear()
+            performance_model.obtain_fama_and_french_dataset(
+                cached_data_location=temp_dir
+            )
+
+            assert mock_get.call_count == 2  # noqa: PLR2004
+
+
+@patch.dict(performance_model._fama_and_french_datasets, clear=True)
+def test_obtain_fama_and_french_dataset_offline():
+    zip_data = get_fama_and_french_zip()
+    expected = performance_model.read_fama_and_french_dataset(zip_data)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with patch(
+            "financetoolkit.performance.performance_model.requests.get",
+            return_value=get_response(content=zip_data),
+        ):
+            performance_model.obtain_fama_and_french_dataset(
+                cached_data_location=temp_dir
+            )
+
+        performance_model._fama_and_french_datasets.clear()
+
+        with (
+            patch(
+                "financetoolkit.performance.performance_model.requests.get",
+                side_effect=requests.exceptions.ConnectionError,
+            ),
+            patch(
+                "financetoolkit.performance.performance_model.urllib.request.urlopen",
+                side_effect=OSError,
+            ),
+            patch("time.time", return_value=time.time() + 60 * 24 * 60 * 60),
+        ):
+            # The stored dataset is used regardless of its age
+            pd.testing.assert_frame_equal(
+                performance_model.obtain_fama_and_french_dataset(
+                    cached_data_location=temp_dir
+                ),
+                expected,
+            )
+
+            # Without a stored dataset the error is raised
+            with pytest.raises(OSError):
+                performance_model.obtain_fama_and_french_dataset(
+                    "https://example.com/factors.zip", cached_data_location=temp_dir
+                )
+
+        # A ZIP file on disk is read directly
+        zip_location = os.path.join(temp_dir, "factors.zip")
+
+        with open(zip_location, "wb") as zip_file:
+            zip_file.write(zip_data)
+
+        pd.testing.assert_frame_equal(
+            performance_model.obtain_fama_and_french_dataset(zip_location), expected
+        )
 
 
 def test_get_factor_asset_correlations(recorder):
@@ -0,0 +1,160 @@
+"""Portfolio Ledger Model Tests"""
+
+# ruff: noqa: PLR2004
+
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.portfolio.ledger_model import PositionsLedger
+from financetoolkit.portfolio.overview_model import create_positions_overview
+
+
+@pytest.fixture
+def sample_prices():
+    """Sample adjusted close prices"""
+    dates = pd.period_range("2023-01-02", periods=6, freq="D", name="Date")
+
+    return pd.DataFrame(
+        {
+            "AAPL": [150.0, 152.0, 151.0, 155.0, 158.0, 160.0],
+            "MSFT": [250.0, 248.0, 255.0, 260.0, 262.0, 265.0],
+        },
+        index=dates,
+    )
+
+
+@pytest.fixture
+def sample_transactions():
+    """Sample transactions with the invested amount"""
+    index = pd.MultiIndex.from_tuples(
+        [
+            (pd.Period("2023-01-02", freq="D"), "AAPL"),
+            (pd.Period("2023-01-03", freq="D"), "MSFT"),
+            (pd.Period("2023-01-05", freq="D"), "AAPL"),
+            (pd.Period("2023-01-05", freq="D"), "AAPL"),
+            (pd.Period("2023-01-07", freq="D"), "MSFT"),
+        ],
+        names=["Date", "Identifier"],
+    )
+
+    return pd.DataFrame(
+        {
+            "Volume": [10.0, 5.0, 4.0, 2.0, 3.0],
+            "Costs": [-1.0, -2.0, 0.0, -1.0, -1.5],
+            "Invested Amount": [1499.0, 1238.0, 620.0, 309.0, 784.5],
+        },
+        index=index,
+    )
+
+
+def test_positions_ledger_matches_positions_overview(
+    sample_prices, sample_transactions
+):
+    """Test that the ledger equals the positions overview that is built from scratch"""
+    expected = create_positions_overview(
+        portfolio_tickers=["AAPL", "MSFT"],
+        period_dates=sample_prices.index,
+        portfolio_dataset=sample_transactions,
+        historical_prices=pd.concat({"Adj Close": sample_prices}, axis=1),
+    )
+
+    ledger = PositionsLedger.from_transactions(
+        transactions=sample_transactions,
+        historical_prices=sample_prices,
+        tickers=["AAPL", "MSFT"],
+    )
+
+    pd.testing.assert_frame_equal(ledger.get_positions_overview(), expected)
+
+
+def test_positions_ledger_incremental_updates(sample_prices, sample_transactions):
+    """Test that appending transactions and price days equals building the ledger at once"""
+    expected = PositionsLedger.from_transactions(
+        transactions=sample_transactions,
+        historical_prices=sample_prices,
+    ).get_positions_overview()
+
+    ledger = PositionsLedger.from_transactions(
+        transactions=sample_transactions.iloc[:2],
+        historical_prices=sample_prices.iloc[:3],
+    )
+
+    # Transactions after the last price day are held until that day is added
+    ledger.add_transactions(sample_transactions.iloc[2:])
+    ledger.update_prices(sample_prices.iloc[3:5])
+    ledger.update_prices(sample_prices.iloc[5:])
+
+    pd.testing.assert_frame_equal(ledger.get_positions_overview(), expected)
+
+    volume = ledger.get_positions_overview()["Volume"]
+    assert volume["AAPL"].tolist() == [10.0, 10.0, 10.0, 16.0, 16.0, 16.0]
+    assert volume["MSFT"].tolist() == [0.0, 5.0, 5.0, 5.0, 5.0, 8.0]
+
+
+def test_positions_ledger_revises_latest_price(sample_prices, sample_transactions):
+    """Test that an existing price day is overwritten"""
+    ledger = PositionsLedger.from_transactions(
+        transactions=sample_transactions,
+        historical_prices=sample_prices,
+    )
+
+    latest_prices = sample_prices.iloc[-1:].copy()
+    latest_prices["AAPL"] = 170.0
+    ledger.update_prices(latest_prices)
+
+    overview = ledger.get_positions_overview(start_date=sample_prices.index[-1])
+
+    assert len(overview) == 1
+    assert overview[("Current Value", "AAPL")].iloc[0] == 16 * 170.0
+
+    with pytest.raises(ValueError):
+        ledger.update_prices(
+            pd.DataFrame(
+                {"AAPL": [1.0]}, index=pd.period_range("2022-12-30", periods=1)
+            )
+        )
+
+
+def test_positions_ledger_serialization(sample_prices, sample_transactions):
+    """Test that a restored ledger continues where the original left off"""
+    ledger = PositionsLedger.from_transactions(
+        transactions=sample_transactions.iloc[:2],
+        historical_prices=sample_prices.iloc[:4],
+    )
+
+    restored = PositionsLedger.from_dict(ledger.to_dict())
+    restored.add_transactions(sample_transactions.iloc[2:])
+    restored.update_prices(sample_prices.iloc[4:])
+
+    expected = PositionsLedger.from_transactions(
+        transactions=sample_transactions,
+        historical_prices=sample_prices,
+    ).get_positions_overview()
+
+    pd.testing.assert_frame_equal(restored.get_positions_overview(), expected)
+    assert np.isclose(
+        restored.get_positions_overview()["Invested Weight"].sum(axis=1), 1.0
+    ).all()
+
+
+def test_positions_ledger_daily_price_updates(sample_prices, sample_transactions):
+    """Test that adding one price day at a time grows the ledger by doubling its capacity"""
+    expected = PositionsLedger.from_transactions(
+        transactions=sample_transactions,
+        historical_prices=sample_prices,
+    ).get_positions_overview()
+
+    ledger = PositionsLedger(tickers=["AAPL"], dates=sample_prices.index[:0])
+    ledger.add_transactions(sample_transactions)
+
+    capacities = []
+
+    for date in sample_prices.index:
+        ledger.update_prices(sample_prices.loc[[date]])
+        capacities.append(ledger._prices.shape[0])
+
+    assert capacities == [1, 2, 4, 4, 8, 8]
+    assert ledger.to_dict()["prices"].shape == (6, 2)
+    pd.testing.assert_frame_equal(ledger.get_positions_overview(), expected)
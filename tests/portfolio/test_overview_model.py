@@ -145,6 +145,91 @@ def test_create_profit_and_loss_overview_average():
     assert "Cumulative PnL" in result.columns
 
 
+@pytest.mark.parametrize(
+    "method, pnl, open_volume, holding_period",
+    [
+        ("FIFO", 350.0, [0.0, 5.0, 10.0], 55 / 15),
+        ("LIFO", 250.0, [10.0, 5.0, 0.0], 35 / 15),
+        ("HIFO", 200.0, [10.0, 0.0, 5.0], 40 / 15),
+        ("AVERAGE", 300.0, [0.0, 5.0, 10.0], 55 / 15),
+        ("SPECIFIC", 350.0, [5.0, 10.0, 0.0], 40 / 15),
+    ],
+)
+def test_create_profit_and_loss_overview_lots(method, pnl, open_volume, holding_period):
+    """Test the realized PnL, open lots and holding periods of each method"""
+    transactions_overview = pd.DataFrame(
+        {
+            "Date": pd.to_datetime(
+                [
+                    "2023-01-01",
+                    "2023-01-01",
+                    "2023-01-02",
+                    "2023-01-03",
+                    "2023-01-04",
+                    "2023-01-05",
+                ]
+            ),
+            "Ticker": ["AAPL", "MSFT", "AAPL", "AAPL", "MSFT", "AAPL"],
+            "Volume": [10, 20, 10, 10, -30, -15],
+            "Price": [100.0, 50.0, 120.0, 110.0, 60.0, 130.0],
+            "Lot": ["a", "m", "b", "c", None, "c"],
+        }
+    ).set_index(["Date", "Ticker"])
+
+    result = create_profit_and_loss_overview(
+        transactions_overview=transactions_overview,
+        ticker_column="Ticker",
+        volume_column="Volume",
+        price_column="Price",
+        method=method,
+        date_column="Date",
+        lot_column="Lot",
+    )
+
+    pd.testing.assert_index_equal(result.index, transactions_overview.index)
+
+    # The MSFT sell exceeds the open volume, only 20 shares are sold
+    assert result["PnL"].tolist() == [0.0, 0.0, 0.0, 0.0, 200.0, pnl]
+    assert result["Cumulative PnL"].iloc[-1] == 200.0 + pnl
+    assert result["Open Volume"].iloc[[0, 2, 3]].tolist() == open_volume
+    assert result["Open Volume"].iloc[[1, 4, 5]].tolist() == [0.0, 0.0, 0.0]
+    assert result["Holding Period"].iloc[4] == 3
+    assert result["Holding Period"].iloc[5] == pytest.approx(holding_period)
+    assert result["Holding Period"].iloc[:4].isna().all()
+
+
+def test_create_profit_and_loss_overview_invalid():
+    """Test create_profit_and_loss_overview with missing tickers and invalid methods"""
+    transactions_overview = pd.DataFrame(
+        {
+            "Ticker": ["AAPL", None, "AAPL"],
+            "Volume": [10, -5, -5],
+            "Price": [1.0, 2.0, 3.0],
+        }
+    )
+
+    result = create_profit_and_loss_overview(
+        transactions_overview=transactions_overview,
+        ticker_column="Ticker",
+        volume_column="Volume",
+        price_column="Price",
+    )
+
+    assert result["PnL"].iloc[[0, 2]].tolist() == [0.0, 10.0]
+    assert pd.isna(result["PnL"].iloc[1])
+    assert "Holding Period" not in result.columns
+
+    for method in ["UNKNOWN", "SPECIFIC"]:
+        with pytest.raises(ValueError):
+            create_profit_and_loss_overview(
+                transactions_overview=transactions_overview,
+                ticker_column="Ticker",
+                volume_column="Volume",
+                price_column="Price",
+                method=method,
+            )
+
+
 def test_create_portfolio_overview_with_missing_data():
     """Test create_portfolio_overview with missing data"""
     portfolio_name = pd.Series(["Apple Inc", "Microsoft Corp"], index=["AAPL", "MSFT"])
@@ -1,5 +1,7 @@
 """Portfolio Model Tests"""
 
+# ruff: noqa: PLR2004
+
 import os
 import tempfile
 
@@ -162,3 +164,223 @@ def test_read_portfolio_dataset_edge_cases():
             )
 
     os.unlink(tmp.name)
+
+
+COLUMN_MAPPING = {
+    "date": "Date",
+    "name": "Name",
+    "identifier": "Ticker",
+    "price": "Price",
+    "volume": "Volume",
+    "currency": "Currency",
+    "costs": "Costs",
+}
+
+
+@pytest.fixture
+def broker_export_file():
+    """Create a temporary CSV file in the notation of a broker export"""
+    data = pd.DataFrame(
+        {
+            "Date": ["02-01-2023", "03-01-2023", "04-01-2023", "05-01-2023"],
+            "Name": ["Apple Inc", "Microsoft Corp", "Apple Inc", "ASML Holding"],
+            "Ticker": ["AAPL", "MSFT", "AAPL", "ASML"],
+            "Price": ["$150.00", "1,250.50", "(160.00)", "€ 1.234,50"],
+            "Volume": ["100", "50", "-20", "10"],
+            "Currency": ["USD", "USD", "USD", "EUR"],
+            "Costs": ["(1.00)", "-2,00", "", "3 EUR"],
+        }
+    )
+
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
+        data.to_csv(tmp.name, index=False, sep=";")
+        yield tmp.name
+    os.unlink(tmp.name)
+
+
+def read_broker_export(location, **kwargs):
+    """Read the broker export with the default options of these tests"""
+    return read_portfolio_dataset(
+        excel_location=[location],
+        adjust_duplicates=False,
+        date_column=["Date"],
+        date_format_options=["%Y-%m-%d", "%d-%m-%Y"],
+        name_columns=["Name"],
+        ticker_columns=["Ticker"],
+        price_columns=["Price"],
+        volume_columns=["Volume"],
+        currency_columns=["Currency"],
+        costs_columns=["Costs"],
+        column_mapping=COLUMN_MAPPING,
+        **kwargs,
+    )[0]
+
+
+def test_read_portfolio_dataset_broker_notation(broker_export_file):
+    """Test reading amounts with currency symbols, separators and parentheses"""
+    dataset = read_broker_export(broker_export_file).sort_values("Date")
+
+    assert dataset["Price"].tolist() == [150.0, 1250.5, -160.0, 1234.5]
+    assert dataset["Costs"].tolist() == [-1.0, -2.0, 0.0, 3.0]
+    assert dataset["Date"].iloc[0] == pd.Period("2023-01-02", freq="D")
+
+
+def test_read_portfolio_dataset_in_chunks(broker_export_file):
+    """Test that reading a CSV file in chunks equals reading it at once"""
+    expected = read_broker_export(broker_export_file)
+    chunked = read_broker_export(broker_export_file, chunk_size=1)
+
+    pd.testing.assert_frame_equal(chunked, expected)
+
+
+def test_read_portfolio_dataset_snapshot(broker_export_file):
+    """Test that the formatted snapshot is reused until the file changes"""
+    expected = read_broker_export(broker_export_file)
+
+    with tempfile.TemporaryDirectory() as cached_data_location:
+        read_broker_export(
+            broker_export_file, cached_data_location=cached_data_location
+        )
+        snapshot = read_broker_export(
+            broker_export_file, cached_data_location=cached_data_location
+        )
+
+        pd.testing.assert_frame_equal(snapshot, expected, check_dtype=False)
+        assert isinstance(snapshot["Date"].dtype, pd.PeriodDtype)
+
+        with open(broker_export_file, "a") as file:
+            file.write("06-01-2023;Apple Inc;AAPL;155.00;5;USD;0\n")
+
+        updated = read_broker_export(
+            broker_export_file, cached_data_location=cached_data_location
+        )
+
+        assert len(updated) == len(expected) + 1
+
+
+def test_read_portfolio_dataset_in_chunks_date_format(broker_export_file):
+    """Test that the date format is inferred once and used for every chunk"""
+    data = pd.read_csv(broker_export_file, sep=";", dtype=str, keep_default_na=False)
+    data["Date"] = ["12-25-2024", "01-05-2025", "01-06-2025", "01-07-2025"]
+    data.to_csv(broker_export_file, index=False, sep=";")
+
+    dataset = read_portfolio_dataset(
+        excel_location=[broker_export_file],
+        adjust_duplicates=False,
+        date_column=["Date"],
+        date_format_options=["%d-%m-%Y", "%m-%d-%Y"],
+        name_columns=["Name"],
+        ticker_columns=["Ticker"],
+        price_columns=["Price"],
+        volume_columns=["Volume"],
+        currency_columns=["Currency"],
+        costs_columns=["Costs"],
+        column_mapping=COLUMN_MAPPING,
+        chunk_size=1,
+    )[0]
+
+    assert dataset["Date"].sort_values().astype(str).tolist() == [
+        "2024-12-25",
+        "2025-01-05",
+        "2025-01-06",
+        "2025-01-07",
+    ]
+
+
+
+def write_dated_export(location, dates):
+    """Write a CSV file with one transaction on each of the given dates"""
+    pd.DataFrame(
+        {
+            "Date": dates,
+            "Name": "Apple Inc",
+            "Ticker": "AAPL",
+            "Price": "150.00",
+            "Volume": "1",
+            "Currency": "USD",
+            "Costs": "0",
+        }
+    ).to_csv(location, index=False, sep=";")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 50, 100_000])
+def test_read_portfolio_dataset_date_format_after_sample(broker_export_file, chunk_size):
+    """Test that an unambiguous date after the first rows determines the format of every chunk"""
+    write_dated_export(
+        broker_export_file,
+        [f"01-{month:02d}-2024" for month in range(1, 13)] * 12
+        + ["01-01-2024"] * 6
+        + ["12-25-2024"],
+    )
+
+    dataset = read_portfolio_dataset(
+        excel_location=[broker_export_file],
+        adjust_duplicates=False,
+        date_column=["Date"],
+        date_format_options=["%d-%m-%Y", "%m-%d-%Y"],
+        name_columns=["Name"],
+        ticker_columns=["Ticker"],
+        price_columns=["Price"],
+        volume_columns=["Volume"],
+        currency_columns=["Currency"],
+        costs_columns=["Costs"],
+        column_mapping=COLUMN_MAPPING,
+        chunk_size=chunk_size,
+    )[0]
+
+    assert len(dataset) == 151
+    assert (dataset["Date"].dt.month == 1).sum() == 150
+    assert dataset["Date"].max() == pd.Period("2024-12-25", freq="D")
+
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100_000])
+def test_read_portfolio_dataset_inconsistent_date_format(broker_export_file, chunk_size):
+    """Test that a file without a single date format raises an error"""
+    write_dated_export(broker_export_file, ["25-12-2024", "12-26-2024"])
+
+    with pytest.raises(ValueError):
+        read_portfolio_dataset(
+            excel_location=[broker_export_file],
+            adjust_duplicates=False,
+            date_column=["Date"],
+            date_format_options=["%d-%m-%Y", "%m-%d-%Y"],
+            name_columns=["Name"],
+            ticker_columns=["Ticker"],
+            price_columns=["Price"],
+            volume_columns=["Volume"],
+            currency_columns=["Currency"],
+            costs_columns=["Costs"],
+            column_mapping=COLUMN_MAPPING,
+            chunk_size=chunk_size,
+        )
+
+
+@pytest.mark.parametrize("value", ["NA", "None", "pending", "", "$", "12 XYZ"])
+def test_format_portfolio_dataset_non_numeric_amount(value):
+    """Test that amounts other than numbers with currency symbols or codes raise an error"""
+    data = pd.DataFrame(
+        {
+            "date": ["2023-01-02", "2023-01-03"],
+            "name": ["Apple Inc", "Microsoft Corp"],
+            "ticker": ["AAPL", "MSFT"],
+            "price": ["150.00 USD", value],
+            "volume": ["100", "50"],
+            "currency": ["USD", "USD"],
+            "costs": ["1.00", "2.00"],
+        }
+    )
+
+    with pytest.raises(ValueError, match="to float"):
+        format_portfolio_dataset(
+            dataset=data,
+            date_columns=["Date"],
+            date_format_options=["%Y-%m-%d"],
+            name_columns=["Name"],
+            tickers_columns=["Ticker"],
+            price_columns=["Price"],
+            volume_columns=["Volume"],
+            currency_columns=["Currency"],
+            costs_columns=["Costs"],
+            column_mapping=COLUMN_MAPPING,
+        )
@@ -0,0 +1,110 @@
+"""Ratios Helpers Tests"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.ratios import helpers
+
+balance_dataset = pd.read_pickle("tests/datasets/balance_dataset.pickle")
+
+# pylint: disable=missing-function-docstring
+
+
+def test_statement_store_get():
+    store = helpers.StatementStore(balance_dataset)
+
+    for line_item in ["Total Assets", "Inventory", "Cash and Cash Equivalents"]:
+        pd.testing.assert_frame_equal(
+            store.get(line_item), balance_dataset.loc[:, line_item, :]
+        )
+
+    with pytest.raises(KeyError):
+        store.get("Unknown Line Item")
+
+
+@pytest.mark.parametrize("statistic", ["sum", "mean"])
+@pytest.mark.parametrize("window", [1, 2, 3, 5])
+def test_statement_store_get_rolling(window, statistic):
+    statement = balance_dataset.copy()
+    statement.iloc[3, 1] = np.nan
+
+    store = helpers.StatementStore(statement)
+    rolling = statement.loc[:, "Total Assets", :].T.rolling(window)
+
+    pd.testing.assert_frame_equal(
+        store.get_rolling("Total Assets", window, statistic=statistic),
+        (rolling.mean() if statistic == "mean" else rolling.sum()).T,
+    )
+
+
+def test_statement_store_missing_line_item_for_ticker():
+    statement = balance_dataset.drop(index=("MSFT", "Inventory"))
+    store = helpers.StatementStore(statement)
+
+    pd.testing.assert_frame_equal(
+        store.get("Inventory"), statement.loc[:, "Inventory", :]
+    )
+    pd.testing.assert_frame_equal(
+        store.get_rolling("Inventory", 2, statistic="mean"),
+        statement.loc[:, "Inventory", :].T.rolling(2).mean().T,
+    )
+
+    # The returned values are copies, altering them does not affect the store
+    total_assets = store.get("Total Assets")
+    total_assets.iloc[0, 0] = 0
+
+    pd.testing.assert_frame_equal(
+        store.get("Total Assets"), statement.loc[:, "Total Assets", :]
+    )
+
+
+def test_formula_compiler():
+    compiler = helpers.FormulaCompiler(
+        ["Revenue", "Net Income", "Net Income per EBT", "Return on Assets (ROA)"]
+    )
+    values = {
+        "Revenue": np.array([10.0, 20.0]),
+        "Net Income": np.array([2.0, 5.0]),
+        "Net Income per EBT": np.array([0.5, 0.8]),
+        "Return on Assets (ROA)": np.array([0.1, 0.2]),
+    }
+
+    compiled_formula = compiler.compile("(Revenue - Net Income) / Net Income")
+
+    assert compiled_formula.names == ("Revenue", "Net Income")
+    np.testing.assert_allclose(
+        helpers.evaluate_formula(compiled_formula, values), [4.0, 3.0]
+    )
+    assert compiler.compile("(Revenue - Net Income) / Net Income") is compiled_formula
+
+    np.testing.assert_allclose(
+        helpers.evaluate_formula(
+            compiler.compile("Net Income per EBT * Return on Assets (ROA) * -100"),
+            values,
+        ),
+        [-5.0, -16.0],
+    )
+    np.testing.assert_array_equal(
+        helpers.evaluate_formula(compiler.compile("5 < Revenue <= 15"), values),
+        [1.0, 0.0],
+    )
+
+    for invalid_formula in ["Revenue + Unknown Item", "Revenue.T", "__import__('os')"]:
+        with pytest.raises(ValueError):
+            compiler.compile(invalid_formula)
+
+
+def test_sort_formulas():
+    sorted_formulas, circular_formulas = helpers.sort_formulas(
+        {
+            "A": ["B"],
+            "B": ["C"],
+            "C": [],
+            "D": ["E"],
+            "E": ["D"],
+        }
+    )
+
+    assert sorted_formulas == ["C", "B", "A"]
+    assert circular_formulas == ["D", "E"]
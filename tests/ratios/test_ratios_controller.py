@@ -353,3 +353,75 @@ def test_get_tangible_asset_value(recorder):
 
 def test_get_net_current_asset_value(recorder):
     recorder.capture(ratios_module.get_net_current_asset_value())
+
+
+def test_collect_custom_ratios():
+    custom_ratios = ratios_module.collect_custom_ratios(
+        custom_ratios_dict={
+            "Defensive Interval": "Quick Assets / Daily Cash Op Expenses",
+            "Quick Assets": "Cash and Short Term Investments + Accounts Receivable",
+            "Daily Cash Op Expenses": "(Cost of Goods Sold + Operating Expenses) / 365",
+            "Large Revenues": "Revenue > 300000000000",
+            "Current Ratio Spread": "Current Ratio - Quick Ratio",
+            "Invalid": "Unknown Item + Revenue",
+        }
+    )
+
+    assert list(custom_ratios.loc["AAPL"].index) == [
+        "Defensive Interval",
+        "Quick Assets",
+        "Daily Cash Op Expenses",
+        "Large Revenues",
+        "Current Ratio Spread",
+        "Invalid",
+    ]
+
+    balance = balance_dataset.loc["AAPL"]
+    income = income_dataset.loc["AAPL"]
+    quick_assets = (
+        balance.loc["Cash and Short Term Investments"]
+        + balance.loc["Accounts Receivable"]
+    )
+    daily_cash_op_expenses = (
+        income.loc["Cost of Goods Sold"] + income.loc["Operating Expenses"]
+    ) / 365
+
+    pd.testing.assert_series_equal(
+        custom_ratios.loc[("AAPL", "Defensive Interval")].dropna(),
+        (quick_assets / daily_cash_op_expenses).round(4).dropna(),
+        check_names=False,
+        check_index_type=False,
+    )
+    assert set(custom_ratios.loc[("AAPL", "Large Revenues")].dropna()) <= {0.0, 1.0}
+    assert (custom_ratios.loc[("MSFT", "Invalid")] == 0).all()
+
+
+def test_collect_custom_ratios_same_formula():
+    custom_ratios = ratios_module.collect_custom_ratios(
+        custom_ratios_dict={
+            "Revenue": "Revenue * 2",
+            "Double Custom Revenue": "Revenue * 2",
+            "Double Revenue": "Revenue*2",
+        }
+    )
+
+    # Revenue refers to the income statement in its own formula and to the custom ratio otherwise
+    revenue = income_dataset.loc[("AAPL", "Revenue")]
+
+    pd.testing.assert_series_equal(
+        custom_ratios.loc[("AAPL", "Revenue")].dropna(),
+        (revenue * 2).round(4).dropna(),
+        check_names=False,
+        check_index_type=False,
+    )
+    pd.testing.assert_series_equal(
+        custom_ratios.loc[("AAPL", "Double Custom Revenue")].dropna(),
+        (revenue * 4).round(4).dropna(),
+        check_names=False,
+        check_index_type=False,
+    )
+    pd.testing.assert_series_equal(
+        custom_ratios.loc[("AAPL", "Double Revenue")],
+        custom_ratios.loc[("AAPL", "Double Custom Revenue")],
+        check_names=False,
+    )
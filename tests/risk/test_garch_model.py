@@ -0,0 +1,171 @@
+"""GARCH Model Tests"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.risk import garch_model
+
+# pylint: disable=missing-function-docstring
+
+
+def simulate_garch(
+    time_steps: int, omega: float, alpha: float, beta: float, seed: int
+) -> np.ndarray:
+    generator = np.random.default_rng(seed)
+    returns = np.zeros(time_steps)
+    sigma_2 = omega / (1 - alpha - beta)
+
+    for i in range(time_steps):
+        returns[i] = np.sqrt(sigma_2) * generator.standard_normal()
+        sigma_2 = omega + alpha * returns[i] ** 2 + beta * sigma_2
+
+    return returns
+
+
+returns = simulate_garch(1500, omega=2e-6, alpha=0.08, beta=0.9, seed=5)
+
+
+def test_get_garch():
+    weights = [1e-5, 0.1, 0.8]
+    sigma_2 = np.zeros(len(returns))
+    sigma_2[0] = returns[0] ** 2
+
+    for i in range(1, len(returns)):
+        sigma_2[i] = (
+            weights[0] + weights[1] * returns[i - 1] ** 2 + weights[2] * sigma_2[i - 1]
+        )
+
+    np.testing.assert_allclose(garch_model.get_garch(returns, weights), sigma_2)
+    np.testing.assert_allclose(
+        garch_model.get_garch(returns, weights, time_steps=10), sigma_2[:10]
+    )
+
+
+def test_get_garch_p_q():
+    weights = [1e-5, 0.05, 0.03, 0.5, 0.2, 0.1]
+    sigma_2 = np.zeros(len(returns))
+    sigma_2[0] = returns[0] ** 2
+
+    for i in range(1, len(returns)):
+        sigma_2[i] = weights[0]
+        sigma_2[i] += sum(
+            weights[j] * returns[i - j] ** 2 for j in range(1, 3) if i - j >= 0
+        )
+        sigma_2[i] += sum(
+            weights[2 + k] * sigma_2[i - k] for k in range(1, 4) if i - k >= 0
+        )
+
+    np.testing.assert_allclose(
+        garch_model.get_garch(returns, weights, p=2, q=3), sigma_2
+    )
+
+    with pytest.raises(ValueError):
+        garch_model.get_garch(returns, weights, p=0, q=1)
+
+
+@pytest.mark.parametrize(
+    ("p", "q", "weights"),
+    [(1, 1, [1e-5, 0.1, 0.8]), (2, 2, [1e-5, 0.05, 0.03, 0.5, 0.3])],
+)
+def test_garch_log_maximization_gradient(p, q, weights):
+    gradient = garch_model.garch_log_maximization_gradient(
+        weights, returns, len(returns), p=p, q=q
+    )
+
+    numerical_gradient = []
+
+    for i, weight in enumerate(weights):
+        step = weight * 1e-6
+        upper, lower = list(weights), list(weights)
+        upper[i], lower[i] = weight + step, weight - step
+
+        numerical_gradient.append(
+            (
+                garch_model.garch_log_maximization(upper, returns, len(returns), p, q)
+                - garch_model.garch_log_maximization(lower, returns, len(returns), p, q)
+            )
+            / (2 * step)
+        )
+
+    np.testing.assert_allclose(gradient, numerical_gradient, rtol=1e-4)
+
+
+def test_get_garch_weights():
+    weights = garch_model.get_garch_weights(returns)
+
+    assert weights[1] == pytest.approx(0.08, abs=0.04)
+    assert weights[2] == pytest.approx(0.9, abs=0.04)
+    assert weights[1] + weights[2] < 1
+
+    # A warm start from the estimated weights results in the same estimate
+    np.testing.assert_allclose(
+        garch_model.get_garch_weights(returns, initial_weights=weights),
+        weights,
+        rtol=1e-3,
+    )
+
+    garch_weights = garch_model.get_garch_weights(returns, p=1, q=2)
+
+    assert len(garch_weights) == 4  # noqa: PLR2004
+    # The additional beta can only improve the likelihood of the GARCH(1, 1) estimate
+    assert (
+        garch_model.garch_log_maximization(
+            garch_weights, returns, len(returns), p=1, q=2
+        )
+        <= garch_model.garch_log_maximization(weights, returns, len(returns)) + 1e-3
+    )
+
+
+def test_get_garch_weights_keeps_initial_guess():
+    # A first return of (nearly) zero dominates the likelihood which can then not be improved
+    degenerate_returns = np.r_[1e-100, returns[:50]]
+
+    np.testing.assert_allclose(
+        garch_model.get_garch_weights(degenerate_returns),
+        [np.var(degenerate_returns[:-1]), 0.1, 0.8],
+    )
+
+
+def test_get_garch_within_period():
+    dates = pd.bdate_range("2020-01-01", periods=len(returns))
+    period_returns = pd.DataFrame(
+        {"A": returns, "B": returns[::-1].copy()},
+        index=pd.MultiIndex.from_arrays([dates.to_period("Y"), dates.to_period("D")]),
+    )
+
+    garch = garch_model.get_garch(period_returns)
+
+    assert garch.shape == (len(returns), 2)
+
+    for period in period_returns.index.get_level_values(0).unique():
+        period_values = period_returns.loc[period, "A"].to_numpy()
+        weights = garch_model.get_garch_weights(period_values)
+
+        assert garch_model.garch_log_maximization(
+            garch_model.get_garch_weights(
+                period_values, initial_weights=[1e-6, 0.05, 0.9]
+            ),
+            period_values,
+            len(period_values),
+        ) == pytest.approx(
+            garch_model.garch_log_maximization(
+                weights, period_values, len(period_values)
+            ),
+            abs=1e-2,
+        )
+
+
+def test_get_garch_forecast():
+    weights = [1e-5, 0.1, 0.8]
+    forecast = garch_model.get_garch_forecast(returns, weights, time_steps=5)
+    sigma_l = weights[0] / (1 - weights[1] - weights[2])
+
+    assert forecast[0] == returns[0] ** 2
+    np.testing.assert_allclose(
+        forecast[1:],
+        [
+            sigma_l**2 + (returns[0] ** 2 - sigma_l**2) * 0.9 ** (i - 1)
+            for i in range(1, 5)
+        ],
+    )
@@ -0,0 +1,111 @@
+"""Risk Helpers Tests"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.risk import helpers
+
+historical = pd.read_pickle("tests/datasets/historical_dataset.pickle")
+
+returns = historical["Return"].copy()
+returns.index = pd.DatetimeIndex(returns.index.to_timestamp())
+returns.iloc[[3, 40, 41], 1] = np.nan
+
+within_returns = helpers.determine_within_historical_data(
+    daily_historical_data=pd.concat({"Return": returns}, axis=1),
+    intraday_historical_data=pd.DataFrame(),
+    intraday_period=None,
+)
+
+# pylint: disable=missing-function-docstring
+
+
+def aggregate_per_period(period_returns: pd.DataFrame, function) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            period: period_returns.loc[period].aggregate(function)
+            for period in period_returns.index.get_level_values(0).unique()
+        }
+    ).T
+
+
+def test_determine_within_historical_data():
+    quarterly_returns = within_returns["quarterly"]["Return"]
+
+    assert quarterly_returns.index.nlevels == 2  # noqa: PLR2004
+    assert quarterly_returns.index.levels[0].freqstr == "Q-DEC"
+    assert quarterly_returns.index.levels[1].freqstr == "D"
+    pd.testing.assert_frame_equal(
+        quarterly_returns.loc["2020Q2"],
+        returns.loc["2020-04-01":"2020-06-30"].set_axis(
+            pd.PeriodIndex(returns.loc["2020-04-01":"2020-06-30"].index, freq="D")
+        ),
+    )
+
+
+@pytest.mark.parametrize("period", ["weekly", "monthly", "yearly"])
+def test_period_blocks_moments(period):
+    period_returns = within_returns[period]["Return"]
+    period_blocks = helpers.PeriodBlocks(period_returns)
+
+    pd.testing.assert_frame_equal(
+        period_blocks.to_dataframe(period_blocks.mean),
+        aggregate_per_period(period_returns, "mean"),
+    )
+    pd.testing.assert_frame_equal(
+        period_blocks.to_dataframe(period_blocks.std),
+        aggregate_per_period(period_returns, lambda x: x.std(ddof=0)),
+    )
+    pd.testing.assert_frame_equal(
+        period_blocks.to_dataframe(period_blocks.skewness),
+        aggregate_per_period(period_returns, "skew"),
+    )
+    pd.testing.assert_frame_equal(
+        period_blocks.to_dataframe(period_blocks.get_kurtosis()),
+        aggregate_per_period(period_returns, "kurtosis"),
+    )
+
+
+@pytest.mark.parametrize("alpha", [0.01, 0.05, 0.5, 1])
+def test_period_blocks_percentile(alpha):
+    period_returns = within_returns["monthly"]["Return"]
+    period_blocks = helpers.PeriodBlocks(period_returns)
+
+    percentile = period_blocks.to_dataframe(period_blocks.get_percentile(alpha))
+
+    pd.testing.assert_frame_equal(
+        percentile,
+        aggregate_per_period(period_returns, lambda x: np.percentile(x, alpha * 100)),
+    )
+
+    # Periods with missing returns have no percentile, just like np.percentile
+    assert percentile.loc[["2020-01", "2020-02"], "MSFT"].isna().all()
+    assert percentile.iloc[:, 0].notna().all()
+
+
+def test_period_blocks_drawdowns():
+    period_returns = within_returns["monthly"]["Return"]
+    period_blocks = helpers.PeriodBlocks(period_returns)
+
+    def get_max_drawdown(x):
+        cumulative_returns = (1 + x).cumprod()
+
+        return (cumulative_returns / cumulative_returns.cummax() - 1).min()
+
+    def get_ulcer_index(x):
+        cumulative_returns = (1 + x).cumprod()
+        cumulative_max = cumulative_returns.rolling(window=5).max()
+
+        return np.sqrt(
+            (((cumulative_returns - cumulative_max) / cumulative_max) ** 2).mean()
+        )
+
+    pd.testing.assert_frame_equal(
+        period_blocks.to_dataframe(period_blocks.get_max_drawdown()),
+        aggregate_per_period(period_returns, get_max_drawdown),
+    )
+    pd.testing.assert_frame_equal(
+        period_blocks.to_dataframe(period_blocks.get_ulcer_index(5)),
+        aggregate_per_period(period_returns, get_ulcer_index),
+    )
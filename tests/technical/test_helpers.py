@@ -5,6 +5,7 @@
 import inspect
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 
 from financetoolkit.technicals import helpers
@@ -248,3 +249,64 @@ def test_handle_errors_decorator_complex_function():
         assert isinstance(result, pd.Series)
         assert result.empty
         mock_logger.error.assert_called_once()
+
+
+def test_get_rolling_argmax_and_argmin_match_rolling_apply():
+    """Test that the rolling positions equal the positions found by rolling apply."""
+    values = np.array(
+        [
+            [1, 5, np.nan],
+            [3, 5, 2],
+            [3, 4, 2],
+            [2, 6, 1],
+            [np.nan, 6, 1],
+            [4, 1, 3],
+            [4, 1, 3],
+        ]
+    )
+    data = pd.DataFrame(values, columns=["A", "B", "C"])
+
+    for window in [1, 2, 3, 5, 8]:
+        pd.testing.assert_frame_equal(
+            helpers.get_rolling_argmax(data, window),
+            data.rolling(window).apply(lambda x: x.argmax(), raw=True),
+        )
+        pd.testing.assert_frame_equal(
+            helpers.get_rolling_argmin(data, window),
+            data.rolling(window).apply(lambda x: x.argmin(), raw=True),
+        )
+
+    pd.testing.assert_series_equal(
+        helpers.get_rolling_argmax(data["A"], 3),
+        data["A"].rolling(3).apply(lambda x: x.argmax(), raw=True),
+    )
+
+
+def test_share_intermediates_reuses_results():
+    """Test that intermediate results are shared only within the context."""
+    calls = []
+
+    @helpers.cache_intermediate
+    def double(data, factor=2):
+        calls.append(factor)
+        return data * factor
+
+    data = pd.Series([1.0, 2.0, 3.0])
+
+    double(data)
+    double(data)
+    assert len(calls) == 2
+
+    with helpers.share_intermediates():
+        result = double(data)
+
+        with helpers.share_intermediates():
+            assert double(data) is result
+
+        assert double(data, factor=3) is not result
+        assert double(data.copy()) is not result
+
+    assert calls == [2, 2, 2, 3, 2]
+
+    double(data)
+    assert len(calls) == 6
@@ -0,0 +1,203 @@
+"""Streaming Model Tests"""
+
+# ruff: noqa: PLR2004
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from financetoolkit.technicals import (
+    breadth_model,
+    momentum_model,
+    overlap_model,
+    streaming_model,
+    volatility_model,
+)
+
+# pylint: disable=missing-function-docstring
+
+
+def create_bars(gaps: bool) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = np.round(100 + np.cumsum(rng.normal(0, 1, 250)), 2)
+    close[50:60] = close[50]
+
+    bars = pd.DataFrame(
+        {
+            "Open": close + rng.normal(0, 0.5, 250).round(2),
+            "High": close + np.abs(rng.normal(0, 1, 250)).round(2),
+            "Low": close - np.abs(rng.normal(0, 1, 250)).round(2),
+            "Adj Close": close,
+            "Volume": rng.integers(1000, 5000, 250).astype(float),
+        }
+    )
+    bars.loc[80:85, "High"] = bars.loc[80:85, "Low"]
+
+    if gaps:
+        bars.iloc[:5] = np.nan
+        bars.iloc[200:203] = np.nan
+
+    return bars
+
+
+INDICATORS = {
+    "Moving Average": (
+        lambda: streaming_model.MovingAverage(14),
+        lambda b: overlap_model.get_moving_average(b["Adj Close"], 14),
+    ),
+    "Exponential Moving Average": (
+        lambda: streaming_model.ExponentialMovingAverage(14),
+        lambda b: overlap_model.get_exponential_moving_average(b["Adj Close"], 14),
+    ),
+    "Double Exponential Moving Average": (
+        lambda: streaming_model.DoubleExponentialMovingAverage(14),
+        lambda b: overlap_model.get_double_exponential_moving_average(
+            b["Adj Close"], 14
+        ),
+    ),
+    "Trix": (
+        lambda: streaming_model.Trix(14),
+        lambda b: overlap_model.get_trix(b["Adj Close"], 14),
+    ),
+    "Triangular Moving Average": (
+        lambda: streaming_model.TriangularMovingAverage(14),
+        lambda b: overlap_model.get_triangular_moving_average(b["Adj Close"], 14),
+    ),
+    "Relative Strength Index": (
+        lambda: streaming_model.RelativeStrengthIndex(14),
+        lambda b: momentum_model.get_relative_strength_index(b["Adj Close"], 14),
+    ),
+    "MACD": (
+        lambda: streaming_model.MovingAverageConvergenceDivergence(12, 26, 9),
+        lambda b: momentum_model.get_moving_average_convergence_divergence(
+            b["Adj Close"], 12, 26, 9
+        ),
+    ),
+    "Percentage Price Oscillator": (
+        lambda: streaming_model.PercentagePriceOscillator(7, 28),
+        lambda b: momentum_model.get_percentage_price_oscillator(b["Adj Close"], 7, 28),
+    ),
+    "Chande Momentum Oscillator": (
+        lambda: streaming_model.ChandeMomentumOscillator(14),
+        lambda b: momentum_model.get_chande_momentum_oscillator(b["Adj Close"], 14),
+    ),
+    "Stochastic Oscillator": (
+        lambda: streaming_model.StochasticOscillator(14, 3),
+        lambda b: momentum_model.get_stochastic_oscillator(
+            b["High"], b["Low"], b["Adj Close"], 14, 3
+        ),
+    ),
+    "Williams %R": (
+        lambda: streaming_model.WilliamsPercentR(14),
+        lambda b: momentum_model.get_williams_percent_r(
+            b["High"], b["Low"], b["Adj Close"], 14
+        ),
+    ),
+    "Money Flow Index": (
+        lambda: streaming_model.MoneyFlowIndex(14),
+        lambda b: momentum_model.get_money_flow_index(
+            b["High"], b["Low"], b["Adj Close"], b["Volume"], 14
+        ),
+    ),
+    "Commodity Channel Index": (
+        lambda: streaming_model.CommodityChannelIndex(14),
+        lambda b: momentum_model.get_commodity_channel_index(
+            b["High"], b["Low"], b["Adj Close"], 14
+        ),
+    ),
+    "Balance of Power": (
+        streaming_model.BalanceOfPower,
+        lambda b: momentum_model.get_balance_of_power(
+            b["Open"], b["High"], b["Low"], b["Adj Close"]
+        ),
+    ),
+    "Average Directional Index": (
+        lambda: streaming_model.AverageDirectionalIndex(14),
+        lambda b: momentum_model.get_average_directional_index(
+            b["High"], b["Low"], b["Adj Close"], 14
+        ),
+    ),
+    "True Range": (
+        streaming_model.TrueRange,
+        lambda b: volatility_model.get_true_range(b["High"], b["Low"], b["Adj Close"]),
+    ),
+    "Average True Range": (
+        lambda: streaming_model.AverageTrueRange(14),
+        lambda b: volatility_model.get_average_true_range(
+            b["High"], b["Low"], b["Adj Close"], 14
+        ),
+    ),
+    "Bollinger Bands": (
+        lambda: streaming_model.BollingerBands(20, 2),
+        lambda b: volatility_model.get_bollinger_bands(b["Adj Close"], 20, 2),
+    ),
+    "Keltner Channels": (
+        lambda: streaming_model.KeltnerChannels(20, 10, 2),
+        lambda b: volatility_model.get_keltner_channels(
+            b["High"], b["Low"], b["Adj Close"], 20, 10, 2
+        ),
+    ),
+    "Advancers Decliners": (
+        streaming_model.AdvancersDecliners,
+        lambda b: breadth_model.get_advancers_decliners(b["Adj Close"]),
+    ),
+    "McClellan Oscillator": (
+        lambda: streaming_model.McClellanOscillator(19, 39),
+        lambda b: breadth_model.get_mcclellan_oscillator(b["Adj Close"], 19, 39),
+    ),
+    "On-Balance Volume": (
+        streaming_model.OnBalanceVolume,
+        lambda b: breadth_model.get_on_balance_volume(b["Adj Close"], b["Volume"]),
+    ),
+    "Accumulation Distribution Line": (
+        streaming_model.AccumulationDistributionLine,
+        lambda b: breadth_model.get_accumulation_distribution_line(
+            b["High"], b["Low"], b["Adj Close"], b["Volume"]
+        ),
+    ),
+    "Chaikin Oscillator": (
+        lambda: streaming_model.ChaikinOscillator(3, 10),
+        lambda b: breadth_model.get_chaikin_oscillator(
+            b["High"], b["Low"], b["Adj Close"], b["Volume"], 3, 10
+        ),
+    ),
+}
+
+
+@pytest.mark.parametrize("gaps", [False, True])
+@pytest.mark.parametrize("name", list(INDICATORS))
+def test_streaming_indicators_match_batch_results(name, gaps):
+    create_indicator, calculate_batch = INDICATORS[name]
+    bars = create_bars(gaps)
+
+    indicator = create_indicator()
+    values = [indicator.update(bar) for bar in bars.to_dict("records")]
+
+    expected = calculate_batch(bars)
+    result = (
+        pd.DataFrame(values, index=bars.index)
+        if isinstance(values[0], dict)
+        else pd.Series(values, index=bars.index)
+    )
+
+    np.testing.assert_array_equal(
+        np.asarray(result, dtype=float), np.asarray(expected, dtype=float)
+    )
+
+
+def test_streaming_indicator_accepts_close_prices():
+    indicator = streaming_model.ExponentialMovingAverage(3)
+
+    assert indicator.update(1.0) == 1.0
+    assert indicator.update(3.0) == 2.0
+
+
+def test_streaming_indicator_requires_update():
+    with pytest.raises(TypeError):
+        streaming_model.StreamingIndicator()  # pylint: disable=abstract-class-instantiated
+
+    class LastClose(streaming_model.StreamingIndicator):
+        def update(self, bar) -> float:
+            return self._get_close(bar)
+
+    assert LastClose().update({"Adj Close": 2.0}) == 2.0
@@ -0,0 +1,57 @@
+"""FinancialModelingPrep Model Tests"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from financetoolkit import fmp_model
+
+# pylint: disable=missing-function-docstring,protected-access
+
+
+def test_aget_financial_data_stops_retrying_unknown_errors():
+    requests_made = []
+
+    async def aget(url, timeout=60):  # pylint: disable=unused-argument
+        requests_made.append(url)
+        return httpx.Response(500, text="Internal Server Error")
+
+    async def sleep(seconds):  # pylint: disable=unused-argument
+        return None
+
+    with (
+        patch.object(fmp_model.fetch_model, "aget", aget),
+        patch.object(fmp_model.asyncio, "sleep", sleep),
+    ):
+        financial_data = asyncio.run(
+            fmp_model.aget_financial_data("https://example.com/stable/profile")
+        )
+
+    assert list(financial_data.columns) == ["NO ERRORS"]
+    assert len(requests_made) == fmp_model.RETRY_LIMIT + 1
+
+
+def test_get_historical_data_urls_pad_period():
+    padded_url, _, padded_start, padded_end = fmp_model._get_historical_data_urls(
+        ticker="AAPL",
+        api_key="KEY",
+        start="2024-01-10",
+        end="2024-03-31",
+        user_subscription="Premium",
+    )
+
+    assert (padded_start, padded_end) == ("2023-01-10", "2025-03-31")
+    assert "from=2023-01-10&to=2025-03-31" in padded_url
+
+    url, _, start, end = fmp_model._get_historical_data_urls(
+        ticker="AAPL",
+        api_key="KEY",
+        start="2024-01-10",
+        end="2024-03-31",
+        user_subscription="Premium",
+        pad_period=False,
+    )
+
+    assert (start, end) == ("2024-01-10", "2024-03-31")
+    assert "from=2024-01-10&to=2024-03-31" in url
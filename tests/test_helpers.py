@@ -121,6 +121,47 @@ def test_calculate_growth_warnings_suppression():
         assert len(future_warnings) == 0
 
 
+def test_calculate_growth_with_list_lag_and_missing_data():
+    """Test that every lag forward fills and calculates growth per row or column."""
+    data = pd.DataFrame(
+        [[100, np.nan, 121, 0], [np.nan, 50, 60, 90], [10, 20, np.nan, 40]],
+        index=pd.MultiIndex.from_tuples(
+            [("AAPL", "Revenue"), ("AAPL", "Assets"), ("MSFT", "Revenue")]
+        ),
+        columns=["2020", "2021", "2022", "2023"],
+    )
+
+    result = helpers.calculate_growth(data, lag=[1, 2])
+
+    assert list(result.index)[:2] == [
+        ("AAPL", "Revenue", "Lag 1"),
+        ("AAPL", "Revenue", "Lag 2"),
+    ]
+
+    for row in data.index:
+        for lag in [1, 2]:
+            np.testing.assert_array_almost_equal(
+                result.loc[(*row, f"Lag {lag}")].to_numpy(dtype=float),
+                data.loc[row].ffill().pct_change(periods=lag).round(4).to_numpy(),
+            )
+
+    result_index = helpers.calculate_growth(data.T, lag=[1, 2], axis="index")
+
+    pd.testing.assert_frame_equal(result_index, result.T)
+
+
+def test_calculate_growth_keeps_warning_filters():
+    """Test that the global warning filters are not altered."""
+    data = pd.DataFrame({"2020": [100], "2021": [110]}, index=["Revenue"])
+
+    filters = list(warnings.filters)
+
+    helpers.calculate_growth(data)
+    helpers.calculate_growth(data, lag=[1, 2])
+
+    assert warnings.filters == filters
+
+
 def test_combine_dataframes():
     """Test combining dataframes from different companies."""
     df1 = pd.DataFrame(
@@ -3,3 +3,97 @@
 # ruff: noqa
 
 # pylint: disable=missing-function-docstring
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from financetoolkit import helpers, historical_model
+
+
+def create_historical_data(tickers, start, end, periods, dividend_date=None):
+    dates = pd.period_range("2022-01-01", periods=periods, freq="D")
+    historical_data = {}
+
+    for number, ticker in enumerate(tickers):
+        prices = 100 + number + np.cumsum(np.sin(np.arange(periods) + number))
+        data = pd.DataFrame(
+            {
+                "Open": prices,
+                "High": prices + 1,
+                "Low": prices - 1,
+                "Close": prices,
+                "Adj Close": prices,
+                "Volume": 1000.0,
+                "Dividends": 0.0,
+            },
+            index=dates,
+        )
+
+        if dividend_date:
+            data.loc[dividend_date, "Dividends"] = 0.5
+
+        historical_data[ticker] = helpers.enrich_historical_data(
+            historical_data=data, start=start, end=end
+        )
+
+    return pd.concat(historical_data).unstack(level=0).dropna(how="all", axis=1)
+
+
+def mock_get_historical_data(full_data, requested):
+    def get_historical_data(tickers, start=None, pad_period=True, **kwargs):
+        requested.append((tuple(tickers), start, pad_period))
+
+        return full_data.loc[:, (slice(None), tickers)], []
+
+    return get_historical_data
+
+
+def test_update_historical_data():
+    tickers = ["AAPL", "MSFT"]
+    full_data = create_historical_data(tickers, "2022-01-10", "2022-04-30", 120)
+    cached_data = create_historical_data(tickers, "2022-01-10", "2022-03-31", 90)
+    requested = []
+
+    with patch.object(
+        historical_model,
+        "get_historical_data",
+        side_effect=mock_get_historical_data(full_data, requested),
+    ):
+        updated_data, no_data = historical_model.update_historical_data(
+            historical_data=cached_data, start="2022-01-10", end="2022-04-30"
+        )
+
+    # Both tickers share the same last date and are therefore retrieved once from that date
+    assert requested == [(("AAPL", "MSFT"), "2022-03-31", False)]
+    assert not no_data
+
+    for column in ["Close", "Return", "Volatility", "Cumulative Return"]:
+        pd.testing.assert_frame_equal(
+            updated_data[column], full_data[column], check_freq=False
+        )
+
+
+def test_update_historical_data_refreshes_changed_history():
+    tickers = ["AAPL"]
+    full_data = create_historical_data(
+        tickers, "2022-01-10", "2022-04-30", 120, dividend_date="2022-04-15"
+    )
+    cached_data = create_historical_data(tickers, "2022-01-10", "2022-03-31", 90)
+    requested = []
+
+    with patch.object(
+        historical_model,
+        "get_historical_data",
+        side_effect=mock_get_historical_data(full_data, requested),
+    ):
+        historical_model.update_historical_data(
+            historical_data=cached_data, start="2022-01-10", end="2022-04-30"
+        )
+
+    # The dividend changes the adjusted history and thus the entire history is retrieved
+    assert requested == [
+        (("AAPL",), "2022-03-31", False),
+        (("AAPL",), "2022-01-10", True),
+    ]
@@ -1,8 +1,12 @@
 # ruff: noqa
 """Toolkit Controller Tests""" ""
+import tempfile
+from unittest.mock import patch
+
 import pandas as pd
 
 from financetoolkit import Toolkit
+from financetoolkit.utilities import cache_model
 
 balance_dataset = pd.read_pickle("tests/datasets/balance_dataset.pickle")
 income_dataset = pd.read_pickle("tests/datasets/income_dataset.pickle")
@@ -193,3 +197,171 @@ def test_toolkit_technicals(recorder):
     recorder.capture(
         toolkit.technicals.collect_all_indicators(growth=True, lag=[1, 2, 3]).round(0)
     )
+
+
+def test_toolkit_controllers_are_cached():
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        balance=balance_dataset,
+        income=income_dataset,
+        cash=cash_dataset,
+        historical=historical_dataset,
+        convert_currency=False,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    ratios = toolkit.ratios
+    risk = toolkit.risk
+
+    assert toolkit.ratios is ratios
+    assert toolkit.risk is risk
+
+    # The ratios the controller has calculated are kept with it
+    ratios.collect_profitability_ratios()
+    assert not toolkit.ratios._profitability_ratios.empty
+
+    # Replacing any of the inputs results in a new controller
+    toolkit._balance_sheet_statement = toolkit._balance_sheet_statement.copy()
+    assert toolkit.ratios is not ratios
+    assert toolkit.ratios._profitability_ratios.empty
+    assert toolkit.risk is risk
+
+    toolkit._portfolio_weights = {"daily": pd.DataFrame()}
+    assert toolkit.risk is not risk
+
+
+def test_toolkit_computation_cache_is_shared():
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        balance=balance_dataset,
+        income=income_dataset,
+        cash=cash_dataset,
+        historical=historical_dataset,
+        convert_currency=False,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    all_ratios = toolkit.ratios.collect_all_ratios()
+    custom_ratios = toolkit.ratios.collect_custom_ratios(
+        {"Double Revenue": "Revenue * 2"}
+    )
+    altman_z_score = toolkit.models.get_altman_z_score()
+
+    computation_cache = toolkit.ratios._computation_cache
+
+    assert toolkit.models._computation_cache is computation_cache
+    assert len(computation_cache) == 4
+
+    # Changing a returned result does not change the cached result
+    all_ratios.iloc[:, :] = 0
+
+    # The results are reused by new controllers as long as the data is unchanged
+    toolkit._controllers.clear()
+
+    pd.testing.assert_frame_equal(
+        toolkit.ratios.collect_all_ratios(), toolkit.ratios._calculate_all_ratios()
+    )
+    assert toolkit.ratios._efficiency_ratios.empty
+    assert (toolkit.ratios.collect_all_ratios() != 0).any().any()
+    pd.testing.assert_frame_equal(
+        toolkit.ratios.collect_custom_ratios({"Double Revenue": "Revenue * 2"}),
+        custom_ratios,
+    )
+    pd.testing.assert_frame_equal(toolkit.models.get_altman_z_score(), altman_z_score)
+    assert len(computation_cache) == 4
+
+    # Other arguments are calculated and stored separately
+    toolkit.ratios.collect_all_ratios(growth=True)
+    toolkit.ratios.collect_all_ratios(rounding=2)
+    assert len(computation_cache) == 7
+
+    # Replacing the data of a controller removes the results of that controller
+    toolkit._daily_risk_free_rate = risk_free_rate.copy()
+    assert toolkit.models._computation_cache is computation_cache
+    assert len(computation_cache) == 6
+
+    toolkit._income_statement = toolkit._income_statement.copy()
+    assert toolkit.ratios._computation_cache is computation_cache
+    assert not computation_cache
+
+
+def test_toolkit_extends_cached_historical_data():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_model.save_ticker_data(
+            cached_data=historical_dataset,
+            cached_data_location=temp_dir,
+            source="Toolkit",
+            endpoint="historical_data",
+            period="daily",
+            params={"start_date": "2019-12-31"},
+        )
+
+        def create_toolkit(end_date):
+            return Toolkit(
+                tickers=["AAPL", "MSFT"],
+                balance=balance_dataset,
+                income=income_dataset,
+                cash=cash_dataset,
+                convert_currency=False,
+                start_date="2019-12-31",
+                end_date=end_date,
+                use_cached_data=temp_dir,
+                sleep_timer=False,
+                progress_bar=False,
+            )
+
+        # The cached data covers the end date and is used as is
+        toolkit = create_toolkit(end_date="2022-12-30")
+        assert not toolkit._extend_historical_data
+
+        # Without the pinned configurations, the cached data ends before the end date
+        # and is therefore extended
+        cache_model.remove_cached_data(temp_dir, "configurations.pickle")
+
+        toolkit = create_toolkit(end_date="2023-01-31")
+        toolkit._daily_risk_free_rate = risk_free_rate
+        assert toolkit._extend_historical_data
+
+        with patch(
+            "financetoolkit.toolkit_controller._update_historical_data",
+            return_value=(historical_dataset, []),
+        ) as update_historical_data:
+            toolkit.get_historical_data()
+            toolkit.get_historical_data()
+
+        update_historical_data.assert_called_once()
+        assert update_historical_data.call_args.kwargs["end"] == "2023-01-31"
+
+
+def test_toolkit_historical_rounding_is_not_reused():
+    toolkit = Toolkit(
+        tickers=["AAPL", "MSFT"],
+        historical=historical_dataset,
+        start_date="2019-12-31",
+        end_date="2023-01-01",
+        sleep_timer=False,
+    )
+
+    toolkit._daily_risk_free_rate = risk_free_rate
+    toolkit._daily_treasury_data = treasury_data
+
+    unrounded = toolkit.get_historical_data(period="yearly")
+    rounded = toolkit.get_historical_data(period="yearly", rounding=1)
+
+    assert not rounded.equals(unrounded)
+    pd.testing.assert_frame_equal(rounded, unrounded.round(1))
+
+    # A later call without rounding does not return the rounded data
+    pd.testing.assert_frame_equal(
+        toolkit.get_historical_data(period="yearly"), unrounded
+    )
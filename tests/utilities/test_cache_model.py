@@ -4,6 +4,7 @@
 import os
 import pickle
 import tempfile
+import time
 from unittest.mock import patch
 
 import pandas as pd
@@ -129,29 +130,31 @@ def test_save_cached_data_pickle_method():
 
 
 def test_save_cached_data_file_already_exists():
-    """Test saving cached data when file already exists."""
+    """Test that saving cached data replaces an existing file."""
     test_data = pd.DataFrame({"A": [1, 2, 3]})
+    new_data = pd.DataFrame({"A": [4, 5, 6]})
 
     with tempfile.TemporaryDirectory() as temp_dir:
         file_path = os.path.join(temp_dir, "existing_file.pkl")
 
         # Create existing file
         test_data.to_pickle(file_path)
-        original_mtime = os.path.getmtime(file_path)
 
         with patch("financetoolkit.utilities.cache_model.logger") as mock_logger:
             cache_model.save_cached_data(
-                cached_data=test_data,
+                cached_data=new_data,
                 cached_data_location=temp_dir,
                 file_name="existing_file.pkl",
                 method="pandas",
             )
 
-            # File should not be overwritten
-            assert os.path.getmtime(file_path) == original_mtime
+            # File should be overwritten so the cache can be refreshed
+            pd.testing.assert_frame_equal(pd.read_pickle(file_path), new_data)
 
-            # No log message should be shown
-            mock_logger.info.assert_not_called()
+            # No temporary files should remain
+            assert os.listdir(temp_dir) == ["existing_file.pkl"]
+
+            mock_logger.info.assert_called_once()
 
 
 def test_save_cached_data_no_message():
@@ -282,3 +285,221 @@ def test_load_cached_data_with_complex_pickle_data():
         assert result["list"] == test_data["list"]
         assert result["nested"] == test_data["nested"]
         pd.testing.assert_frame_equal(result["dataframe"], test_data["dataframe"])
+
+
+def test_get_cache_key_depends_on_request():
+    """Test that the cache key changes with every part of the request."""
+    key = cache_model.get_cache_key("Toolkit", "historical_data", "AAPL", "daily")
+
+    assert key == cache_model.get_cache_key(
+        "Toolkit", "historical_data", "AAPL", "daily", {}
+    )
+    assert key != cache_model.get_cache_key(
+        "Toolkit", "historical_data", "MSFT", "daily"
+    )
+    assert key != cache_model.get_cache_key(
+        "Toolkit", "historical_data", "AAPL", "daily", {"start_date": "2020-01-01"}
+    )
+
+
+def test_save_and_load_entry_with_columns():
+    """Test that an entry is loaded back entirely or for a selection of columns."""
+    test_data = pd.DataFrame(
+        {"Close": [1.0, 2.0, 3.0], "Volume": [10, 20, 30]},
+        index=pd.period_range("2023-01-01", periods=3, freq="D"),
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assert cache_model.save_entry(
+            test_data, temp_dir, "Toolkit", "historical_data", ticker="AAPL"
+        )
+
+        result = cache_model.load_entry(
+            temp_dir, "Toolkit", "historical_data", ticker="AAPL"
+        )
+        pd.testing.assert_frame_equal(result, test_data)
+
+        result = cache_model.load_entry(
+            temp_dir, "Toolkit", "historical_data", ticker="AAPL", columns=["Close"]
+        )
+        pd.testing.assert_frame_equal(result, test_data[["Close"]])
+
+        assert cache_model.load_entry(
+            temp_dir, "Toolkit", "historical_data", ticker="MSFT"
+        ).empty
+
+
+def test_load_entry_expired():
+    """Test that an expired entry is not returned and can be removed."""
+    test_data = pd.DataFrame({"A": [1, 2, 3]})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_model.save_entry(test_data, temp_dir, "FMP", "quote", time_to_live=60)
+        cache_model.save_entry(test_data, temp_dir, "FMP", "profile")
+
+        with patch(
+            "financetoolkit.utilities.cache_model.time.time",
+            return_value=time.time() + 120,
+        ):
+            assert cache_model.load_entry(temp_dir, "FMP", "quote").empty
+            assert not cache_model.load_entry(temp_dir, "FMP", "profile").empty
+
+            assert cache_model.remove_expired_entries(temp_dir) == 1
+
+
+def test_entry_metadata_and_refresh():
+    """Test that metadata is kept in the manifest and that an entry can be refreshed."""
+    test_data = pd.DataFrame({"A": [1.0, 2.0, 3.0]})
+    params = {"url": "https://example.com/factors.zip"}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assert cache_model.load_manifest(temp_dir, "FamaFrench", "factors") == {}
+        assert not cache_model.refresh_entry(temp_dir, "FamaFrench", "factors")
+
+        cache_model.save_entry(
+            test_data,
+            temp_dir,
+            "FamaFrench",
+            "factors",
+            params=params,
+            time_to_live=60,
+            metadata={"etag": '"abc"'},
+        )
+
+        manifest = cache_model.load_manifest(
+            temp_dir, "FamaFrench", "factors", params=params
+        )
+        assert manifest["metadata"] == {"etag": '"abc"'}
+        assert not cache_model.is_expired(manifest)
+
+        future = time.time() + 120
+
+        with patch(
+            "financetoolkit.utilities.cache_model.time.time", return_value=future
+        ):
+            assert cache_model.is_expired(manifest)
+            assert cache_model.load_entry(
+                temp_dir, "FamaFrench", "factors", params=params
+            ).empty
+
+            pd.testing.assert_frame_equal(
+                cache_model.load_entry(
+                    temp_dir,
+                    "FamaFrench",
+                    "factors",
+                    params=params,
+                    include_expired=True,
+                ),
+                test_data,
+            )
+
+            assert cache_model.refresh_entry(
+                temp_dir, "FamaFrench", "factors", params=params
+            )
+
+            manifest = cache_model.load_manifest(
+                temp_dir, "FamaFrench", "factors", params=params
+            )
+            assert manifest["created"] == future
+            assert manifest["metadata"] == {"etag": '"abc"'}
+
+            pd.testing.assert_frame_equal(
+                cache_model.load_entry(
+                    temp_dir, "FamaFrench", "factors", params=params
+                ),
+                test_data,
+            )
+
+
+def test_save_and_load_ticker_data():
+    """Test that data with tickers in the columns is stored and loaded per ticker."""
+    historical_data = pd.read_pickle("tests/datasets/historical_dataset.pickle")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assert cache_model.save_ticker_data(
+            historical_data, temp_dir, "Toolkit", "historical_data", period="daily"
+        )
+
+        result = cache_model.load_ticker_data(
+            temp_dir,
+            "Toolkit",
+            "historical_data",
+            tickers=list(historical_data.columns.get_level_values(1).unique()),
+            period="daily",
+        )
+        pd.testing.assert_frame_equal(result, historical_data)
+
+        result = cache_model.load_ticker_data(
+            temp_dir,
+            "Toolkit",
+            "historical_data",
+            tickers=["MSFT"],
+            period="daily",
+            columns=["Close"],
+        )
+        pd.testing.assert_frame_equal(
+            result, historical_data.loc[:, [("Close", "MSFT")]]
+        )
+
+        # A missing ticker results in an empty DataFrame so that the data is collected again
+        assert cache_model.load_ticker_data(
+            temp_dir, "Toolkit", "historical_data", tickers=["MSFT", "TSLA"]
+        ).empty
+
+
+def test_save_entry_removes_other_format():
+    """Test that switching the format of an entry removes the file of the previous format."""
+    columnar_data = pd.DataFrame({"A": [1.0, 2.0]})
+    mixed_data = pd.DataFrame({("A", "B"): [1.0, 2.0]})
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_model.save_entry(columnar_data, temp_dir, "FMP", "profile")
+        cache_model.save_entry(mixed_data, temp_dir, "FMP", "profile")
+
+        extensions = sorted(
+            os.path.splitext(file_name)[1]
+            for _, _, file_names in os.walk(temp_dir)
+            for file_name in file_names
+        )
+
+        assert extensions == [".json", ".pickle"]
+        pd.testing.assert_frame_equal(
+            cache_model.load_entry(temp_dir, "FMP", "profile"), mixed_data
+        )
+
+
+def test_save_and_load_ticker_data_with_tickers_as_columns():
+    """Test that data with the tickers as columns is stored and loaded per ticker."""
+    profile = pd.DataFrame(
+        {"AAPL": ["Apple", 1.5], "MSFT": ["Microsoft", 2.5]},
+        index=["Company Name", "Beta"],
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        assert cache_model.save_ticker_data(
+            profile, temp_dir, "Toolkit", "profile", time_to_live=60, level=None
+        )
+
+        result = cache_model.load_ticker_data(
+            temp_dir, "Toolkit", "profile", tickers=["MSFT", "AAPL"], level=None
+        )
+        pd.testing.assert_frame_equal(result, profile[["MSFT", "AAPL"]])
+
+        with patch(
+            "financetoolkit.utilities.cache_model.time.time",
+            return_value=time.time() + 120,
+        ):
+            assert cache_model.load_ticker_data(
+                temp_dir, "Toolkit", "profile", tickers=["AAPL"], level=None
+            ).empty
+
+
+def test_remove_cached_data():
+    """Test that cached data is removed when it exists."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_model.save_cached_data(
+            pd.DataFrame({"A": [1]}), temp_dir, "profile.pickle", include_message=False
+        )
+
+        assert cache_model.remove_cached_data(temp_dir, "profile.pickle")
+        assert not cache_model.remove_cached_data(temp_dir, "profile.pickle")
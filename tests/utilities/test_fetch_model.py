@@ -0,0 +1,254 @@
+# ruff: noqa
+"""Fetch Model Tests"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from financetoolkit.utilities import fetch_model
+
+
+def test_token_bucket_invalid_rate():
+    """Test that the token bucket rejects a non-positive rate."""
+    with pytest.raises(ValueError, match="larger than zero"):
+        fetch_model.TokenBucket(requests_per_minute=0)
+
+
+def test_token_bucket_allows_burst_up_to_capacity():
+    """Test that the token bucket allows a burst up to its capacity without waiting."""
+    bucket = fetch_model.TokenBucket(requests_per_minute=600, capacity=5)
+
+    waited = [bucket.acquire() for _ in range(5)]
+
+    assert waited == [0.0] * 5
+
+
+def test_token_bucket_waits_when_empty():
+    """Test that the token bucket waits for a new token once it is empty."""
+    bucket = fetch_model.TokenBucket(requests_per_minute=1200, capacity=1)
+
+    bucket.acquire()
+    start = time.monotonic()
+    bucket.acquire()
+
+    # 1200 requests per minute equals one token every 0.05 seconds
+    assert time.monotonic() - start >= 0.04
+
+
+def test_run_workers_processes_all_items():
+    """Test that the worker is called for every item with the shared arguments."""
+    results: dict[str, str] = {}
+
+    def worker(ticker, results_dict):
+        results_dict[ticker] = ticker.lower()
+
+    fetch_model.run_workers(worker, ["AAPL", "MSFT", "TSLA"], results)
+
+    assert results == {"AAPL": "aapl", "MSFT": "msft", "TSLA": "tsla"}
+
+
+def test_run_workers_is_bounded():
+    """Test that no more workers than configured run at the same time."""
+    active = []
+    maximum = []
+    lock = threading.Lock()
+
+    def worker(_):
+        with lock:
+            active.append(1)
+            maximum.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+
+    fetch_model.configure(max_workers=3)
+
+    try:
+        fetch_model.run_workers(worker, range(20))
+    finally:
+        fetch_model.configure(max_workers=fetch_model.MAX_WORKERS)
+
+    assert max(maximum) <= 3
+
+
+def test_run_workers_continues_after_errors(caplog):
+    """Test that an error within a worker does not stop the other workers."""
+    results: dict[str, str] = {}
+
+    def worker(ticker, results_dict):
+        if ticker == "AAPL":
+            raise ValueError("Test error")
+        results_dict[ticker] = ticker.lower()
+
+    fetch_model.run_workers(worker, ["AAPL", "MSFT"], results)
+
+    assert results == {"MSFT": "msft"}
+    assert "collecting the data for AAPL: Test error" in caplog.text
+
+
+def test_configure_invalid_values():
+    """Test that invalid configurations are rejected."""
+    with pytest.raises(ValueError, match="at least 1"):
+        fetch_model.configure(max_workers=0)
+
+    with pytest.raises(ValueError, match="valid plan"):
+        fetch_model.configure(plan="Unknown")
+
+
+def test_get_records_statistics_per_endpoint():
+    """Test that the throughput is recorded per endpoint."""
+    fetch_model.reset_statistics()
+
+    response = MagicMock()
+    response.ok = True
+    session = MagicMock()
+    session.get.return_value = response
+
+    with patch.object(fetch_model, "get_session", return_value=session):
+        fetch_model.get(
+            "https://example.com/stable/profile?symbol=AAPL", rate_limit=False
+        )
+        fetch_model.get(
+            "https://example.com/stable/profile?symbol=MSFT", rate_limit=False
+        )
+        response.ok = False
+        fetch_model.get(
+            "https://example.com/stable/quote?symbol=AAPL", rate_limit=False
+        )
+
+    statistics = fetch_model.get_statistics()
+
+    assert list(statistics.index) == ["/stable/profile", "/stable/quote"]
+    assert statistics.loc["/stable/profile", "Requests"] == 2
+    assert statistics.loc["/stable/profile", "Errors"] == 0
+    assert statistics.loc["/stable/quote", "Errors"] == 1
+    assert (statistics["Requests per Second"] > 0).all()
+
+    fetch_model.reset_statistics()
+
+    assert fetch_model.get_statistics().empty
+
+
+def test_get_session_is_shared():
+    """Test that the same session is returned on consecutive calls."""
+    assert fetch_model.get_session() is fetch_model.get_session()
+
+
+def test_token_bucket_acquire_async_allows_burst():
+    """Test that the asynchronous acquire shares the burst capacity of the bucket."""
+    bucket = fetch_model.TokenBucket(requests_per_minute=600, capacity=2)
+
+    async def acquire():
+        return [await bucket.acquire_async() for _ in range(2)]
+
+    assert asyncio.run(acquire()) == [0.0, 0.0]
+    assert bucket.acquire() > 0
+
+
+def test_arun_workers_processes_all_items():
+    """Test that the asynchronous worker is awaited for every item."""
+    results: dict[str, str] = {}
+
+    async def worker(ticker, results_dict):
+        await asyncio.sleep(0)
+        results_dict[ticker] = ticker.lower()
+
+    asyncio.run(fetch_model.arun_workers(worker, ["AAPL", "MSFT"], results))
+
+    assert results == {"AAPL": "aapl", "MSFT": "msft"}
+
+
+def test_aget_records_statistics_per_endpoint():
+    """Test that asynchronous requests go through the shared client and are recorded."""
+    fetch_model.reset_statistics()
+
+    def handler(request):
+        status_code = 200 if request.url.path == "/stable/profile" else 429
+        return httpx.Response(status_code, json=[{"symbol": "AAPL"}])
+
+    async def fetch():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        semaphore = asyncio.Semaphore(2)
+
+        with patch.object(
+            fetch_model, "get_async_client", return_value=(client, semaphore)
+        ):
+            profile = await fetch_model.aget(
+                "https://example.com/stable/profile?symbol=AAPL", rate_limit=False
+            )
+            quote = await fetch_model.aget(
+                "https://example.com/stable/quote?symbol=AAPL", rate_limit=False
+            )
+
+        await client.aclose()
+
+        return profile, quote
+
+    profile, quote = asyncio.run(fetch())
+
+    assert profile.json() == [{"symbol": "AAPL"}]
+    assert quote.status_code == 429
+
+    statistics = fetch_model.get_statistics()
+
+    assert statistics.loc["/stable/profile", "Errors"] == 0
+    assert statistics.loc["/stable/quote", "Errors"] == 1
+
+    fetch_model.reset_statistics()
+
+
+def test_get_async_client_is_bound_to_event_loop():
+    """Test that each event loop receives its own client that is reused within the loop."""
+
+    async def get_clients():
+        first, _ = fetch_model.get_async_client()
+        second, _ = fetch_model.get_async_client()
+        await fetch_model.close_async_client()
+
+        return first, second
+
+    first, second = asyncio.run(get_clients())
+    third, _ = asyncio.run(get_clients())
+
+    assert first is second
+    assert first is not third
+
+
+def test_arun_workers_continues_after_errors():
+    """Test that an error within an asynchronous worker does not stop the other workers."""
+    results: dict[str, str] = {}
+
+    async def worker(ticker, results_dict):
+        if ticker == "AAPL":
+            raise ValueError("Test error")
+        results_dict[ticker] = ticker.lower()
+
+    asyncio.run(fetch_model.arun_workers(worker, ["AAPL", "MSFT"], results))
+
+    assert results == {"MSFT": "msft"}
+
+
+def test_configure_retires_async_clients_until_closed():
+    """Test that resizing the pool replaces the asynchronous client without dropping the old one."""
+
+    async def resize():
+        first, _ = fetch_model.get_async_client()
+        fetch_model.configure(max_workers=2)
+        second, second_semaphore = fetch_model.get_async_client()
+        await fetch_model.close_async_client()
+
+        return first, second, second_semaphore
+
+    try:
+        first, second, second_semaphore = asyncio.run(resize())
+    finally:
+        fetch_model.configure(max_workers=fetch_model.MAX_WORKERS)
+
+    assert first is not second
+    assert second_semaphore._value == 2  # pylint: disable=protected-access
+    assert first.is_closed
+    assert second.is_closed